@@ -0,0 +1,110 @@
+"""
+Compares the time taken to turn a page of jobs into the body of a response
+using :mod:`marshmallow` and :func:`flask.json.dumps`, with the time taken
+using :class:`topchef.serializers.CompiledSerializer` and
+:func:`topchef.serializers.json_encoder.dumps`. Both ways must produce the
+same text.
+
+Run it from the root of the repository with
+
+.. sourcecode:: bash
+
+    python -m benchmarks.serialization --jobs 10000
+"""
+import argparse
+import timeit
+from datetime import datetime, timedelta
+from typing import Callable, List
+from uuid import uuid4
+from flask import Flask, json
+from topchef.database.models import Job as DatabaseJob
+from topchef.database.models import Service as DatabaseService
+from topchef.database.schemas import JobStatus
+from topchef.models.job import Job
+from topchef.serializers import CompiledSerializer, JobDetail, JobOverview
+from topchef.serializers import json_encoder
+
+
+def make_jobs(number_of_jobs: int) -> List[Job]:
+    """
+
+    :param number_of_jobs: The number of jobs to make
+    :return: Jobs that are not stored in any database, with parameters and
+        results of the size usually posted to the API
+    """
+    service = DatabaseService(
+        uuid4(), 'Benchmark', 'A service for benchmarks',
+        {'type': 'object'}, {'type': 'object'}
+    )
+    start = datetime(2017, 8, 15, 18, 29, 7, 902093)
+    statuses = list(JobStatus)
+    return [
+        Job(DatabaseJob(
+            uuid4(), statuses[index % len(statuses)],
+            {'experiment_type': 'RABI', 'pulse_duration': index * 1e-9,
+             'repetitions': 1000, 'channels': [1, 2, 3]},
+            service,
+            {'amplitudes': [0.5, 0.25, 0.125], 'converged': True},
+            start + timedelta(seconds=index)
+        )) for index in range(number_of_jobs)
+    ]
+
+
+def marshmallow_body(schema_class: type) -> Callable[[List[Job]], str]:
+    def dump(jobs: List[Job]) -> str:
+        data = schema_class().dump(jobs, many=True).data
+        return json.dumps(
+            {'data': data}, indent=2, separators=(', ', ': ')
+        )
+    return dump
+
+
+def compiled_body(schema_class: type) -> Callable[[List[Job]], str]:
+    serializer = CompiledSerializer.for_schema(schema_class)
+
+    def dump(jobs: List[Job]) -> str:
+        data = serializer.dump(jobs, many=True).data
+        return json_encoder.dumps(
+            {'data': data}, indent=2, separators=(', ', ': '),
+            sort_keys=True
+        )
+    return dump
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--jobs', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    arguments = parser.parse_args()
+
+    jobs = make_jobs(arguments.jobs)
+    app = Flask(__name__)
+
+    print('%-32s %12s %12s %8s' % (
+        'schema', 'marshmallow', 'compiled', 'speedup'
+    ))
+    with app.app_context():
+        for schema_class in (JobOverview, JobDetail):
+            old, new = marshmallow_body(schema_class), \
+                compiled_body(schema_class)
+            if old(jobs) != new(jobs):
+                raise AssertionError(
+                    'The bodies for %s are not the same' % (
+                        schema_class.__name__
+                    )
+                )
+
+            old_time = min(timeit.repeat(
+                lambda: old(jobs), number=1, repeat=arguments.repeat
+            ))
+            new_time = min(timeit.repeat(
+                lambda: new(jobs), number=1, repeat=arguments.repeat
+            ))
+            print('%-32s %11.3fs %11.3fs %7.1fx' % (
+                '%s (%d jobs)' % (schema_class.__name__, len(jobs)),
+                old_time, new_time, old_time / new_time
+            ))
+
+
+if __name__ == '__main__':
+    main()
@@ -40,8 +40,13 @@ class TestAPIMetadata(AcceptanceTestCase):
 
         data = json.loads(response.data.decode('utf-8'))
 
+        schema_response = self.client.get(
+            data['meta']['schema']['$ref'], headers=self.headers
+        )
+        self.assertEqual(200, schema_response.status_code)
+
         validator = jsonschema.Draft4Validator(
-            data['meta']['schema']
+            json.loads(schema_response.data.decode('utf-8'))
         )
 
         if not validator.is_valid(data['data']):
@@ -44,7 +44,8 @@ class AcceptanceTestCaseWithService(AcceptanceTestCase):
         if hasattr(cls, 'service'):
             session = Session(bind=APP_FACTORY.engine)
             service_list = ServiceList(session)
-            del service_list[cls.service.id]
+            if cls.service.id in service_list:
+                del service_list[cls.service.id]
         AcceptanceTestCase.tearDownClass()
 
     class JobRegistrationSchema(Schema):
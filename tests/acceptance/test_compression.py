@@ -0,0 +1,82 @@
+"""
+Tests that request and response bodies can be sent compressed
+"""
+import gzip
+import json
+from tests.acceptance import AcceptanceTestCaseWithService
+
+
+class TestCompression(AcceptanceTestCaseWithService):
+    """
+    Tests that jobs can be submitted and listed with compressed bodies
+    """
+    @property
+    def jobs_url(self) -> str:
+        """
+
+        :return: The URL to which jobs for the service are posted
+        """
+        return '%s/services/%s/jobs' % (self.app_url, self.service.id)
+
+    def test_post_compressed_jobs(self) -> None:
+        """
+        Tests that a gzip-compressed batch of jobs is accepted, and that the
+        jobs can be listed with a gzip-compressed response
+        """
+        jobs = [{'parameters': {'value': value}} for value in range(100)]
+        response = self.client.post(
+            self.jobs_url, data=gzip.compress(
+                json.dumps(jobs).encode('utf-8')
+            ),
+            headers={
+                'Content-Type': 'application/json',
+                'Content-Encoding': 'gzip'
+            }
+        )
+        self.assertEqual(201, response.status_code)
+
+        response = self.client.get(
+            self.jobs_url, headers={'Accept-Encoding': 'gzip'}
+        )
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('gzip', response.headers['Content-Encoding'])
+        response_body = json.loads(
+            gzip.decompress(response.data).decode('utf-8')
+        )
+        self.assertEqual(len(jobs), len(response_body['data']))
+
+    def test_post_corrupt_body(self) -> None:
+        """
+        Tests that a body that claims to be compressed, but is not, is
+        reported as an error
+        """
+        response = self.client.post(
+            self.jobs_url, data=b'{"parameters": {"value": 1}}',
+            headers={
+                'Content-Type': 'application/json',
+                'Content-Encoding': 'gzip'
+            }
+        )
+        self.assertEqual(400, response.status_code)
+
+    def test_compressed_entity_tag(self) -> None:
+        """
+        Tests that a compressed response has its own entity tag, and that
+        the tag can be used to revalidate the response
+        """
+        url = '%s/services/%s' % (self.app_url, self.service.id)
+        headers = {'Accept-Encoding': 'gzip'}
+
+        uncompressed_etag, _ = self.client.get(url).get_etag()
+        response = self.client.get(url, headers=headers)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('gzip', response.headers['Content-Encoding'])
+
+        etag, _ = response.get_etag()
+        self.assertNotEqual(uncompressed_etag, etag)
+
+        response = self.client.get(
+            url, headers=dict(headers, **{'If-None-Match': '"%s"' % etag})
+        )
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(etag, response.get_etag()[0])
@@ -2,7 +2,12 @@
 Tests that the job status and job results can be effectively modified
 """
 import json
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
 from tests.acceptance import AcceptanceTestCaseWithJob
+from topchef import APP_FACTORY
+from topchef.database.models import Job as DatabaseJob, JobStatus
+from topchef.models.job_archive import JobArchive
 from topchef.serializers import JobDetail as JobDetailSerializer
 from uuid import uuid4
 
@@ -83,6 +88,44 @@ class TestGet(TestJobDetail):
         response_body = json.loads(response.data.decode('utf-8'))
         self.assertEqual(self.expected_job_data, response_body['data'])
 
+    def test_get_job_schema(self) -> None:
+        """
+        Tests that the schema referenced in the ``meta`` object can be
+        retrieved, that it describes the job, and that it can be cached
+        """
+        response = self.client.get(self.url, headers=self.headers)
+        response_body = json.loads(response.data.decode('utf-8'))
+        schema_url = response_body['meta']['job_info_schema']['$ref']
+
+        schema_response = self.client.get(schema_url, headers=self.headers)
+        self.assertEqual(200, schema_response.status_code)
+        self.assertIn('immutable', schema_response.headers['Cache-Control'])
+        schema = json.loads(schema_response.data.decode('utf-8'))
+        self.assertEqual('Detailed Job Schema', schema['title'])
+        self.assertEqual(
+            set(response_body['data'].keys()), set(schema['properties'])
+        )
+
+        cached_response = self.client.get(
+            schema_url, headers={
+                'If-None-Match': schema_response.headers['ETag']
+            }
+        )
+        self.assertEqual(304, cached_response.status_code)
+
+    def test_get_without_meta(self) -> None:
+        """
+        Tests that the ``meta`` object is left out if the client asks for
+        it to be left out
+        """
+        response = self.client.get(
+            self.url + '?meta=false', headers=self.headers
+        )
+        self.assertEqual(200, response.status_code)
+        response_body = json.loads(response.data.decode('utf-8'))
+        self.assertNotIn('meta', response_body)
+        self.assertEqual(self.expected_job_data, response_body['data'])
+
 
 class TestPatch(TestJobDetail):
     """
@@ -125,6 +168,26 @@ class TestPatch(TestJobDetail):
         response_body = json.loads(response.data.decode('utf-8'))
         self.assertEqual('WORKING', response_body['data']['status'])
 
+    def test_get_not_modified(self) -> None:
+        """
+        Tests that the job is only sent again after it has been changed
+        """
+        response = self.client.get(self.url, headers=self.headers)
+        etag, _ = response.get_etag()
+        conditional_headers = dict(self.headers)
+        conditional_headers['If-None-Match'] = '"%s"' % etag
+
+        response = self.client.get(self.url, headers=conditional_headers)
+        self.assertEqual(304, response.status_code)
+
+        self.client.patch(
+            self.url, headers=self.headers,
+            data=json.dumps(self.patch_request_body)
+        )
+        response = self.client.get(self.url, headers=conditional_headers)
+        self.assertEqual(200, response.status_code)
+        self.assertNotEqual(etag, response.get_etag()[0])
+
     def test_set_job_status_null_request(self) -> None:
         """
         Tests that the job status can successfully be set even if the
@@ -149,3 +212,49 @@ class TestPatch(TestJobDetail):
             data=json.dumps(self.undo_request)
         )
         TestJobDetail.tearDown(self)
+
+
+class TestArchivedJob(TestJobDetail):
+    """
+    Tests that jobs moved to the archive can still be read, but not
+    modified
+    """
+    def setUp(self) -> None:
+        """
+        Give the service a job retention through the API, and archive the
+        job once it has finished
+        """
+        TestJobDetail.setUp(self)
+        response = self.client.patch(
+            '%s/services/%s' % (self.app_url, self.service.id),
+            headers=self.headers, data=json.dumps({'job_retention': 60})
+        )
+        self.assertEqual(200, response.status_code)
+
+        session = Session(bind=APP_FACTORY.engine)
+        try:
+            session.query(DatabaseJob).filter_by(id=self.job.id).update({
+                DatabaseJob.status: JobStatus.COMPLETED,
+                DatabaseJob.date_submitted:
+                    datetime.utcnow() - timedelta(hours=1)
+            }, synchronize_session=False)
+            JobArchive(session).archive_expired_jobs(10)
+            session.commit()
+        finally:
+            session.close()
+
+    def test_archived_job(self) -> None:
+        """
+        Tests that the archived job is returned by ``GET``, and that
+        ``PATCH`` no longer finds it
+        """
+        response = self.client.get(self.url, headers=self.headers)
+        self.assertEqual(200, response.status_code)
+        response_body = json.loads(response.data.decode('utf-8'))
+        self.assertEqual('COMPLETED', response_body['data']['status'])
+
+        response = self.client.patch(
+            self.url, headers=self.headers,
+            data=json.dumps({'status': 'REGISTERED'})
+        )
+        self.assertEqual(404, response.status_code)
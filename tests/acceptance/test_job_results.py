@@ -0,0 +1,61 @@
+"""
+Contains acceptance tests for the ``/jobs/<job_id>/results`` endpoint
+"""
+import json
+from uuid import uuid4
+from tests.acceptance import AcceptanceTestCaseWithJob
+
+
+class TestGet(AcceptanceTestCaseWithJob):
+    """
+    Contains tests for
+
+    .. sourcecode:: http
+
+        GET /jobs/(job_id)/results HTTP/1.1
+
+    """
+    @property
+    def url(self) -> str:
+        """
+
+        :return: The URL to the results of the job
+        """
+        return '%s/jobs/%s/results' % (self.app_url, self.job.id)
+
+    def test_get_happy_path(self) -> None:
+        """
+        Tests that the results of the job are returned by themselves, and
+        are the same as the results in the details of the job
+        """
+        response = self.client.get(self.url)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual('application/json', response.mimetype)
+
+        job_response = self.client.get(
+            '%s/jobs/%s' % (self.app_url, self.job.id)
+        )
+        self.assertEqual(
+            json.loads(job_response.data.decode('utf-8'))['data']['results'],
+            json.loads(response.data.decode('utf-8'))
+        )
+
+    def test_get_not_modified(self) -> None:
+        """
+        Tests that the results are not sent again to a client that already
+        has them
+        """
+        response = self.client.get(self.url)
+        cached_response = self.client.get(
+            self.url, headers={'If-None-Match': response.headers['ETag']}
+        )
+        self.assertEqual(304, cached_response.status_code)
+
+    def test_get_job_not_found(self) -> None:
+        """
+        Tests that ``404`` is returned for a job that does not exist
+        """
+        response = self.client.get(
+            '%s/jobs/%s/results' % (self.app_url, uuid4())
+        )
+        self.assertEqual(404, response.status_code)
@@ -0,0 +1,40 @@
+"""
+Tests that jobs can be paged through with streamed responses
+"""
+import json
+from tests.acceptance import AcceptanceTestCaseWithService
+
+
+class TestJobsList(AcceptanceTestCaseWithService):
+    """
+    Tests that following the ``next`` links of ``/jobs`` visits every job
+    """
+    def test_pages_cover_every_job(self) -> None:
+        """
+        Tests that every job posted for the service is listed once, and
+        that the last page has no ``next`` link
+        """
+        jobs = [{'parameters': {'value': value}} for value in range(5)]
+        response = self.client.post(
+            '%s/services/%s/jobs' % (self.app_url, self.service.id),
+            data=json.dumps(jobs), content_type='application/json'
+        )
+        self.assertEqual(201, response.status_code)
+        posted_job_ids = [
+            item['id'] for item in
+            json.loads(response.data.decode('utf-8'))['data']
+        ]
+
+        listed_job_ids = []
+        url = '%s/jobs?limit=2&service_id=%s' % (
+            self.app_url, self.service.id
+        )
+        while url is not None:
+            response = self.client.get(url)
+            self.assertEqual(200, response.status_code)
+            body = json.loads(response.data.decode('utf-8'))
+            listed_job_ids.extend(job['id'] for job in body['data'])
+            url = body['links'].get('next')
+
+        self.assertEqual(sorted(posted_job_ids), sorted(listed_job_ids))
+        self.assertEqual(len(set(listed_job_ids)), len(listed_job_ids))
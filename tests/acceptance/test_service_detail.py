@@ -1,6 +1,7 @@
 """
 Tests that the services can be successfully interrogated after posting a job
 """
+import json
 from tests.acceptance import AcceptanceTestCaseWithJob
 
 
@@ -34,3 +35,68 @@ class TestServiceDetail(AcceptanceTestCaseWithJob):
             self.working_service_url, headers=self.headers
         )
         self.assertEqual(response.status_code, 200)
+
+    def test_job_counts(self) -> None:
+        """
+        Tests that the jobs of the service are counted, rather than listed
+        """
+        response = self.client.get(
+            self.working_service_url, headers=self.headers
+        )
+        data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertNotIn('jobs', data)
+        self.assertEqual(1, sum(data['job_counts'].values()))
+
+    def test_include_jobs(self) -> None:
+        """
+        Tests that a page of the service's jobs can be asked for
+        """
+        response = self.client.get(
+            '%s?include=jobs&limit=1' % self.working_service_url,
+            headers=self.headers
+        )
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertEqual(1, len(data['jobs']))
+
+    def test_heartbeat(self) -> None:
+        """
+        Tests that the service can check in without getting its details
+        back
+        """
+        response = self.client.post(
+            '%s/heartbeat' % self.working_service_url
+        )
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(response.data, b'')
+
+
+class TestDeleteService(AcceptanceTestCaseWithJob):
+    """
+    Tests that a service can be deleted, and that the purge of its jobs
+    can be followed
+    """
+    def test_delete(self) -> None:
+        """
+        Tests that the service and its job disappear as soon as the service
+        is deleted, and that its job is waiting to be purged
+        """
+        service_url = '%s/services/%s' % (self.app_url, self.service.id)
+        response = self.client.delete(service_url)
+        self.assertEqual(response.status_code, 202)
+        deletion_url = json.loads(
+            response.data.decode('utf-8')
+        )['links']['deletion']
+
+        self.assertEqual(404, self.client.get(service_url).status_code)
+        self.assertEqual(
+            404,
+            self.client.get(
+                '%s/jobs/%s' % (self.app_url, self.job.id)
+            ).status_code
+        )
+
+        response = self.client.get(deletion_url)
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertEqual(1, data['jobs_remaining'])
@@ -30,3 +30,37 @@ class IntegrationTestCaseWithJob(IntegrationTestCaseWithService):
     def test_new(self):
         job = Job.new(self.service, self.valid_job_registration)
         self.assertNotEqual(self.job_id, job.id)
+
+
+class TestVersion(IntegrationTestCaseWithService):
+    """
+    Contains integration tests for the version counter of a job
+    """
+    def setUp(self) -> None:
+        self.job = Job(
+            uuid4(), JobStatus.REGISTERED, self.valid_job_registration,
+            self.service, None
+        )
+        self.session.add(self.job)
+        self.session.commit()
+
+    def tearDown(self) -> None:
+        self.session.delete(self.job)
+        self.session.commit()
+
+    def test_new_job_has_version_one(self) -> None:
+        self.assertEqual(1, self.job.version)
+
+    def test_update_increments_version(self) -> None:
+        self.job.status = JobStatus.WORKING
+        self.session.commit()
+        self.session.refresh(self.job)
+        self.assertEqual(2, self.job.version)
+
+    def test_bulk_update_increments_version(self) -> None:
+        self.session.query(Job).filter(Job.id == self.job.id).update(
+            {Job.status: JobStatus.COMPLETED}, synchronize_session=False
+        )
+        self.session.commit()
+        self.session.refresh(self.job)
+        self.assertEqual(2, self.job.version)
@@ -0,0 +1,66 @@
+"""
+Contains integration tests for
+:mod:`topchef.database.schemas.schema_upgrader`
+"""
+import os
+from unittest import TestCase
+from sqlalchemy import create_engine, inspect, MetaData, Table
+from topchef.database.schemas import DatabaseSchema, SchemaUpgrader
+from tests.integration import IntegrationTestCase
+
+
+class TestSchemaUpgrader(TestCase):
+    """
+    Tests that a database created before jobs had leases and indexes is
+    upgraded to the current schema
+    """
+    _COLUMNS_MISSING_FROM_LEGACY_SCHEMA = {'lease_expires', 'lease_owner'}
+
+    def setUp(self) -> None:
+        """
+        Create a database with the legacy schema
+        """
+        self.engine = create_engine(os.environ.get(
+            IntegrationTestCase.DATABASE_ENVIRONMENT_VARIABLE_KEY,
+            IntegrationTestCase.SQLITE_IN_MEMORY_URI
+        ))
+        self.schema = DatabaseSchema()
+        self.upgrader = SchemaUpgrader(self.schema)
+        self._legacy_metadata().create_all(bind=self.engine)
+
+    def tearDown(self) -> None:
+        """
+        Drop the upgraded tables
+        """
+        self.schema.metadata.drop_all(bind=self.engine)
+
+    def test_upgrade(self) -> None:
+        """
+        Tests that the missing columns and indexes are added to the jobs
+        table, and that running the upgrade twice does nothing
+        """
+        self.upgrader.upgrade(self.engine)
+        self.upgrader.upgrade(self.engine)
+
+        inspector = inspect(self.engine)
+        self.assertTrue(self._COLUMNS_MISSING_FROM_LEGACY_SCHEMA.issubset(
+            column['name'] for column in inspector.get_columns('jobs')
+        ))
+        self.assertEqual(
+            {index.name for index in self.schema.jobs.indexes},
+            {index['name'] for index in inspector.get_indexes('jobs')}
+        )
+
+    def _legacy_metadata(self) -> MetaData:
+        """
+
+        :return: The metadata for the schema as it was before leases and
+            indexes were added to the jobs table
+        """
+        metadata = MetaData()
+        for table in self.schema.metadata.sorted_tables:
+            Table(table.name, metadata, *(
+                column.copy() for column in table.columns
+                if column.name not in self._COLUMNS_MISSING_FROM_LEGACY_SCHEMA
+            ))
+        return metadata
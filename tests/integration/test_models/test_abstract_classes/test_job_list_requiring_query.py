@@ -2,6 +2,8 @@
 Contains unit tests for the ``JobListRequiringQuery`` abstract class
 """
 import asyncio
+import unittest.mock as mock
+from datetime import datetime, timedelta
 from uuid import uuid4
 from tests.integration.test_models import IntegrationTestCaseWithModels
 from topchef.models.abstract_classes import JobListFromQuery
@@ -22,6 +24,7 @@ class TestJobListRequiringQuery(IntegrationTestCaseWithModels):
         """
         self.job_list = self.ConcreteJobList(self.session)
         self.invalid_job_id = uuid4()
+        self.lease_duration = timedelta(minutes=5)
 
     class ConcreteJobList(JobListFromQuery):
         """
@@ -147,3 +150,365 @@ class TestAsyncIter(TestJobListRequiringQuery):
             self.get_async_job(self.job_list.__aiter__())
         )
         self.assertEqual(self.job, result)
+
+
+class TestClaimNextJob(TestJobListRequiringQuery):
+    """
+    Contains integration tests for the ``claim_next_job`` method
+    """
+    def test_claim_next_job(self) -> None:
+        """
+        Tests that the registered job is claimed exactly once, and that its
+        status is set to ``WORKING`` when it is claimed
+        """
+        claimed_job = self.job_list.claim_next_job(self.lease_duration)
+        self.assertEqual(self.job, claimed_job)
+        self.assertIs(claimed_job.status, Job.JobStatus.WORKING)
+        self.assertGreater(claimed_job.lease_expires, datetime.utcnow())
+        self.assertIs(
+            self.job_list[self.job.id].status, Job.JobStatus.WORKING
+        )
+
+        self.assertIsNone(self.job_list.claim_next_job(self.lease_duration))
+
+
+class TestClaimJobs(TestJobListRequiringQuery):
+    """
+    Contains integration tests for the ``claim_jobs`` method
+    """
+    def setUp(self) -> None:
+        TestJobListRequiringQuery.setUp(self)
+        self.later_jobs = [
+            self.service.new_job({'value': value}) for value in range(2, 5)
+        ]
+
+    def test_claim_jobs(self) -> None:
+        """
+        Tests that jobs are claimed in the order in which they were
+        submitted, and that no job is claimed twice
+        """
+        first_batch = self.job_list.claim_jobs(2, self.lease_duration)
+        self.assertEqual([self.job, self.later_jobs[0]], first_batch)
+
+        second_batch = self.job_list.claim_jobs(10, self.lease_duration)
+        self.assertEqual(self.later_jobs[1:], second_batch)
+
+        for job in first_batch + second_batch:
+            self.assertIs(job.status, Job.JobStatus.WORKING)
+
+        self.assertEqual([], self.job_list.claim_jobs(10, self.lease_duration))
+
+
+class TestExtendLease(TestJobListRequiringQuery):
+    """
+    Contains integration tests for the ``extend_lease`` method
+    """
+    def setUp(self) -> None:
+        TestJobListRequiringQuery.setUp(self)
+        self.job.status = Job.JobStatus.REGISTERED
+        self.session.commit()
+        self.lease_owner = 'worker'
+
+    def test_extend_lease(self) -> None:
+        """
+        Tests that the holder of a lease can extend it
+        """
+        claimed_job = self.job_list.claim_next_job(
+            self.lease_duration, self.lease_owner
+        )
+        old_lease_expiry = claimed_job.lease_expires
+        new_lease_expiry = self.job_list.extend_lease(
+            self.job.id, timedelta(hours=1), self.lease_owner
+        )
+
+        self.assertIsNotNone(new_lease_expiry)
+        self.assertGreater(new_lease_expiry, old_lease_expiry)
+        self.assertEqual(
+            new_lease_expiry,
+            self.job_list[self.job.id].lease_expires
+        )
+
+    def test_extend_lease_held_by_other_worker(self) -> None:
+        """
+        Tests that a worker cannot extend a lease held by another worker
+        """
+        self.job_list.claim_next_job(self.lease_duration, self.lease_owner)
+        self.assertIsNone(self.job_list.extend_lease(
+            self.job.id, self.lease_duration, 'another worker'
+        ))
+
+    def test_extend_lease_on_registered_job(self) -> None:
+        """
+        Tests that jobs which are not working cannot have their lease
+        extended
+        """
+        self.assertIsNone(
+            self.job_list.extend_lease(self.job.id, self.lease_duration)
+        )
+
+    def test_extend_lease_on_invalid_job(self) -> None:
+        """
+        Tests that extending the lease on a job that does not exist raises
+        ``KeyError``
+        """
+        with self.assertRaises(KeyError):
+            self.job_list.extend_lease(
+                self.invalid_job_id, self.lease_duration
+            )
+
+
+class TestRequeueExpiredJobs(TestJobListRequiringQuery):
+    """
+    Contains integration tests for the ``requeue_expired_jobs`` method
+    """
+    def test_requeue_expired_jobs(self) -> None:
+        """
+        Tests that a job whose lease has expired is returned to the queue,
+        and that a job with a live lease is left alone
+        """
+        live_job = self.service.new_job({'value': 2})
+        self.job_list.claim_jobs(2, self.lease_duration)
+        self.job.db_model.lease_expires = datetime.utcnow() - timedelta(
+            seconds=1
+        )
+        self.session.commit()
+
+        self.assertEqual(1, self.job_list.requeue_expired_jobs())
+        self.session.expire_all()
+
+        self.assertIs(
+            self.job_list[self.job.id].status, Job.JobStatus.REGISTERED
+        )
+        self.assertIsNone(self.job_list[self.job.id].lease_expires)
+        self.assertIs(
+            self.job_list[live_job.id].status, Job.JobStatus.WORKING
+        )
+
+
+class TestQueue(TestJobListRequiringQuery):
+    """
+    Contains integration tests for the ``queue`` method
+    """
+    def test_queue(self) -> None:
+        """
+        Tests that the queue contains the oldest registered jobs, oldest
+        first, and that jobs which are not registered are left out
+        """
+        later_jobs = [
+            self.service.new_job({'value': value}) for value in range(2, 5)
+        ]
+        later_jobs[0].status = Job.JobStatus.COMPLETED
+        self.session.commit()
+
+        self.assertEqual([self.job, later_jobs[1]], self.job_list.queue(2))
+        self.assertEqual(
+            [self.job] + later_jobs[1:], self.job_list.queue(10)
+        )
+
+
+class TestJobsWithIDs(TestJobListRequiringQuery):
+    """
+    Contains integration tests for the ``jobs_with_ids`` method
+    """
+    def test_jobs_with_ids(self) -> None:
+        """
+        Tests that the jobs are retrieved by ID, and that unknown IDs are
+        left out
+        """
+        jobs = self.job_list.jobs_with_ids([self.job.id, self.invalid_job_id])
+
+        self.assertEqual({self.job.id: self.job}, jobs)
+
+    def test_jobs_with_ids_in_chunks(self) -> None:
+        """
+        Tests that more IDs than fit in one query can be requested
+        """
+        job_ids = [uuid4() for _ in range(
+            self.job_list._MAXIMUM_IDS_PER_QUERY
+        )] + [self.job.id]
+
+        self.assertEqual(
+            {self.job.id: self.job}, self.job_list.jobs_with_ids(job_ids)
+        )
+
+
+class TestPage(TestJobListRequiringQuery):
+    """
+    Contains integration tests for the ``page`` method
+    """
+    def test_pages_cover_every_job(self) -> None:
+        """
+        Tests that paging through the list visits every job once, in the
+        order in which the jobs were submitted
+        """
+        self.service.new_jobs([{'value': value} for value in range(4)])
+        self.session.commit()
+
+        expected_job_ids = [
+            job.id for job in sorted(
+                self.job_list, key=lambda job: (job.date_submitted, job.id)
+            )
+        ]
+        seen_job_ids = []
+        page = self.job_list.page(3)
+        while page:
+            seen_job_ids.extend(job.id for job in page)
+            page = self.job_list.page(3, after=page[-1].id)
+
+        self.assertEqual(expected_job_ids, seen_job_ids)
+
+    def test_page_after_invalid_job(self) -> None:
+        """
+        Tests that paging from a job that is not in the list raises
+        ``KeyError``
+        """
+        with self.assertRaises(KeyError):
+            self.job_list.page(1, after=self.invalid_job_id)
+
+
+class TestStreamPage(TestJobListRequiringQuery):
+    """
+    Contains integration tests for the ``stream_page`` method
+    """
+    def test_same_jobs_as_page(self) -> None:
+        """
+        Tests that a streamed page holds the same jobs as the page that is
+        read all at once, even if it spans several batches
+        """
+        self.service.new_jobs([{'value': value} for value in range(5)])
+        self.session.commit()
+
+        with mock.patch.object(
+                self.job_list, '_JOBS_PER_STREAMED_BATCH', 2
+        ):
+            streamed_jobs = list(self.job_list.stream_page(4))
+        self.assertEqual(self.job_list.page(4), streamed_jobs)
+
+        after = streamed_jobs[-1].id
+        self.assertEqual(
+            self.job_list.page(4, after=after),
+            list(self.job_list.stream_page(4, after=after))
+        )
+
+    def test_stream_after_invalid_job(self) -> None:
+        """
+        Tests that an invalid ``after`` is reported before the iterator is
+        advanced
+        """
+        with self.assertRaises(KeyError):
+            self.job_list.stream_page(1, after=self.invalid_job_id)
+
+
+class TestStatusCounts(TestJobListRequiringQuery):
+    """
+    Contains integration tests for the ``status_counts`` method
+    """
+    def test_status_counts(self) -> None:
+        """
+        Tests that every job is counted under its status
+        """
+        counts = self.job_list.status_counts()
+
+        self.assertEqual(set(Job.JobStatus), set(counts.keys()))
+        self.assertEqual(len(self.job_list), sum(counts.values()))
+        for status in Job.JobStatus:
+            self.assertEqual(
+                sum(1 for job in self.job_list if job.status == status),
+                counts[status]
+            )
+
+
+class TestOnly(TestJobListRequiringQuery):
+    """
+    Contains integration tests for the ``only`` method
+    """
+    def test_only_leaves_out_unrequested_columns(self) -> None:
+        """
+        Tests that the JSON columns that were not asked for are not selected
+        """
+        query = str(self.job_list.only(['id', 'status']).root_job_query)
+
+        self.assertNotIn('jobs.parameters', query)
+        self.assertNotIn('jobs.results', query)
+        self.assertIn('jobs.status', query)
+
+    def test_deferred_attributes_can_still_be_read(self) -> None:
+        """
+        Tests that reading an attribute that was not asked for still works
+        """
+        job_id = self.job.id
+        parameters = self.job.parameters
+        self.session.commit()
+        self.session.expunge_all()
+
+        job = self.job_list.only(['id'])[job_id]
+
+        self.assertEqual(parameters, job.parameters)
+
+
+class TestFilter(TestJobListRequiringQuery):
+    """
+    Contains integration tests for the ``filter`` method
+    """
+    def test_filter_by_status(self) -> None:
+        """
+        Tests that only jobs with the given statuses are kept
+        """
+        filtered_list = self.job_list.filter(
+            statuses=[self.job.status]
+        )
+        self.assertIn(self.job.id, filtered_list)
+        self.assertEqual(
+            sum(1 for job in self.job_list if job.status == self.job.status),
+            len(filtered_list)
+        )
+
+        other_statuses = set(Job.JobStatus).difference([self.job.status])
+        self.assertNotIn(
+            self.job.id, self.job_list.filter(statuses=other_statuses)
+        )
+
+    def test_filter_by_service(self) -> None:
+        """
+        Tests that only jobs of the given service are kept
+        """
+        self.assertIn(
+            self.job.id, self.job_list.filter(service_id=self.service.id)
+        )
+        self.assertFalse(len(self.job_list.filter(service_id=uuid4())))
+
+    def test_filter_by_date(self) -> None:
+        """
+        Tests that jobs are kept according to their submission date
+        """
+        submitted = self.job.date_submitted
+        second = timedelta(seconds=1)
+
+        self.assertIn(
+            self.job.id, self.job_list.filter(
+                submitted_after=submitted - second,
+                submitted_before=submitted + second
+            )
+        )
+        self.assertNotIn(
+            self.job.id, self.job_list.filter(submitted_after=submitted)
+        )
+        self.assertNotIn(
+            self.job.id, self.job_list.filter(submitted_before=submitted)
+        )
+
+
+class TestVersions(TestJobListRequiringQuery):
+    """
+    Contains integration tests for the ``versions`` method
+    """
+    def test_versions(self) -> None:
+        """
+        Tests that the version of every job is listed, in order of job ID
+        """
+        versions = list(self.job_list.versions())
+
+        self.assertEqual(
+            sorted((job.id, job.version) for job in self.job_list), versions
+        )
+        self.assertIn((self.job.id, self.job.version), versions)
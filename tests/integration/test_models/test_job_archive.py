@@ -0,0 +1,165 @@
+"""
+Contains integration tests for :mod:`topchef.models.job_archive`
+"""
+import tempfile
+from datetime import datetime, timedelta
+from uuid import uuid4
+from tests.integration.test_models import IntegrationTestCaseWithModels
+from topchef.database.models import Job as DatabaseJob
+from topchef.database.models import JobStatus
+from topchef.models.blob_store import BlobStore, referenced_result_blobs
+from topchef.models.job import Job
+from topchef.models.job_archive import JobArchive
+from topchef.models.job_list import JobList
+
+
+class TestJobArchive(IntegrationTestCaseWithModels):
+    def setUp(self):
+        IntegrationTestCaseWithModels.setUp(self)
+        self.service_with_retention = self._create_test_service()
+        self.service_with_retention.job_retention = timedelta(days=1)
+        self.session.commit()
+        self.job_archive = JobArchive(self.session)
+
+    def _new_job(self, status, age):
+        job = self.service_with_retention.new_job({'value': 1})
+        job.db_model.status = status
+        job.db_model.date_submitted = datetime.utcnow() - age
+        self.session.commit()
+        return job
+
+    def _archive(self, max_jobs=10):
+        number_of_jobs = self.job_archive.archive_expired_jobs(max_jobs)
+        self.session.commit()
+        return number_of_jobs
+
+
+class TestArchiveExpiredJobs(TestJobArchive):
+    def test_expired_finished_jobs_are_archived(self):
+        completed_job = self._new_job(JobStatus.COMPLETED, timedelta(days=2))
+        failed_job = self._new_job(JobStatus.ERROR, timedelta(days=2))
+
+        self.assertEqual(2, self._archive())
+
+        job_list = JobList(self.session)
+        for job in (completed_job, failed_job):
+            self.assertNotIn(job.id, job_list)
+            self.assertIn(job.id, self.job_archive)
+
+    def test_recent_and_unfinished_jobs_are_kept(self):
+        recent_job = self._new_job(JobStatus.COMPLETED, timedelta(hours=1))
+        registered_job = self._new_job(
+            JobStatus.REGISTERED, timedelta(days=2)
+        )
+
+        self.assertEqual(0, self._archive())
+
+        job_list = JobList(self.session)
+        self.assertIn(recent_job.id, job_list)
+        self.assertIn(registered_job.id, job_list)
+
+    def test_services_without_retention_are_kept(self):
+        self.job.db_model.status = JobStatus.COMPLETED
+        self.job.db_model.date_submitted = \
+            datetime.utcnow() - timedelta(days=365)
+        self.session.commit()
+
+        self._archive()
+
+        self.assertIn(self.job.id, JobList(self.session))
+
+    def test_archive_in_chunks(self):
+        for _ in range(3):
+            self._new_job(JobStatus.COMPLETED, timedelta(days=2))
+
+        self.assertEqual(2, self._archive(2))
+        self.assertEqual(1, self._archive(2))
+        self.assertEqual(0, self._archive(2))
+
+    def test_jobs_version_changes(self):
+        self._new_job(JobStatus.COMPLETED, timedelta(days=2))
+        self.session.expire(self.service_with_retention.db_model)
+        jobs_version = self.service_with_retention.jobs_version
+
+        self._archive()
+
+        self.session.expire(self.service_with_retention.db_model)
+        self.assertGreater(
+            self.service_with_retention.jobs_version, jobs_version
+        )
+
+
+class TestGetItem(TestJobArchive):
+    def test_archived_job_is_readable(self):
+        job = self._new_job(JobStatus.COMPLETED, timedelta(days=2))
+        job.db_model.results = {'value': 2}
+        self.session.commit()
+        self._archive()
+
+        archived_job = self.job_archive[job.id]
+
+        self.assertIsInstance(archived_job, Job)
+        self.assertEqual(Job.JobStatus.COMPLETED, archived_job.status)
+        self.assertEqual({'value': 1}, archived_job.parameters)
+        self.assertEqual({'value': 2}, archived_job.results)
+        self.assertEqual(
+            self.service_with_retention.id, archived_job.service_id
+        )
+        self.assertIsNone(archived_job.lease_expires)
+
+    def test_getitem_keyerror(self):
+        with self.assertRaises(KeyError):
+            _ = self.job_archive[uuid4()]
+
+    def test_jobs_of_deleted_services_are_hidden(self):
+        job = self._new_job(JobStatus.COMPLETED, timedelta(days=2))
+        self._archive()
+        self.service_with_retention.db_model.is_deleted = True
+        self.session.commit()
+
+        self.assertNotIn(job.id, self.job_archive)
+        self.assertEqual(
+            0, self.session.query(DatabaseJob).filter_by(
+                service_id=self.service_with_retention.id
+            ).count()
+        )
+
+    def test_results_in_blob_store_are_archived(self):
+        job = self._new_job(JobStatus.COMPLETED, timedelta(days=2))
+        with tempfile.TemporaryDirectory() as directory:
+            blob_store = BlobStore(directory)
+            results = {'counts': list(range(100))}
+            Job(job.db_model, blob_store, blob_threshold=16).results = results
+            self.session.commit()
+            self._archive()
+
+            archived_job = self.job_archive[job.id]
+            self.assertIsNone(archived_job.db_model.results)
+            self.assertEqual(
+                results,
+                Job(archived_job.db_model, blob_store).results
+            )
+
+    def test_referenced_result_blobs(self):
+        archived_job = self._new_job(JobStatus.COMPLETED, timedelta(days=2))
+        job = self._new_job(JobStatus.COMPLETED, timedelta(hours=1))
+        with tempfile.TemporaryDirectory() as directory:
+            blob_store = BlobStore(directory)
+            digests = set()
+            for index, result_job in enumerate((archived_job, job)):
+                model = Job(result_job.db_model, blob_store, blob_threshold=16)
+                model.results = {'counts': list(range(100 + index))}
+                digests.add(model.db_model.results_blob)
+            self.session.commit()
+            self._archive()
+
+            self.assertEqual(digests, referenced_result_blobs(self.session))
+            unreferenced_digest = blob_store.put(b'{"foo": "bar"}')
+            self.assertEqual(
+                1, blob_store.remove_unreferenced(
+                    referenced_result_blobs(self.session), minimum_age=-1
+                )
+            )
+            self.assertNotIn(unreferenced_digest, blob_store)
+            for digest in digests:
+                self.assertIn(digest, blob_store)
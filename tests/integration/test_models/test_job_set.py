@@ -0,0 +1,96 @@
+"""
+Contains integration tests for :mod:`topchef.models.job_set`
+"""
+from datetime import datetime, timedelta
+from uuid import uuid4
+from tests.integration.test_models import IntegrationTestCaseWithModels
+from topchef.models.job_archive import JobArchive
+from topchef.models.job_set_list import JobSetList
+from topchef.models.service_list import ServiceList
+from topchef.models.interfaces import Job
+
+
+class TestJobSet(IntegrationTestCaseWithModels):
+    def setUp(self):
+        IntegrationTestCaseWithModels.setUp(self)
+        self.job_set_list = JobSetList(self.session)
+        self.job_set = self.job_set_list.new('Integration test job set')
+        self.job_ids = self.service.new_jobs(
+            [{'value': value} for value in range(3)], self.job_set
+        )
+        self.session.commit()
+
+
+class TestJobSetList(TestJobSet):
+    def test_getitem(self):
+        self.assertEqual(self.job_set, self.job_set_list[self.job_set.id])
+
+    def test_getitem_keyerror(self):
+        with self.assertRaises(KeyError):
+            _ = self.job_set_list[uuid4()]
+
+    def test_contains(self):
+        self.assertIn(self.job_set, iter(self.job_set_list))
+
+
+class TestJobsInJobSet(TestJobSet):
+    def test_jobs(self):
+        self.assertEqual(
+            set(self.job_ids), {job.id for job in self.job_set.jobs}
+        )
+
+    def test_job_not_in_set(self):
+        self.assertNotIn(self.job.id, self.job_set.jobs)
+
+    def test_status_counts(self):
+        self.job_set.jobs[self.job_ids[0]].status = Job.JobStatus.COMPLETED
+        self.session.commit()
+
+        counts = self.job_set.jobs.status_counts()
+
+        self.assertEqual(1, counts[Job.JobStatus.COMPLETED])
+        self.assertEqual(2, counts[Job.JobStatus.REGISTERED])
+        self.assertEqual(0, counts[Job.JobStatus.ERROR])
+
+    def test_status_counts_include_archived_jobs(self):
+        self.service.job_retention = timedelta(days=1)
+        archived_job = self.job_set.jobs[self.job_ids[0]]
+        archived_job.status = Job.JobStatus.COMPLETED
+        archived_job.db_model.date_submitted = \
+            datetime.utcnow() - timedelta(days=2)
+        self.session.commit()
+        self.assertEqual(1, JobArchive(self.session).archive_expired_jobs(10))
+        self.session.commit()
+
+        counts = self.job_set.jobs.status_counts()
+
+        self.assertNotIn(self.job_ids[0], self.job_set.jobs)
+        self.assertEqual(1, counts[Job.JobStatus.COMPLETED])
+        self.assertEqual(2, counts[Job.JobStatus.REGISTERED])
+        self.assertEqual(3, sum(counts.values()))
+
+
+class TestJobSetOfDeletedService(TestJobSet):
+    def setUp(self):
+        TestJobSet.setUp(self)
+        self.deleted_service = self._create_test_service()
+        self.hidden_job_set = self.job_set_list.new('Deleted job set')
+        self.deleted_service.new_jobs([{'value': 1}], self.hidden_job_set)
+        self.session.commit()
+        del ServiceList(self.session)[self.deleted_service.id]
+        self.session.commit()
+
+    def test_job_set_is_hidden(self):
+        with self.assertRaises(KeyError):
+            _ = self.job_set_list[self.hidden_job_set.id]
+        self.assertNotIn(
+            self.hidden_job_set.id,
+            {job_set.id for job_set in self.job_set_list}
+        )
+        self.assertEqual(self.job_set, self.job_set_list[self.job_set.id])
+
+    def test_jobs_are_hidden(self):
+        self.assertEqual(0, len(self.hidden_job_set.jobs))
+        self.assertEqual(
+            0, sum(self.hidden_job_set.jobs.status_counts().values())
+        )
@@ -1,9 +1,11 @@
 """
 Contains integration tests for :mod:`topchef.models.service.Service`
 """
+from datetime import timedelta
 from uuid import uuid4
 from tests.integration.test_models import IntegrationTestCaseWithModels
 import asyncio
+from topchef.models.new_job_notifier import NEW_JOB_NOTIFIER
 
 
 class TestService(IntegrationTestCaseWithModels):
@@ -87,3 +89,93 @@ class TestContains(TestService):
 
     def test_contains_bad_job_id(self):
         self.assertNotIn(self.bad_job_id, self.service.jobs)
+
+
+class TestNewJobNotification(TestService):
+    def test_commit_notifies_waiters(self):
+        generation = NEW_JOB_NOTIFIER.generation(self.service.id)
+        self.service.new_job({'value': 2})
+        self.session.commit()
+
+        self.assertNotEqual(
+            generation, NEW_JOB_NOTIFIER.generation(self.service.id)
+        )
+
+
+class TestNewJobs(TestService):
+    def test_new_jobs(self):
+        parameter_sets = [{'value': value} for value in range(3)]
+        job_ids = self.service.new_jobs(parameter_sets)
+        self.session.commit()
+
+        self.assertEqual(len(parameter_sets), len(job_ids))
+        for job_id, parameters in zip(job_ids, parameter_sets):
+            self.assertEqual(
+                parameters, self.service.jobs[job_id].parameters
+            )
+
+    def test_new_jobs_are_queued_in_order(self):
+        for job in self.service.jobs.queue(len(self.service.jobs)):
+            job.status = job.JobStatus.COMPLETED
+        self.session.commit()
+
+        job_ids = self.service.new_jobs(
+            [{'value': value} for value in range(20)]
+        )
+        self.session.commit()
+
+        queue = self.service.jobs.queue(20)
+        self.assertEqual(job_ids, [job.id for job in queue])
+        self.assertEqual(1, len({job.date_submitted for job in queue}))
+
+    def test_no_jobs(self):
+        self.assertEqual([], self.service.new_jobs([]))
+
+
+class TestJobsVersion(TestService):
+    def setUp(self):
+        TestService.setUp(self)
+        self.session.commit()
+        self.jobs_version = self._jobs_version()
+        self.version = self.service.version
+
+    def _jobs_version(self):
+        self.session.expire(self.service.db_model)
+        return self.service.jobs_version
+
+    def test_new_job(self):
+        self.service.new_job({'value': 2})
+        self.session.commit()
+        self.assertGreater(self._jobs_version(), self.jobs_version)
+
+    def test_new_jobs(self):
+        self.service.new_jobs([{'value': 2}, {'value': 3}])
+        self.session.commit()
+        self.assertGreater(self._jobs_version(), self.jobs_version)
+
+    def test_status_change(self):
+        job = self.service.jobs[self.job_id]
+        job.status = job.JobStatus.ERROR
+        self.session.commit()
+        self.assertGreater(self._jobs_version(), self.jobs_version)
+
+    def test_claim(self):
+        job = self.service.jobs[self.job_id]
+        job.status = job.JobStatus.REGISTERED
+        self.session.commit()
+        jobs_version = self._jobs_version()
+
+        self.service.jobs.claim_jobs(1, timedelta(minutes=1))
+        self.session.commit()
+        self.assertGreater(self._jobs_version(), jobs_version)
+
+    def test_results_do_not_change_version(self):
+        self.service.jobs[self.job_id].results = {'result': 'data'}
+        self.session.commit()
+        self.assertEqual(self.jobs_version, self._jobs_version())
+
+    def test_service_version_is_unchanged(self):
+        self.service.new_job({'value': 2})
+        self.session.commit()
+        self._jobs_version()
+        self.assertEqual(self.version, self.service.version)
@@ -0,0 +1,273 @@
+"""
+Contains integration tests for :mod:`topchef.models.service_list`
+"""
+from datetime import datetime, timedelta
+from uuid import uuid4
+from tests.integration.test_models import IntegrationTestCaseWithModels
+from topchef.database.models import JobSet as DatabaseJobSet
+from topchef.database.models import JobStatus
+from topchef.models.heartbeat_coalescer import HeartbeatCoalescer
+from topchef.models.job_archive import JobArchive
+from topchef.models.job_list import JobList
+from topchef.models.job_set_list import JobSetList
+from topchef.models.service_list import ServiceList
+
+
+class TestServiceList(IntegrationTestCaseWithModels):
+    def setUp(self):
+        IntegrationTestCaseWithModels.setUp(self)
+        self.session.commit()
+        self.coalescer = HeartbeatCoalescer(window_seconds=3600)
+        self.service_list = ServiceList(self.session, self.coalescer)
+
+
+class TestCheckIn(TestServiceList):
+    def setUp(self):
+        TestServiceList.setUp(self)
+        self.session.expire(self.service.db_model)
+        self.last_checked_in = self.service.db_model.last_checked_in
+        self.version = self.service.version
+
+    def _refresh(self):
+        self.session.commit()
+        self.session.expire(self.service.db_model)
+
+    def test_check_in(self):
+        self.service_list.check_in(self.service.id)
+        self._refresh()
+        self.assertGreater(
+            self.service.db_model.last_checked_in, self.last_checked_in
+        )
+
+    def test_check_in_does_not_change_version(self):
+        self.service_list.check_in(self.service.id)
+        self._refresh()
+        self.assertEqual(self.version, self.service.version)
+
+    def test_heartbeats_are_coalesced(self):
+        self.service_list.check_in(self.service.id)
+        self._refresh()
+        last_checked_in = self.service.db_model.last_checked_in
+
+        self.service_list.check_in(self.service.id)
+        self._refresh()
+        self.assertEqual(
+            last_checked_in, self.service.db_model.last_checked_in
+        )
+
+        self.coalescer.flush(self.session)
+        self._refresh()
+        self.assertGreater(
+            self.service.db_model.last_checked_in, last_checked_in
+        )
+
+    def test_check_in_keyerror(self):
+        with self.assertRaises(KeyError):
+            self.service_list.check_in(uuid4())
+
+    def test_service_deleted_by_another_process(self):
+        service = self._create_test_service()
+        self.session.commit()
+        self.service_list.check_in(service.id)
+        service.db_model.is_deleted = True
+        self.session.commit()
+
+        self.service_list.check_in(service.id)
+        self.coalescer.flush(self.session)
+        self.session.commit()
+
+        with self.assertRaises(KeyError):
+            self.service_list.check_in(service.id)
+
+
+class TestLiveService(TestServiceList):
+    def setUp(self):
+        TestServiceList.setUp(self)
+        self.db_model = self.service.db_model
+        self.db_model.is_service_available = True
+        self.db_model.last_checked_in = datetime.utcnow()
+        self.db_model.timeout = 30
+        self.session.commit()
+
+    def _time_out(self):
+        self.db_model.last_checked_in = \
+            datetime.utcnow() - timedelta(seconds=31)
+        self.session.commit()
+
+
+class TestFilterByAvailability(TestLiveService):
+    def _service_ids(self, is_available):
+        return {
+            service.id for service in
+            self.service_list.filter_by_availability(is_available)
+        }
+
+    def test_live_service(self):
+        self.assertIn(self.service.id, self._service_ids(True))
+        self.assertNotIn(self.service.id, self._service_ids(False))
+
+    def test_timed_out_service(self):
+        self._time_out()
+        self.assertNotIn(self.service.id, self._service_ids(True))
+        self.assertIn(self.service.id, self._service_ids(False))
+
+    def test_unavailable_service(self):
+        self.db_model.is_service_available = False
+        self.session.commit()
+        self.assertNotIn(self.service.id, self._service_ids(True))
+        self.assertIn(self.service.id, self._service_ids(False))
+
+    def test_versions(self):
+        self._time_out()
+        self.assertEqual(
+            [], list(self.service_list.filter_by_availability(True).versions())
+        )
+        self.assertEqual(
+            [(self.service.id, self.service.version)],
+            list(self.service_list.filter_by_availability(False).versions())
+        )
+
+
+class TestMarkTimedOutServicesUnavailable(TestLiveService):
+    def _sweep(self):
+        number_of_services = \
+            self.service_list.mark_timed_out_services_unavailable()
+        self.session.commit()
+        self.session.expire(self.db_model)
+        return number_of_services
+
+    def test_timed_out_service(self):
+        self._time_out()
+        version = self.service.version
+
+        self.assertEqual(1, self._sweep())
+        self.assertFalse(self.service.is_service_available)
+        self.assertGreater(self.service.version, version)
+
+    def test_live_service(self):
+        self.assertEqual(0, self._sweep())
+        self.assertTrue(self.service.is_service_available)
+
+    def test_buffered_heartbeats_are_written_first(self):
+        self.service_list.check_in(self.service.id)
+        self.session.commit()
+        self._time_out()
+        self.service_list.check_in(self.service.id)
+
+        self.assertEqual(0, self._sweep())
+        self.assertTrue(self.service.is_service_available)
+
+
+class TestDeletedService(TestServiceList):
+    number_of_jobs = 5
+
+    def setUp(self):
+        TestServiceList.setUp(self)
+        self._purge_services_deleted_by_other_tests()
+        self.deleted_service = self._create_test_service()
+        self.deleted_service.new_jobs(
+            [{'value': value} for value in range(self.number_of_jobs)]
+        )
+        self.session.commit()
+        del self.service_list[self.deleted_service.id]
+        self.session.commit()
+
+    def _purge_services_deleted_by_other_tests(self):
+        self.service_list.purge_deleted_services(
+            len(JobList(self.session)) + self.number_of_jobs
+        )
+        self.session.commit()
+
+
+class TestDelItem(TestDeletedService):
+    def test_service_is_hidden(self):
+        self.assertNotIn(self.deleted_service.id, self.service_list)
+        self.assertNotIn(
+            self.deleted_service.id,
+            {service.id for service in self.service_list}
+        )
+        with self.assertRaises(KeyError):
+            _ = self.service_list[self.deleted_service.id]
+
+    def test_jobs_are_hidden(self):
+        job_list = JobList(self.session)
+        self.assertNotIn(
+            self.deleted_service.id,
+            {job.db_model.service_id for job in job_list}
+        )
+        self.assertIn(self.job.id, job_list)
+
+    def test_jobs_are_not_deleted_yet(self):
+        self.assertEqual(
+            self.number_of_jobs,
+            self.service_list.jobs_awaiting_purge(self.deleted_service.id)
+        )
+
+    def test_delete_twice(self):
+        with self.assertRaises(KeyError):
+            del self.service_list[self.deleted_service.id]
+
+    def test_check_in(self):
+        with self.assertRaises(KeyError):
+            self.service_list.check_in(self.deleted_service.id)
+
+
+class TestPurgeDeletedServices(TestDeletedService):
+    def _purge(self, max_jobs):
+        number_of_jobs = self.service_list.purge_deleted_services(max_jobs)
+        self.session.commit()
+        return number_of_jobs
+
+    def test_purge_in_chunks(self):
+        self.assertEqual(2, self._purge(2))
+        self.assertEqual(
+            self.number_of_jobs - 2,
+            self.service_list.jobs_awaiting_purge(self.deleted_service.id)
+        )
+
+        self.assertEqual(self.number_of_jobs - 2, self._purge(10))
+        with self.assertRaises(KeyError):
+            self.service_list.jobs_awaiting_purge(self.deleted_service.id)
+
+    def test_purge_leaves_other_services(self):
+        while self._purge(2) == 2:
+            pass
+        self.assertIn(self.service.id, self.service_list)
+        self.assertIn(self.job.id, JobList(self.session))
+
+    def test_archived_jobs_are_purged(self):
+        service = self._create_test_service()
+        service.job_retention = timedelta(days=1)
+        job = service.new_job({'value': 1})
+        job.db_model.status = JobStatus.COMPLETED
+        job.db_model.date_submitted = datetime.utcnow() - timedelta(days=2)
+        self.session.commit()
+        JobArchive(self.session).archive_expired_jobs(1)
+        del self.service_list[service.id]
+        self.session.commit()
+
+        self.assertEqual(1, self.service_list.jobs_awaiting_purge(service.id))
+        while self._purge(2) == 2:
+            pass
+        with self.assertRaises(KeyError):
+            self.service_list.jobs_awaiting_purge(service.id)
+
+    def test_job_sets_are_purged(self):
+        service = self._create_test_service()
+        job_set = JobSetList(self.session).new('Purged job set')
+        service.new_jobs([{'value': 1}], job_set)
+        self.session.commit()
+        del self.service_list[service.id]
+        self.session.commit()
+
+        while self._purge(2) == 2:
+            pass
+        self.assertEqual(
+            0, self.session.query(DatabaseJobSet).filter_by(
+                id=job_set.id
+            ).count()
+        )
+
+    def test_jobs_awaiting_purge_of_service_not_deleted(self):
+        with self.assertRaises(KeyError):
+            self.service_list.jobs_awaiting_purge(self.service.id)
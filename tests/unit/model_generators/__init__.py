@@ -7,3 +7,4 @@ from .api_exception import api_exceptions
 from .api_metadata import api_metadata
 from .job import jobs
 from .job_list import job_lists
+from .job_set import job_sets, job_set_lists
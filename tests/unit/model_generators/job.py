@@ -1,8 +1,10 @@
 """
 Contains a generator for creating jobs
 """
-from uuid import UUID
+import json
+from uuid import UUID, uuid4
 from datetime import datetime
+from typing import Iterable, Optional
 from hypothesis.strategies import composite, uuids, text, sampled_from
 from hypothesis.strategies import dictionaries, datetimes
 from topchef.models import Job as JobInterface
@@ -21,7 +23,9 @@ class Job(JobInterface):
             results: dict,
             date_submitted: datetime,
             parameter_schema: dict,
-            result_schema: dict
+            result_schema: dict,
+            lease_expires: Optional[datetime]=None,
+            service_id: Optional[UUID]=None
     ) -> None:
         """
 
@@ -34,6 +38,9 @@ class Job(JobInterface):
             order to successfully create parameters for a job
         :param result_schema: The schema that must be satisified in order to
             post job results.
+        :param lease_expires: The time at which the lease on the job expires
+        :param service_id: The ID of the service to which the job belongs.
+            If this is ``None``, the job gets a service of its own
         """
         self._job_id = job_id
         self._status = status
@@ -42,6 +49,9 @@ class Job(JobInterface):
         self._date_submitted = date_submitted
         self._parameter_schema = parameter_schema
         self._result_schema = result_schema
+        self._lease_expires = lease_expires
+        self._version = 1
+        self._service_id = service_id if service_id is not None else uuid4()
 
     @property
     def id(self) -> UUID:
@@ -66,6 +76,7 @@ class Job(JobInterface):
         :param new_status: The desired job status to set
         """
         self._status = new_status
+        self._version += 1
 
     @property
     def parameters(self) -> dict:
@@ -92,6 +103,10 @@ class Job(JobInterface):
             the results are modified
         """
         self._results = new_results
+        self._version += 1
+
+    def encoded_results(self) -> Iterable[bytes]:
+        return [json.dumps(self._results).encode('utf-8')]
 
     @property
     def date_submitted(self) -> datetime:
@@ -102,6 +117,41 @@ class Job(JobInterface):
         """
         return self._date_submitted
 
+    @property
+    def lease_expires(self) -> Optional[datetime]:
+        """
+
+        :return: The time at which the lease on the job expires
+        """
+        return self._lease_expires
+
+    @lease_expires.setter
+    def lease_expires(self, new_lease_expiry: Optional[datetime]) -> None:
+        """
+
+        :param new_lease_expiry: The new lease expiry. This is meant to
+            simulate a worker claiming the job, or extending its lease
+        """
+        self._lease_expires = new_lease_expiry
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """
+
+        :return: The number of times that this job has been changed, plus
+            one
+        """
+        return self._version
+
+    @property
+    def service_id(self) -> UUID:
+        """
+
+        :return: The ID of the service to which the job belongs
+        """
+        return self._service_id
+
     @property
     def parameter_schema(self) -> dict:
         """
@@ -6,8 +6,10 @@ from hypothesis.strategies import composite, lists
 from tests.unit.model_generators.job import jobs
 from topchef.models import JobList as JobListInterface
 from topchef.models import Job as JobInterface
-from typing import Iterable, MutableSequence, Iterator, Union
+from typing import Iterable, MutableSequence, Iterator, Union, Optional
+from typing import Sequence, Dict, Tuple
 from uuid import UUID
+from datetime import datetime, timedelta
 
 
 class JobList(JobListInterface):
@@ -25,6 +27,203 @@ class JobList(JobListInterface):
         """
         return (job.id for job in self._jobs)
 
+    def queue(self, depth: int) -> Sequence[JobInterface]:
+        """
+
+        :param depth: The maximum number of jobs to return
+        :return: The oldest registered jobs in the list
+        """
+        return self._registered_jobs[:max(depth, 0)]
+
+    def claim_next_job(
+            self, lease_duration: timedelta, lease_owner: Optional[str]=None
+    ) -> Optional[JobInterface]:
+        """
+
+        :param lease_duration: The amount of time for which the job is leased
+        :param lease_owner: The name of the worker claiming the job
+        :return: The oldest registered job in the list, which is marked as
+            ``WORKING``, or ``None`` if there are no registered jobs
+        """
+        return next(
+            iter(self.claim_jobs(1, lease_duration, lease_owner)), None
+        )
+
+    def claim_jobs(
+            self,
+            number_of_jobs: int,
+            lease_duration: timedelta,
+            lease_owner: Optional[str]=None
+    ) -> Sequence[JobInterface]:
+        """
+
+        :param number_of_jobs: The maximum number of jobs to claim
+        :param lease_duration: The amount of time for which the jobs are
+            leased
+        :param lease_owner: The name of the worker claiming the jobs
+        :return: The oldest registered jobs in the list, which are marked as
+            ``WORKING``
+        """
+        claimed_jobs = self.queue(number_of_jobs)
+
+        for job in claimed_jobs:
+            job.status = JobInterface.JobStatus.WORKING
+            job.lease_expires = datetime.utcnow() + lease_duration
+
+        return claimed_jobs
+
+    def extend_lease(
+            self,
+            job_id: UUID,
+            lease_duration: timedelta,
+            lease_owner: Optional[str]=None
+    ) -> Optional[datetime]:
+        """
+
+        :param job_id: The ID of the job whose lease is to be extended
+        :param lease_duration: The amount of time from now for which the
+            job is to stay leased
+        :param lease_owner: The name of the worker extending the lease
+        :return: The new lease expiry, or ``None`` if the job is not working
+        """
+        job = self._jobs[job_id]
+        if job.status != JobInterface.JobStatus.WORKING:
+            return None
+
+        job.lease_expires = datetime.utcnow() + lease_duration
+        return job.lease_expires
+
+    def requeue_expired_jobs(self) -> int:
+        """
+
+        :return: The number of working jobs whose leases had expired, and
+            which are now registered again
+        """
+        expired_jobs = [
+            job for job in self._jobs.values()
+            if job.status == JobInterface.JobStatus.WORKING and
+            job.lease_expires is not None and
+            job.lease_expires < datetime.utcnow()
+        ]
+        for job in expired_jobs:
+            job.status = JobInterface.JobStatus.REGISTERED
+            job.lease_expires = None
+
+        return len(expired_jobs)
+
+    @property
+    def _registered_jobs(self) -> Sequence[JobInterface]:
+        """
+
+        :return: The registered jobs in the list, sorted by the date on
+            which they were submitted
+        """
+        return sorted(
+            (job for job in self._jobs.values()
+             if job.status == JobInterface.JobStatus.REGISTERED),
+            key=lambda job: job.date_submitted
+        )
+
+    def page(
+            self, limit: int, after: Optional[UUID]=None
+    ) -> Sequence[JobInterface]:
+        """
+
+        :param limit: The maximum number of jobs on the page
+        :param after: The ID of the last job on the previous page
+        :return: The jobs on the page
+        """
+        jobs = sorted(
+            self._jobs.values(), key=lambda job: (job.date_submitted, job.id)
+        )
+        if after is not None:
+            previous_job = self._jobs[after]
+            jobs = [
+                job for job in jobs
+                if (job.date_submitted, job.id) >
+                (previous_job.date_submitted, previous_job.id)
+            ]
+        return jobs[:max(limit, 0)]
+
+    def stream_page(
+            self, limit: int, after: Optional[UUID]=None
+    ) -> Iterator[JobInterface]:
+        """
+
+        :param limit: The maximum number of jobs on the page
+        :param after: The ID of the last job on the previous page
+        :return: An iterator over the jobs on the page
+        """
+        return iter(self.page(limit, after))
+
+    def status_counts(self) -> Dict[JobInterface.JobStatus, int]:
+        """
+
+        :return: The number of jobs in the list with each status
+        """
+        return {
+            status: sum(
+                1 for job in self._jobs.values() if job.status == status
+            ) for status in JobInterface.JobStatus
+        }
+
+    def only(self, attributes: Iterable[str]) -> JobListInterface:
+        """
+
+        :param attributes: The attributes that the caller will read
+        :return: This list, since the jobs are already in memory
+        """
+        return self
+
+    def filter(
+            self,
+            statuses: Optional[Iterable[JobInterface.JobStatus]]=None,
+            service_id: Optional[UUID]=None,
+            submitted_after: Optional[datetime]=None,
+            submitted_before: Optional[datetime]=None
+    ) -> JobListInterface:
+        """
+        The generated jobs do not know which service they belong to, so
+        ``service_id`` is not checked
+
+        :param statuses: The statuses that the jobs may have
+        :param service_id: The ID of the service that the jobs belong to
+        :param submitted_after: The time after which the jobs were submitted
+        :param submitted_before: The time before which the jobs were
+            submitted
+        :return: A new list with the matching jobs
+        """
+        return JobList([
+            job for job in self._jobs.values()
+            if (statuses is None or job.status in statuses) and
+            (submitted_after is None or job.date_submitted > submitted_after)
+            and (submitted_before is None or
+                 job.date_submitted < submitted_before)
+        ])
+
+    def versions(self) -> Iterator[Tuple[UUID, int]]:
+        """
+
+        :return: The ID and version of each job in the list, in order of
+            job ID
+        """
+        return iter(sorted(
+            (job.id, job.version) for job in self._jobs.values()
+        ))
+
+    def jobs_with_ids(
+            self, job_ids: Iterable[UUID]
+    ) -> Dict[UUID, JobInterface]:
+        """
+
+        :param job_ids: The IDs of the jobs to get
+        :return: The jobs in this list with those IDs
+        """
+        return {
+            job_id: self._jobs[job_id] for job_id in job_ids
+            if job_id in self._jobs
+        }
+
     def __getitem__(self, job_id: UUID) -> JobInterface:
         """
 
@@ -0,0 +1,91 @@
+"""
+Contains generators for job sets and job set lists
+"""
+from hypothesis import settings
+from hypothesis.strategies import composite, uuids, text, lists
+from tests.unit.model_generators.job_list import JobList as MockJobList
+from tests.unit.model_generators.job_list import job_lists
+from topchef.models import JobSet as JobSetInterface
+from topchef.models import JobSetList as JobSetListInterface
+from topchef.models import JobList as JobListInterface
+from typing import Iterable, Iterator
+from uuid import UUID, uuid4
+
+
+class JobSet(JobSetInterface):
+    """
+    A minimal implementation of the ``JobSetInterface`` that can be easily
+    generated using hypothesis
+    """
+    def __init__(
+            self, job_set_id: UUID, description: str,
+            job_list: JobListInterface
+    ) -> None:
+        """
+
+        :param job_set_id: The ID of the job set
+        :param description: The description of the job set
+        :param job_list: The jobs in the set
+        """
+        self._id = job_set_id
+        self._description = description
+        self._jobs = job_list
+
+    @property
+    def id(self) -> UUID:
+        return self._id
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+    @property
+    def jobs(self) -> JobListInterface:
+        return self._jobs
+
+    def __repr__(self) -> str:
+        return '%s(job_set_id=%s, description=%s, job_list=%s)' % (
+            self.__class__.__name__, self._id, self._description, self._jobs
+        )
+
+
+class JobSetList(JobSetListInterface):
+    """
+    Contains a mock implementation of the job set list interface
+    """
+    def __init__(self, job_set_sequence: Iterable[JobSetInterface]) -> None:
+        self._job_sets = {
+            job_set.id: job_set for job_set in job_set_sequence
+        }
+
+    def __getitem__(self, job_set_id: UUID) -> JobSetInterface:
+        return self._job_sets[job_set_id]
+
+    def __iter__(self) -> Iterator[JobSetInterface]:
+        return iter(self._job_sets.values())
+
+    def __len__(self) -> int:
+        return len(self._job_sets)
+
+    def new(self, description: str) -> JobSetInterface:
+        job_set = JobSet(uuid4(), description, MockJobList([]))
+        self._job_sets[job_set.id] = job_set
+        return job_set
+
+
+@composite
+@settings(deadline=None)
+def job_sets(
+        draw, ids=uuids(), descriptions=text(), job_set_job_lists=job_lists()
+) -> JobSetInterface:
+    return JobSet(draw(ids), draw(descriptions), draw(job_set_job_lists))
+
+
+@composite
+def job_set_lists(
+        draw, min_size=None, max_size=None, job_set_generator=job_sets()
+) -> JobSetListInterface:
+    return JobSetList(draw(lists(
+        job_set_generator, min_size=min_size, max_size=max_size,
+        unique_by=lambda job_set: job_set.id
+    )))
@@ -12,10 +12,10 @@ from topchef.models import Service as ServiceInterface
 from topchef.json_type import JSON_TYPE as JSON
 from uuid import UUID, uuid4
 from sqlalchemy.orm import Session
-from typing import Callable
+from typing import Callable, Sequence, Optional
 from topchef.database.models import Service as DatabaseService
 from topchef.database.models import Job as DatabaseJob
-from topchef.models import Job
+from topchef.models import Job, JobSet
 from topchef.models import JobList as JobListInterface
 from datetime import datetime, timedelta
 
@@ -56,11 +56,21 @@ class Service(ServiceInterface):
         self._jobs = job_list
         self._has_timed_out = False
         self._timeout = timeout
+        self._job_retention = None  # type: Optional[timedelta]
+        self._version = 1
 
     @property
     def id(self) -> UUID:
         return self._id
 
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def jobs_version(self) -> int:
+        return 1
+
     @property
     def name(self) -> str:
         return self._name
@@ -68,6 +78,7 @@ class Service(ServiceInterface):
     @name.setter
     def name(self, new_name: str) -> None:
         self._name = new_name
+        self._version += 1
 
     @property
     def description(self) -> str:
@@ -76,6 +87,7 @@ class Service(ServiceInterface):
     @description.setter
     def description(self, new_description: str) -> None:
         self._description = new_description
+        self._version += 1
 
     @property
     def job_registration_schema(self) -> JSON:
@@ -92,6 +104,7 @@ class Service(ServiceInterface):
     @is_service_available.setter
     def is_service_available(self, service_available: bool) -> None:
         self._is_service_available = service_available
+        self._version += 1
 
     @property
     def has_timed_out(self) -> bool:
@@ -111,6 +124,16 @@ class Service(ServiceInterface):
     @timeout.setter
     def timeout(self, new_timeout: int) -> None:
         self._timeout = new_timeout
+        self._version += 1
+
+    @property
+    def job_retention(self) -> Optional[timedelta]:
+        return self._job_retention
+
+    @job_retention.setter
+    def job_retention(self, new_retention: Optional[timedelta]) -> None:
+        self._job_retention = new_retention
+        self._version += 1
 
     @classmethod
     def new(
@@ -148,6 +171,17 @@ class Service(ServiceInterface):
 
         return new_job
 
+    def new_jobs(
+            self,
+            parameter_sets: Sequence[JSON],
+            job_set: Optional[JobSet]=None
+    ) -> Sequence[UUID]:
+        new_jobs = [self.new_job(parameters) for parameters in parameter_sets]
+        if job_set is not None:
+            for job in new_jobs:
+                job_set.jobs[job.id] = job
+        return [job.id for job in new_jobs]
+
     @property
     def jobs(self) -> JobListInterface:
         return self._jobs
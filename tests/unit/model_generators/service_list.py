@@ -9,7 +9,7 @@ from tests.unit.model_generators.service import Service as MockService
 from topchef.models import ServiceList as ServiceListInterface
 from topchef.models import Service as ServiceInterface
 from topchef.json_type import JSON_TYPE as JSON
-from typing import Iterable, Union, Iterator
+from typing import Dict, Iterable, List, Union, Iterator, Tuple
 from uuid import UUID
 
 
@@ -21,6 +21,7 @@ class _ServiceList(ServiceListInterface):
         self._services = {
             service.id: service for service in service_sequence
         }
+        self._jobs_awaiting_purge = {}  # type: Dict[UUID, List[UUID]]
 
     def __getitem__(self, service_id: UUID) -> ServiceInterface:
         return self._services[service_id]
@@ -29,7 +30,10 @@ class _ServiceList(ServiceListInterface):
         self._services[service_id] = service
 
     def __delitem__(self, service_id: UUID) -> None:
-        del self._services[service_id]
+        service = self._services.pop(service_id)
+        self._jobs_awaiting_purge[service_id] = [
+            job.id for job in service.jobs
+        ]
 
     def __contains__(self, item: Union[ServiceInterface, UUID]) -> bool:
         return item in self._services.keys() or item in self._services.values()
@@ -43,6 +47,44 @@ class _ServiceList(ServiceListInterface):
     def __len__(self) -> int:
         return len(self._services.keys())
 
+    def versions(self) -> Iterator[Tuple[UUID, int]]:
+        return iter(sorted(
+            (service.id, service.version)
+            for service in self._services.values()
+        ))
+
+    def filter_by_availability(self, is_available: bool) -> '_ServiceList':
+        return _ServiceList(
+            service for service in self._services.values()
+            if (service.is_service_available and not service.has_timed_out)
+            == is_available
+        )
+
+    def mark_timed_out_services_unavailable(self) -> int:
+        timed_out_services = [
+            service for service in self._services.values()
+            if service.is_service_available and service.has_timed_out
+        ]
+        for service in timed_out_services:
+            service.is_service_available = False
+        return len(timed_out_services)
+
+    def jobs_awaiting_purge(self, service_id: UUID) -> int:
+        return len(self._jobs_awaiting_purge[service_id])
+
+    def purge_deleted_services(self, max_jobs: int) -> int:
+        number_of_purged_jobs = 0
+        for service_id, job_ids in list(self._jobs_awaiting_purge.items()):
+            purged_job_ids = job_ids[:max_jobs - number_of_purged_jobs]
+            del job_ids[:len(purged_job_ids)]
+            number_of_purged_jobs += len(purged_job_ids)
+            if not job_ids and number_of_purged_jobs < max_jobs:
+                del self._jobs_awaiting_purge[service_id]
+        return number_of_purged_jobs
+
+    def check_in(self, service_id: UUID) -> None:
+        self._services[service_id].check_in()
+
     def new(
             self, name: str, description: str, registration_schema: JSON,
             result_schema: JSON
@@ -3,13 +3,21 @@ Contains unit tests for
 """
 import json
 import unittest
+from datetime import datetime
+from uuid import uuid4
 import unittest.mock as mock
 
 from flask import Request, jsonify, Response, Flask
 from sqlalchemy.orm import Session
+from werkzeug.datastructures import MultiDict, ETags
 
 from topchef.api.abstract_endpoints.abstract_endpoint import AbstractEndpoint
+from topchef.api.abstract_endpoints.abstract_endpoint import StreamedPage
+from topchef.api.abstract_endpoints.abstract_endpoint import parse_uuid
+from topchef.api.abstract_endpoints.meta_schema import MetaSchema
+from topchef.models.schema_registry import SchemaRegistry
 from topchef.models import APIError
+from topchef.models.errors import QueryParameterError, NotUUIDError
 
 
 class TestAbstractEndpoint(unittest.TestCase):
@@ -24,6 +32,7 @@ class TestAbstractEndpoint(unittest.TestCase):
         """
         self.session = mock.MagicMock(spec=Session)  # type: Session
         self.request = mock.MagicMock(spec=Request)  # type: Request
+        self.request.is_xhr = False
         self.endpoint = self.ConcreteGetEndpoint(
             self.session, self.request
         )
@@ -314,3 +323,241 @@ class TestDispatchRequest(TestAbstractEndpoint):
                 TestDispatchRequest.ConcreteAPIError(501)
             )
             return jsonify(dict())
+
+
+class TestJsonify(TestAbstractEndpoint):
+    """
+    Contains unit tests for leaving the ``meta`` object out of responses
+    """
+    document = {'data': {'value': 1}, 'meta': {'schema': {}}}
+
+    def test_meta_is_sent_by_default(self) -> None:
+        self.request.args = MultiDict()
+        response = self.endpoint.jsonify(self.document)
+        self.assertEqual(
+            self.document, json.loads(response.data.decode('utf-8'))
+        )
+
+    def test_meta_false(self) -> None:
+        self.request.args = MultiDict([('meta', 'false')])
+        response = self.endpoint.jsonify(self.document)
+        self.assertEqual(
+            {'data': {'value': 1}}, json.loads(response.data.decode('utf-8'))
+        )
+        self.assertIn('meta', self.document)
+
+    def test_same_bytes_as_flask(self) -> None:
+        self.request.args = MultiDict()
+        document = {
+            'data': [{'id': 'é', 'values': [1, 2.5, None, True]}, {}],
+            'links': {'self': 'http://localhost/'}
+        }
+        for pretty_print in (True, False):
+            self.app.config['JSONIFY_PRETTYPRINT_REGULAR'] = pretty_print
+            self.assertEqual(
+                jsonify(document).data,
+                self.endpoint.jsonify(document).data
+            )
+
+    def test_ajax_request_is_not_pretty_printed(self) -> None:
+        self.request.args = MultiDict()
+        self.request.is_xhr = True
+        self.app.config['JSONIFY_PRETTYPRINT_REGULAR'] = True
+        self.assertEqual(
+            b'{"data":{"value":1}}\n',
+            self.endpoint.jsonify({'data': {'value': 1}}).data
+        )
+
+    def test_types_that_are_not_json(self) -> None:
+        self.request.args = MultiDict()
+        document = {'data': {'id': uuid4(), 'date': datetime.utcnow()}}
+        self.assertEqual(
+            jsonify(document).data, self.endpoint.jsonify(document).data
+        )
+
+    def test_method_not_allowed_without_meta(self) -> None:
+        self.request.method = 'POST'
+        self.request.args = MultiDict([('meta', 'FALSE')])
+        response = self.endpoint.dispatch_request()
+        self.assertEqual(405, response.status_code)
+        self.assertNotIn('meta', json.loads(response.data.decode('utf-8')))
+
+
+class TestStreamedJsonify(TestAbstractEndpoint):
+    """
+    Contains unit tests for streaming JSON responses
+    """
+    def setUp(self) -> None:
+        super(TestStreamedJsonify, self).setUp()
+        self.request.args = MultiDict()
+
+    def test_same_bytes_as_flask(self) -> None:
+        items = [{'id': 'é', 'values': [1, 2.5, None, True]}, {}]
+        for pretty_print in (True, False):
+            self.app.config['JSONIFY_PRETTYPRINT_REGULAR'] = pretty_print
+            document = {'data': iter(items), 'meta': {'schema': {}}}
+            self.assertEqual(
+                jsonify({'data': items, 'meta': {'schema': {}}}).data,
+                self.endpoint.streamed_jsonify(document).data
+            )
+
+    def test_meta_false(self) -> None:
+        self.request.args = MultiDict([('meta', 'false')])
+        response = self.endpoint.streamed_jsonify(
+            {'data': iter([1]), 'meta': {'schema': {}}}
+        )
+        self.assertEqual(
+            {'data': [1]}, json.loads(response.data.decode('utf-8'))
+        )
+
+    def test_session_is_closed_after_body(self) -> None:
+        response = self.endpoint.streamed_jsonify({'data': iter([1, 2])})
+        self.assertFalse(self.session.close.called)
+        _ = response.data
+        self.assertTrue(self.session.close.called)
+
+
+class TestStreamedPage(unittest.TestCase):
+    """
+    Contains unit tests for :class:`StreamedPage`
+    """
+    def test_last_job(self) -> None:
+        page = StreamedPage(iter(['first', 'second']))
+        with self.assertRaises(IndexError):
+            _ = page[-1]
+
+        self.assertEqual(['first', 'second'], list(page))
+        self.assertEqual(2, len(page))
+        self.assertEqual('second', page[-1])
+
+
+class TestPrecomputeMetaSchemas(TestAbstractEndpoint):
+    """
+    Contains unit tests for building the schemas of an endpoint before any
+    request is made
+    """
+    def test_error_schema_is_built(self) -> None:
+        with mock.patch.object(
+                MetaSchema, 'document_for', autospec=True
+        ) as document_for:
+            self.ConcreteGetEndpoint.precompute_meta_schemas()
+        document_for.assert_any_call(
+            mock.ANY, self.ConcreteGetEndpoint
+        )
+
+
+class TestSchemaReference(TestAbstractEndpoint):
+    """
+    Contains unit tests for referring to published schemas
+    """
+    def setUp(self) -> None:
+        super(TestSchemaReference, self).setUp()
+        self.schema = SchemaRegistry().register({'type': 'object'})
+
+    def test_reference(self) -> None:
+        self.app.add_url_rule(
+            '/schemas/<schema_fingerprint>', endpoint='SchemaDetail'
+        )
+        self.assertEqual(
+            {'$ref': 'http://localhost/schemas/%s' % self.schema.fingerprint},
+            self.endpoint.schema_reference(self.schema)
+        )
+
+    def test_schema_is_inlined_if_schemas_are_not_served(self) -> None:
+        self.assertIs(self.schema, self.endpoint.schema_reference(self.schema))
+
+
+class TestConditionalResponse(TestAbstractEndpoint):
+    """
+    Contains unit tests for answering requests that carry ``If-None-Match``
+    """
+    def setUp(self) -> None:
+        super(TestConditionalResponse, self).setUp()
+        self.request.query_string = b''
+        self.request.if_none_match = ETags()
+        self.build_response = mock.MagicMock(
+            return_value=jsonify({'status': 'success'})
+        )
+
+    def test_entity_tag_depends_on_versions(self) -> None:
+        self.assertEqual(
+            self.endpoint.entity_tag('id', 1),
+            self.endpoint.entity_tag('id', 1)
+        )
+        self.assertNotEqual(
+            self.endpoint.entity_tag('id', 1),
+            self.endpoint.entity_tag('id', 2)
+        )
+
+    def test_entity_tag_depends_on_query_string(self) -> None:
+        etag = self.endpoint.entity_tag('id', 1)
+        self.request.query_string = b'meta=false'
+        self.assertNotEqual(etag, self.endpoint.entity_tag('id', 1))
+
+    def test_version_digest(self) -> None:
+        self.assertNotEqual(
+            self.endpoint.version_digest([('a', 1), ('b', 1)]),
+            self.endpoint.version_digest([('a', 1), ('b', 2)])
+        )
+
+    def test_response_is_built_without_matching_tag(self) -> None:
+        response = self.endpoint.conditional_response(
+            'tag', self.build_response
+        )
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(('tag', False), response.get_etag())
+        self.build_response.assert_called_once_with()
+
+    def test_not_modified(self) -> None:
+        self.request.if_none_match = ETags(['tag'])
+        response = self.endpoint.conditional_response(
+            'tag', self.build_response
+        )
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(('tag', False), response.get_etag())
+        self.assertFalse(self.build_response.called)
+
+    def test_not_modified_compressed(self) -> None:
+        self.request.if_none_match = ETags(['tag-gzip'])
+        response = self.endpoint.conditional_response(
+            'tag', self.build_response
+        )
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(('tag-gzip', False), response.get_etag())
+        self.assertFalse(self.build_response.called)
+
+
+class TestGetBooleanQueryParameter(TestAbstractEndpoint):
+    """
+    Contains unit tests for the ``get_boolean_query_parameter`` method
+    """
+    def test_missing_parameter(self) -> None:
+        self.request.args = MultiDict()
+        self.assertIsNone(self.endpoint.get_boolean_query_parameter('flag'))
+
+    def test_boolean_values(self) -> None:
+        for raw_value, value in (('true', True), ('False', False)):
+            self.request.args = MultiDict({'flag': raw_value})
+            self.assertEqual(
+                value, self.endpoint.get_boolean_query_parameter('flag')
+            )
+
+    def test_value_that_is_not_boolean(self) -> None:
+        self.request.args = MultiDict({'flag': 'yes'})
+        with self.assertRaises(QueryParameterError):
+            self.endpoint.get_boolean_query_parameter('flag')
+
+
+
+class TestParseUUID(unittest.TestCase):
+    """
+    Contains unit tests for :func:`parse_uuid`
+    """
+    def test_uuid(self) -> None:
+        identifier = uuid4()
+        self.assertEqual(identifier, parse_uuid(str(identifier)))
+        self.assertEqual(identifier, parse_uuid(identifier))
+
+    def test_value_that_is_not_uuid(self) -> None:
+        with self.assertRaises(NotUUIDError):
+            parse_uuid('not-a-uuid')
@@ -0,0 +1,76 @@
+"""
+Contains unit tests for :mod:`topchef.api.abstract_endpoints.meta_schema`
+"""
+import unittest
+import unittest.mock as mock
+from topchef.api.abstract_endpoints.meta_schema import MetaSchema
+from topchef.models.schema_registry import SchemaRegistry
+
+
+class TestMetaSchema(unittest.TestCase):
+    """
+    Base class for testing the descriptor
+    """
+    def setUp(self) -> None:
+        self.build = mock.MagicMock(
+            return_value={'type': 'object', 'required': ['value']}
+        )
+        self.build.__name__ = 'schema'
+
+        class Endpoint(object):
+            schema = MetaSchema(self.build)
+
+        class SubEndpoint(Endpoint):
+            pass
+
+        self.endpoint_class = Endpoint
+        self.subclass = SubEndpoint
+
+
+class TestGet(TestMetaSchema):
+    """
+    Contains unit tests for reading the schema
+    """
+    def test_schema_is_built_once(self) -> None:
+        self.assertEqual(
+            self.endpoint_class.schema, self.endpoint_class().schema
+        )
+        self.build.assert_called_once_with(self.endpoint_class)
+
+    def test_schema_is_built_for_each_class(self) -> None:
+        self.endpoint_class().schema
+        self.subclass().schema
+        self.assertEqual(2, self.build.call_count)
+
+    def test_schema_is_read_only(self) -> None:
+        schema = self.endpoint_class.schema
+        with self.assertRaises(TypeError):
+            schema['type'] = 'array'
+        with self.assertRaises(TypeError):
+            schema['required'].append('other_value')
+
+
+class TestPrecompute(TestMetaSchema):
+    """
+    Contains unit tests for the ``precompute`` method
+    """
+    def test_precompute_builds_inherited_schemas(self) -> None:
+        MetaSchema.precompute(self.subclass)
+        self.build.assert_called_once_with(self.subclass)
+        self.subclass.schema
+        self.assertEqual(1, self.build.call_count)
+
+
+class TestRegistry(TestMetaSchema):
+    """
+    Contains unit tests for publishing the schema
+    """
+    def test_schema_is_published(self) -> None:
+        registry = SchemaRegistry()
+
+        class Endpoint(object):
+            schema = MetaSchema(self.build, registry=registry)
+
+        self.assertIs(
+            Endpoint.schema, registry[Endpoint.schema.fingerprint]
+        )
@@ -0,0 +1,33 @@
+"""
+Contains unit tests for :mod:`topchef.api.entity_tags`
+"""
+import unittest
+from werkzeug.datastructures import ETags
+from topchef.api.entity_tags import encoded_entity_tag, matching_entity_tag
+
+
+class TestEncodedEntityTag(unittest.TestCase):
+    """
+    Contains unit tests for the ``encoded_entity_tag`` function
+    """
+    def test_strong_tag(self) -> None:
+        self.assertEqual('"tag-gzip"', encoded_entity_tag('"tag"', 'gzip'))
+
+    def test_weak_tag(self) -> None:
+        self.assertEqual('W/"tag"', encoded_entity_tag('W/"tag"', 'gzip'))
+
+
+class TestMatchingEntityTag(unittest.TestCase):
+    """
+    Contains unit tests for the ``matching_entity_tag`` function
+    """
+    def test_uncompressed_tag(self) -> None:
+        self.assertEqual('tag', matching_entity_tag('tag', ETags(['tag'])))
+
+    def test_compressed_tag(self) -> None:
+        self.assertEqual(
+            'tag-deflate', matching_entity_tag('tag', ETags(['tag-deflate']))
+        )
+
+    def test_no_match(self) -> None:
+        self.assertIsNone(matching_entity_tag('tag', ETags(['other'])))
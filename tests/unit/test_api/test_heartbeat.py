@@ -0,0 +1,80 @@
+"""
+Contains unit tests for the ``/services/<service_id>/heartbeat`` endpoint
+"""
+import unittest
+import unittest.mock as mock
+from uuid import uuid4
+from sqlalchemy.orm import Session
+from flask import Request, Flask
+from hypothesis import given
+from tests.unit.model_generators.service import services
+from tests.unit.model_generators.service_list import _ServiceList
+from topchef.api.heartbeat import Heartbeat
+from topchef.models import Service
+from topchef.models.errors import NotUUIDError, ServiceWithUUIDNotFound
+
+
+class TestHeartbeat(unittest.TestCase):
+    """
+    Base class for unit testing the ``Heartbeat`` endpoint
+    """
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+        self.session = mock.MagicMock(spec=Session)
+        self.request = mock.MagicMock(spec=Request)
+        app = Flask(__name__)
+        app.add_url_rule(
+            '/<service_id>/heartbeat', view_func=Heartbeat.as_view(
+                Heartbeat.__name__,
+            )
+        )
+        self.context = app.test_request_context()
+        self.context.push()
+
+    def tearDown(self) -> None:
+        """
+        Pop the context
+        """
+        self.context.pop()
+
+
+class TestPost(TestHeartbeat):
+    """
+    Contains unit tests for the ``post`` method
+    """
+    @given(services())
+    def test_post(self, service: Service) -> None:
+        """
+        Tests that the service is checked in, and that nothing is returned
+
+        :param service: The randomly-generated service to test
+        """
+        service_list = _ServiceList([service])
+        endpoint = Heartbeat(self.session, self.request, service_list)
+
+        with mock.patch.object(service, 'check_in') as check_in:
+            response = endpoint.post(str(service.id))
+
+        self.assertEqual(204, response.status_code)
+        self.assertEqual(b'', response.data)
+        self.assertEqual(mock.call(), check_in.call_args)
+
+    def test_post_service_not_found(self) -> None:
+        """
+        Tests that a 404 error is thrown if the service does not exist
+        """
+        endpoint = Heartbeat(self.session, self.request, _ServiceList([]))
+
+        with self.assertRaises(ServiceWithUUIDNotFound):
+            endpoint.post(str(uuid4()))
+
+    def test_post_service_id_not_uuid(self) -> None:
+        """
+        Tests that an error is thrown if the service ID is not a UUID
+        """
+        endpoint = Heartbeat(self.session, self.request, _ServiceList([]))
+
+        with self.assertRaises(NotUUIDError):
+            endpoint.post('not a UUID')
@@ -6,11 +6,13 @@ import unittest.mock as mock
 from jsonschema import Draft4Validator, ValidationError
 from sqlalchemy.orm import Session
 from flask import Request, Flask
+from werkzeug.datastructures import ETags
 from hypothesis import given, assume
 from hypothesis.strategies import sampled_from, dictionaries, text
 from tests.unit.model_generators.job import jobs
-from topchef.api.job_detail import JobDetail
-from topchef.models import Job
+from topchef.api.job_detail import JobDetail, JobDetailForJobID
+from topchef.models import Job, JobArchive, JobList
+from topchef.models.errors import JobWithUUIDNotFound
 
 
 class TestJobDetail(unittest.TestCase):
@@ -29,6 +31,11 @@ class TestJobDetail(unittest.TestCase):
                 JobDetail.__name__,
             )
         )
+        app.add_url_rule(
+            '/<job_id>', view_func=JobDetailForJobID.as_view(
+                JobDetailForJobID.__name__,
+            )
+        )
         self.context = app.test_request_context()
         self.context.push()
 
@@ -53,6 +60,84 @@ class TestGet(TestJobDetail):
         response = endpoint.get(job)
         self.assertEqual(200, response.status_code)
 
+    @given(jobs())
+    def test_get_not_modified(self, job: Job) -> None:
+        """
+
+        :param job: The randomly-generated job to test
+        """
+        self.request.query_string = b''
+        endpoint = JobDetail(self.session, self.request)
+        etag, _ = endpoint.get(job).get_etag()
+
+        self.request.if_none_match = ETags([etag])
+        self.assertEqual(304, endpoint.get(job).status_code)
+
+        job.status = Job.JobStatus.COMPLETED
+        self.assertEqual(200, endpoint.get(job).status_code)
+
+
+class TestArchivedJob(TestJobDetail):
+    """
+    Contains unit tests for looking up jobs that have been archived
+    """
+    def setUp(self) -> None:
+        """
+        Create a job list that does not have any jobs, and an archive
+        """
+        TestJobDetail.setUp(self)
+        self.job_list = mock.MagicMock(spec=JobList)
+        self.job_list.__getitem__.side_effect = KeyError
+        self.job_archive = mock.MagicMock(spec=JobArchive)
+        self.endpoint = JobDetailForJobID(
+            self.session, self.request, self.job_list,
+            job_archive=self.job_archive
+        )
+
+    @given(jobs())
+    def test_get_archived_job(self, job: Job) -> None:
+        """
+        Tests that a job that is not in the job list is read from the
+        archive
+
+        :param job: The randomly-generated job to archive
+        """
+        self.job_archive.__getitem__.side_effect = None
+        self.job_archive.__getitem__.return_value = job
+
+        response = self.endpoint.get(str(job.id))
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            mock.call(job.id), self.job_archive.__getitem__.call_args
+        )
+
+    @given(jobs())
+    def test_get_job_not_found(self, job: Job) -> None:
+        """
+        Tests that a job that is in neither the job list nor the archive is
+        not found
+
+        :param job: The randomly-generated job to look for
+        """
+        self.job_archive.__getitem__.side_effect = KeyError
+
+        with self.assertRaises(JobWithUUIDNotFound):
+            self.endpoint.get(str(job.id))
+
+    @given(jobs())
+    def test_patch_archived_job(self, job: Job) -> None:
+        """
+        Tests that archived jobs cannot be modified
+
+        :param job: The randomly-generated job to archive
+        """
+        self.job_archive.__getitem__.return_value = job
+
+        with self.assertRaises(JobWithUUIDNotFound):
+            self.endpoint.patch(str(job.id))
+        self.assertFalse(self.job_archive.__getitem__.called)
+
 
 class TestPatch(TestJobDetail):
     """
@@ -1,14 +1,21 @@
 """
 Contains unit tests for the job queue endpoint
 """
+import json
 import unittest
 import unittest.mock as mock
 from sqlalchemy.orm import Session
 from flask import Request, Flask
+from werkzeug.datastructures import MultiDict
 from topchef.api.job_queue import JobQueueForService
 from topchef.models import Service, ServiceList
 from tests.unit.model_generators.service import services
+from tests.unit.model_generators.job_list import job_lists
+from tests.unit.model_generators.job import registered_jobs
+from topchef.config import config
+from topchef.models.errors import QueryParameterError
 from hypothesis import given, assume, settings
+from hypothesis.strategies import integers
 from typing import Sized
 
 
@@ -16,6 +23,7 @@ class TestJobQueue(unittest.TestCase):
     def setUp(self) -> None:
         self.session = mock.MagicMock(spec=Session)  # type: Session
         self.request = mock.MagicMock(spec=Request)  # type: Request
+        self.request.args = MultiDict()
         self.service_list = mock.MagicMock(
             spec=ServiceList
         )  # type: ServiceList
@@ -58,3 +66,50 @@ class TestGet(TestJobQueue):
         return set(filter(
             lambda job: job.status is job.JobStatus.REGISTERED, service.jobs
         ))
+
+    @given(
+        services(
+            service_job_lists=job_lists(min_size=1, jobs=registered_jobs())
+        ),
+        integers(min_value=1, max_value=config.MAXIMUM_QUEUE_DEPTH)
+    )
+    def test_depth(self, service: Service, depth: int) -> None:
+        self.request.args = MultiDict([('depth', str(depth))])
+        endpoint = JobQueueForService(
+            self.session, self.request, self.service_list
+        )
+        response = endpoint.get(service)
+        self.assertEqual(200, response.status_code)
+
+        data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertEqual(min(depth, len(service.jobs)), len(data))
+        self.assertEqual(
+            sorted(job['date_submitted'] for job in data),
+            [job['date_submitted'] for job in data]
+        )
+
+    @given(
+        services(
+            service_job_lists=job_lists(min_size=1, jobs=registered_jobs())
+        )
+    )
+    def test_fields(self, service: Service) -> None:
+        self.request.args = MultiDict([('fields', 'id,status')])
+        endpoint = JobQueueForService(
+            self.session, self.request, self.service_list
+        )
+        response = endpoint.get(service)
+        self.assertEqual(200, response.status_code)
+
+        data = json.loads(response.data.decode('utf-8'))['data']
+        for job in data:
+            self.assertEqual({'id', 'status'}, set(job.keys()))
+
+    @given(services())
+    def test_unknown_field(self, service: Service) -> None:
+        self.request.args = MultiDict([('fields', 'id,secrets')])
+        endpoint = JobQueueForService(
+            self.session, self.request, self.service_list
+        )
+        with self.assertRaises(QueryParameterError):
+            endpoint.get(service)
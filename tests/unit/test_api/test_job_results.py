@@ -0,0 +1,126 @@
+"""
+Contains unit tests for the ``/jobs/<job_id>/results`` endpoint
+"""
+import json
+import tempfile
+import unittest
+import unittest.mock as mock
+from sqlalchemy.orm import Session
+from flask import Request, Flask
+from werkzeug.datastructures import ETags
+from hypothesis import given
+from tests.unit.model_generators.job import jobs
+from topchef.api.job_results import JobResults, JobResultsForJobID
+from topchef.models import Job, JobArchive, JobList
+from topchef.models.blob_store import BlobStore
+
+
+class TestJobResults(unittest.TestCase):
+    """
+    Base class for unit testing the ``JobResults`` endpoint
+    """
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+        self.session = mock.MagicMock(spec=Session)
+        self.request = mock.MagicMock(spec=Request)
+        self.request.if_none_match = ETags()
+        app = Flask(__name__)
+        app.add_url_rule(
+            '/<job_id>', view_func=JobResultsForJobID.as_view(
+                JobResultsForJobID.__name__,
+            )
+        )
+        self.context = app.test_request_context()
+        self.context.push()
+
+    def tearDown(self) -> None:
+        """
+        Pop the context
+        """
+        self.context.pop()
+
+
+class TestGet(TestJobResults):
+    """
+    Contains unit tests for the get method
+    """
+    @given(jobs())
+    def test_get(self, job: Job) -> None:
+        """
+        Tests that the response contains the results of the job
+
+        :param job: The randomly-generated job to test
+        """
+        endpoint = JobResults(self.session, self.request)
+        response = endpoint.get(job)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            job.results, json.loads(response.data.decode('utf-8'))
+        )
+
+    @given(jobs())
+    def test_get_not_modified(self, job: Job) -> None:
+        """
+        Tests that the results are not sent again if the job has not
+        changed
+
+        :param job: The randomly-generated job to test
+        """
+        endpoint = JobResults(self.session, self.request)
+        etag, _ = endpoint.get(job).get_etag()
+
+        self.request.if_none_match = ETags([etag])
+        self.assertEqual(304, endpoint.get(job).status_code)
+
+        job.status = Job.JobStatus.COMPLETED
+        self.assertEqual(200, endpoint.get(job).status_code)
+
+    def test_get_from_blob_store(self) -> None:
+        """
+        Tests that results kept in the blob store are streamed from it,
+        and that the blob is closed once the response is closed
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            blob_store = BlobStore(directory, chunk_size=4)
+            contents = b'{"counts": [1, 2, 3, 4, 5, 6, 7, 8, 9]}'
+            reader = blob_store.open(blob_store.put(contents))
+            job = mock.MagicMock(spec=Job)
+            job.encoded_results.return_value = reader
+
+            endpoint = JobResults(self.session, self.request)
+            response = endpoint.get(job)
+
+            self.assertEqual(len(contents), response.content_length)
+            self.assertEqual(contents, b''.join(response.response))
+            response.close()
+            with self.assertRaises(ValueError):
+                reader.read()
+
+
+class TestArchivedJob(TestJobResults):
+    """
+    Contains unit tests for reading the results of archived jobs
+    """
+    @given(jobs())
+    def test_get_archived_job(self, job: Job) -> None:
+        """
+        Tests that the results of a job that is not in the job list are
+        read from the archive
+
+        :param job: The randomly-generated job to archive
+        """
+        job_list = mock.MagicMock(spec=JobList)
+        job_list.__getitem__.side_effect = KeyError
+        job_archive = mock.MagicMock(spec=JobArchive)
+        job_archive.__getitem__.return_value = job
+
+        endpoint = JobResultsForJobID(
+            self.session, self.request, job_list, job_archive
+        )
+        response = endpoint.get(str(job.id))
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(mock.call(job.id), job_archive.__getitem__.call_args)
@@ -0,0 +1,133 @@
+"""
+Contains unit tests for the ``/job_sets/<job_set_id>`` endpoint
+"""
+import json
+import unittest
+import unittest.mock as mock
+from uuid import uuid4
+from sqlalchemy.orm import Session
+from flask import Request, Flask
+from werkzeug.datastructures import MultiDict
+from hypothesis import given
+from tests.unit.model_generators.job_list import job_lists
+from tests.unit.model_generators.job_set import job_sets, JobSetList
+from topchef.api.job_set_detail import JobSetDetail
+from topchef.models import JobSet
+from topchef.models.errors import NotUUIDError, JobSetWithUUIDNotFound
+from topchef.models.errors import QueryParameterError
+
+
+class TestJobSetDetail(unittest.TestCase):
+    """
+    Base class for unit testing the ``JobSetDetail`` endpoint
+    """
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+        self.session = mock.MagicMock(spec=Session)
+        self.request = mock.MagicMock(spec=Request)
+        self.request.args = MultiDict()
+        app = Flask(__name__)
+        app.add_url_rule(
+            '/<job_set_id>', view_func=JobSetDetail.as_view(
+                JobSetDetail.__name__
+            )
+        )
+        self.context = app.test_request_context()
+        self.context.push()
+
+    def tearDown(self) -> None:
+        """
+        Pop the context
+        """
+        self.context.pop()
+
+
+class TestGet(TestJobSetDetail):
+    """
+    Contains unit tests for the ``get`` method
+    """
+    @given(job_sets())
+    def test_get(self, job_set: JobSet) -> None:
+        """
+        Tests that the progress of the job set is reported
+
+        :param job_set: The randomly-generated job set to test
+        """
+        endpoint = JobSetDetail(
+            self.session, self.request, JobSetList([job_set])
+        )
+        response = endpoint.get(str(job_set.id))
+
+        self.assertEqual(200, response.status_code)
+        data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertEqual(len(job_set.jobs), data['total'])
+        self.assertEqual(
+            {status.name: count
+             for status, count in job_set.jobs.status_counts().items()},
+            data['progress']
+        )
+
+    @given(job_sets(job_set_job_lists=job_lists(min_size=3, max_size=3)))
+    def test_pages(self, job_set: JobSet) -> None:
+        """
+        Tests that following the ``next`` links visits every job in the set
+        exactly once
+
+        :param job_set: The randomly-generated job set to test
+        """
+        endpoint = JobSetDetail(
+            self.session, self.request, JobSetList([job_set])
+        )
+        seen_job_ids = []
+        self.request.args = MultiDict({'limit': '2'})
+
+        response_body = json.loads(
+            endpoint.get(str(job_set.id)).data.decode('utf-8')
+        )
+        seen_job_ids.extend(job['id'] for job in response_body['data']['jobs'])
+        self.assertIn('next', response_body['links'])
+
+        self.request.args = MultiDict({
+            'limit': '2', 'after': seen_job_ids[-1]
+        })
+        response_body = json.loads(
+            endpoint.get(str(job_set.id)).data.decode('utf-8')
+        )
+        seen_job_ids.extend(job['id'] for job in response_body['data']['jobs'])
+        self.assertNotIn('next', response_body['links'])
+
+        self.assertEqual(
+            sorted(str(job.id) for job in job_set.jobs), sorted(seen_job_ids)
+        )
+
+    @given(job_sets())
+    def test_after_not_in_set(self, job_set: JobSet) -> None:
+        """
+        Tests that paging from a job outside the set is refused
+
+        :param job_set: The randomly-generated job set to test
+        """
+        self.request.args = MultiDict({'after': str(uuid4())})
+        endpoint = JobSetDetail(
+            self.session, self.request, JobSetList([job_set])
+        )
+        with self.assertRaises(QueryParameterError):
+            endpoint.get(str(job_set.id))
+
+    def test_not_uuid(self) -> None:
+        """
+        Tests that a job set ID that is not a UUID is refused
+        """
+        endpoint = JobSetDetail(self.session, self.request, JobSetList([]))
+        with self.assertRaises(NotUUIDError):
+            endpoint.get('not a UUID')
+
+    def test_not_found(self) -> None:
+        """
+        Tests that an unknown job set ID is reported
+        """
+        endpoint = JobSetDetail(self.session, self.request, JobSetList([]))
+        with self.assertRaises(JobSetWithUUIDNotFound):
+            endpoint.get(str(uuid4()))
@@ -0,0 +1,151 @@
+"""
+Contains unit tests for the ``/services/<service_id>/job_sets`` endpoint
+"""
+import json
+import unittest
+import unittest.mock as mock
+from sqlalchemy.orm import Session
+from flask import Request, Flask
+from werkzeug.datastructures import MultiDict
+from hypothesis import given
+from hypothesis.strategies import lists, fixed_dictionaries, dictionaries
+from hypothesis.strategies import text
+from jsonschema import Draft4Validator as JSONSchemaValidator
+from tests.unit.model_generators.job_list import job_lists
+from tests.unit.model_generators.job_set import JobSetList
+from tests.unit.model_generators.service import services
+from topchef.api.job_set_detail import JobSetDetail
+from topchef.api.job_sets_for_service import JobSetsForService
+from topchef.models import Service, ServiceList
+
+
+class TestJobSetsForService(unittest.TestCase):
+    """
+    Base class for unit testing the ``JobSetsForService`` endpoint
+    """
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+        self.session = mock.MagicMock(spec=Session)
+        self.request = mock.MagicMock(spec=Request)
+        self.request.args = MultiDict()
+        self.service_list = mock.MagicMock(spec=ServiceList)
+        self.validator = mock.MagicMock(spec=JSONSchemaValidator)
+        self.validator.iter_errors = mock.MagicMock(return_value=[])
+        self.validator_factory = mock.MagicMock(return_value=self.validator)
+        app = Flask(__name__)
+        app.add_url_rule(
+            '/<job_set_id>', view_func=JobSetDetail.as_view(
+                JobSetDetail.__name__
+            )
+        )
+        self.context = app.test_request_context()
+        self.context.push()
+
+    def tearDown(self) -> None:
+        """
+        Pop the context
+        """
+        self.context.pop()
+
+
+class TestPost(TestJobSetsForService):
+    """
+    Contains unit tests for the ``post`` method
+    """
+    @given(
+        lists(
+            fixed_dictionaries({'parameters': dictionaries(text(), text())}),
+            min_size=1, max_size=10
+        ),
+        services(service_job_lists=job_lists(max_size=0))
+    )
+    def test_post(self, items: list, service: Service) -> None:
+        """
+        Tests that the job set is created along with all of its jobs
+
+        :param items: The jobs in the new set
+        :param service: The service for which the set is to be created
+        """
+        job_set_list = JobSetList([])
+        self.request.get_json = mock.MagicMock(
+            return_value={'description': 'sweep', 'jobs': items}
+        )
+        endpoint = JobSetsForService(
+            self.session, self.request, self.service_list, job_set_list,
+            self.validator_factory
+        )
+
+        response = endpoint.post(service)
+
+        self.assertEqual(201, response.status_code)
+        self.assertIn('Location', response.headers)
+        job_set = next(iter(job_set_list))
+        self.assertEqual(len(items), len(job_set.jobs))
+        self.assertEqual(
+            len(items),
+            json.loads(response.data.decode('utf-8'))['data']['total']
+        )
+
+    @given(services(service_job_lists=job_lists(max_size=0)))
+    def test_invalid_item(self, service: Service) -> None:
+        """
+        Tests that no job set is created if any of the jobs is invalid
+
+        :param service: The service for which the set is to be created
+        """
+        job_set_list = JobSetList([])
+        self.request.get_json = mock.MagicMock(return_value={
+            'description': 'sweep',
+            'jobs': [{'parameters': {}}, {'parameter': {}}]
+        })
+        endpoint = JobSetsForService(
+            self.session, self.request, self.service_list, job_set_list,
+            self.validator_factory
+        )
+
+        response = endpoint.post(service)
+
+        self.assertEqual(400, response.status_code)
+        self.assertEqual(
+            [1], [item['index'] for item in
+                  json.loads(response.data.decode('utf-8'))['errors']]
+        )
+        self.assertFalse(len(job_set_list))
+        self.assertFalse(len(service.jobs))
+
+    @given(services())
+    def test_no_description(self, service: Service) -> None:
+        """
+        Tests that the request is refused if it does not satisfy the new job
+        set schema
+
+        :param service: The service for which the set is to be created
+        """
+        self.request.get_json = mock.MagicMock(return_value={'jobs': []})
+        endpoint = JobSetsForService(
+            self.session, self.request, self.service_list, JobSetList([])
+        )
+
+        with self.assertRaises(endpoint.Abort):
+            endpoint.post(service)
+
+    @given(services())
+    def test_no_jobs(self, service: Service) -> None:
+        """
+        Tests that a job set without any jobs is refused
+
+        :param service: The service for which the set is to be created
+        """
+        self.request.get_json = mock.MagicMock(
+            return_value={'description': 'Empty', 'jobs': []}
+        )
+        job_set_list = JobSetList([])
+        endpoint = JobSetsForService(
+            self.session, self.request, self.service_list, job_set_list
+        )
+
+        with self.assertRaises(endpoint.Abort):
+            endpoint.post(service)
+        self.assertFalse(len(job_set_list))
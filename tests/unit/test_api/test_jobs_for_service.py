@@ -6,10 +6,13 @@ import unittest.mock as mock
 from tests.unit.test_api import TestAPI
 from sqlalchemy.orm import Session
 from flask import Request
+from werkzeug.datastructures import MultiDict
 from topchef.models import Service
 from hypothesis import given, assume
 from hypothesis.strategies import fixed_dictionaries, dictionaries, text
+from hypothesis.strategies import lists
 from tests.unit.model_generators.service import services
+from tests.unit.model_generators.job_list import job_lists
 from topchef.serializers import JobDetail as JobDetailSerializer
 from topchef.serializers import NewJob as NewJobSerializer
 from topchef.api.jobs_for_service import JobsForServiceEndpoint
@@ -25,6 +28,7 @@ class TestJobsForService(TestAPI):
         TestAPI.setUp(self)
         self.session = mock.MagicMock(spec=Session)
         self.request = mock.MagicMock(spec=Request)
+        self.request.args = MultiDict()
         self.service_list = mock.MagicMock(spec=ServiceList)
         self.testing_app.add_url_rule(
             '/test_url/<service_id>', view_func=JobsForServiceEndpoint.as_view(
@@ -53,9 +57,61 @@ class TestGet(TestJobsForService):
         serializer = JobDetailSerializer()
         self.assertEqual(
             json.loads(response.data.decode('utf-8'))['data'],
-            serializer.dump(service.jobs, many=True).data
+            serializer.dump(sorted(
+                service.jobs, key=lambda job: (job.date_submitted, job.id)
+            ), many=True).data
         )
 
+    @given(services(service_job_lists=job_lists(min_size=3, max_size=3)))
+    def test_get_pages(self, service: Service) -> None:
+        """
+        Tests that following the ``next`` links visits every job exactly
+        once
+
+        :param service: The service for which the endpoint is to be tested
+        """
+        endpoint = JobsForServiceEndpoint(
+            self.session, self.request, self.service_list
+        )
+        self.request.args = MultiDict({'limit': '2'})
+        first_page = json.loads(
+            endpoint.get(service).data.decode('utf-8')
+        )
+        self.assertIn('next', first_page['links'])
+
+        self.request.args = MultiDict({
+            'limit': '2', 'after': first_page['data'][-1]['id']
+        })
+        second_page = json.loads(
+            endpoint.get(service).data.decode('utf-8')
+        )
+        self.assertNotIn('next', second_page['links'])
+
+        self.assertEqual(
+            sorted(str(job.id) for job in service.jobs),
+            sorted(
+                job['id'] for job in first_page['data'] + second_page['data']
+            )
+        )
+
+
+    @given(services(service_job_lists=job_lists(min_size=1)))
+    def test_get_fields(self, service: Service) -> None:
+        """
+        Tests that only the requested attributes of each job are returned
+
+        :param service: The service for which the endpoint is to be tested
+        """
+        self.request.args = MultiDict({'fields': 'id, status'})
+        endpoint = JobsForServiceEndpoint(
+            self.session, self.request, self.service_list
+        )
+        response = endpoint.get(service)
+
+        self.assertEqual(200, response.status_code)
+        for job in json.loads(response.data.decode('utf-8'))['data']:
+            self.assertEqual({'id', 'status'}, set(job.keys()))
+
 
 class TestPost(TestJobsForService):
     """
@@ -142,3 +198,98 @@ class TestPost(TestJobsForService):
 
         self.assertEqual(response.status_code, 201)
         self.assertIn('Location', response.headers)
+
+
+class TestPostMany(TestJobsForService):
+    """
+    Contains unit tests for the ``POST`` method of this endpoint when it is
+    given an array of jobs
+    """
+    @given(
+        lists(
+            fixed_dictionaries({'parameters': dictionaries(text(), text())}),
+            min_size=1, max_size=10
+        ),
+        services()
+    )
+    def test_valid_post(self, items: list, service: Service) -> None:
+        """
+        Test that every job is created, and that the validator is only
+        built once
+
+        :param items: The jobs to create
+        :param service: The service for which the jobs are to be created
+        """
+        validator = mock.MagicMock(spec=JSONSchemaValidator)
+        validator.iter_errors = mock.MagicMock(return_value=[])
+        validator_factory = mock.MagicMock(return_value=validator)
+
+        self.request.get_json = mock.MagicMock(return_value=items)
+
+        endpoint = JobsForServiceEndpoint(
+            self.session, self.request, self.service_list, validator_factory
+        )
+        response = endpoint.post(service)
+
+        self.assertEqual(201, response.status_code)
+        validator_factory.assert_called_once_with(
+            service.job_registration_schema
+        )
+        response_data = json.loads(response.data.decode('utf-8'))
+        self.assertEqual(
+            list(range(len(items))),
+            [item['index'] for item in response_data['data']]
+        )
+        self.assertFalse(response_data['errors'])
+        for item in response_data['data']:
+            self.assertIn(item['id'], (str(job.id) for job in service.jobs))
+
+    @given(services())
+    def test_invalid_items_reported_by_index(self, service: Service) -> None:
+        """
+        Test that an item that cannot be deserialized is rejected, while
+        the valid items around it are still created
+
+        :param service: The service for which the jobs are to be created
+        """
+        items = [{'parameters': {}}, {'parameter': {}}, {'parameters': {}}]
+        validator = mock.MagicMock(spec=JSONSchemaValidator)
+        validator.iter_errors = mock.MagicMock(return_value=[])
+        validator_factory = mock.MagicMock(return_value=validator)
+
+        self.request.get_json = mock.MagicMock(return_value=items)
+
+        endpoint = JobsForServiceEndpoint(
+            self.session, self.request, self.service_list, validator_factory
+        )
+        response = endpoint.post(service)
+
+        self.assertEqual(201, response.status_code)
+        response_data = json.loads(response.data.decode('utf-8'))
+        self.assertEqual(
+            [0, 2], [item['index'] for item in response_data['data']]
+        )
+        self.assertEqual(
+            [1], [item['index'] for item in response_data['errors']]
+        )
+        self.assertTrue(response_data['errors'][0]['errors'])
+
+    @given(services())
+    def test_nothing_created(self, service: Service) -> None:
+        """
+        Test that the request fails if none of the jobs are valid
+
+        :param service: The service for which the jobs are to be created
+        """
+        self.request.get_json = mock.MagicMock(return_value=[1, 'job'])
+
+        endpoint = JobsForServiceEndpoint(
+            self.session, self.request, self.service_list
+        )
+        response = endpoint.post(service)
+
+        self.assertEqual(400, response.status_code)
+        response_data = json.loads(response.data.decode('utf-8'))
+        self.assertEqual(
+            [0, 1], [item['index'] for item in response_data['errors']]
+        )
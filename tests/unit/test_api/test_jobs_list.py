@@ -5,12 +5,17 @@ import unittest
 import json
 import unittest.mock as mock
 from flask import Request, Flask
+from werkzeug.datastructures import MultiDict
 from sqlalchemy.orm import Session
 from topchef.api import JobsList
 from topchef.models import JobList as JobListInterface
 from topchef.serializers import JobOverview
 from hypothesis import given
+from uuid import uuid4
+from jsonschema import Draft4Validator as JSONSchemaValidator
 from tests.unit.model_generators import job_lists
+from tests.unit.model_generators.job_list import JobList
+from topchef.models.errors import QueryParameterError
 
 
 class TestJobList(unittest.TestCase):
@@ -23,6 +28,7 @@ class TestJobList(unittest.TestCase):
         handle these fake requests
         """
         self.request = mock.MagicMock(spec=Request)
+        self.request.args = MultiDict()
         self.session = mock.MagicMock(spec=Session)
 
         self._app = Flask(__name__)
@@ -94,7 +100,197 @@ class TestGet(TestJobList):
             self.serialize_jobs(job_list)
         )
 
+    @given(job_lists(min_size=1, max_size=1))
+    def test_get_last_page(self, job_list: JobListInterface) -> None:
+        """
+        Tests that the ``next`` link is present while a page is full, and
+        absent once the last job has been returned
+
+        :param job_list: The randomly-generated list of one job
+        """
+        endpoint = JobsList(self.session, self.request, job_list)
+        self.request.args = MultiDict({'limit': '1'})
+        first_page = json.loads(endpoint.get().data.decode('utf-8'))
+        self.assertIn('next', first_page['links'])
+
+        self.request.args = MultiDict({
+            'limit': '1', 'after': first_page['data'][0]['id']
+        })
+        second_page = json.loads(endpoint.get().data.decode('utf-8'))
+        self.assertFalse(second_page['data'])
+        self.assertNotIn('next', second_page['links'])
+
     @staticmethod
     def serialize_jobs(job_list: JobListInterface) -> dict:
         serializer = JobOverview()
-        return serializer.dump(job_list, many=True).data
+        return serializer.dump(sorted(
+            job_list, key=lambda job: (job.date_submitted, job.id)
+        ), many=True).data
+
+
+class TestGetWithFilters(TestJobList):
+    """
+    Contains unit tests for the filters of the ``GET`` request handler
+    """
+    @given(job_lists())
+    def test_status_filter(self, job_list: JobListInterface) -> None:
+        """
+        Tests that only jobs with the requested statuses are returned, and
+        that they are all counted
+
+        :param job_list: The randomly-generated jobs to filter
+        """
+        self.request.args = MultiDict({
+            'status': 'registered,WORKING', 'count': 'true'
+        })
+        endpoint = JobsList(self.session, self.request, job_list)
+        response = endpoint.get()
+
+        self.assertEqual(200, response.status_code)
+        response_data = json.loads(response.data.decode('utf-8'))
+        matching_jobs = [
+            job for job in job_list if job.status in
+            (job.JobStatus.REGISTERED, job.JobStatus.WORKING)
+        ]
+        self.assertEqual(len(matching_jobs), response_data['meta']['total'])
+        self.assertEqual(
+            {str(job.id) for job in matching_jobs},
+            {job['id'] for job in response_data['data']}
+        )
+
+    def test_no_count_by_default(self) -> None:
+        """
+        Tests that the jobs are only counted if the client asks for it
+        """
+        endpoint = JobsList(self.session, self.request, JobList([]))
+        response_data = json.loads(endpoint.get().data.decode('utf-8'))
+        self.assertNotIn('total', response_data['meta'])
+
+    def test_invalid_status(self) -> None:
+        """
+        Tests that an unknown status is refused
+        """
+        self.request.args = MultiDict({'status': 'REGISTERED,SLEEPING'})
+        endpoint = JobsList(self.session, self.request, JobList([]))
+        with self.assertRaises(QueryParameterError):
+            endpoint.get()
+
+    def test_invalid_date(self) -> None:
+        """
+        Tests that a submission date that is not in ISO 8601 is refused
+        """
+        self.request.args = MultiDict({'submitted_after': 'yesterday'})
+        endpoint = JobsList(self.session, self.request, JobList([]))
+        with self.assertRaises(QueryParameterError):
+            endpoint.get()
+
+
+class TestPatch(TestJobList):
+    """
+    Contains unit tests for the ``PATCH`` request handler, which modifies
+    many jobs at once
+    """
+    def setUp(self) -> None:
+        TestJobList.setUp(self)
+        self.validator = mock.MagicMock(spec=JSONSchemaValidator)
+        self.validator.iter_errors = mock.MagicMock(return_value=[])
+        self.validator_factory = mock.MagicMock(return_value=self.validator)
+
+    @given(job_lists(min_size=1))
+    def test_patch(self, job_list: JobListInterface) -> None:
+        """
+        Test that every job in the request is modified
+
+        :param job_list: The jobs to modify
+        """
+        items = [
+            {'id': str(job.id), 'status': 'COMPLETED', 'results': {'a': 1}}
+            for job in job_list
+        ]
+        self.request.get_json = mock.MagicMock(return_value=items)
+
+        endpoint = JobsList(
+            self.session, self.request, job_list, self.validator_factory
+        )
+        response = endpoint.patch()
+
+        self.assertEqual(200, response.status_code)
+        response_data = json.loads(response.data.decode('utf-8'))
+        self.assertEqual(len(items), len(response_data['data']))
+        self.assertFalse(response_data['errors'])
+        for job in job_list:
+            self.assertEqual(job.JobStatus.COMPLETED, job.status)
+            self.assertEqual({'a': 1}, job.results)
+
+    @given(job_lists(min_size=1))
+    def test_invalid_items_reported_by_index(
+            self, job_list: JobListInterface
+    ) -> None:
+        """
+        Test that missing jobs and malformed items are rejected without
+        preventing the valid items from being applied
+
+        :param job_list: The jobs to modify
+        """
+        job = next(iter(job_list))
+        items = [
+            {'id': str(uuid4()), 'status': 'COMPLETED'},
+            {'status': 'COMPLETED'},
+            {'id': str(job.id), 'status': 'ERROR'}
+        ]
+        self.request.get_json = mock.MagicMock(return_value=items)
+
+        endpoint = JobsList(
+            self.session, self.request, job_list, self.validator_factory
+        )
+        response = endpoint.patch()
+
+        self.assertEqual(200, response.status_code)
+        response_data = json.loads(response.data.decode('utf-8'))
+        self.assertEqual(
+            [2], [item['index'] for item in response_data['data']]
+        )
+        self.assertEqual(
+            [0, 1], [item['index'] for item in response_data['errors']]
+        )
+        self.assertEqual(
+            404, response_data['errors'][0]['errors'][0]['status_code']
+        )
+        self.assertEqual(job.JobStatus.ERROR, job.status)
+
+    @given(job_lists(min_size=1))
+    def test_invalid_results(self, job_list: JobListInterface) -> None:
+        """
+        Test that results that do not match the result schema are rejected,
+        and that the validator is only built once per schema
+
+        :param job_list: The jobs to modify
+        """
+        self.validator_factory.reset_mock()
+        self.validator.iter_errors = mock.MagicMock(
+            return_value=[mock.MagicMock()]
+        )
+        job = next(iter(job_list))
+        items = [
+            {'id': str(job.id), 'results': {'a': 1}},
+            {'id': str(job.id), 'results': {'a': 2}}
+        ]
+        self.request.get_json = mock.MagicMock(return_value=items)
+
+        endpoint = JobsList(
+            self.session, self.request, job_list, self.validator_factory
+        )
+        response = endpoint.patch()
+
+        self.assertEqual(400, response.status_code)
+        self.validator_factory.assert_called_once_with(job.result_schema)
+
+    def test_body_not_array(self) -> None:
+        """
+        Test that the request fails if the body is not an array
+        """
+        self.request.get_json = mock.MagicMock(return_value={})
+        endpoint = JobsList(self.session, self.request, mock.MagicMock())
+
+        with self.assertRaises(endpoint.Abort):
+            endpoint.patch()
@@ -0,0 +1,97 @@
+"""
+Contains unit tests for the ``/jobs/<job_id>/lease`` endpoint
+"""
+import json
+import unittest
+import unittest.mock as mock
+from uuid import uuid4
+from sqlalchemy.orm import Session
+from flask import Request, Flask
+from werkzeug.datastructures import MultiDict
+from hypothesis import given
+from tests.unit.model_generators.job import jobs
+from tests.unit.model_generators.job_list import JobList
+from topchef.api.lease_extension import LeaseExtension
+from topchef.models import Job
+from topchef.models.errors import NotUUIDError, JobWithUUIDNotFound
+from topchef.models.errors import LeaseNotHeldError
+
+
+class TestLeaseExtension(unittest.TestCase):
+    """
+    Base class for unit testing the ``LeaseExtension`` endpoint
+    """
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+        self.session = mock.MagicMock(spec=Session)
+        self.request = mock.MagicMock(spec=Request)
+        self.request.args = MultiDict()
+        app = Flask(__name__)
+        app.add_url_rule(
+            '/<job_id>/lease', view_func=LeaseExtension.as_view(
+                LeaseExtension.__name__,
+            )
+        )
+        self.context = app.test_request_context()
+        self.context.push()
+
+    def tearDown(self) -> None:
+        """
+        Pop the context
+        """
+        self.context.pop()
+
+
+class TestPost(TestLeaseExtension):
+    """
+    Contains unit tests for the ``post`` method
+    """
+    @given(jobs())
+    def test_post_working_job(self, job: Job) -> None:
+        """
+        Tests that the lease on a working job is extended
+
+        :param job: The randomly-generated job to test
+        """
+        job.status = Job.JobStatus.WORKING
+        endpoint = LeaseExtension(self.session, self.request, JobList([job]))
+
+        response = endpoint.post(str(job.id))
+
+        self.assertEqual(200, response.status_code)
+        data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertEqual(str(job.id), data['id'])
+        self.assertIsNotNone(data['lease_expires'])
+
+    @given(jobs())
+    def test_post_registered_job(self, job: Job) -> None:
+        """
+        Tests that the lease on a job that is not working cannot be extended
+
+        :param job: The randomly-generated job to test
+        """
+        job.status = Job.JobStatus.REGISTERED
+        endpoint = LeaseExtension(self.session, self.request, JobList([job]))
+
+        with self.assertRaises(LeaseNotHeldError):
+            endpoint.post(str(job.id))
+
+    def test_post_job_not_found(self) -> None:
+        """
+        Tests that a 404 error is thrown if the job does not exist
+        """
+        endpoint = LeaseExtension(self.session, self.request, JobList([]))
+
+        with self.assertRaises(JobWithUUIDNotFound):
+            endpoint.post(str(uuid4()))
+
+    def test_post_job_id_not_uuid(self) -> None:
+        """
+        Tests that an error is thrown if the job ID is not a UUID
+        """
+        endpoint = LeaseExtension(self.session, self.request, JobList([]))
+
+        with self.assertRaises(NotUUIDError):
+            endpoint.post('not a UUID')
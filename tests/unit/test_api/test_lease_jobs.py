@@ -0,0 +1,82 @@
+"""
+Contains unit tests for the ``lease_jobs`` endpoint
+"""
+import json
+import unittest
+import unittest.mock as mock
+from uuid import UUID
+from hypothesis import given
+from hypothesis.strategies import integers
+from werkzeug.datastructures import MultiDict
+from topchef.api.lease_jobs import LeaseJobs
+from topchef.config import config
+from topchef.models import Job, Service
+from topchef.models.errors import QueryParameterError
+from tests.unit.model_generators.service import services
+from tests.unit.model_generators.job_list import job_lists
+from tests.unit.model_generators.job import registered_jobs
+from sqlalchemy.orm import Session
+from flask import Request, Flask
+
+
+class TestLeaseJobs(unittest.TestCase):
+    """
+    Base class for unit testing the ``lease_jobs`` endpoint
+    """
+    def setUp(self) -> None:
+        self.session = mock.MagicMock(spec=Session)  # type: Session
+        self.request = mock.MagicMock(spec=Request)  # type: Request
+        self.request.args = MultiDict()
+        app = Flask(__name__)
+        app.add_url_rule('/', view_func=LeaseJobs.as_view(
+            LeaseJobs.__name__
+        ))
+        self.context = app.test_request_context()
+        self.context.push()
+
+    def tearDown(self) -> None:
+        self.context.pop()
+
+
+class TestPost(TestLeaseJobs):
+    @given(
+        services(
+            service_job_lists=job_lists(min_size=1, jobs=registered_jobs())
+        ),
+        integers(min_value=1, max_value=config.MAXIMUM_JOBS_PER_LEASE)
+    )
+    def test_post_jobs_available(self, service: Service, count: int) -> None:
+        self.request.args = MultiDict([('count', str(count))])
+        endpoint = LeaseJobs(self.session, self.request)
+        response = endpoint.post(service)
+        self.assertEqual(200, response.status_code)
+
+        data = json.loads(response.data.decode('utf-8'))['data']
+        self.assertEqual(min(count, len(service.jobs)), len(data))
+        for claimed_job in data:
+            self.assertEqual(
+                Job.JobStatus.WORKING,
+                service.jobs[UUID(claimed_job['id'])].status
+            )
+
+    @given(services(service_job_lists=job_lists(max_size=0)))
+    def test_post_jobs_unavailable(self, service: Service) -> None:
+        endpoint = LeaseJobs(self.session, self.request)
+        response = endpoint.post(service)
+        self.assertEqual(204, response.status_code)
+
+    @given(services())
+    def test_post_count_not_integer(self, service: Service) -> None:
+        self.request.args = MultiDict([('count', 'not an integer')])
+        endpoint = LeaseJobs(self.session, self.request)
+        with self.assertRaises(QueryParameterError):
+            endpoint.post(service)
+
+    @given(services(), integers(max_value=0))
+    def test_post_count_not_positive(
+            self, service: Service, count: int
+    ) -> None:
+        self.request.args = MultiDict([('count', str(count))])
+        endpoint = LeaseJobs(self.session, self.request)
+        with self.assertRaises(QueryParameterError):
+            endpoint.post(service)
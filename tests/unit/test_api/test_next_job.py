@@ -1,19 +1,22 @@
 """
 Contains unit tests for the next job endpoint
 """
+import json
 import unittest
 import unittest.mock as mock
+from uuid import UUID
 from topchef.api.next_job import NextJob
 from hypothesis import given, assume
-from hypothesis.strategies import just
 from topchef.models import Job
 from typing import Sequence
 from tests.unit.model_generators.service import services
 from tests.unit.model_generators.job_list import job_lists
 from tests.unit.model_generators.job import registered_jobs
 from topchef.models import Service
+from topchef.models.new_job_notifier import NewJobNotifier
 from sqlalchemy.orm import Session
 from flask import Request, Flask
+from werkzeug.datastructures import MultiDict
 
 
 class TestNextJob(unittest.TestCase):
@@ -23,6 +26,7 @@ class TestNextJob(unittest.TestCase):
     def setUp(self) -> None:
         self.session = mock.MagicMock(spec=Session)  # type: Session
         self.request = mock.MagicMock(spec=Request)  # type: Request
+        self.request.args = MultiDict()
         app = Flask(__name__)
         app.add_url_rule('/', view_func=NextJob.as_view(
             NextJob.__name__
@@ -45,7 +49,7 @@ class TestGet(TestNextJob):
         response = endpoint.get(service)
         self.assertEqual(200, response.status_code)
 
-    @given(services(service_job_lists=just(list())))
+    @given(services(service_job_lists=job_lists(max_size=0)))
     def test_get_job_unavailable(self, service: Service) -> None:
         assume(len(self._registered_jobs(service)) == 0)
         endpoint = NextJob(self.session, self.request)
@@ -58,3 +62,62 @@ class TestGet(TestNextJob):
             job for job in service.jobs
             if job.status == Job.JobStatus.REGISTERED
         )
+
+
+class TestPost(TestNextJob):
+    @given(
+        services(
+            service_job_lists=job_lists(min_size=1, jobs=registered_jobs())
+        )
+    )
+    def test_post_job_available(self, service: Service) -> None:
+        endpoint = NextJob(self.session, self.request)
+        response = endpoint.post(service)
+        self.assertEqual(200, response.status_code)
+
+        claimed_job_id = json.loads(response.data.decode('utf-8'))['data']['id']
+        claimed_job = service.jobs[UUID(claimed_job_id)]
+        self.assertEqual(Job.JobStatus.WORKING, claimed_job.status)
+
+    @given(services(service_job_lists=job_lists(max_size=0)))
+    def test_post_job_unavailable(self, service: Service) -> None:
+        endpoint = NextJob(self.session, self.request)
+        response = endpoint.post(service)
+        self.assertEqual(204, response.status_code)
+
+
+class TestGetWithWait(TestNextJob):
+    """
+    Contains unit tests for long-polling the next job endpoint
+    """
+    def setUp(self) -> None:
+        TestNextJob.setUp(self)
+        self.notifier = mock.MagicMock(spec=NewJobNotifier)
+        self.notifier.generation.return_value = 0
+
+    @given(services(service_job_lists=job_lists(max_size=0)), registered_jobs())
+    def test_job_registered_while_waiting(
+            self, service: Service, job: Job
+    ) -> None:
+        def _register_job(*_) -> bool:
+            service.jobs[job.id] = job
+            return True
+
+        self.notifier.wait.side_effect = _register_job
+        self.request.args = MultiDict([('wait', '10')])
+
+        endpoint = NextJob(self.session, self.request)
+        endpoint.new_job_notifier = self.notifier
+        response = endpoint.get(service)
+
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(self.session.commit.called)
+
+    @given(services(service_job_lists=job_lists(max_size=0)))
+    def test_no_wait_by_default(self, service: Service) -> None:
+        endpoint = NextJob(self.session, self.request)
+        endpoint.new_job_notifier = self.notifier
+        response = endpoint.get(service)
+
+        self.assertEqual(204, response.status_code)
+        self.assertFalse(self.notifier.wait.called)
@@ -0,0 +1,70 @@
+"""
+Contains unit tests for :mod:`topchef.api.schema_detail`
+"""
+import json
+import unittest
+import unittest.mock as mock
+from flask import Request, Flask
+from sqlalchemy.orm import Session
+from werkzeug.datastructures import ETags
+from topchef.api.schema_detail import SchemaDetail
+from topchef.models.errors import SchemaNotFound
+from topchef.models.schema_registry import SchemaRegistry
+
+
+class TestSchemaDetail(unittest.TestCase):
+    """
+    Base class for testing the endpoint
+    """
+    schema = {'type': 'object', 'title': 'Schema'}
+
+    def setUp(self) -> None:
+        self.session = mock.MagicMock(spec=Session)
+        self.request = mock.MagicMock(spec=Request)
+        self.request.if_none_match = ETags()
+        self.registry = SchemaRegistry()
+        self.published_schema = self.registry.register(self.schema)
+
+        app = Flask(__name__)
+        app.add_url_rule(
+            '/schemas/<schema_fingerprint>',
+            view_func=SchemaDetail.as_view(SchemaDetail.__name__)
+        )
+        self.context = app.test_request_context()
+        self.context.push()
+
+        self.endpoint = SchemaDetail(
+            self.session, self.request, schema_registry=self.registry
+        )
+
+    def tearDown(self) -> None:
+        self.context.pop()
+
+
+class TestGet(TestSchemaDetail):
+    """
+    Contains unit tests for the ``get`` method
+    """
+    def test_get(self) -> None:
+        response = self.endpoint.get(self.published_schema.fingerprint)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            self.schema, json.loads(response.data.decode('utf-8'))
+        )
+        self.assertEqual(
+            (self.published_schema.fingerprint, False),
+            response.get_etag()
+        )
+        self.assertIn('immutable', response.headers['Cache-Control'])
+
+    def test_get_not_modified(self) -> None:
+        self.request.if_none_match = ETags(
+            [self.published_schema.fingerprint]
+        )
+        response = self.endpoint.get(self.published_schema.fingerprint)
+        self.assertEqual(304, response.status_code)
+        self.assertFalse(response.data)
+
+    def test_get_unknown_schema(self) -> None:
+        with self.assertRaises(SchemaNotFound):
+            self.endpoint.get('0' * 64)
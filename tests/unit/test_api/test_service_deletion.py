@@ -0,0 +1,105 @@
+"""
+Contains unit tests for the ``/services/<service_id>/deletion`` endpoint
+"""
+import json
+import unittest
+import unittest.mock as mock
+from uuid import uuid4
+from sqlalchemy.orm import Session
+from flask import Request, Flask
+from hypothesis import given
+from tests.unit.model_generators.service import services
+from tests.unit.model_generators.service_list import _ServiceList
+from topchef.api.service_deletion import ServiceDeletion
+from topchef.models import Service
+from topchef.models.errors import NotUUIDError, ServiceWithUUIDNotFound
+
+
+class TestServiceDeletion(unittest.TestCase):
+    """
+    Base class for unit testing the ``ServiceDeletion`` endpoint
+    """
+    def setUp(self) -> None:
+        """
+        Set up the test
+        """
+        self.session = mock.MagicMock(spec=Session)
+        self.request = mock.MagicMock(spec=Request)
+        app = Flask(__name__)
+        app.add_url_rule(
+            '/<service_id>/deletion', view_func=ServiceDeletion.as_view(
+                ServiceDeletion.__name__,
+            )
+        )
+        self.context = app.test_request_context()
+        self.context.push()
+
+    def tearDown(self) -> None:
+        """
+        Pop the context
+        """
+        self.context.pop()
+
+
+class TestGet(TestServiceDeletion):
+    """
+    Contains unit tests for the ``get`` method
+    """
+    @given(services())
+    def test_get(self, service: Service) -> None:
+        """
+        Tests that the number of jobs waiting to be purged is returned for
+        a deleted service
+
+        :param service: The randomly-generated service to delete
+        """
+        service_list = _ServiceList([service])
+        del service_list[service.id]
+        endpoint = ServiceDeletion(self.session, self.request, service_list)
+
+        response = endpoint.get(str(service.id))
+
+        self.assertEqual(200, response.status_code)
+        data = json.loads(response.data.decode('utf-8'))
+        self.assertEqual(str(service.id), data['data']['id'])
+        self.assertEqual(len(service.jobs), data['data']['jobs_remaining'])
+
+    @given(services())
+    def test_get_service_not_deleted(self, service: Service) -> None:
+        """
+        Tests that a 404 error is thrown if the service was never deleted
+
+        :param service: The randomly-generated service
+        """
+        endpoint = ServiceDeletion(
+            self.session, self.request, _ServiceList([service])
+        )
+
+        with self.assertRaises(ServiceWithUUIDNotFound):
+            endpoint.get(str(service.id))
+
+    @given(services())
+    def test_get_service_purged(self, service: Service) -> None:
+        """
+        Tests that a 404 error is thrown once the service has been purged
+
+        :param service: The randomly-generated service to delete
+        """
+        service_list = _ServiceList([service])
+        del service_list[service.id]
+        service_list.purge_deleted_services(len(service.jobs) + 1)
+        endpoint = ServiceDeletion(self.session, self.request, service_list)
+
+        with self.assertRaises(ServiceWithUUIDNotFound):
+            endpoint.get(str(service.id))
+
+    def test_get_service_id_not_uuid(self) -> None:
+        """
+        Tests that an error is thrown if the service ID is not a UUID
+        """
+        endpoint = ServiceDeletion(
+            self.session, self.request, _ServiceList([])
+        )
+
+        with self.assertRaises(NotUUIDError):
+            endpoint.get('not a UUID')
@@ -7,13 +7,19 @@ import unittest.mock as mock
 from datetime import timedelta
 from math import floor
 from topchef.api.service_detail import ServiceDetail
+from topchef.api.jobs_for_service import JobsForServiceID as JobsForService
+from topchef.api.service_deletion import ServiceDeletion
 from sqlalchemy.orm import Session
 from flask import Flask, Request
 from hypothesis import given, settings
 from topchef.models import Service, ServiceList
+from topchef.models.errors import QueryParameterError
 from topchef.serializers import ServiceDetail as ServiceSerializer
+from topchef.serializers import JobOverview as JobOverviewSerializer
 from hypothesis.strategies import booleans, text, timedeltas
 from tests.unit.model_generators.service import services
+from tests.unit.model_generators.service_list import _ServiceList
+from werkzeug.datastructures import ETags, MultiDict
 from werkzeug.exceptions import BadRequest
 
 
@@ -27,6 +33,7 @@ class TestServiceDetail(unittest.TestCase):
         """
         self.session = mock.MagicMock(spec=Session)  # type: Session
         self.request = mock.MagicMock(spec=Request)  # type: Request
+        self.request.args = MultiDict()
         self.service_list = mock.MagicMock(
             spec=ServiceList
         )  # type: ServiceList
@@ -37,6 +44,16 @@ class TestServiceDetail(unittest.TestCase):
                 ServiceDetail.__name__, self.session
             )
         )
+        self._app.add_url_rule(
+            '/<service_id>/jobs', view_func=JobsForService.as_view(
+                JobsForService.__name__, self.session
+            )
+        )
+        self._app.add_url_rule(
+            '/<service_id>/deletion', view_func=ServiceDeletion.as_view(
+                ServiceDeletion.__name__, self.session
+            )
+        )
 
         self._context = self._app.test_request_context()
 
@@ -66,9 +83,82 @@ class TestGet(TestServiceDetail):
 
         self._assert_data_equal(data['data'], service)
 
+    @given(services())
+    def test_get_not_modified(self, service: Service) -> None:
+        self.request.query_string = b''
+        endpoint = ServiceDetail(
+            self.session, self.request, self.service_list
+        )
+        etag, _ = endpoint.get(service).get_etag()
+
+        self.request.if_none_match = ETags([etag])
+        self.assertEqual(304, endpoint.get(service).status_code)
+
+        service.description = service.description + 'changed'
+        self.assertEqual(200, endpoint.get(service).status_code)
+
+    @given(services())
+    def test_get_does_not_include_jobs(self, service: Service) -> None:
+        """
+        Tests that the jobs are summarized by their status, rather than
+        listed, unless they are asked for
+
+        :param service: The service to get
+        """
+        endpoint = ServiceDetail(
+            self.session, self.request, self.service_list
+        )
+        data = json.loads(endpoint.get(service).data.decode('utf-8'))
+
+        self.assertNotIn('jobs', data['data'])
+        self.assertEqual(
+            len(service.jobs), sum(data['data']['job_counts'].values())
+        )
+        self.assertIn('jobs', data['links'])
+
+    @given(services())
+    def test_get_include_jobs(self, service: Service) -> None:
+        """
+        Tests that a bounded page of jobs is returned if the jobs are asked
+        for
+
+        :param service: The service to get
+        """
+        self.request.args = MultiDict({'include': 'jobs', 'limit': '1'})
+        endpoint = ServiceDetail(
+            self.session, self.request, self.service_list
+        )
+        data = json.loads(endpoint.get(service).data.decode('utf-8'))
+
+        self.assertEqual(
+            JobOverviewSerializer().dump(
+                service.jobs.page(1, None), many=True
+            ).data,
+            data['data']['jobs']
+        )
+
+    @given(services())
+    def test_get_include_something_else(self, service: Service) -> None:
+        """
+        Tests that only the jobs can be included
+
+        :param service: The service to get
+        """
+        self.request.args = MultiDict({'include': 'results'})
+        endpoint = ServiceDetail(
+            self.session, self.request, self.service_list
+        )
+        with self.assertRaises(QueryParameterError):
+            endpoint.get(service)
+
     def _assert_data_equal(self, data: dict, service: Service) -> None:
-        serializer = ServiceSerializer()
-        self.assertEqual(data, serializer.dump(service).data)
+        serializer = ServiceSerializer(exclude=('jobs',))
+        expected_data = serializer.dump(service).data
+        expected_data['job_counts'] = {
+            status.name: count
+            for status, count in service.jobs.status_counts().items()
+        }
+        self.assertEqual(data, expected_data)
 
 
 class TestPatch(TestServiceDetail):
@@ -142,6 +232,38 @@ class TestPatch(TestServiceDetail):
             floor(timeout.total_seconds()), service.timeout.total_seconds()
         )
 
+    @given(services(), timedeltas(min_value=timedelta(seconds=1)))
+    @settings(deadline=None)
+    def test_patch_job_retention(
+            self, service: Service, job_retention: timedelta
+    ) -> None:
+        body = {'job_retention': job_retention.total_seconds()}
+        self._send_patch_request(service, body)
+        self.assertEqual(
+            floor(job_retention.total_seconds()),
+            service.job_retention.total_seconds()
+        )
+
+    @given(services())
+    def test_patch_job_retention_null(self, service: Service) -> None:
+        service.job_retention = timedelta(days=1)
+        self._send_patch_request(service, {'job_retention': None})
+        self.assertIsNone(service.job_retention)
+
+    @given(services())
+    def test_patch_job_retention_not_positive(
+            self, service: Service
+    ) -> None:
+        self.request.get_json = mock.MagicMock(
+            return_value={'job_retention': 0}
+        )
+        endpoint = ServiceDetail(
+            self.session, self.request, self.service_list
+        )
+        with self.assertRaises(endpoint.Abort):
+            endpoint.patch(service)
+        self.assertIsNone(service.job_retention)
+
     def _send_patch_request(
             self, service: Service, request_body: dict
     ) -> None:
@@ -151,3 +273,35 @@ class TestPatch(TestServiceDetail):
         )
         response = endpoint.patch(service)
         self.assertEqual(200, response.status_code)
+
+
+class TestDelete(TestServiceDetail):
+    """
+    Contains unit tests for the ``delete`` method
+    """
+    @given(services())
+    def test_delete(self, service: Service) -> None:
+        """
+        Tests that the service is removed from the list, and that the
+        response points to the progress of the purge
+
+        :param service: The service to delete
+        """
+        service_list = _ServiceList([service])
+        endpoint = ServiceDetail(self.session, self.request, service_list)
+
+        response = endpoint.delete(service)
+
+        self.assertEqual(202, response.status_code)
+        self.assertNotIn(service.id, service_list)
+        self.assertEqual(
+            len(service.jobs), service_list.jobs_awaiting_purge(service.id)
+        )
+
+        data = json.loads(response.data.decode('utf-8'))
+        self.assertEqual(
+            response.headers['Location'], data['links']['deletion']
+        )
+        self.assertTrue(
+            data['links']['deletion'].endswith('%s/deletion' % service.id)
+        )
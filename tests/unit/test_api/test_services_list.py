@@ -5,11 +5,12 @@ import json
 from topchef.models import ServiceList
 from topchef.serializers import ServiceOverview as ServiceSerializer
 from flask import Request
+from werkzeug.datastructures import ETags, MultiDict
 from tests.unit.test_api import TestAPI
 import unittest.mock as mock
 from sqlalchemy.orm import Session
 from topchef.api import ServicesList
-from topchef.models.errors import RequestNotJSONError
+from topchef.models.errors import RequestNotJSONError, QueryParameterError
 from hypothesis import given, assume
 from hypothesis.strategies import composite, text, dictionaries
 from tests.unit.model_generators.service_list import service_lists
@@ -36,6 +37,7 @@ class TestGet(TestServicesList):
     def setUp(self):
         TestServicesList.setUp(self)
         self.expected_response_code = 200
+        self.request.args = MultiDict()
 
     @given(service_lists())
     def test_200_status_code(self, service_list: ServiceList) -> None:
@@ -52,6 +54,52 @@ class TestGet(TestServicesList):
             json.loads(response.data.decode('utf-8')), service_list
         )
 
+    @given(service_lists())
+    def test_not_modified(self, service_list: ServiceList) -> None:
+        """
+
+        Tests that the list is not sent again if no service has changed
+        """
+        self.request.query_string = b''
+        endpoint = ServicesList(self.session, self.request, service_list)
+        etag, _ = endpoint.get().get_etag()
+
+        self.request.if_none_match = ETags([etag])
+        self.assertEqual(304, endpoint.get().status_code)
+
+        for service in service_list:
+            service.name = service.name + 'changed'
+            self.assertEqual(200, endpoint.get().status_code)
+
+    @given(service_lists())
+    def test_available_services(self, service_list: ServiceList) -> None:
+        """
+
+        Tests that only the services that can take jobs are listed if the
+        ``available`` parameter is ``true``
+        """
+        self.request.args = MultiDict({'available': 'true'})
+        endpoint = ServicesList(self.session, self.request, service_list)
+        response = endpoint.get()
+
+        self.assertEqual(self.expected_response_code, response.status_code)
+        self.assert_data_equal(
+            json.loads(response.data.decode('utf-8')),
+            service_list.filter_by_availability(True)
+        )
+
+    def test_available_is_not_boolean(self) -> None:
+        """
+
+        Tests that an error is thrown if the ``available`` parameter is
+        neither ``true`` nor ``false``
+        """
+        self.request.args = MultiDict({'available': 'sometimes'})
+        endpoint = ServicesList(self.session, self.request)
+
+        with self.assertRaises(QueryParameterError):
+            endpoint.get()
+
     def assert_data_equal(self, data: dict, service_list: ServiceList) -> None:
         """
 
@@ -1,11 +1,13 @@
 """
 Contains unit tests for the validator endpoint
 """
+import json
 import unittest
 import unittest.mock as mock
 from sqlalchemy.orm import Session
 from flask import Request, Flask
 from topchef.api.validator import JSONSchemaValidator
+from topchef.models.validator_cache import ValidatorCache
 
 
 class TestValidator(unittest.TestCase):
@@ -33,6 +35,7 @@ class TestValidator(unittest.TestCase):
     def setUp(self) -> None:
         self.session = mock.MagicMock(spec=Session)
         self.request = mock.MagicMock(spec=Request)
+        self.cache = ValidatorCache()
         app = Flask(__name__)
         app.add_url_rule(
             '/', view_func=JSONSchemaValidator.as_view(
@@ -52,6 +55,18 @@ class TestGet(TestValidator):
         response = endpoint.get()
         self.assertEqual(200, response.status_code)
 
+    def test_get_reports_cache_statistics(self) -> None:
+        endpoint = JSONSchemaValidator(
+            self.session, self.request, validator_cache=self.cache
+        )
+        response = endpoint.get()
+        self.assertEqual(
+            self.cache.statistics,
+            json.loads(response.data.decode('utf-8'))['meta'][
+                'validator_cache'
+            ]
+        )
+
 
 class TestPost(TestValidator):
     def test_post_valid_instance(self):
@@ -84,3 +99,16 @@ class TestPost(TestValidator):
         with self.assertRaises(endpoint.Abort):
             endpoint.post()
         self.assertTrue(endpoint.errors)
+
+    def test_post_reuses_validator(self) -> None:
+        self.request.get_json = mock.MagicMock(return_value={
+            'schema': self.schema, 'object': self.valid_instance
+        })
+        for _ in range(2):
+            endpoint = JSONSchemaValidator(
+                self.session, self.request, validator_cache=self.cache
+            )
+            endpoint.post()
+
+        self.assertEqual(1, self.cache.statistics['hits'])
+        self.assertEqual(1, self.cache.statistics['misses'])
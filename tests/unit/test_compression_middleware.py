@@ -0,0 +1,243 @@
+"""
+Contains unit tests for :mod:`topchef.compression_middleware`
+"""
+import gzip
+import io
+import json
+import unittest
+import zlib
+from hypothesis import given
+from hypothesis.strategies import binary
+from werkzeug.exceptions import BadRequest
+from werkzeug.test import Client, EnvironBuilder
+from werkzeug.wrappers import Request, Response
+from topchef.compression_middleware import CompressionMiddleware
+from topchef.compression_middleware import DecompressingStream
+from topchef.models.errors import RequestBodyTooLargeError
+
+
+class TestCompressionMiddleware(unittest.TestCase):
+    """
+    Base class for testing the compression middleware
+    """
+    large_body = json.dumps(
+        [{'parameters': {'value': index}} for index in range(200)]
+    ).encode('utf-8')
+
+    small_body = b'{"value": 1}'
+
+    def setUp(self) -> None:
+        self.request_bodies = []
+        self.middleware = CompressionMiddleware(
+            self.application, minimum_size=100, compression_level=6,
+            maximum_request_size=len(self.large_body)
+        )
+        self.client = Client(self.middleware, Response)
+
+    def application(self, environ, start_response):
+        """
+        A WSGI application that echoes the body of ``POST`` requests, and
+        returns a large or small body for ``GET`` requests
+        """
+        request = Request(environ)
+        if request.method == 'POST':
+            self.request_bodies.append(request.get_data())
+            response = Response(status=201)
+        elif request.path == '/small':
+            response = Response(self.small_body)
+        elif request.path == '/not_modified':
+            response = Response(status=304)
+        elif request.path == '/stream':
+            response = Response(iter([self.large_body, self.small_body]))
+        elif request.path == '/tagged':
+            response = Response(self.large_body)
+            response.set_etag('tag', weak=request.args.get('weak') == '1')
+        else:
+            response = Response(self.large_body)
+        return response(environ, start_response)
+
+
+class TestResponseCompression(TestCompressionMiddleware):
+    """
+    Contains unit tests for compressing responses
+    """
+    def test_gzip(self) -> None:
+        response = self.client.get(
+            '/', headers={'Accept-Encoding': 'gzip, deflate'}
+        )
+        self.assertEqual('gzip', response.headers['Content-Encoding'])
+        self.assertEqual('Accept-Encoding', response.headers['Vary'])
+        self.assertNotIn('Content-Length', response.headers)
+        self.assertEqual(self.large_body, gzip.decompress(response.data))
+        self.assertLess(len(response.data), len(self.large_body))
+
+    def test_deflate(self) -> None:
+        response = self.client.get(
+            '/', headers={'Accept-Encoding': 'gzip;q=0.5, deflate'}
+        )
+        self.assertEqual('deflate', response.headers['Content-Encoding'])
+        self.assertEqual(self.large_body, zlib.decompress(response.data))
+
+    def test_compression_not_accepted(self) -> None:
+        response = self.client.get('/')
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual('Accept-Encoding', response.headers['Vary'])
+        self.assertEqual(self.large_body, response.data)
+
+    def test_compression_refused(self) -> None:
+        response = self.client.get(
+            '/', headers={'Accept-Encoding': 'gzip;q=0'}
+        )
+        self.assertNotIn('Content-Encoding', response.headers)
+
+    def test_small_response(self) -> None:
+        response = self.client.get(
+            '/small', headers={'Accept-Encoding': 'gzip'}
+        )
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertNotIn('Vary', response.headers)
+        self.assertEqual(self.small_body, response.data)
+
+    def test_not_modified(self) -> None:
+        response = self.client.get(
+            '/not_modified', headers={'Accept-Encoding': 'gzip'}
+        )
+        self.assertEqual(304, response.status_code)
+        self.assertNotIn('Content-Encoding', response.headers)
+
+    def test_head(self) -> None:
+        response = self.client.head('/', headers={'Accept-Encoding': 'gzip'})
+        self.assertNotIn('Content-Encoding', response.headers)
+
+    def test_strong_entity_tag(self) -> None:
+        response = self.client.get(
+            '/tagged', headers={'Accept-Encoding': 'gzip'}
+        )
+        self.assertEqual(('tag-gzip', False), response.get_etag())
+
+    def test_weak_entity_tag(self) -> None:
+        response = self.client.get(
+            '/tagged?weak=1', headers={'Accept-Encoding': 'deflate'}
+        )
+        self.assertEqual(('tag', True), response.get_etag())
+
+    def test_uncompressed_entity_tag(self) -> None:
+        response = self.client.get('/tagged')
+        self.assertEqual(('tag', False), response.get_etag())
+
+    def test_streamed_response(self) -> None:
+        response = self.client.get(
+            '/stream', headers={'Accept-Encoding': 'gzip'}
+        )
+        self.assertEqual('gzip', response.headers['Content-Encoding'])
+        self.assertEqual(
+            self.large_body + self.small_body, gzip.decompress(response.data)
+        )
+
+    def test_streamed_chunks_are_flushed(self) -> None:
+        """
+        Tests that the first chunk of a streamed response can be
+        decompressed before the rest of the body has been produced
+        """
+        environ = EnvironBuilder(
+            path='/stream', headers={'Accept-Encoding': 'deflate'}
+        ).get_environ()
+        body = iter(self.middleware(environ, lambda *args: None))
+
+        first_chunk = next(body)
+
+        self.assertEqual(
+            self.large_body,
+            zlib.decompressobj(zlib.MAX_WBITS).decompress(first_chunk)
+        )
+
+
+class TestRequestDecompression(TestCompressionMiddleware):
+    """
+    Contains unit tests for decompressing request bodies
+    """
+    def test_gzip(self) -> None:
+        response = self.client.post(
+            '/', data=gzip.compress(self.large_body),
+            headers={'Content-Encoding': 'gzip'}
+        )
+        self.assertEqual(201, response.status_code)
+        self.assertEqual([self.large_body], self.request_bodies)
+
+    def test_deflate(self) -> None:
+        self.client.post(
+            '/', data=zlib.compress(self.large_body),
+            headers={'Content-Encoding': 'deflate'}
+        )
+        self.assertEqual([self.large_body], self.request_bodies)
+
+    def test_uncompressed(self) -> None:
+        self.client.post('/', data=self.small_body)
+        self.assertEqual([self.small_body], self.request_bodies)
+
+    def test_unsupported_encoding(self) -> None:
+        response = self.client.post(
+            '/', data=self.small_body, headers={'Content-Encoding': 'br'}
+        )
+        self.assertEqual(415, response.status_code)
+        self.assertEqual(
+            415,
+            json.loads(response.data.decode('utf-8'))['errors'][0][
+                'status_code'
+            ]
+        )
+        self.assertEqual([], self.request_bodies)
+
+    def test_environment(self) -> None:
+        environ = EnvironBuilder(
+            method='POST', data=gzip.compress(self.small_body),
+            headers={'Content-Encoding': 'gzip'}
+        ).get_environ()
+        self.middleware._decompress_request(environ, 'gzip')
+
+        self.assertNotIn('CONTENT_LENGTH', environ)
+        self.assertNotIn('HTTP_CONTENT_ENCODING', environ)
+        self.assertTrue(environ['wsgi.input_terminated'])
+        self.assertEqual(self.small_body, environ['wsgi.input'].read())
+
+
+class TestDecompressingStream(unittest.TestCase):
+    """
+    Contains unit tests for reading compressed streams
+    """
+    @given(binary())
+    def test_read(self, data: bytes) -> None:
+        stream = io.BufferedReader(DecompressingStream(
+            io.BytesIO(gzip.compress(data)), 16 + zlib.MAX_WBITS, len(data)
+        ))
+        self.assertEqual(data, stream.read())
+
+    def test_read_in_chunks(self) -> None:
+        data = bytes(range(256)) * 1024
+        stream = DecompressingStream(
+            io.BytesIO(zlib.compress(data)), zlib.MAX_WBITS, len(data)
+        )
+        chunks = iter(lambda: stream.read(1000), b'')
+        self.assertEqual(data, b''.join(chunks))
+
+    def test_corrupt_data(self) -> None:
+        stream = DecompressingStream(
+            io.BytesIO(b'not compressed'), zlib.MAX_WBITS, 1000
+        )
+        with self.assertRaises(BadRequest):
+            stream.read()
+
+    def test_truncated_data(self) -> None:
+        stream = DecompressingStream(
+            io.BytesIO(zlib.compress(b'data' * 100)[:10]), zlib.MAX_WBITS,
+            1000
+        )
+        with self.assertRaises(BadRequest):
+            stream.read()
+
+    def test_too_large(self) -> None:
+        stream = DecompressingStream(
+            io.BytesIO(zlib.compress(b'\0' * 10000)), zlib.MAX_WBITS, 1000
+        )
+        with self.assertRaises(RequestBodyTooLargeError):
+            stream.read()
@@ -0,0 +1,60 @@
+"""
+Contains unit tests for :mod:`topchef.database.seconds_after`
+"""
+import unittest
+from datetime import datetime, timedelta
+from hypothesis import given
+from hypothesis.strategies import datetimes, integers
+from sqlalchemy import create_engine, select, literal, DateTime, Integer
+from sqlalchemy.dialects.mysql.mysqldb import MySQLDialect_mysqldb
+from sqlalchemy.dialects.postgresql.psycopg2 import PGDialect_psycopg2
+from topchef.database.seconds_after import SecondsAfter
+
+
+class TestSecondsAfter(unittest.TestCase):
+    """
+    Contains unit tests for the expression
+    """
+    def setUp(self) -> None:
+        self.time = literal(datetime(2017, 8, 15, 18, 0, 0), DateTime)
+        self.seconds = literal(30, Integer)
+        self.expression = SecondsAfter(self.time, self.seconds)
+
+    def test_postgresql(self) -> None:
+        self.assertIn(
+            "INTERVAL '1 second'",
+            str(self.expression.compile(dialect=PGDialect_psycopg2()))
+        )
+
+    def test_mysql(self) -> None:
+        self.assertIn(
+            'DATE_ADD',
+            str(self.expression.compile(dialect=MySQLDialect_mysqldb()))
+        )
+
+    @given(
+        datetimes(
+            min_value=datetime(2000, 1, 1), max_value=datetime(2100, 1, 1)
+        ),
+        integers(min_value=1, max_value=86400)
+    )
+    def test_sqlite(self, time: datetime, seconds: int) -> None:
+        """
+        Tests that the time in SQLite compares correctly with the times
+        just before and just after it
+        """
+        expression = SecondsAfter(
+            literal(time, DateTime), literal(seconds, Integer)
+        )
+        expected_time = time + timedelta(seconds=seconds)
+        engine = create_engine('sqlite://')
+
+        is_after_earlier_time, is_before_later_time = engine.execute(
+            select([
+                expression > expected_time - timedelta(milliseconds=1),
+                expression < expected_time + timedelta(milliseconds=1)
+            ])
+        ).first()
+
+        self.assertTrue(is_after_earlier_time)
+        self.assertTrue(is_before_later_time)
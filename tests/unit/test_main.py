@@ -1,12 +1,17 @@
 """
 Contains unit tests for :mod:`topchef.__main__`
 """
+import argparse
 import unittest
 import unittest.mock as mock
 from flask import Flask
-from topchef.__main__ import TopchefManager
+from topchef.__main__ import TopchefManager, positive_integer
 from topchef.wsgi_app import DatabaseEngineFactory, WSGIAppFactory
 from topchef.database import DatabaseSchema
+from topchef.database.schemas import SchemaUpgrader
+from topchef.models import JobArchive, JobList, ServiceList
+from topchef.models.blob_store import BlobStore
+from sqlalchemy.orm import Session
 
 
 class TestMain(unittest.TestCase):
@@ -74,3 +79,257 @@ class TestCreateDB(TestMain):
             mock.call(bind=self.db_engine_factory.engine),
             self.database_schema.metadata.create_all.call_args
         )
+
+
+class TestReap(TestMain):
+    """
+    Contains unit tests for the ``reap`` command
+    """
+    def setUp(self) -> None:
+        """
+        Create the command with a mock job list and a mock session
+        """
+        TestMain.setUp(self)
+        self.job_list = mock.MagicMock(spec=JobList)
+        self.job_list.requeue_expired_jobs.return_value = 1
+        self.job_list_constructor = mock.MagicMock(
+            return_value=self.job_list
+        )
+        self.session = mock.MagicMock(spec=Session)
+        self.session_constructor = mock.MagicMock(return_value=self.session)
+        self.command = self.manager.Reap(
+            self.db_engine_factory,
+            self.job_list_constructor,
+            self.session_constructor
+        )
+
+    def test_run(self) -> None:
+        """
+        Tests that expired jobs are requeued, and that the requeue is
+        committed
+        """
+        self.command.run()
+        self.assertEqual(
+            mock.call(bind=self.db_engine_factory.engine),
+            self.session_constructor.call_args
+        )
+        self.assertTrue(self.job_list.requeue_expired_jobs.called)
+        self.assertTrue(self.session.commit.called)
+        self.assertTrue(self.session.close.called)
+
+    @mock.patch('topchef.__main__.sleep')
+    def test_run_every_interval(self, sleep: mock.MagicMock) -> None:
+        """
+        Tests that a run that fails is logged, and that the command keeps
+        running after it
+
+        :param sleep: A mock for the function that waits between runs. It
+            stops the command after its second run
+        """
+        sleep.side_effect = [None, KeyboardInterrupt()]
+        self.job_list.requeue_expired_jobs.side_effect = [
+            RuntimeError('The database went away'), 1
+        ]
+        with self.assertLogs('topchef.__main__', 'ERROR'):
+            with self.assertRaises(KeyboardInterrupt):
+                self.command.run(60)
+
+        self.assertEqual(2, self.job_list.requeue_expired_jobs.call_count)
+        self.assertEqual([mock.call(60)] * 2, sleep.call_args_list)
+
+    def test_interval_option(self) -> None:
+        """
+        Tests that the ``--every`` option only accepts whole numbers of
+        seconds of at least 1
+        """
+        self.assertEqual(5, positive_integer('5'))
+        for value in ('0', '-3', 'often'):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                positive_integer(value)
+
+
+class TestSweep(TestMain):
+    """
+    Contains unit tests for the ``sweep`` command
+    """
+    def setUp(self) -> None:
+        """
+        Create the command with a mock service list and a mock session
+        """
+        TestMain.setUp(self)
+        self.service_list = mock.MagicMock(spec=ServiceList)
+        self.service_list.mark_timed_out_services_unavailable.return_value = 1
+        self.service_list_constructor = mock.MagicMock(
+            return_value=self.service_list
+        )
+        self.session = mock.MagicMock(spec=Session)
+        self.session_constructor = mock.MagicMock(return_value=self.session)
+        self.command = self.manager.Sweep(
+            self.db_engine_factory,
+            self.service_list_constructor,
+            self.session_constructor
+        )
+
+    def test_run(self) -> None:
+        """
+        Tests that timed out services are marked unavailable, and that the
+        change is committed
+        """
+        self.command.run()
+        self.assertEqual(
+            mock.call(bind=self.db_engine_factory.engine),
+            self.session_constructor.call_args
+        )
+        self.assertTrue(
+            self.service_list.mark_timed_out_services_unavailable.called
+        )
+        self.assertTrue(self.session.commit.called)
+        self.assertTrue(self.session.close.called)
+
+
+class TestPurge(TestMain):
+    """
+    Contains unit tests for the ``purge`` command
+    """
+    def setUp(self) -> None:
+        """
+        Create the command with a mock service list, a mock session, and a
+        small chunk size
+        """
+        TestMain.setUp(self)
+        self.chunk_size = 10
+        self.service_list = mock.MagicMock(spec=ServiceList)
+        self.service_list.purge_deleted_services.side_effect = [
+            self.chunk_size, self.chunk_size, 3
+        ]
+        self.service_list_constructor = mock.MagicMock(
+            return_value=self.service_list
+        )
+        self.session = mock.MagicMock(spec=Session)
+        self.session_constructor = mock.MagicMock(return_value=self.session)
+        self.blob_store = mock.MagicMock(spec=BlobStore)
+        self.command = self.manager.Purge(
+            self.db_engine_factory,
+            self.service_list_constructor,
+            self.session_constructor,
+            self.chunk_size,
+            self.blob_store
+        )
+
+    def test_run(self) -> None:
+        """
+        Tests that chunks are purged until a chunk comes back short, and
+        that every chunk is committed in its own session
+        """
+        self.assertEqual(2 * self.chunk_size + 3, self.command.purge())
+        self.assertEqual(
+            [mock.call(self.chunk_size)] * 3,
+            self.service_list.purge_deleted_services.call_args_list
+        )
+        self.assertEqual(3, self.session_constructor.call_count)
+        self.assertEqual(3, self.session.commit.call_count)
+        self.assertEqual(3, self.session.close.call_count)
+
+    @mock.patch('topchef.__main__.referenced_result_blobs')
+    def test_run_once_removes_blobs(
+            self, referenced_result_blobs: mock.MagicMock
+    ) -> None:
+        """
+        Tests that the results of the purged jobs are removed from the blob
+        store once the jobs have been purged
+
+        :param referenced_result_blobs: A mock that returns the digests of
+            the blobs that are still referenced
+        """
+        self.command.run_once()
+        self.assertEqual(
+            mock.call(referenced_result_blobs.return_value),
+            self.blob_store.remove_unreferenced.call_args
+        )
+        self.assertEqual(4, self.session.close.call_count)
+
+
+class TestArchive(TestMain):
+    """
+    Contains unit tests for the ``archive`` command
+    """
+    def setUp(self) -> None:
+        """
+        Create the command with a mock job archive, a mock session, and a
+        small chunk size
+        """
+        TestMain.setUp(self)
+        self.chunk_size = 10
+        self.job_archive = mock.MagicMock(spec=JobArchive)
+        self.job_archive.archive_expired_jobs.side_effect = [
+            self.chunk_size, 0
+        ]
+        self.job_archive_constructor = mock.MagicMock(
+            return_value=self.job_archive
+        )
+        self.session = mock.MagicMock(spec=Session)
+        self.session_constructor = mock.MagicMock(return_value=self.session)
+        self.blob_store = mock.MagicMock(spec=BlobStore)
+        self.command = self.manager.Archive(
+            self.db_engine_factory,
+            self.job_archive_constructor,
+            self.session_constructor,
+            self.chunk_size,
+            self.blob_store
+        )
+
+    def test_run(self) -> None:
+        """
+        Tests that chunks are archived until a chunk comes back short, and
+        that every chunk is committed in its own session
+        """
+        self.assertEqual(self.chunk_size, self.command.archive())
+        self.assertEqual(
+            [mock.call(self.chunk_size)] * 2,
+            self.job_archive.archive_expired_jobs.call_args_list
+        )
+        self.assertEqual(2, self.session.commit.call_count)
+        self.assertEqual(2, self.session.close.call_count)
+
+    @mock.patch('topchef.__main__.referenced_result_blobs')
+    def test_run_once_removes_blobs(
+            self, referenced_result_blobs: mock.MagicMock
+    ) -> None:
+        """
+        Tests that blobs that no job refers to are removed once the jobs
+        have been archived
+
+        :param referenced_result_blobs: A mock that returns the digests of
+            the blobs that are still referenced
+        """
+        self.command.run_once()
+        self.assertEqual(
+            mock.call(referenced_result_blobs.return_value),
+            self.blob_store.remove_unreferenced.call_args
+        )
+        self.assertEqual(3, self.session.close.call_count)
+
+
+class TestUpgradeDB(TestMain):
+    """
+    Contains unit tests for the ``upgrade-db`` command
+    """
+    def setUp(self) -> None:
+        """
+        Create the command with a mock schema upgrader
+        """
+        TestMain.setUp(self)
+        self.schema_upgrader = mock.MagicMock(spec=SchemaUpgrader)
+        self.command = self.manager.UpgradeDB(
+            self.db_engine_factory, self.schema_upgrader
+        )
+
+    def test_run(self) -> None:
+        """
+        Tests that the database behind the engine is upgraded
+        """
+        self.command.run()
+        self.assertEqual(
+            mock.call(self.db_engine_factory.engine),
+            self.schema_upgrader.upgrade.call_args
+        )
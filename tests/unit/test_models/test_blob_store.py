@@ -0,0 +1,173 @@
+"""
+Contains unit tests for :mod:`topchef.models.blob_store`
+"""
+import hashlib
+import os
+import tempfile
+import time
+import unittest
+from hypothesis import given
+from hypothesis.strategies import binary, integers
+from topchef.models.blob_store import BlobStore
+
+
+class TestBlobStore(unittest.TestCase):
+    """
+    Base class for testing the blob store. Each test gets a store in a
+    directory of its own
+    """
+    def setUp(self) -> None:
+        """
+        Create the directory for the store
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = BlobStore(self.directory.name, chunk_size=16)
+
+    def tearDown(self) -> None:
+        """
+        Remove the directory, and the blobs in it
+        """
+        self.directory.cleanup()
+
+
+class TestPut(TestBlobStore):
+    """
+    Contains unit tests for the ``put`` method
+    """
+    @given(binary())
+    def test_put(self, contents: bytes) -> None:
+        """
+        Tests that a blob is stored under the SHA-256 digest of its
+        contents
+
+        :param contents: The randomly-generated blob to store
+        """
+        digest = self.store.put(contents)
+        self.assertEqual(hashlib.sha256(contents).hexdigest(), digest)
+        self.assertIn(digest, self.store)
+        self.assertEqual(contents, self.store.read(digest))
+
+    def test_put_twice(self) -> None:
+        """
+        Tests that storing the same blob twice leaves a single file
+        """
+        digest = self.store.put(b'{"foo": "bar"}')
+        self.assertEqual(digest, self.store.put(b'{"foo": "bar"}'))
+        self.assertEqual(
+            [digest[2:]],
+            os.listdir(os.path.join(self.directory.name, digest[:2]))
+        )
+
+    def test_put_twice_makes_blob_young(self) -> None:
+        """
+        Tests that storing a blob that is already stored keeps it from
+        being removed before the job that refers to it is committed
+        """
+        digest = self.store.put(b'{"foo": "bar"}')
+        path = os.path.join(self.directory.name, digest[:2], digest[2:])
+        os.utime(path, (0, 0))
+        self.store.put(b'{"foo": "bar"}')
+        self.assertEqual(0, self.store.remove_unreferenced(set(), 60))
+        self.assertIn(digest, self.store)
+
+
+class TestOpen(TestBlobStore):
+    """
+    Contains unit tests for the ``open`` method
+    """
+    @given(binary(min_size=1), integers(min_value=1, max_value=64))
+    def test_chunks(self, contents: bytes, chunk_size: int) -> None:
+        """
+        Tests that a blob is read in chunks that are no longer than the
+        chunk size of the store
+
+        :param contents: The randomly-generated blob to read
+        :param chunk_size: The randomly-generated chunk size
+        """
+        store = BlobStore(self.directory.name, chunk_size=chunk_size)
+        reader = store.open(store.put(contents))
+        try:
+            chunks = list(reader)
+            self.assertEqual(len(contents), len(reader))
+        finally:
+            reader.close()
+
+        self.assertEqual(contents, b''.join(chunks))
+        self.assertTrue(all(len(chunk) <= chunk_size for chunk in chunks))
+
+    def test_missing_blob(self) -> None:
+        """
+        Tests that opening a blob that was never stored raises
+        ``KeyError``
+        """
+        digest = hashlib.sha256(b'missing').hexdigest()
+        self.assertNotIn(digest, self.store)
+        with self.assertRaises(KeyError):
+            self.store.open(digest)
+
+    def test_invalid_digest(self) -> None:
+        """
+        Tests that a digest that could point outside of the store is
+        rejected
+        """
+        self.assertNotIn('../../etc/passwd', self.store)
+        with self.assertRaises(KeyError):
+            self.store.open('../../etc/passwd')
+
+
+class TestRemoveUnreferenced(TestBlobStore):
+    """
+    Contains unit tests for the ``remove_unreferenced`` method
+    """
+    def _age(self, relative_path: str, seconds: float) -> None:
+        """
+
+        :param relative_path: The path of a file in the store
+        :param seconds: The number of seconds since the file was written
+        """
+        written = time.time() - seconds
+        os.utime(
+            os.path.join(self.directory.name, relative_path),
+            (written, written)
+        )
+
+    def test_remove_unreferenced(self) -> None:
+        """
+        Tests that old blobs that are not referenced are removed, and that
+        referenced or young blobs are kept
+        """
+        referenced = self.store.put(b'[1]')
+        unreferenced = self.store.put(b'[2]')
+        young = self.store.put(b'[3]')
+        for digest in (referenced, unreferenced):
+            self._age(os.path.join(digest[:2], digest[2:]), 120)
+
+        self.assertEqual(
+            1, self.store.remove_unreferenced({referenced}, minimum_age=60)
+        )
+        self.assertIn(referenced, self.store)
+        self.assertNotIn(unreferenced, self.store)
+        self.assertIn(young, self.store)
+
+    def test_remove_temporary_files(self) -> None:
+        """
+        Tests that old files left behind by writes that did not finish are
+        removed
+        """
+        os.makedirs(os.path.join(self.directory.name, 'ab'))
+        with open(os.path.join(self.directory.name, 'ab', 'tmp1234'), 'w'):
+            pass
+        self._age(os.path.join('ab', 'tmp1234'), 120)
+
+        self.assertEqual(1, self.store.remove_unreferenced(set(), 60))
+        self.assertEqual(
+            [], os.listdir(os.path.join(self.directory.name, 'ab'))
+        )
+
+    def test_missing_directory(self) -> None:
+        """
+        Tests that nothing is removed from a store that was never written
+        to
+        """
+        store = BlobStore(os.path.join(self.directory.name, 'missing'))
+        self.assertEqual(0, store.remove_unreferenced(set()))
@@ -0,0 +1,209 @@
+"""
+Contains unit tests for :mod:`topchef.models.heartbeat_coalescer`
+"""
+import unittest
+import unittest.mock as mock
+from uuid import UUID
+from hypothesis import given
+from hypothesis.strategies import lists, uuids
+from sqlalchemy.orm import Session
+from topchef.models.heartbeat_coalescer import HeartbeatCoalescer
+
+
+class TestHeartbeatCoalescer(unittest.TestCase):
+    """
+    Base class for testing the coalescer
+    """
+    def setUp(self) -> None:
+        """
+        Create a coalescer with a clock that the tests can move, and a
+        session in which every service exists
+        """
+        self.session = mock.MagicMock(spec=Session)
+        self.session.execute.return_value.rowcount = 1
+        self.time = 0.0
+        self.coalescer = HeartbeatCoalescer(
+            window_seconds=1, clock=lambda: self.time
+        )
+        self.existing_service_ids = mock.patch.object(
+            HeartbeatCoalescer, '_existing_service_ids',
+            side_effect=lambda session, service_ids: set(service_ids)
+        )
+        self.existing_service_ids.start()
+        self.addCleanup(self.existing_service_ids.stop)
+
+    def _written_service_ids(self, call_index: int=-1) -> set:
+        """
+
+        :param call_index: The index of the write to inspect
+        :return: The IDs of the services whose heartbeats were written in a
+            batch
+        """
+        _, parameters = self.session.execute.call_args_list[call_index][0]
+        return {
+            parameter['heartbeat_service_id'] for parameter in parameters
+        }
+
+    @property
+    def _number_of_batches(self) -> int:
+        """
+
+        :return: The number of batches of heartbeats that were written
+        """
+        return sum(
+            1 for call in self.session.execute.call_args_list
+            if len(call[0]) == 2
+        )
+
+
+class TestCheckIn(TestHeartbeatCoalescer):
+    """
+    Contains unit tests for the ``check_in`` method
+    """
+    @given(uuids())
+    def test_first_heartbeat_is_written(self, service_id: UUID) -> None:
+        """
+        Tests that the first heartbeat of a service is written at once,
+        without being buffered
+        """
+        self.session.reset_mock()
+        self.coalescer.check_in(self.session, service_id)
+        self.assertEqual(1, self.session.execute.call_count)
+        self.assertEqual(0, self.coalescer.number_of_pending_heartbeats)
+
+    def test_unknown_service(self) -> None:
+        """
+        Tests that the heartbeat of a service that does not exist is
+        refused
+        """
+        self.session.execute.return_value.rowcount = 0
+        with self.assertRaises(KeyError):
+            self.coalescer.check_in(self.session, UUID(int=0))
+        self.assertEqual(0, self.coalescer.number_of_pending_heartbeats)
+
+    @given(lists(uuids(), min_size=1, unique=True))
+    def test_heartbeats_in_window_are_coalesced(
+            self, service_ids: list
+    ) -> None:
+        """
+        Tests that the heartbeats of known services are only written once
+        the window has passed
+        """
+        self.setUp()
+        for service_id in service_ids:
+            self.coalescer.check_in(self.session, service_id)
+        self.session.reset_mock()
+
+        for service_id in service_ids:
+            self.coalescer.check_in(self.session, service_id)
+        self.assertFalse(self.session.execute.called)
+
+        self.time += 1
+        self.coalescer.check_in(self.session, service_ids[0])
+
+        self.assertEqual(1, self._number_of_batches)
+        self.assertEqual(set(service_ids), self._written_service_ids())
+
+    def test_service_is_written_once_per_batch(self) -> None:
+        self.coalescer.check_in(self.session, UUID(int=1))
+        self.coalescer.check_in(self.session, UUID(int=1))
+        self.coalescer.check_in(self.session, UUID(int=1))
+
+        self.time += 1
+        self.coalescer.check_in(self.session, UUID(int=1))
+
+        _, parameters = self.session.execute.call_args[0]
+        self.assertEqual(1, len(parameters))
+
+    def test_deleted_services_are_forgotten(self) -> None:
+        """
+        Tests that a service that no longer exists when its batch is
+        written is looked up again on its next heartbeat
+        """
+        self.coalescer.check_in(self.session, UUID(int=0))
+        self.coalescer.check_in(self.session, UUID(int=0))
+
+        with mock.patch.object(
+            HeartbeatCoalescer, '_existing_service_ids', return_value=set()
+        ):
+            self.coalescer.flush(self.session)
+        self.assertEqual(0, self._number_of_batches)
+
+        self.session.execute.return_value.rowcount = 0
+        with self.assertRaises(KeyError):
+            self.coalescer.check_in(self.session, UUID(int=0))
+
+    def test_forget(self) -> None:
+        """
+        Tests that forgetting a service drops its buffered heartbeat
+        """
+        self.coalescer.check_in(self.session, UUID(int=0))
+        self.coalescer.check_in(self.session, UUID(int=0))
+        self.coalescer.forget(UUID(int=0))
+        self.assertEqual(0, self.coalescer.number_of_pending_heartbeats)
+
+
+class TestFlush(TestHeartbeatCoalescer):
+    """
+    Contains unit tests for the ``flush`` method
+    """
+    def test_flush_writes_pending_heartbeats(self) -> None:
+        self.coalescer.check_in(self.session, UUID(int=0))
+        self.coalescer.check_in(self.session, UUID(int=1))
+        self.coalescer.check_in(self.session, UUID(int=1))
+        self.assertEqual(1, self.coalescer.number_of_pending_heartbeats)
+
+        self.coalescer.flush(self.session)
+
+        self.assertEqual({UUID(int=1)}, self._written_service_ids())
+        self.assertEqual(0, self.coalescer.number_of_pending_heartbeats)
+
+    def test_flush_without_heartbeats(self) -> None:
+        self.coalescer.flush(self.session)
+        self.assertFalse(self.session.execute.called)
+
+
+class TestTimer(TestHeartbeatCoalescer):
+    """
+    Contains unit tests for writing buffered heartbeats once the window
+    has passed
+    """
+    def test_timer_writes_pending_heartbeats(self) -> None:
+        """
+        Tests that a buffered heartbeat is written in a new session by the
+        timer, without waiting for another heartbeat
+        """
+        timer_session = mock.MagicMock(spec=Session)
+        self.coalescer.session_factory = lambda: timer_session
+        self.coalescer.check_in(self.session, UUID(int=0))
+
+        with mock.patch('threading.Timer') as timer:
+            self.coalescer.check_in(self.session, UUID(int=0))
+            self.coalescer.check_in(self.session, UUID(int=0))
+
+        self.assertEqual(1, timer.call_count)
+        delay, flush_on_timer = timer.call_args[0]
+        self.assertEqual(1, delay)
+
+        flush_on_timer()
+
+        self.assertEqual(0, self.coalescer.number_of_pending_heartbeats)
+        self.assertTrue(timer_session.execute.called)
+        self.assertTrue(timer_session.commit.called)
+        self.assertTrue(timer_session.close.called)
+
+    def test_timer_errors_are_logged(self) -> None:
+        """
+        Tests that a failed write is rolled back, and does not raise
+        """
+        timer_session = mock.MagicMock(spec=Session)
+        timer_session.execute.side_effect = RuntimeError
+        self.coalescer.session_factory = lambda: timer_session
+        self.coalescer.check_in(self.session, UUID(int=0))
+
+        with mock.patch('threading.Timer') as timer:
+            self.coalescer.check_in(self.session, UUID(int=0))
+
+        with self.assertLogs('topchef.models.heartbeat_coalescer'):
+            timer.call_args[0][1]()
+        self.assertTrue(timer_session.rollback.called)
@@ -1,3 +1,5 @@
+import json
+import tempfile
 import unittest
 import unittest.mock as mock
 from hypothesis import given
@@ -5,6 +7,7 @@ from hypothesis.strategies import dictionaries, text, integers, \
     sampled_from, composite
 from topchef.database.models import Job as DatabaseJob
 from topchef.database.models import JobStatus as DatabaseJobStatus
+from topchef.models.blob_store import BlobStore
 from topchef.models.job import Job
 from tests.unit.database_model_generators import jobs as database_jobs
 
@@ -93,3 +96,66 @@ class TestResults(TestJob):
         self.job.results = results
         self.assertEqual(results, self.job.results)
         self.assertEqual(self.job.results, self.database_job.results)
+
+
+class TestResultsInBlobStore(unittest.TestCase):
+    """
+    Contains unit tests for results that are longer than the blob threshold
+    """
+    def setUp(self) -> None:
+        """
+        Create a job whose large results are written to a blob store in a
+        temporary directory
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.blob_store = BlobStore(self.directory.name)
+        self.database_job = mock.MagicMock(spec=DatabaseJob)
+        self.job = Job(
+            self.database_job, blob_store=self.blob_store, blob_threshold=16
+        )
+
+    def tearDown(self) -> None:
+        """
+        Remove the blob store
+        """
+        self.directory.cleanup()
+
+    def test_large_results(self) -> None:
+        """
+        Tests that results longer than the threshold are kept in the blob
+        store, and are read back from it
+        """
+        results = {'counts': list(range(100))}
+        self.job.results = results
+
+        self.assertIsNone(self.database_job.results)
+        self.assertIn(self.database_job.results_blob, self.blob_store)
+        self.assertEqual(results, self.job.results)
+
+        reader = self.job.encoded_results()
+        try:
+            self.assertEqual(results, json.loads(b''.join(reader).decode()))
+        finally:
+            reader.close()
+
+    def test_small_results(self) -> None:
+        """
+        Tests that results no longer than the threshold are kept in the
+        database model, even if the job had large results before
+        """
+        self.job.results = {'counts': list(range(100))}
+        self.job.results = {'count': 1}
+
+        self.assertIsNone(self.database_job.results_blob)
+        self.assertEqual({'count': 1}, self.database_job.results)
+        self.assertEqual(
+            {'count': 1},
+            json.loads(b''.join(self.job.encoded_results()).decode())
+        )
+
+    def test_results_not_json(self) -> None:
+        """
+        Tests that results that cannot be encoded as JSON are rejected
+        """
+        with self.assertRaises(ValueError):
+            self.job.results = {'count': object()}
@@ -0,0 +1,89 @@
+"""
+Contains unit tests for :mod:`topchef.models.new_job_notifier`
+"""
+import threading
+import unittest
+import unittest.mock as mock
+from uuid import UUID
+from hypothesis import given
+from hypothesis.strategies import uuids
+from sqlalchemy.orm import Session
+from topchef.models.new_job_notifier import NewJobNotifier
+
+
+class TestNewJobNotifier(unittest.TestCase):
+    """
+    Base class for testing the notifier
+    """
+    def setUp(self) -> None:
+        self.notifier = NewJobNotifier()
+
+
+class TestGeneration(TestNewJobNotifier):
+    """
+    Contains unit tests for the ``generation`` method
+    """
+    @given(uuids())
+    def test_notify_changes_generation(self, service_id: UUID) -> None:
+        generation = self.notifier.generation(service_id)
+        self.notifier.notify([service_id])
+        self.assertNotEqual(generation, self.notifier.generation(service_id))
+
+
+class TestWait(TestNewJobNotifier):
+    """
+    Contains unit tests for the ``wait`` method
+    """
+    @given(uuids())
+    def test_wait_returns_immediately_if_generation_is_stale(
+            self, service_id: UUID
+    ) -> None:
+        generation = self.notifier.generation(service_id)
+        self.notifier.notify([service_id])
+        self.assertTrue(self.notifier.wait(service_id, generation, 0))
+
+    @given(uuids())
+    def test_wait_times_out(self, service_id: UUID) -> None:
+        generation = self.notifier.generation(service_id)
+        self.assertFalse(self.notifier.wait(service_id, generation, 0))
+
+    def test_wait_is_woken_up_by_notify(self) -> None:
+        service_id = UUID(int=1)
+        generation = self.notifier.generation(service_id)
+
+        notifying_thread = threading.Timer(
+            0.01, self.notifier.notify, args=([service_id],)
+        )
+        notifying_thread.start()
+
+        self.assertTrue(self.notifier.wait(service_id, generation, 10))
+        notifying_thread.join()
+
+
+class TestSessionEvents(TestNewJobNotifier):
+    """
+    Contains unit tests for the hooks that notify waiters when a session
+    commits
+    """
+    def setUp(self) -> None:
+        TestNewJobNotifier.setUp(self)
+        self.session = mock.MagicMock(spec=Session)
+        self.session.info = {}
+
+    @given(uuids())
+    def test_commit_notifies_waiters(self, service_id: UUID) -> None:
+        generation = self.notifier.generation(service_id)
+        self.notifier.job_registered(self.session, service_id)
+        self.assertEqual(generation, self.notifier.generation(service_id))
+
+        self.notifier._after_commit(self.session)
+        self.assertNotEqual(generation, self.notifier.generation(service_id))
+
+    @given(uuids())
+    def test_rollback_does_not_notify_waiters(self, service_id: UUID) -> None:
+        generation = self.notifier.generation(service_id)
+        self.notifier.job_registered(self.session, service_id)
+
+        self.notifier._after_soft_rollback(self.session, None)
+        self.notifier._after_commit(self.session)
+        self.assertEqual(generation, self.notifier.generation(service_id))
@@ -0,0 +1,60 @@
+"""
+Contains unit tests for :mod:`topchef.models.schema_registry`
+"""
+import unittest
+from hypothesis import given
+from hypothesis.strategies import dictionaries, text, integers
+from topchef.models.schema_registry import SchemaRegistry, fingerprint
+
+
+class TestSchemaRegistry(unittest.TestCase):
+    """
+    Base class for testing the registry
+    """
+    schema = {'type': 'object', 'required': ['value']}
+
+    def setUp(self) -> None:
+        self.registry = SchemaRegistry()
+
+
+class TestFingerprint(TestSchemaRegistry):
+    """
+    Contains unit tests for :func:`fingerprint`
+    """
+    @given(dictionaries(text(), integers()))
+    def test_fingerprint_ignores_key_order(self, schema: dict) -> None:
+        reversed_schema = dict(reversed(list(schema.items())))
+        self.assertEqual(fingerprint(schema), fingerprint(reversed_schema))
+
+
+class TestRegister(TestSchemaRegistry):
+    """
+    Contains unit tests for the ``register`` method
+    """
+    def test_register(self) -> None:
+        published_schema = self.registry.register(self.schema)
+        self.assertEqual(self.schema, published_schema)
+        self.assertEqual(
+            fingerprint(self.schema), published_schema.fingerprint
+        )
+        self.assertIs(
+            published_schema, self.registry[published_schema.fingerprint]
+        )
+
+    def test_equal_schemas_are_published_once(self) -> None:
+        first_schema = self.registry.register(self.schema)
+        second_schema = self.registry.register(dict(self.schema))
+        self.assertIs(first_schema, second_schema)
+        self.assertEqual(1, len(self.registry))
+        self.assertEqual([first_schema.fingerprint], list(self.registry))
+
+    def test_published_schema_is_read_only(self) -> None:
+        published_schema = self.registry.register(self.schema)
+        with self.assertRaises(TypeError):
+            published_schema['type'] = 'array'
+        with self.assertRaises(TypeError):
+            published_schema['required'].append('other_value')
+
+    def test_unknown_fingerprint(self) -> None:
+        with self.assertRaises(KeyError):
+            _ = self.registry[fingerprint(self.schema)]
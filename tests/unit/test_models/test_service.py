@@ -225,6 +225,34 @@ class TestTimeout(TestService):
             self.service.timeout = timeout
 
 
+class TestJobRetention(TestService):
+    """
+    Contains unit tests for the ``job_retention`` property
+    """
+    @given(timedeltas(min_value=timedelta(seconds=1)))
+    @settings(deadline=None)
+    def test_that_setting_valid_retention_changes_it(
+            self, job_retention: timedelta
+    ):
+        self.service.job_retention = job_retention
+        self.assertEqual(
+            job_retention.total_seconds(),
+            self.service.job_retention.total_seconds()
+        )
+
+    def test_that_retention_can_be_removed(self) -> None:
+        self.service.job_retention = None
+        self.assertIsNone(self.service.job_retention)
+
+    @given(timedeltas(max_value=timedelta(microseconds=0)))
+    @settings(deadline=None)
+    def test_setting_invalid_retention(
+            self, job_retention: timedelta
+    ) -> None:
+        with self.assertRaises(ValueError):
+            self.service.job_retention = job_retention
+
+
 class TestNew(TestService):
     """
     Contains unit tests for :meth:`topchef.models.Service.new`
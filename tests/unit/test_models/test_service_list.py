@@ -87,19 +87,14 @@ class TestDelItem(TestServiceList):
 
         self.db_model.jobs = [self.job]
 
-    def test_delitem_service_deleted(self):
+    def test_delitem_service_marked_deleted(self):
         del self.service_list[self.service_id]
-        self.assertEqual(
-            call(self.db_model),
-            self.db_session.delete.call_args
-        )
+        self.assertTrue(self.db_model.is_deleted)
+        self.assertFalse(self.db_model.is_service_available)
 
-    def test_delitem_job_deleted(self):
+    def test_delitem_jobs_left_for_purge(self):
         del self.service_list[self.service_id]
-        self.assertIn(
-            call(self.job),
-            self.db_session.delete.call_args_list
-        )
+        self.assertFalse(self.db_session.delete.called)
 
 
 class TestContains(TestServiceList):
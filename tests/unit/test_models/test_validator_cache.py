@@ -0,0 +1,139 @@
+"""
+Contains unit tests for :mod:`topchef.models.validator_cache`
+"""
+import unittest
+import unittest.mock as mock
+from uuid import uuid4
+from hypothesis import given
+from hypothesis.strategies import dictionaries, text, integers
+from jsonschema import Draft4Validator
+from sqlalchemy import event
+from topchef.database.models import Service as DatabaseService
+from topchef.models.validator_cache import ValidatorCache
+
+
+class TestValidatorCache(unittest.TestCase):
+    """
+    Base class for testing the cache
+    """
+    schema = {
+        'type': 'object',
+        'properties': {
+            'value': {'type': 'integer', 'minimum': 1, 'maximum': 10}
+        }
+    }
+
+    def setUp(self) -> None:
+        self.validator_factory = mock.MagicMock(side_effect=Draft4Validator)
+        self.cache = ValidatorCache(
+            max_size=2, validator_factory=self.validator_factory
+        )
+
+
+class TestFingerprint(TestValidatorCache):
+    """
+    Contains unit tests for the ``fingerprint`` method
+    """
+    @given(dictionaries(text(), integers()))
+    def test_fingerprint_ignores_key_order(self, schema: dict) -> None:
+        reversed_schema = dict(reversed(list(schema.items())))
+        self.assertEqual(
+            self.cache.fingerprint(schema),
+            self.cache.fingerprint(reversed_schema)
+        )
+
+    def test_different_schemas_have_different_fingerprints(self) -> None:
+        self.assertNotEqual(
+            self.cache.fingerprint(self.schema),
+            self.cache.fingerprint({'type': 'object'})
+        )
+
+
+class TestCall(TestValidatorCache):
+    """
+    Contains unit tests for the ``__call__`` method
+    """
+    def test_validator_is_built_once(self) -> None:
+        first_validator = self.cache(self.schema)
+        second_validator = self.cache(dict(self.schema))
+
+        self.assertIs(first_validator, second_validator)
+        self.assertEqual(1, self.validator_factory.call_count)
+        self.assertTrue(first_validator.is_valid({'value': 1}))
+        self.assertFalse(first_validator.is_valid({'value': 11}))
+
+    def test_statistics(self) -> None:
+        self.cache(self.schema)
+        self.cache(self.schema)
+        self.cache({'type': 'object'})
+
+        self.assertEqual(
+            {'hits': 1, 'misses': 2, 'size': 2, 'max_size': 2},
+            self.cache.statistics
+        )
+
+    def test_least_recently_used_validator_is_evicted(self) -> None:
+        self.cache(self.schema)
+        self.cache({'type': 'object'})
+        self.cache(self.schema)
+        self.cache({'type': 'array'})
+
+        self.assertEqual(2, len(self.cache))
+        self.cache(self.schema)
+        self.assertEqual(3, self.validator_factory.call_count)
+        self.cache({'type': 'object'})
+        self.assertEqual(4, self.validator_factory.call_count)
+
+
+class TestInvalidate(TestValidatorCache):
+    """
+    Contains unit tests for the ``invalidate`` and ``clear`` methods
+    """
+    def test_invalidate(self) -> None:
+        self.cache(self.schema)
+        self.cache.invalidate(self.schema)
+        self.cache(self.schema)
+        self.assertEqual(2, self.validator_factory.call_count)
+
+    def test_invalidate_unknown_schema(self) -> None:
+        self.cache.invalidate(self.schema)
+        self.assertEqual(0, len(self.cache))
+
+    def test_clear(self) -> None:
+        self.cache(self.schema)
+        self.cache.clear()
+        self.assertEqual(
+            {'hits': 0, 'misses': 0, 'size': 0, 'max_size': 2},
+            self.cache.statistics
+        )
+
+
+class TestListen(TestValidatorCache):
+    """
+    Contains unit tests for evicting validators when a service's schema is
+    replaced
+    """
+    def setUp(self) -> None:
+        super(TestListen, self).setUp()
+        self.cache.listen(DatabaseService)
+        self.addCleanup(self._stop_listening)
+        self.service = DatabaseService(
+            uuid4(), 'name', 'description', self.schema, self.schema
+        )
+
+    def _stop_listening(self) -> None:
+        for attribute in (
+                DatabaseService.job_registration_schema,
+                DatabaseService.job_result_schema
+        ):
+            event.remove(attribute, 'set', self.cache._schema_replaced)
+
+    def test_replacing_schema_evicts_validator(self) -> None:
+        self.cache(self.schema)
+        self.service.job_result_schema = {'type': 'object'}
+        self.assertEqual(0, len(self.cache))
+
+    def test_setting_same_schema_keeps_validator(self) -> None:
+        self.cache(self.schema)
+        self.service.job_registration_schema = dict(self.schema)
+        self.assertEqual(1, len(self.cache))
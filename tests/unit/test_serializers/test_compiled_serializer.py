@@ -0,0 +1,145 @@
+"""
+Contains unit tests for :mod:`topchef.serializers.compiled_serializer`
+"""
+import unittest
+from datetime import datetime, timezone, timedelta
+from hypothesis import given
+from hypothesis.strategies import lists, sampled_from, sets, integers
+from marshmallow import Schema, fields, post_dump
+from tests.unit.model_generators.job import jobs
+from tests.unit.model_generators.service import services
+from topchef.models import Job, Service
+from topchef.serializers import CompiledSerializer
+from topchef.serializers import JobDetail, JobOverview
+from topchef.serializers import ServiceDetail, ServiceOverview
+
+
+class TestCompiledSerializer(unittest.TestCase):
+    """
+    Base class for checking that compiled serializers give the same output
+    as the schemas that they were compiled from
+    """
+    def assert_same_output(
+            self, schema_class: type, obj, many: bool=False, only=None
+    ) -> None:
+        """
+
+        :param schema_class: The schema to compile
+        :param obj: The object to serialize
+        :param many: ``True`` if ``obj`` is a collection
+        :param only: The names of the fields to serialize
+        """
+        expected = schema_class(only=only).dump(obj, many=many)
+        result = CompiledSerializer(schema_class, only=only).dump(
+            obj, many=many
+        )
+        self.assertEqual(expected.data, result.data)
+        self.assertEqual(expected.errors, result.errors)
+
+
+class TestDump(TestCompiledSerializer):
+    """
+    Contains unit tests for the ``dump`` method
+    """
+    @given(jobs())
+    def test_job_detail(self, job: Job) -> None:
+        self.assert_same_output(JobDetail, job)
+
+    @given(lists(jobs()))
+    def test_job_overview(self, job_list) -> None:
+        self.assert_same_output(JobOverview, job_list, many=True)
+
+    @given(
+        lists(jobs()),
+        sets(sampled_from(sorted(JobDetail().fields.keys())), min_size=1)
+    )
+    def test_only(self, job_list, only) -> None:
+        self.assert_same_output(JobDetail, job_list, many=True, only=only)
+
+    @given(services())
+    def test_service_detail(self, service: Service) -> None:
+        self.assert_same_output(ServiceDetail, service)
+
+    @given(lists(services()))
+    def test_service_overview(self, service_list) -> None:
+        self.assert_same_output(ServiceOverview, service_list, many=True)
+
+    @given(jobs(), integers(min_value=-23, max_value=23))
+    def test_aware_dates(self, job: Job, offset: int) -> None:
+        job._date_submitted = job.date_submitted.replace(
+            tzinfo=timezone(timedelta(hours=offset))
+        )
+        self.assert_same_output(JobDetail, job)
+
+    @given(jobs())
+    def test_invalid_status(self, job: Job) -> None:
+        job.status = 'not a status'
+        self.assert_same_output(JobDetail, [job], many=True)
+        self.assertTrue(
+            CompiledSerializer(JobDetail).dump([job], many=True).errors
+        )
+
+    def test_dictionary(self) -> None:
+        service = {
+            'id': 'not a UUID', 'name': 'name', 'description': 'description'
+        }
+        self.assert_same_output(ServiceOverview, service)
+
+
+class TestUncompiledSchemas(TestCompiledSerializer):
+    """
+    Contains unit tests for schemas that are serialized by the schema itself
+    """
+    class ProcessedSchema(Schema):
+        value = fields.Int()
+
+        @post_dump
+        def add_key(self, data: dict) -> dict:
+            data['key'] = 'value'
+            return data
+
+    class DefaultSchema(Schema):
+        value = fields.Int()
+        timeout = fields.TimeDelta(default=timedelta(seconds=30))
+        date = fields.DateTime(attribute='nested.date')
+
+    class Model(object):
+        value = 1
+        nested = type('Nested', (object,), {
+            'date': datetime(2017, 1, 1, tzinfo=timezone.utc)
+        })
+
+    def test_processors(self) -> None:
+        self.assert_same_output(self.ProcessedSchema, self.Model())
+
+    def test_defaults_and_dotted_attributes(self) -> None:
+        self.assert_same_output(self.DefaultSchema, self.Model())
+
+
+class TestForSchema(unittest.TestCase):
+    """
+    Contains unit tests for the ``for_schema`` method
+    """
+    def test_serializer_is_compiled_once(self) -> None:
+        self.assertIs(
+            CompiledSerializer.for_schema(JobDetail, only=['id']),
+            CompiledSerializer.for_schema(JobDetail, only=['id'])
+        )
+        self.assertIsNot(
+            CompiledSerializer.for_schema(JobDetail),
+            CompiledSerializer.for_schema(JobDetail, only=['id'])
+        )
+
+    def test_order_of_fields_is_ignored(self) -> None:
+        self.assertIs(
+            CompiledSerializer.for_schema(JobDetail, only=['id', 'status']),
+            CompiledSerializer.for_schema(
+                JobDetail, only=['status', 'id', 'id']
+            )
+        )
+
+    def test_nested_schema(self) -> None:
+        self.assertIs(
+            CompiledSerializer.for_schema(ServiceDetail),
+            CompiledSerializer.for_schema(ServiceDetail)
+        )
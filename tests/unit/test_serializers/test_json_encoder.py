@@ -0,0 +1,130 @@
+"""
+Contains unit tests for :mod:`topchef.serializers.json_encoder`
+"""
+import json
+import unittest
+from uuid import uuid4
+from hypothesis import given
+from hypothesis.strategies import recursive, none, booleans, integers
+from hypothesis.strategies import floats, text, lists, dictionaries, tuples
+from hypothesis.strategies import sampled_from
+from topchef.serializers import json_encoder
+
+_documents = recursive(
+    none() | booleans() | integers() | floats() | text(),
+    lambda children: lists(children) | dictionaries(text(), children) |
+    tuples(children, children),
+    max_leaves=20
+)
+
+
+class TestDumps(unittest.TestCase):
+    """
+    Contains unit tests for the ``dumps`` function
+    """
+    @given(
+        _documents, booleans(), booleans(), sampled_from([None, 2, 4]),
+        sampled_from([(', ', ': '), (',', ':'), None])
+    )
+    def test_same_as_standard_library(
+            self, document, sort_keys: bool, ensure_ascii: bool, indent,
+            separators
+    ) -> None:
+        arguments = dict(
+            indent=indent, separators=separators, sort_keys=sort_keys,
+            ensure_ascii=ensure_ascii
+        )
+        self.assertEqual(
+            json.dumps(document, **arguments),
+            json_encoder.dumps(document, **arguments)
+        )
+
+    @given(dictionaries(
+        integers() | floats(allow_nan=False) | booleans() | none(), text()
+    ))
+    def test_keys_that_are_not_strings(self, document: dict) -> None:
+        self.assertEqual(
+            json.dumps(document, indent=2),
+            json_encoder.dumps(document, indent=2)
+        )
+
+    def test_unknown_type(self) -> None:
+        for indent in (None, 2):
+            with self.assertRaises(TypeError):
+                json_encoder.dumps({'id': [uuid4()]}, indent=indent)
+
+    def test_default(self) -> None:
+        document = {'id': [uuid4()], 'job': {'id': uuid4(), 'status': 1}}
+        for indent in (None, 2):
+            self.assertEqual(
+                json.dumps(document, indent=indent, default=str),
+                json_encoder.dumps(document, indent=indent, default=str)
+            )
+
+    def test_circular_reference(self) -> None:
+        document = {'jobs': []}
+        document['jobs'].append(document)
+        for indent in (None, 2):
+            with self.assertRaises(ValueError):
+                json_encoder.dumps(document, indent=indent)
+
+
+class TestIterdumps(unittest.TestCase):
+    """
+    Contains unit tests for the ``iterdumps`` function
+    """
+    @given(
+        dictionaries(text(), _documents), lists(_documents), booleans(),
+        booleans(), sampled_from([None, 2]),
+        sampled_from([(', ', ': '), (',', ':'), None]),
+        sampled_from([1, 10, 1000])
+    )
+    def test_same_as_standard_library(
+            self, document: dict, items: list, sort_keys: bool,
+            ensure_ascii: bool, indent, separators, chunk_size: int
+    ) -> None:
+        arguments = dict(
+            indent=indent, separators=separators, sort_keys=sort_keys,
+            ensure_ascii=ensure_ascii
+        )
+        streamed_document = dict(document, data=iter(items))
+        expected_document = dict(document, data=items)
+        self.assertEqual(
+            json.dumps(expected_document, **arguments),
+            ''.join(json_encoder.iterdumps(
+                streamed_document, chunk_size=chunk_size, **arguments
+            ))
+        )
+
+    def test_functions_are_called_after_iterators(self) -> None:
+        items = []
+
+        def numbers():
+            for number in range(3):
+                items.append(number)
+                yield number
+
+        document = {'data': numbers(), 'meta': lambda: {'count': len(items)}}
+        self.assertEqual(
+            json.dumps(
+                {'data': [0, 1, 2], 'meta': {'count': 3}}, indent=2,
+                sort_keys=True
+            ),
+            ''.join(json_encoder.iterdumps(
+                document, indent=2, sort_keys=True
+            ))
+        )
+
+    def test_circular_reference(self) -> None:
+        job = {'id': 1}
+        job['parent'] = job
+        with self.assertRaises(ValueError):
+            list(json_encoder.iterdumps(
+                {'data': iter([job])}, indent=2
+            ))
+
+    def test_chunks(self) -> None:
+        chunks = list(json_encoder.iterdumps(
+            {'data': iter(range(1000))}, chunk_size=100
+        ))
+        self.assertGreater(len(chunks), 1)
@@ -12,12 +12,44 @@ Flask development server.
     web server like Apache, it is recommended to use the ``APP_FACTORY``
     variable in :mod:`topchef.wsgi_app`.
 """
+import argparse
+import logging
+from time import sleep
+from typing import Optional, Callable
 from flask import Flask
-from flask_script import Manager, Command
+from flask_script import Manager, Command, Option
+from sqlalchemy.orm import Session
 from topchef.wsgi_app import WSGIAppFactory
 from topchef.wsgi_app import DatabaseEngineFactory
 from topchef import APP_FACTORY
+from topchef.config import config
 from topchef.database.schemas import DatabaseSchema, AbstractDatabaseSchema
+from topchef.database.schemas import SchemaUpgrader
+from topchef.models import JobArchive, JobList, ServiceList
+from topchef.models.blob_store import BlobStore, RESULT_BLOB_STORE
+from topchef.models.blob_store import referenced_result_blobs
+from topchef.models.job_archive import JobArchive as JobArchiveModel
+from topchef.models.job_list import JobList as JobListModel
+from topchef.models.service_list import ServiceList as ServiceListModel
+
+LOG = logging.getLogger(__name__)
+
+
+def positive_integer(value: str) -> int:
+    """
+
+    :param value: A command line argument
+    :return: The argument, as an integer
+    :raises: :exc:`argparse.ArgumentTypeError` if the argument is not an
+        integer of at least 1
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError('%r is not an integer' % value)
+    if number < 1:
+        raise argparse.ArgumentTypeError('%r is less than 1' % value)
+    return number
 
 
 class TopchefManager(Manager):
@@ -39,6 +71,11 @@ class TopchefManager(Manager):
         self.add_default_commands()
         self.add_command('run', self.Run(self.app))
         self.add_command('create-db', self.CreateDB(db_engine_factory))
+        self.add_command('upgrade-db', self.UpgradeDB(db_engine_factory))
+        self.add_command('reap', self.Reap(db_engine_factory))
+        self.add_command('sweep', self.Sweep(db_engine_factory))
+        self.add_command('purge', self.Purge(db_engine_factory))
+        self.add_command('archive', self.Archive(db_engine_factory))
 
     class Run(Command):
         def __init__(self, app: Flask) -> None:
@@ -46,7 +83,7 @@ class TopchefManager(Manager):
             self.app = app
 
         def run(self) -> None:
-            self.app.run()
+            self.app.run(threaded=True)
 
     class CreateDB(Command):
         def __init__(
@@ -62,6 +99,323 @@ class TopchefManager(Manager):
             engine = self.app_factory.engine
             self.schema.metadata.create_all(bind=engine)
 
+    class UpgradeDB(Command):
+        """
+        Add any tables, columns, and indexes that are missing from an
+        existing database
+        """
+        def __init__(
+                self,
+                app_factory: DatabaseEngineFactory,
+                schema_upgrader: SchemaUpgrader=SchemaUpgrader(
+                    DatabaseSchema()
+                )
+        ) -> None:
+            super(self.__class__, self).__init__()
+            self.app_factory = app_factory
+            self.schema_upgrader = schema_upgrader
+
+        def run(self):
+            self.schema_upgrader.upgrade(self.app_factory.engine)
+
+    class RepeatingCommand(Command):
+        """
+        A maintenance command that runs once by default, which makes it
+        suitable for running from ``cron``. With the ``--every`` option, the
+        command keeps running, and repeats itself every few seconds.
+        """
+        option_list = (
+            Option(
+                '--every', dest='interval', type=positive_integer,
+                default=None,
+                help='Keep running, and repeat the command every INTERVAL '
+                     'seconds'
+            ),
+        )
+
+        def run(self, interval: Optional[int]=None) -> None:
+            """
+
+            :param interval: The number of seconds to wait between runs. If
+                this is ``None``, the command runs once. Otherwise, a run
+                that fails is logged, and does not stop the runs after it
+            """
+            if interval is None:
+                self.run_once()
+                return
+
+            while True:
+                try:
+                    self.run_once()
+                except Exception:
+                    LOG.exception(
+                        'Failed to run %s', self.__class__.__name__
+                    )
+                sleep(interval)
+
+        def run_once(self) -> None:
+            """
+            Do the command's work once
+            """
+            raise NotImplementedError()
+
+    class Reap(RepeatingCommand):
+        """
+        Return jobs whose leases have expired to the queue
+        """
+        def __init__(
+                self,
+                app_factory: DatabaseEngineFactory,
+                job_list_constructor: Callable[[Session], JobList]=
+                JobListModel,
+                session_constructor: Callable[..., Session]=Session
+        ) -> None:
+            """
+
+            :param app_factory: The factory providing the database engine
+            :param job_list_constructor: A callable that takes a session,
+                and returns the list of all jobs
+            :param session_constructor: A callable that makes a session
+                bound to the engine passed into it
+            """
+            super(self.__class__, self).__init__()
+            self.app_factory = app_factory
+            self.job_list_constructor = job_list_constructor
+            self.session_constructor = session_constructor
+
+        def run_once(self) -> None:
+            self.reap()
+
+        def reap(self) -> int:
+            """
+
+            :return: The number of jobs that were returned to the queue
+            """
+            session = self.session_constructor(bind=self.app_factory.engine)
+            try:
+                job_list = self.job_list_constructor(session)
+                number_of_jobs = job_list.requeue_expired_jobs()
+                session.commit()
+            finally:
+                session.close()
+
+            LOG.info('Returned %d expired jobs to the queue', number_of_jobs)
+            return number_of_jobs
+
+    class Sweep(RepeatingCommand):
+        """
+        Mark services that have not checked in within their timeout as
+        unavailable, so that producers stop sending jobs to them
+        """
+        def __init__(
+                self,
+                app_factory: DatabaseEngineFactory,
+                service_list_constructor: Callable[[Session], ServiceList]=
+                ServiceListModel,
+                session_constructor: Callable[..., Session]=Session
+        ) -> None:
+            """
+
+            :param app_factory: The factory providing the database engine
+            :param service_list_constructor: A callable that takes a
+                session, and returns the list of all services
+            :param session_constructor: A callable that makes a session
+                bound to the engine passed into it
+            """
+            super(self.__class__, self).__init__()
+            self.app_factory = app_factory
+            self.service_list_constructor = service_list_constructor
+            self.session_constructor = session_constructor
+
+        def run_once(self) -> None:
+            self.sweep()
+
+        def sweep(self) -> int:
+            """
+
+            :return: The number of services that were marked unavailable
+            """
+            session = self.session_constructor(bind=self.app_factory.engine)
+            try:
+                service_list = self.service_list_constructor(session)
+                number_of_services = \
+                    service_list.mark_timed_out_services_unavailable()
+                session.commit()
+            finally:
+                session.close()
+
+            LOG.info(
+                'Marked %d timed out services as unavailable',
+                number_of_services
+            )
+            return number_of_services
+
+    class BlobCollectingCommand(RepeatingCommand):
+        """
+        A maintenance command that removes the result blobs that no job
+        refers to any more, after it has done its work
+        """
+        def remove_unreferenced_blobs(self) -> int:
+            """
+
+            :return: The number of blobs that were removed
+            """
+            session = self.session_constructor(bind=self.app_factory.engine)
+            try:
+                referenced_digests = referenced_result_blobs(session)
+            finally:
+                session.close()
+
+            number_of_blobs = self.blob_store.remove_unreferenced(
+                referenced_digests
+            )
+            LOG.info('Removed %d unreferenced result blobs', number_of_blobs)
+            return number_of_blobs
+
+    class Purge(BlobCollectingCommand):
+        """
+        Remove the jobs of deleted services, and then the services
+        themselves, in chunks of ``PURGE_CHUNK_SIZE`` jobs. Each chunk is
+        deleted in its own short transaction, so that purging a service
+        with many jobs does not hold locks on the jobs table for long. The
+        results of the deleted jobs are then removed from the blob store
+        """
+        def __init__(
+                self,
+                app_factory: DatabaseEngineFactory,
+                service_list_constructor: Callable[[Session], ServiceList]=
+                ServiceListModel,
+                session_constructor: Callable[..., Session]=Session,
+                chunk_size: int=config.PURGE_CHUNK_SIZE,
+                blob_store: BlobStore=RESULT_BLOB_STORE
+        ) -> None:
+            """
+
+            :param app_factory: The factory providing the database engine
+            :param service_list_constructor: A callable that takes a
+                session, and returns the list of all services
+            :param session_constructor: A callable that makes a session
+                bound to the engine passed into it
+            :param chunk_size: The maximum number of jobs to delete in one
+                transaction
+            :param blob_store: The store of the results of the jobs
+            """
+            super(self.__class__, self).__init__()
+            self.app_factory = app_factory
+            self.service_list_constructor = service_list_constructor
+            self.session_constructor = session_constructor
+            self.chunk_size = chunk_size
+            self.blob_store = blob_store
+
+        def run_once(self) -> None:
+            self.purge()
+            self.remove_unreferenced_blobs()
+
+        def purge(self) -> int:
+            """
+            Delete chunks of jobs until every deleted service has been
+            purged
+
+            :return: The number of jobs that were deleted
+            """
+            number_of_jobs = 0
+            while True:
+                number_of_jobs_in_chunk = self.purge_chunk()
+                number_of_jobs += number_of_jobs_in_chunk
+                if number_of_jobs_in_chunk < self.chunk_size:
+                    break
+
+            LOG.info(
+                'Purged %d jobs of deleted services', number_of_jobs
+            )
+            return number_of_jobs
+
+        def purge_chunk(self) -> int:
+            """
+
+            :return: The number of jobs deleted in this chunk
+            """
+            session = self.session_constructor(bind=self.app_factory.engine)
+            try:
+                service_list = self.service_list_constructor(session)
+                number_of_jobs = service_list.purge_deleted_services(
+                    self.chunk_size
+                )
+                session.commit()
+            finally:
+                session.close()
+            return number_of_jobs
+
+    class Archive(BlobCollectingCommand):
+        """
+        Move finished jobs that are older than the job retention of their
+        service into the archive, in chunks of ``ARCHIVE_CHUNK_SIZE`` jobs.
+        Each chunk is moved in its own short transaction. Result blobs that
+        no job refers to are then removed from the blob store
+        """
+        def __init__(
+                self,
+                app_factory: DatabaseEngineFactory,
+                job_archive_constructor: Callable[[Session], JobArchive]=
+                JobArchiveModel,
+                session_constructor: Callable[..., Session]=Session,
+                chunk_size: int=config.ARCHIVE_CHUNK_SIZE,
+                blob_store: BlobStore=RESULT_BLOB_STORE
+        ) -> None:
+            """
+
+            :param app_factory: The factory providing the database engine
+            :param job_archive_constructor: A callable that takes a session,
+                and returns the job archive
+            :param session_constructor: A callable that makes a session
+                bound to the engine passed into it
+            :param chunk_size: The maximum number of jobs to move in one
+                transaction
+            :param blob_store: The store of the results of the jobs
+            """
+            super(self.__class__, self).__init__()
+            self.app_factory = app_factory
+            self.job_archive_constructor = job_archive_constructor
+            self.session_constructor = session_constructor
+            self.chunk_size = chunk_size
+            self.blob_store = blob_store
+
+        def run_once(self) -> None:
+            self.archive()
+            self.remove_unreferenced_blobs()
+
+        def archive(self) -> int:
+            """
+            Move chunks of jobs until every expired job has been archived
+
+            :return: The number of jobs that were archived
+            """
+            number_of_jobs = 0
+            while True:
+                number_of_jobs_in_chunk = self.archive_chunk()
+                number_of_jobs += number_of_jobs_in_chunk
+                if number_of_jobs_in_chunk < self.chunk_size:
+                    break
+
+            LOG.info('Archived %d expired jobs', number_of_jobs)
+            return number_of_jobs
+
+        def archive_chunk(self) -> int:
+            """
+
+            :return: The number of jobs archived in this chunk
+            """
+            session = self.session_constructor(bind=self.app_factory.engine)
+            try:
+                job_archive = self.job_archive_constructor(session)
+                number_of_jobs = job_archive.archive_expired_jobs(
+                    self.chunk_size
+                )
+                session.commit()
+            finally:
+                session.close()
+            return number_of_jobs
+
 
 if __name__ == '__main__':
     manager = TopchefManager()
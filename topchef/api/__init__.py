@@ -8,5 +8,13 @@ from .jobs_list import JobsList
 from .jobs_for_service import JobsForServiceID as JobsForService
 from .job_queue import JobQueueForServiceID as JobQueueForService
 from .next_job import NextJobForServiceID as NextJob
+from .lease_jobs import LeaseJobsForServiceID as LeaseJobs
 from .job_detail import JobDetailForJobID as JobDetail
+from .job_sets_for_service import JobSetsForServiceID as JobSetsForService
+from .job_set_detail import JobSetDetail
+from .lease_extension import LeaseExtension
+from .job_results import JobResultsForJobID as JobResults
+from .heartbeat import Heartbeat
+from .service_deletion import ServiceDeletion
 from .validator import JSONSchemaValidator
+from .schema_detail import SchemaDetail
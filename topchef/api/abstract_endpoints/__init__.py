@@ -12,7 +12,8 @@ argument to a method that Flask dispatches. Using the classes defined here,
 we can define these methods (like ``get``) to work with ``Service`` instead
 of ``service_id``. The error handling is done once, in a separate place.
 """
-from .abstract_endpoint import AbstractEndpoint
+from .abstract_endpoint import AbstractEndpoint, parse_uuid
+from .meta_schema import MetaSchema
 from .endpoint_for_service import AbstractEndpointForServiceMeta
 from .endpoint_for_service import AbstractEndpointForService
 from .endpoint_for_service import EndpointForServiceIdMeta
@@ -3,23 +3,52 @@ Provides an abstract endpoint unique to this API from which all other
 endpoints will inherit. This takes care of managing the database session,
 as well as providing a ``links`` object containing the endpoint to itself.
 """
+import hashlib
+from datetime import datetime, timedelta, timezone
 from functools import reduce
-from flask import Response, jsonify
+from flask import Response, jsonify, current_app, stream_with_context
 from flask.views import View, http_method_funcs
 from flask import url_for, Request
 from flask import request as flask_request
 from werkzeug.exceptions import BadRequest
+from werkzeug.routing import BuildError
+from marshmallow import fields, ValidationError as MarshmallowValidationError
 from sqlalchemy.orm import Session
 import abc
-from typing import List, Iterable, Callable, Optional, Any, Set
-from topchef.models import APIError
+from typing import List, Iterable, Callable, Optional, Any, Set, Sequence
+from typing import Tuple, Iterator, Dict, Union
+from uuid import UUID
+from topchef.models import APIError, Job, JobList
 from topchef.models.errors import MethodNotAllowedError
 from topchef.models.errors import SQLAlchemyError
 from topchef.models.errors import RequestNotJSONError
+from topchef.models.errors import QueryParameterError
+from topchef.models.errors import NotUUIDError
 from topchef.serializers import APIException as ExceptionSerializer
 from topchef.serializers import JSONSchema
+from topchef.serializers import json_encoder
+from topchef.config import config
+from topchef.api.entity_tags import matching_entity_tag
+from topchef.models.schema_registry import PublishedSchema
+from .meta_schema import MetaSchema
 
-__all__ = ['AbstractEndpoint']
+__all__ = ['AbstractEndpoint', 'StreamedPage']
+
+
+def parse_uuid(identifier: Union[str, UUID]) -> UUID:
+    """
+    Parse an ID taken from the URL of an endpoint
+
+    :param identifier: The ID
+    :return: The ID as a UUID
+    :raises: :exc:`NotUUIDError` if the ID is not a UUID
+    """
+    if isinstance(identifier, UUID):
+        return identifier
+    try:
+        return UUID(identifier)
+    except ValueError:
+        raise NotUUIDError(identifier)
 
 
 class AbstractMethodViewType(abc.ABCMeta):
@@ -83,6 +112,19 @@ class AbstractEndpoint(View, metaclass=AbstractMethodViewType):
     The ``links`` object exists primarily to display a link to the current
     endpoint. If an endpoint will be paginated, the pagination links should
     go into this object.
+
+    The ``meta`` object mostly holds JSON schemas describing the response.
+    These should be declared with :class:`MetaSchema`, so that they are
+    built once rather than on every request, and placed in the ``meta``
+    object with :meth:`AbstractEndpoint.schema_reference`, so that clients
+    can fetch them once and cache them. Clients that do not need the
+    ``meta`` object can leave it out of a response with ``?meta=false``.
+
+    Endpoints whose responses are built from versioned rows can answer
+    conditional requests with :meth:`AbstractEndpoint.conditional_response`.
+    The entity tag of such a response is derived from the versions of the
+    rows, so a client holding a current copy of the response gets a ``304``
+    without the rows being serialized again.
     """
     def __init__(
             self, session: Session, request: Request=flask_request
@@ -129,6 +171,176 @@ class AbstractEndpoint(View, metaclass=AbstractMethodViewType):
 
         return response
 
+    @classmethod
+    def precompute_meta_schemas(cls) -> None:
+        """
+        Build every :class:`MetaSchema` declared by this endpoint, so that
+        they are ready before the first request arrives
+        """
+        MetaSchema.precompute(cls)
+
+    def jsonify(self, document: dict) -> Response:
+        """
+
+        :param document: The document to place in the body of the response
+        :return: A JSON response with the document, which is the same as
+            the response returned by :func:`flask.jsonify`. The ``meta``
+            object is left out if the client asked for it not to be sent
+        """
+        if not self.meta_requested:
+            document = {
+                key: value for key, value in document.items() if key != 'meta'
+            }
+
+        body = json_encoder.dumps(document, **self._json_options)
+        return current_app.response_class(
+            (body, '\n'), mimetype=current_app.config['JSONIFY_MIMETYPE']
+        )
+
+    def streamed_jsonify(self, document: dict) -> Response:
+        """
+        Send a JSON document while it is being built. The values of the
+        document may be iterators, whose items are serialized and sent one
+        at a time, or functions taking no arguments, which are called once
+        everything before them has been sent. The text of the response is
+        the same as the text that :meth:`AbstractEndpoint.jsonify` would
+        send for the finished document.
+
+        The body is produced after this endpoint has committed its session,
+        so the iterators read the database in a transaction of their own.
+        The session is closed once the body has been sent, so that the
+        transaction does not stay open between requests.
+
+        :param document: The document to place in the body of the response
+        :return: A streamed JSON response with the document
+        """
+        if not self.meta_requested:
+            document = {
+                key: value for key, value in document.items() if key != 'meta'
+            }
+
+        chunks = json_encoder.iterdumps(document, **self._json_options)
+        session = self.database_session
+
+        def body() -> Iterator[str]:
+            try:
+                yield from chunks
+                yield '\n'
+            finally:
+                session.close()
+
+        return current_app.response_class(
+            stream_with_context(body()),
+            mimetype=current_app.config['JSONIFY_MIMETYPE']
+        )
+
+    @property
+    def _json_options(self) -> Dict[str, Any]:
+        """
+
+        :return: The arguments with which documents are encoded, which are
+            the same as the ones that :func:`flask.jsonify` uses
+        """
+        indent = None
+        separators = (',', ':')
+        if current_app.config['JSONIFY_PRETTYPRINT_REGULAR'] and \
+                not self._request.is_xhr:
+            indent = 2
+            separators = (', ', ': ')
+
+        return {
+            'indent': indent,
+            'separators': separators,
+            'sort_keys': current_app.config['JSON_SORT_KEYS'],
+            'ensure_ascii': current_app.config['JSON_AS_ASCII'],
+            'default': current_app.json_encoder().default
+        }
+
+    @staticmethod
+    def schema_reference(schema: PublishedSchema) -> dict:
+        """
+
+        :param schema: A schema declared with :class:`MetaSchema`
+        :return: A JSON reference to the URL at which the schema is served
+            by the ``SchemaDetail`` endpoint. If the app does not serve
+            schemas, the schema itself is returned instead
+        """
+        try:
+            return {'$ref': url_for(
+                'SchemaDetail', schema_fingerprint=schema.fingerprint,
+                _external=True
+            )}
+        except BuildError:
+            return schema
+
+    def entity_tag(self, *versions: Any) -> str:
+        """
+
+        :param versions: Values that change whenever the response body
+            changes, such as the IDs and versions of the rows in it
+        :return: A strong entity tag for the response. The tag also covers
+            the API version, the endpoint, and the query string, since these
+            change the body as well
+        """
+        tag = hashlib.sha256()
+        for part in (
+                config.VERSION, self.__class__.__name__,
+                self._request.query_string
+        ) + versions:
+            tag.update(str(part).encode('utf-8'))
+            tag.update(b'\0')
+        return tag.hexdigest()
+
+    @staticmethod
+    def version_digest(versions: Iterable[Tuple[UUID, int]]) -> str:
+        """
+
+        :param versions: The IDs and versions of a collection of rows, in
+            a stable order, such as those returned by
+            :meth:`topchef.models.JobList.versions`
+        :return: A hash of the versions, which can be passed to
+            :meth:`AbstractEndpoint.entity_tag`, so that a tag can cover
+            an unbounded number of rows
+        """
+        digest = hashlib.sha256()
+        for row_id, version in versions:
+            digest.update(('%s:%d;' % (row_id, version)).encode('utf-8'))
+        return digest.hexdigest()
+
+    def conditional_response(
+            self, etag: str, build_response: Callable[[], Response]
+    ) -> Response:
+        """
+
+        :param etag: The entity tag of the current response, as returned by
+            :meth:`AbstractEndpoint.entity_tag`
+        :param build_response: A function that builds the full response.
+            It is only called if the client does not have the current
+            response already
+        :return: A ``304`` response if the tag, or the tag of a compressed
+            copy of the response, matches the ``If-None-Match`` header of
+            the request, otherwise the full response. Either response
+            carries the tag that the client should keep in its ``ETag``
+            header
+        """
+        matching_etag = matching_entity_tag(etag, self._request.if_none_match)
+        if matching_etag is not None:
+            response = Response(status=304)
+            response.set_etag(matching_etag)
+        else:
+            response = build_response()
+            response.set_etag(etag)
+        return response
+
+    @property
+    def meta_requested(self) -> bool:
+        """
+
+        :return: ``False`` if the ``meta`` query parameter is ``false``,
+            otherwise ``True``
+        """
+        return self._request.args.get('meta', 'true').lower() != 'false'
+
     @property
     def request_json(self) -> dict:
         """
@@ -144,6 +356,254 @@ class AbstractEndpoint(View, metaclass=AbstractMethodViewType):
         else:
             return json
 
+    def get_integer_query_parameter(
+            self,
+            parameter_name: str,
+            default: int,
+            minimum: int=0,
+            maximum: Optional[int]=None
+    ) -> int:
+        """
+        Read an integer out of the query string of the request. Values
+        larger than ``maximum`` are clamped to ``maximum``, so that clients
+        cannot ask the API to do an unbounded amount of work.
+
+        :param parameter_name: The name of the query parameter to read
+        :param default: The value to return if the parameter is not supplied
+        :param minimum: The smallest value that the parameter may take
+        :param maximum: The largest value that the parameter may take. If
+            this is ``None``, the parameter is not bounded from above
+        :return: The value of the query parameter
+        :raises: :exc:`QueryParameterError` if the parameter is not an
+            integer, or if it is smaller than ``minimum``
+        """
+        raw_value = self._request.args.get(parameter_name)
+        if raw_value is None:
+            return default
+
+        try:
+            value = int(raw_value)
+        except ValueError:
+            raise QueryParameterError(
+                parameter_name, raw_value, 'an integer'
+            )
+
+        if value < minimum:
+            raise QueryParameterError(
+                parameter_name, raw_value,
+                'an integer greater than or equal to %d' % minimum
+            )
+
+        if maximum is not None:
+            value = min(value, maximum)
+
+        return value
+
+    def get_boolean_query_parameter(
+            self, parameter_name: str
+    ) -> Optional[bool]:
+        """
+
+        :param parameter_name: The name of the query parameter to read
+        :return: The value of the query parameter, or ``None`` if the
+            parameter is not supplied
+        :raises: :exc:`QueryParameterError` if the parameter is neither
+            ``true`` nor ``false``
+        """
+        raw_value = self._request.args.get(parameter_name)
+        if raw_value is None:
+            return None
+
+        if raw_value.lower() not in ('true', 'false'):
+            raise QueryParameterError(
+                parameter_name, raw_value, 'true or false'
+            )
+
+        return raw_value.lower() == 'true'
+
+    def get_uuid_query_parameter(self, parameter_name: str) -> Optional[UUID]:
+        """
+
+        :param parameter_name: The name of the query parameter to read
+        :return: The UUID in the query parameter, or ``None`` if the
+            parameter is not supplied
+        :raises: :exc:`QueryParameterError` if the parameter is not a UUID
+        """
+        raw_value = self._request.args.get(parameter_name)
+        if raw_value is None:
+            return None
+
+        try:
+            return UUID(raw_value)
+        except ValueError:
+            raise QueryParameterError(parameter_name, raw_value, 'a UUID')
+
+    def get_requested_fields(
+            self, available_fields: Iterable[str]
+    ) -> Optional[Tuple[str, ...]]:
+        """
+        Read the comma-separated list of attributes that the client wants
+        in the response out of the ``fields`` query parameter
+
+        :param available_fields: The attributes that the client may ask for
+        :return: The requested attributes, or ``None`` if the client did not
+            restrict the attributes
+        :raises: :exc:`QueryParameterError` if an attribute is not one of
+            the available fields, or if no attributes are given
+        """
+        raw_value = self._request.args.get('fields')
+        if raw_value is None:
+            return None
+
+        available_fields = frozenset(available_fields)
+        fields = tuple(
+            field.strip() for field in raw_value.split(',') if field.strip()
+        )
+
+        if not fields or not available_fields.issuperset(fields):
+            raise QueryParameterError(
+                'fields', raw_value,
+                'a comma-separated list of fields from %s' % ', '.join(
+                    sorted(available_fields)
+                )
+            )
+
+        return fields
+
+    def get_datetime_query_parameter(
+            self, parameter_name: str
+    ) -> Optional[datetime]:
+        """
+
+        :param parameter_name: The name of the query parameter to read
+        :return: The ISO 8601 date and time in the query parameter, in UTC,
+            or ``None`` if the parameter is not supplied. Times without a
+            time zone are taken to be in UTC, like the times stored by the
+            API
+        :raises: :exc:`QueryParameterError` if the parameter is not an ISO
+            8601 date and time
+        """
+        raw_value = self._request.args.get(parameter_name)
+        if raw_value is None:
+            return None
+
+        try:
+            value = fields.DateTime().deserialize(raw_value)
+        except MarshmallowValidationError:
+            raise QueryParameterError(
+                parameter_name, raw_value, 'an ISO 8601 date and time'
+            )
+
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+        return value
+
+    @property
+    def requested_page_size(self) -> int:
+        """
+
+        :return: The number of items per page requested through the
+            ``limit`` query parameter. This defaults to the
+            ``DEFAULT_PAGE_SIZE`` configuration parameter, and is capped by
+            ``MAXIMUM_PAGE_SIZE``
+        """
+        return self.get_integer_query_parameter(
+            'limit', default=config.DEFAULT_PAGE_SIZE, minimum=1,
+            maximum=config.MAXIMUM_PAGE_SIZE
+        )
+
+    def get_page_of_jobs(self, job_list: JobList) -> Sequence[Job]:
+        """
+        Get the page of jobs requested through the ``limit`` and ``after``
+        query parameters. ``after`` is the ID of the last job on the
+        previous page, as given in the ``next`` link of that page.
+
+        :param job_list: The jobs to page through
+        :return: The jobs on the requested page
+        :raises: :exc:`QueryParameterError` if ``after`` is not the ID of a
+            job in the list
+        """
+        after = self.get_uuid_query_parameter('after')
+        try:
+            return job_list.page(self.requested_page_size, after)
+        except KeyError:
+            raise QueryParameterError(
+                'after', str(after), 'the ID of a job in this list'
+            )
+
+    def get_streamed_page_of_jobs(self, job_list: JobList) -> 'StreamedPage':
+        """
+        Get the page of jobs requested through the ``limit`` and ``after``
+        query parameters, in the same way as
+        :meth:`AbstractEndpoint.get_page_of_jobs`, but read as the page is
+        sent
+
+        :param job_list: The jobs to page through
+        :return: The jobs on the requested page
+        :raises: :exc:`QueryParameterError` if ``after`` is not the ID of a
+            job in the list
+        """
+        after = self.get_uuid_query_parameter('after')
+        try:
+            jobs = job_list.stream_page(self.requested_page_size, after)
+        except KeyError:
+            raise QueryParameterError(
+                'after', str(after), 'the ID of a job in this list'
+            )
+        return StreamedPage(jobs)
+
+    def next_page_url(self, page: Sequence[Job], **values) -> Optional[str]:
+        """
+
+        :param page: The page of jobs returned by
+            :meth:`AbstractEndpoint.get_page_of_jobs`, or a page returned by
+            :meth:`AbstractEndpoint.get_streamed_page_of_jobs` that has
+            been read to the end
+        :param values: The URL parameters needed to build the URL of this
+            endpoint. The other query parameters of this request, such as
+            filters, are carried over to the next page
+        :return: The URL of the next page, or ``None`` if this is the last
+            page
+        """
+        page_size = self.requested_page_size
+        if len(page) < page_size:
+            return None
+
+        query_parameters = {
+            name: value for name, value in self._request.args.items()
+            if name not in ('limit', 'after')
+        }
+        query_parameters.update(values)
+
+        return url_for(
+            self.__class__.__name__, limit=page_size, after=str(page[-1].id),
+            _external=True, **query_parameters
+        )
+
+    @property
+    def requested_lease_duration(self) -> timedelta:
+        """
+
+        :return: The duration of a job lease requested through the ``lease``
+            query parameter, in seconds. This defaults to the
+            ``JOB_LEASE_SECONDS`` configuration parameter, and is capped by
+            ``MAXIMUM_JOB_LEASE_SECONDS``
+        """
+        return timedelta(seconds=self.get_integer_query_parameter(
+            'lease', default=config.JOB_LEASE_SECONDS, minimum=1,
+            maximum=config.MAXIMUM_JOB_LEASE_SECONDS
+        ))
+
+    @property
+    def requested_lease_owner(self) -> Optional[str]:
+        """
+
+        :return: The name of the worker making the request, as given by the
+            ``worker`` query parameter, or ``None`` if it was not given
+        """
+        return self._request.args.get('worker')
+
     @property
     def links(self) -> dict:
         """
@@ -230,20 +690,27 @@ class AbstractEndpoint(View, metaclass=AbstractMethodViewType):
         )
         serializer = ExceptionSerializer()
 
-        error_schema = JSONSchema(
-            title='Error Schema',
-            description='Describes the schema for an API Exception'
-        )
-
-        response = jsonify({
+        response = self.jsonify({
             'errors': serializer.dump(exception),
             'meta': {
-                'error_schema': error_schema.dump(serializer)
+                'error_schema': self.schema_reference(self._error_schema)
             }
         })
         response.status_code = exception.status_code
         return response
 
+    @MetaSchema
+    def _error_schema(cls) -> dict:
+        """
+
+        :return: The schema for an error returned by the API
+        """
+        error_schema = JSONSchema(
+            title='Error Schema',
+            description='Describes the schema for an API Exception'
+        )
+        return error_schema.dump(ExceptionSerializer())
+
     def _close_session(self, session: Session) -> None:
         """
         Safely close the session. If there is an error from ``SQLAlchemy``,
@@ -300,3 +767,49 @@ class AbstractEndpoint(View, metaclass=AbstractMethodViewType):
         Exception thrown if the endpoint has to stop. The error response
         will be returned at this point.
         """
+
+
+class StreamedPage(Iterator[Job]):
+    """
+    A page of jobs that is read while it is being sent. The page keeps
+    track of the jobs that were read, so that once it has been read to the
+    end, it can be used to build the link to the next page in the same way
+    as a page that was read all at once.
+    """
+    def __init__(self, jobs: Iterator[Job]) -> None:
+        """
+
+        :param jobs: The jobs on the page
+        """
+        self._jobs = jobs
+        self._number_of_jobs = 0
+        self._last_job = None  # type: Optional[Job]
+
+    def __iter__(self) -> 'StreamedPage':
+        return self
+
+    def __next__(self) -> Job:
+        job = next(self._jobs)
+        self._number_of_jobs += 1
+        self._last_job = job
+        return job
+
+    def __len__(self) -> int:
+        """
+
+        :return: The number of jobs read so far
+        """
+        return self._number_of_jobs
+
+    def __getitem__(self, index: int) -> Job:
+        """
+
+        :param index: ``-1``, which is the only index supported
+        :return: The last job read so far
+        :raises: :exc:`IndexError` if no job was read, or if another index
+            is requested
+        """
+        if index != -1 or self._last_job is None:
+            raise IndexError('Only the last job read from the page is kept')
+        return self._last_job
+
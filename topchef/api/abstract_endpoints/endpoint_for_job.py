@@ -2,14 +2,15 @@
 Describes an abstract endpoint that maps a Job UUID to a particular Job
 """
 import abc
-from .abstract_endpoint import AbstractMethodViewType
+from .abstract_endpoint import AbstractMethodViewType, parse_uuid
 from uuid import UUID
 from functools import wraps
 from flask import Response, Request, request
-from typing import Union, Optional
+from typing import Optional
 from topchef.api.abstract_endpoints import AbstractEndpoint
-from topchef.models.errors import NotUUIDError, JobWithUUIDNotFound
-from topchef.models import Job, JobList
+from topchef.models.errors import JobWithUUIDNotFound
+from topchef.models import Job, JobArchive, JobList
+from topchef.models.job_archive import JobArchive as JobArchiveModel
 from topchef.models.job_list import JobList as JobListModel
 from sqlalchemy.orm import Session
 
@@ -35,10 +36,12 @@ class EndpointForJobIdMeta(AbstractMethodViewType):
 
         cls._decorate_endpoints()
 
-    def _job_decorator(cls, function_to_decorate):
+    def _job_decorator(cls, function_to_decorate, find_archived_jobs=False):
         """
 
         :param function_to_decorate: The job endpoint to decorate
+        :param find_archived_jobs: If ``True``, jobs that are not in the job
+            list are looked up in the endpoint's ``job_archive``
         :return:
         """
 
@@ -46,35 +49,34 @@ class EndpointForJobIdMeta(AbstractMethodViewType):
         def decorated_function(
                 instance, job_id: str, *args, **kwargs
         ) -> Response:
-            if not cls._is_uuid(job_id):
-                raise NotUUIDError(job_id)
-
-            job = cls._get_job(instance, UUID(job_id))
+            job = cls._get_job(
+                instance, parse_uuid(job_id), find_archived_jobs
+            )
 
             return function_to_decorate(instance, job, *args, **kwargs)
 
         return decorated_function
 
     @staticmethod
-    def _is_uuid(job_id: Union[str, UUID]) -> bool:
-        if isinstance(job_id, UUID):
-            return True
+    def _get_job(
+            instance, job_id: UUID, find_archived_jobs: bool=False
+    ) -> Job:
         try:
-            UUID(job_id)
-            return True
-        except ValueError:
-            return False
+            return instance.job_list[job_id]
+        except KeyError:
+            if not find_archived_jobs:
+                raise JobWithUUIDNotFound(job_id)
 
-    @staticmethod
-    def _get_job(instance, job_id: UUID) -> Job:
         try:
-            return instance.job_list[job_id]
+            return instance.job_archive[job_id]
         except KeyError:
             raise JobWithUUIDNotFound(job_id)
 
     def _decorate_endpoints(cls) -> None:
         if hasattr(cls, 'get'):
-            cls.get = cls._job_decorator(cls.get)
+            cls.get = cls._job_decorator(
+                cls.get, find_archived_jobs=hasattr(cls, 'job_archive')
+            )
         if hasattr(cls, 'put'):
             cls.put = cls._job_decorator(cls.put)
         if hasattr(cls, 'post'):
@@ -92,12 +94,29 @@ class AbstractEndpointForJobMeta(EndpointForJobIdMeta, abc.ABCMeta):
 class AbstractEndpointForJob(AbstractEndpoint, metaclass=abc.ABCMeta):
     def __init__(
             self, session: Session, flask_request: Request=request,
-            job_list: Optional[JobList]=None
+            job_list: Optional[JobList]=None,
+            job_archive: Optional[JobArchive]=None
     ):
         super(AbstractEndpointForJob, self).__init__(session, flask_request)
         if job_list is None:
             self._job_list = JobListModel(self.database_session)
+        else:
+            self._job_list = job_list
+
+        if job_archive is None:
+            self._job_archive = JobArchiveModel(self.database_session)
+        else:
+            self._job_archive = job_archive
 
     @property
     def job_list(self) -> JobList:
         return self._job_list
+
+    @property
+    def job_archive(self) -> JobArchive:
+        """
+
+        :return: The archive in which ``GET`` requests look for jobs that
+            are no longer in the job list
+        """
+        return self._job_archive
@@ -4,18 +4,29 @@ use for wrapping the service endpoint
 """
 import abc
 from functools import wraps
+from time import monotonic
 from sqlalchemy.orm import Session
 from flask import Response, Request, request
 from topchef.models import ServiceList
 from topchef.models.service_list import ServiceList as ServiceListModel
-from topchef.models.errors import NotUUIDError, ServiceWithUUIDNotFound
+from topchef.models.errors import ServiceWithUUIDNotFound
+from topchef.models.errors import DeserializationError, ValidationError
+from topchef.models.new_job_notifier import NEW_JOB_NOTIFIER, NewJobNotifier
+from topchef.config import config
+from topchef.json_type import JSON_TYPE as JSON
+from topchef.serializers import NewJob as NewJobSerializer
+from jsonschema import Draft4Validator as JSONSchemaValidator
 from uuid import UUID
 from topchef.models import Service
 from .abstract_endpoint import AbstractEndpoint, AbstractMethodViewType
-from typing import Union, Optional
+from .abstract_endpoint import parse_uuid
+from typing import Optional, Callable, TypeVar, Sequence, List, Tuple
 from flask import url_for
 
 
+T = TypeVar('T')
+
+
 class EndpointForServiceIdMeta(AbstractMethodViewType):
     """
     A metaclass for getting the service
@@ -47,25 +58,12 @@ class EndpointForServiceIdMeta(AbstractMethodViewType):
         def decorated_function(
                 instance, service_id: str, *args, **kwargs
         ) -> Response:
-            if not cls._is_uuid(service_id):
-                raise NotUUIDError(service_id)
-
-            service = cls._get_service(instance, UUID(service_id))
+            service = cls._get_service(instance, parse_uuid(service_id))
 
             return function_to_decorate(instance, service, *args, **kwargs)
 
         return decorated_function
 
-    @staticmethod
-    def _is_uuid(service_id: Union[str, UUID]) -> bool:
-        if isinstance(service_id, UUID):
-            return True
-        try:
-            UUID(service_id)
-            return True
-        except ValueError:
-            return False
-
     @staticmethod
     def _get_service(instance, service_id: UUID) -> Service:
         try:
@@ -96,6 +94,8 @@ class AbstractEndpointForServiceMeta(EndpointForServiceIdMeta, abc.ABCMeta):
 class AbstractEndpointForService(
     AbstractEndpoint, metaclass=abc.ABCMeta
 ):
+    new_job_notifier = NEW_JOB_NOTIFIER  # type: NewJobNotifier
+
     def __init__(
             self, session: Session, flask_request: Request=request,
             service_list: Optional[ServiceList]=None
@@ -114,4 +114,88 @@ class AbstractEndpointForService(
 
     def self_url(self, service: Service) -> str:
         return url_for(self.__class__.__name__, service_id=service.id,
-                       _external=True)
\ No newline at end of file
+                       _external=True)
+
+    def wait_for_jobs(
+            self, service: Service, find_jobs: Callable[[], T]
+    ) -> T:
+        """
+        Look for jobs, and if none are found, hold the request until jobs
+        are registered for the service. The number of seconds to wait is
+        taken from the ``wait`` query parameter, and is capped by the
+        ``MAXIMUM_LONG_POLL_SECONDS`` configuration parameter. By default,
+        the request does not wait.
+
+        While waiting, the request is woken up as soon as a job is committed
+        for the service in this process. In order to pick up jobs committed
+        by other processes, the database is checked again every
+        ``LONG_POLL_RECHECK_SECONDS``.
+
+        :param service: The service for which jobs are to be found
+        :param find_jobs: A function that looks for jobs in the database,
+            and returns something falsy if there are none
+        :return: The last value returned by ``find_jobs``
+        """
+        timeout = self.get_integer_query_parameter(
+            'wait', default=0, minimum=0,
+            maximum=config.MAXIMUM_LONG_POLL_SECONDS
+        )
+        deadline = monotonic() + timeout
+
+        generation = self.new_job_notifier.generation(service.id)
+        jobs = find_jobs()
+
+        while not jobs:
+            time_left = deadline - monotonic()
+            if time_left <= 0:
+                break
+
+            self.database_session.commit()
+            self.new_job_notifier.wait(
+                service.id, generation,
+                min(time_left, config.LONG_POLL_RECHECK_SECONDS)
+            )
+
+            generation = self.new_job_notifier.generation(service.id)
+            jobs = find_jobs()
+
+        return jobs
+
+    @staticmethod
+    def check_new_jobs(
+            items: Sequence, validator: JSONSchemaValidator
+    ) -> Tuple[List[Tuple[int, JSON]], List[dict]]:
+        """
+        Check the items in the body of a request that creates many jobs.
+        Every item must satisfy the new job schema, and its parameters must
+        satisfy the service's job registration schema.
+
+        :param items: The items to check
+        :param validator: A validator for the job registration schema of the
+            service. It is built once by the caller and reused for every item
+        :return: The index and parameters of every valid item, and the index
+            and errors of every invalid item
+        """
+        deserializer = NewJobSerializer()
+        accepted_items = []  # type: List[Tuple[int, JSON]]
+        rejected_items = []  # type: List[dict]
+
+        for index, item in enumerate(items):
+            data, errors = deserializer.load(item)
+            if errors:
+                item_errors = [
+                    DeserializationError(key, errors[key])
+                    for key in errors.keys()
+                ]
+            else:
+                item_errors = [
+                    ValidationError(error)
+                    for error in validator.iter_errors(data['parameters'])
+                ]
+
+            if item_errors:
+                rejected_items.append({'index': index, 'errors': item_errors})
+            else:
+                accepted_items.append((index, data['parameters']))
+
+        return accepted_items, rejected_items
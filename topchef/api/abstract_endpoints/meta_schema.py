@@ -0,0 +1,92 @@
+"""
+Most endpoints describe the documents that they return and accept with JSON
+schemas, which are placed in the ``meta`` object of the response. These
+schemas are generated from marshmallow serializers, which is slow, but they
+never change while the API is running. The :class:`MetaSchema` descriptor
+builds each schema once per endpoint class, and then serves the same
+read-only document to every request. Each schema is also published in the
+:data:`topchef.models.schema_registry.SCHEMA_REGISTRY`, so that responses
+can refer to it by URL instead of including it.
+"""
+import threading
+from typing import Any, Callable, Dict
+from functools import update_wrapper
+from topchef.models.schema_registry import PublishedSchema, SchemaRegistry
+from topchef.models.schema_registry import SCHEMA_REGISTRY
+
+__all__ = ["MetaSchema"]
+
+
+class MetaSchema(object):
+    """
+    Decorates a function that takes an endpoint class and returns a JSON
+    schema, turning it into an attribute that can be read from the class or
+    from any of its instances. The schema is built the first time that it is
+    read for each endpoint class, and is published afterwards. The
+    published schema cannot be modified.
+
+    .. sourcecode:: python
+
+        class Endpoint(AbstractEndpoint):
+            @MetaSchema
+            def data_schema(cls) -> dict:
+                return JSONSchema(title='Data').dump(Serializer())
+    """
+    def __init__(
+            self,
+            build: Callable[[type], dict],
+            registry: SchemaRegistry=SCHEMA_REGISTRY
+    ) -> None:
+        """
+
+        :param build: The function that builds the schema for an endpoint
+            class
+        :param registry: The registry in which the schema is published
+        """
+        update_wrapper(self, build)
+        self._build = build
+        self._registry = registry
+        self._lock = threading.Lock()
+        self._documents = {}  # type: Dict[type, PublishedSchema]
+
+    def __get__(self, instance: Any, owner: type) -> PublishedSchema:
+        """
+
+        :param instance: The endpoint from which the schema is read, or
+            ``None`` if it is read from the class
+        :param owner: The endpoint class
+        :return: The schema for the endpoint class
+        """
+        return self.document_for(owner)
+
+    def document_for(self, endpoint_class: type) -> PublishedSchema:
+        """
+
+        :param endpoint_class: The class for which the schema is required
+        :return: The schema, which is built if this is the first time that
+            it was asked for
+        """
+        try:
+            return self._documents[endpoint_class]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if endpoint_class not in self._documents:
+                self._documents[endpoint_class] = self._registry.register(
+                    self._build(endpoint_class)
+                )
+            return self._documents[endpoint_class]
+
+    @classmethod
+    def precompute(cls, endpoint_class: type) -> None:
+        """
+        Build every schema that an endpoint class declares, so that no
+        request has to wait for one to be built
+
+        :param endpoint_class: The class whose schemas are to be built
+        """
+        for base in endpoint_class.__mro__:
+            for attribute in vars(base).values():
+                if isinstance(attribute, cls):
+                    attribute.document_for(endpoint_class)
@@ -2,10 +2,11 @@
 Describes the root endpoint of the API, which provides some metadata about
 the API.
 """
-from flask import jsonify, Response, Request, request
+from flask import Response, Request, request
 from sqlalchemy.orm import Session
 
 from topchef.api.abstract_endpoints.abstract_endpoint import AbstractEndpoint
+from topchef.api.abstract_endpoints.meta_schema import MetaSchema
 from topchef.models import APIMetadata as APIMetadataModelInterface
 from topchef.models.api_metadata import APIMetadata as MetadataModel
 from topchef.serializers import APIMetadata as MetadataSerializer
@@ -16,6 +17,10 @@ class APIMetadata(AbstractEndpoint):
     """
     Maps HTTP ``GET`` methods to the API's root endpoint
     """
+    metadata_schema_title = 'API Metadata'
+    metadata_schema_description = \
+        'Describes the JSON schema for describing API metadata'
+
     def __init__(
             self,
             session: Session,
@@ -62,39 +67,7 @@ class APIMetadata(AbstractEndpoint):
                 },
                 "meta": {
                     "schema": {
-                        "$schema": "http://json-schema.org/draft-04/schema#",
-                        "description": "Describes the JSON schema for describing API metadata",
-                        "properties": {
-                            "documentation_url": {
-                                "title": "documentation_url",
-                                "type": "string"
-                            },
-                            "maintainer_email": {
-                                "title": "maintainer_email",
-                                "type": "string"
-                            },
-                            "maintainer_name": {
-                                "title": "maintainer_name",
-                                "type": "string"
-                            },
-                            "source_code_repository_url": {
-                                "title": "source_code_repository_url",
-                                "type": "string"
-                            },
-                            "version": {
-                                "title": "version",
-                                "type": "string"
-                            }
-                        },
-                        "required": [
-                            "documentation_url",
-                            "maintainer_email",
-                            "maintainer_name",
-                            "source_code_repository_url",
-                            "version"
-                        ],
-                        "title": "API Metadata",
-                        "type": "object"
+                        "$ref": "http://localhost:5000/schemas/1370952136cbfd582fcfe913fc62b2052068cba8e351a96857a6929ecd3bc772"
                     }
                 }
             }
@@ -103,7 +76,7 @@ class APIMetadata(AbstractEndpoint):
 
         :return: A response containing the metadata
         """
-        response = jsonify({
+        response = self.jsonify({
             'data': self._data, 'meta': self._meta, 'links': self.links
         })
         response.status_code = 200
@@ -116,19 +89,15 @@ class APIMetadata(AbstractEndpoint):
 
     @property
     def _meta(self) -> dict:
-        serializer = MetadataSerializer(strict=True)
-        json_schema_serializer = JSONSchema(
-            title=self.metadata_schema_title,
-            description=self.metadata_schema_description
-        )
         return {
-            'schema': json_schema_serializer.dump(serializer, many=False)
+            'schema': self.schema_reference(self._metadata_schema)
         }
 
-    @property
-    def metadata_schema_title(self) -> str:
-        return 'API Metadata'
-
-    @property
-    def metadata_schema_description(self) -> str:
-        return 'Describes the JSON schema for describing API metadata'
+    @MetaSchema
+    def _metadata_schema(cls) -> dict:
+        serializer = MetadataSerializer(strict=True)
+        json_schema_serializer = JSONSchema(
+            title=cls.metadata_schema_title,
+            description=cls.metadata_schema_description
+        )
+        return json_schema_serializer.dump(serializer, many=False)
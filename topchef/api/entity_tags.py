@@ -0,0 +1,49 @@
+"""
+Contains the entity tags of compressed representations.
+
+A compressed body is a different representation from the uncompressed one,
+so it must not share a strong entity tag with it. The strong ``ETag`` of a
+compressed response is suffixed with the name of the encoding by
+:class:`topchef.compression_middleware.CompressionMiddleware`, and
+endpoints use :func:`matching_entity_tag` to recognize either form in
+``If-None-Match`` headers.
+"""
+from typing import Optional
+from werkzeug.datastructures import ETags
+from werkzeug.http import quote_etag, unquote_etag
+
+__all__ = ["CONTENT_ENCODINGS", "encoded_entity_tag", "matching_entity_tag"]
+
+CONTENT_ENCODINGS = ('gzip', 'deflate')
+
+
+def encoded_entity_tag(etag_header: str, encoding: str) -> str:
+    """
+
+    :param etag_header: The ``ETag`` header of an uncompressed response
+    :param encoding: The compression applied to the response body
+    :return: The ``ETag`` header of the compressed response. Weak tags
+        only promise that the content is equivalent, so they are left as
+        they are
+    """
+    etag, weak = unquote_etag(etag_header)
+    if weak or etag is None:
+        return etag_header
+    return quote_etag('%s-%s' % (etag, encoding))
+
+
+def matching_entity_tag(etag: str, if_none_match: ETags) -> Optional[str]:
+    """
+
+    :param etag: The strong entity tag of the uncompressed response
+    :param if_none_match: The entity tags that the client already has
+    :return: The form of the tag that the client has, which is either the
+        tag itself, or the tag of one of its compressed representations.
+        ``None`` is returned if the client has none of them
+    """
+    for candidate in [etag] + [
+        '%s-%s' % (etag, encoding) for encoding in CONTENT_ENCODINGS
+    ]:
+        if candidate in if_none_match:
+            return candidate
+    return None
@@ -0,0 +1,53 @@
+"""
+Maps the ``/services/<service_id>/heartbeat`` endpoint
+"""
+from flask import Response
+from topchef.api.abstract_endpoints import AbstractEndpointForService
+from topchef.api.abstract_endpoints import parse_uuid
+from topchef.models.errors import ServiceWithUUIDNotFound
+
+
+class Heartbeat(AbstractEndpointForService):
+    """
+    Lets services check in without modifying or reading their details.
+    Unlike ``PATCH /services/<service_id>``, this endpoint does not load the
+    service, and does not return a body, so that workers can check in often
+    without loading the API.
+    """
+    def post(self, service_id: str) -> Response:
+        """
+        Reset the service's timeout. Heartbeats that arrive close together
+        are collected in memory, and written to the database together, so
+        a heartbeat may take up to ``HEARTBEAT_COALESCING_SECONDS`` to be
+        reflected in the service's details.
+
+        .. :quickref: Service; Check in with a service
+
+        **Example Request**
+
+        .. sourcecode:: http
+
+            POST /services/668a7c9e-8bdb-4e2b-9b4e-a4d7a8c0f9a3/heartbeat HTTP/1.1
+
+        **Example Response**
+
+        .. sourcecode:: http
+
+            HTTP/1.1 204 NO CONTENT
+
+        :statuscode 204: The heartbeat was recorded
+        :statuscode 404: A service with that ID could not be found
+
+        :param service_id: The ID of the service that is checking in
+        :return: An empty flask response
+        """
+        service_uuid = parse_uuid(service_id)
+
+        try:
+            self.service_list.check_in(service_uuid)
+        except KeyError:
+            raise ServiceWithUUIDNotFound(service_uuid)
+
+        response = Response()
+        response.status_code = 204
+        return response
@@ -4,16 +4,18 @@ Maps the ``jobs/<job_id>`` endpoint
 from jsonschema import Draft4Validator as JsonschemaValidator
 from jsonschema import ValidationError as JsonSchemaValidatorError
 from sqlalchemy.orm import Session
-from flask import Response, jsonify, url_for, Request, request
-from topchef.models import Job, JobList
+from flask import Response, url_for, Request, request
+from topchef.models import Job, JobList, JobArchive
 from topchef.models.errors import ValidationError
 from topchef.api.abstract_endpoints import AbstractEndpointForJob
 from topchef.api.abstract_endpoints import AbstractEndpointForJobMeta
-from topchef.serializers import JSONSchema
+from topchef.api.abstract_endpoints import MetaSchema
+from topchef.serializers import JSONSchema, CompiledSerializer
 from topchef.serializers import JobDetail as JobSerializer
 from topchef.serializers import JobModification as JobModificationSerializer
 from topchef.models.errors import DeserializationError
-from typing import Dict, Optional, Type, Iterable
+from topchef.models.validator_cache import VALIDATOR_CACHE
+from typing import Callable, Dict, Optional, Iterable
 from uuid import UUID
 
 
@@ -21,15 +23,22 @@ class JobDetail(AbstractEndpointForJob):
     """
     Contains details for a particular job
     """
+    _detailed_job_schema = JSONSchema(
+        title='Detailed Job Schema',
+        description='The schema for all displayable data for a job'
+    )
+
     def __init__(
             self,
             session: Session,
             flask_request: Request=request,
             job_list:Optional[JobList]=None,
-            validator_factory: Type[JsonschemaValidator]=JsonschemaValidator
+            validator_factory: Callable[[dict], JsonschemaValidator]=
+            VALIDATOR_CACHE,
+            job_archive: Optional[JobArchive]=None
     ) -> None:
         super(JobDetail, self).__init__(
-            session, flask_request, job_list
+            session, flask_request, job_list, job_archive
         )
         self._validator_factory = validator_factory
 
@@ -45,6 +54,7 @@ class JobDetail(AbstractEndpointForJob):
 
             HTTP/1.1 200 OK
             Content-Type: application/json
+            ETag: "0c1e6c5b8a1f4d3f2e0ab8f5b9a3c7d14b0a6e2d9c8f7e6d5c4b3a2918070605"
 
             {
                 "data": {
@@ -61,97 +71,32 @@ class JobDetail(AbstractEndpointForJob):
                 },
                 "meta": {
                     "job_info_schema": {
-                        "$schema": "http://json-schema.org/draft-04/schema#",
-                        "description": "The schema for all displayable data for a job",
-                        "properties": {
-                            "date_submitted": {
-                                "format": "date-time",
-                                "title": "date_submitted",
-                                "type": "string"
-                            },
-                            "id": {
-                                "format": "uuid",
-                                "title": "id",
-                                "type": "string"
-                            },
-                            "parameters": {
-                                "title": "parameters",
-                                "type": "object"
-                            },
-                            "results": {
-                                "title": "results",
-                                "type": "object"
-                            },
-                            "status": {
-                                "enum": [
-                                    "REGISTERED",
-                                    "WORKING",
-                                    "COMPLETED",
-                                    "ERROR"
-                                ],
-                                "type": "string"
-                            }
-                        },
-                        "required": [
-                            "id",
-                            "parameters",
-                            "results",
-                            "status"
-                        ],
-                        "title": "Detailed Job Schema",
-                        "type": "object"
+                        "$ref": "http://localhost:5000/schemas/374923817336d4975047b19dc6ac4a9065ba436579b8a0d968a334c94bdf4eab"
                     },
                     "patch_request_schema": {
-                        "$schema": "http://json-schema.org/draft-04/schema#",
-                        "description": "The schema for all displayable data for a job",
-                        "properties": {
-                            "results": {
-                                "title": "results",
-                                "type": "object"
-                            },
-                            "status": {
-                                "enum": [
-                                "REGISTERED",
-                                "WORKING",
-                                "COMPLETED",
-                                "ERROR"
-                                ],
-                                "type": "string"
-                            }
-                        },
-                        "required": [],
-                        "title": "Detailed Job Schema",
-                        "type": "object"
+                        "$ref": "http://localhost:5000/schemas/5d28061d1534baaab91f1deaf0790885253fb89858e4fb116cbbb9f23c362a96"
                     }
                 }
             }
 
+        Jobs that have been moved to the archive by the ``archive`` command
+        are still returned by this endpoint, but can no longer be modified.
+
+        The ``ETag`` of the response changes whenever the job changes.
+        Sending it back in the ``If-None-Match`` header of a later request
+        returns ``304`` if the job has not changed since.
+
         :statuscode 200: The request completed successfully
+        :statuscode 304: The job has not changed since the client got it
         :statuscode 404: A job with that ID could not be found
 
         :param job: The job for which a response is to be obtained
         :return: A Flask response containing the data for a given job
         """
-        serializer = JobSerializer()
-        serializer_schema = JSONSchema(
-            title='Detailed Job Schema',
-            description='The schema for all displayable data for a job'
+        return self.conditional_response(
+            self.entity_tag(job.id, job.version),
+            lambda: self._get_response_for_job(job)
         )
-        job_modification_serializer = JobModificationSerializer()
-        response = jsonify({
-            'data': serializer.dump(job, many=False).data,
-            'meta': {
-                'job_info_schema': serializer_schema.dump(serializer),
-                'patch_request_schema': serializer_schema.dump(
-                    job_modification_serializer
-                )
-            },
-            'links': {
-                'self': self._self_url(job.id)
-            }
-        })
-        response.status_code = 200
-        return response
 
     def patch(self, job: Job) -> Response:
         """
@@ -214,7 +159,9 @@ class JobDetail(AbstractEndpointForJob):
         :return: The response
         """
         serializer = JobModificationSerializer()
-        job_reporting_serializer = JobSerializer()
+        job_reporting_serializer = CompiledSerializer.for_schema(
+            JobSerializer
+        )
 
         data, errors = serializer.load(self.request_json)
 
@@ -230,10 +177,57 @@ class JobDetail(AbstractEndpointForJob):
             if data['status'] is not None:
                 self._modify_job_status(job, data['status'])
 
-        response = jsonify(job_reporting_serializer.dump(job).data)
+        response = self.jsonify(job_reporting_serializer.dump(job).data)
         response.status_code = 200
         return response
 
+    def _get_response_for_job(self, job: Job) -> Response:
+        """
+
+        :param job: The job to serialize
+        :return: The full response to a ``GET`` request for the job
+        """
+        serializer = CompiledSerializer.for_schema(JobSerializer)
+        response = self.jsonify({
+            'data': serializer.dump(job, many=False).data,
+            'meta': self._meta,
+            'links': {
+                'self': self._self_url(job.id)
+            }
+        })
+        response.status_code = 200
+        return response
+
+    @property
+    def _meta(self) -> dict:
+        """
+
+        :return: References to the schemas for the job returned by ``GET``,
+            and for the body of a ``PATCH`` request
+        """
+        return {
+            'job_info_schema': self.schema_reference(self._job_info_schema),
+            'patch_request_schema': self.schema_reference(
+                self._patch_request_schema
+            )
+        }
+
+    @MetaSchema
+    def _job_info_schema(cls) -> dict:
+        """
+
+        :return: The schema for the job returned by ``GET``
+        """
+        return cls._detailed_job_schema.dump(JobSerializer())
+
+    @MetaSchema
+    def _patch_request_schema(cls) -> dict:
+        """
+
+        :return: The schema for the body of a ``PATCH`` request
+        """
+        return cls._detailed_job_schema.dump(JobModificationSerializer())
+
     def _report_loading_errors(self, errors: Dict[str, str]) -> None:
         self.errors.extend(
             DeserializationError(key, errors[key]) for key in errors.keys()
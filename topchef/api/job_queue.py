@@ -1,14 +1,15 @@
 """
 Maps the ``/services/<service_id>/queue`` endpoint
 """
-from datetime import datetime
-from flask import Response, jsonify
+from functools import partial
+from flask import Response
 from topchef.api.abstract_endpoints import AbstractEndpointForService
 from topchef.api.abstract_endpoints import AbstractEndpointForServiceMeta
+from topchef.api.abstract_endpoints import MetaSchema
+from topchef.config import config
 from topchef.models import Service, Job
-from topchef.serializers import JobDetail, JSONSchema
-from itertools import islice
-from typing import Iterable
+from topchef.serializers import CompiledSerializer, JobDetail, JSONSchema
+from typing import Iterable, Optional, Sequence
 
 
 class JobQueueForService(AbstractEndpointForService):
@@ -17,7 +18,8 @@ class JobQueueForService(AbstractEndpointForService):
     """
     def get(self, service: Service) -> Response:
         r"""
-        Returns the next 10 jobs available for a given service
+        Returns the next few jobs available for a given service, oldest
+        first. By default, the next 10 jobs are returned.
 
         .. :quickref: Job; Get the next few jobs
 
@@ -52,49 +54,7 @@ class JobQueueForService(AbstractEndpointForService):
                 },
                 "meta": {
                     "data_schema": {
-                        "$schema": "http://json-schema.org/draft-04/schema#",
-                        "description": "The schema for the data in the \"data\" key",
-                        "items": {
-                            "$schema": "http://json-schema.org/draft-04/schema#",
-                            "properties": {
-                                "date_submitted": {
-                                    "format": "date-time",
-                                    "title": "date_submitted",
-                                    "type": "string"
-                                },
-                                "id": {
-                                    "format": "uuid",
-                                    "title": "id",
-                                    "type": "string"
-                                },
-                            "parameters": {
-                                "title": "parameters",
-                                "type": "object"
-                            },
-                            "results": {
-                                "title": "results",
-                                "type": "object"
-                            },
-                            "status": {
-                                "enum": [
-                                  "REGISTERED",
-                                  "WORKING",
-                                  "COMPLETED",
-                                  "ERROR"
-                                ],
-                                "type": "string"
-                            }
-                        },
-                        "required": [
-                            "id",
-                            "parameters",
-                            "results",
-                            "status"
-                        ],
-                        "type": "object"
-                        },
-                        "title": "Job List Schema",
-                        "type": "array"
+                        "$ref": "http://localhost:5000/schemas/ef24ac05e6beb830a592294c57f2d6586e00e1112aa06a3647708c83b0e0ad49"
                     }
                 }
             }
@@ -105,33 +65,46 @@ class JobQueueForService(AbstractEndpointForService):
 
             HTTP/1.1 204 NO CONTENT
 
+        :query depth: The maximum number of jobs to return. Defaults to the
+            ``DEFAULT_QUEUE_DEPTH`` configuration parameter, and is capped by
+            ``MAXIMUM_QUEUE_DEPTH``
+        :query wait: If there are no jobs in the queue, the number of seconds
+            for which to hold the request until a job is registered for the
+            service. Defaults to ``0``
+        :query fields: A comma-separated list of the job attributes to
+            return, for instance ``id,status``. By default, all attributes
+            are returned
         :statuscode 200: The request completed successfully
         :statuscode 204: The request completed successfully, but there are
             no jobs in the queue right now.
+        :statuscode 400: The ``depth`` parameter is not a positive integer,
+            or the ``wait`` parameter is not a non-negative integer
         :statuscode 404: A service with that ID could not be found
 
         :param service: The service for which the next few jobs are to be
             retrieved
         :return: A flask response with the appropriate data
         """
-        registered_jobs = filter(
-            self._is_job_registered, service.jobs
+        depth = self.get_integer_query_parameter(
+            'depth', default=config.DEFAULT_QUEUE_DEPTH, minimum=1,
+            maximum=config.MAXIMUM_QUEUE_DEPTH
         )
-        first_few_jobs = islice(registered_jobs, 10)
-        sorted_jobs_by_date = sorted(
-            first_few_jobs,
-            key=self._get_date_submitted,
-            reverse=False
+        fields = self.get_requested_fields(JobDetail().fields.keys())
+        job_list = service.jobs if fields is None else \
+            service.jobs.only(fields)
+
+        sorted_jobs_by_date = self.wait_for_jobs(
+            service, partial(job_list.queue, depth)
         )
 
         if not sorted_jobs_by_date:
             response = Response()
             response.status_code = 204
         else:
-            response = jsonify({
-                'data': self._get_data(sorted_jobs_by_date),
+            response = self.jsonify({
+                'data': self._get_data(sorted_jobs_by_date, fields),
                 'meta': {
-                    'data_schema': self.data_schema
+                    'data_schema': self.schema_reference(self.data_schema)
                 },
                 'links': {'self': self.self_url(service)}
             })
@@ -140,25 +113,15 @@ class JobQueueForService(AbstractEndpointForService):
         return response
 
     @staticmethod
-    def _is_job_registered(job: Job):
-        """
-
-        :param job: The job to check if it is registered
-        :return:
-        """
-        return job.status is Job.JobStatus.REGISTERED
-
-    @staticmethod
-    def _get_date_submitted(job: Job) -> datetime:
-        return job.date_submitted
-
-    @staticmethod
-    def _get_data(sorted_jobs_by_date: Iterable[Job]) -> dict:
-        serializer = JobDetail()
+    def _get_data(
+            sorted_jobs_by_date: Iterable[Job],
+            fields: Optional[Sequence[str]]=None
+    ) -> list:
+        serializer = CompiledSerializer.for_schema(JobDetail, only=fields)
         return serializer.dump(sorted_jobs_by_date, many=True).data
 
-    @property
-    def data_schema(self) -> dict:
+    @MetaSchema
+    def data_schema(cls) -> dict:
         entry_schema = JSONSchema()
         return {
             '$schema': entry_schema.schema,
@@ -0,0 +1,71 @@
+"""
+Maps the ``/jobs/<job_id>/results`` endpoint
+"""
+from flask import Response
+from topchef.api.abstract_endpoints import AbstractEndpointForJob
+from topchef.api.abstract_endpoints import AbstractEndpointForJobMeta
+from topchef.models import Job
+from topchef.models.blob_store import BlobReader
+
+
+class JobResults(AbstractEndpointForJob):
+    """
+    Returns the results of a job by themselves. Unlike ``GET /jobs/<job_id>``,
+    this endpoint does not parse the results, and large results are streamed
+    from the blob store in which they are kept, so that clients can download
+    them without the API holding them in memory.
+    """
+    def get(self, job: Job) -> Response:
+        """
+        Return the results of a job, as a JSON document. Jobs that have been
+        moved to the archive are found as well.
+
+        .. :quickref: Job; Get the results of a job
+
+        **Example Response**
+
+        .. sourcecode:: http
+
+            HTTP/1.1 200 OK
+            Content-Type: application/json
+            Content-Length: 62
+            ETag: "0c1e6c5b8a1f4d3f2e0ab8f5b9a3c7d14b0a6e2d9c8f7e6d5c4b3a2918070605"
+
+            {"light_count": 153, "dark_count": 100, "result_count": 113}
+
+        The ``ETag`` of the response changes whenever the job changes, in
+        the same way as the ``ETag`` of ``GET /jobs/<job_id>``.
+
+        :statuscode 200: The request completed successfully
+        :statuscode 304: The job has not changed since the client got its
+            results
+        :statuscode 404: A job with that ID could not be found
+
+        :param job: The job whose results are to be returned
+        :return: A flask response with the results of the job
+        """
+        return self.conditional_response(
+            self.entity_tag(job.id, job.version),
+            lambda: self._get_response_for_results(job)
+        )
+
+    @staticmethod
+    def _get_response_for_results(job: Job) -> Response:
+        """
+
+        :param job: The job whose results are to be returned
+        :return: A response whose body is read from the results. Readers of
+            the blob store are closed by the WSGI server once the body has
+            been sent
+        """
+        results = job.encoded_results()
+        response = Response(results, mimetype='application/json')
+        if isinstance(results, BlobReader):
+            response.content_length = len(results)
+        return response
+
+
+class JobResultsForJobID(JobResults, metaclass=AbstractEndpointForJobMeta):
+    """
+    Contains a mixin to map a job UUID to the job results endpoint
+    """
@@ -0,0 +1,131 @@
+"""
+Maps the ``/job_sets/<job_set_id>`` endpoint
+"""
+from typing import Optional
+from flask import Response, Request, request, url_for
+from sqlalchemy.orm import Session
+from topchef.api.abstract_endpoints import AbstractEndpoint, parse_uuid
+from topchef.models import JobSetList
+from topchef.models.job_set_list import JobSetList as JobSetListModel
+from topchef.models.errors import JobSetWithUUIDNotFound
+from topchef.serializers import JobSetDetail as JobSetDetailSerializer
+
+
+class JobSetDetail(AbstractEndpoint):
+    """
+    Reports the progress of a job set
+    """
+    def __init__(
+            self,
+            session: Session,
+            flask_request: Request=request,
+            job_set_list: Optional[JobSetList]=None
+    ) -> None:
+        """
+
+        :param session: The session to use
+        :param flask_request: The request that this endpoint needs to
+            process
+        :param job_set_list: The job sets that this endpoint can report
+        """
+        super(JobSetDetail, self).__init__(session, flask_request)
+        if job_set_list is None:
+            self.job_set_list = JobSetListModel(self.database_session)
+        else:
+            self.job_set_list = job_set_list
+
+    def get(self, job_set_id: str) -> Response:
+        """
+        Get the number of jobs in the set with each status, along with one
+        page of the jobs in the set. The counts are computed by the
+        database, so the cost of this request does not grow with the number
+        of jobs on the page. The jobs are ordered by the date on which they
+        were submitted. The page size is set by the ``limit`` query
+        parameter, and the next page can be retrieved by following the
+        ``next`` link. The ``next`` link is absent on the last page.
+
+        Jobs that have been moved to the archive are still counted, but are
+        not listed on the pages of jobs. They can be read from
+        ``/jobs/<job_id>``.
+
+        .. :quickref: Job Set; Get the progress of a job set
+
+        **Example Response**
+
+        .. sourcecode:: http
+
+            HTTP/1.1 200 OK
+            Content-Type: application/json
+
+            {
+                "data": {
+                    "id": "b7fdcb0e-5e1b-4c6a-a5b0-4f0a1b5ac5e2",
+                    "description": "Rabi sweep",
+                    "total": 2,
+                    "progress": {
+                        "REGISTERED": 1,
+                        "WORKING": 0,
+                        "COMPLETED": 1,
+                        "ERROR": 0
+                    },
+                    "jobs": [
+                        {
+                            "date_submitted": "2017-08-15T18:29:07.902093+00:00",
+                            "id": "42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7",
+                            "status": "COMPLETED"
+                        }
+                    ]
+                },
+                "links": {
+                    "self": "http://localhost:5000/job_sets/b7fdcb0e-5e1b-4c6a-a5b0-4f0a1b5ac5e2?limit=1",
+                    "next": "http://localhost:5000/job_sets/b7fdcb0e-5e1b-4c6a-a5b0-4f0a1b5ac5e2?limit=1&after=42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7"
+                }
+            }
+
+        :query limit: The maximum number of jobs to return. This is capped
+            by the ``MAXIMUM_PAGE_SIZE`` configuration parameter
+        :query after: The ID of the last job on the previous page
+
+        :statuscode 200: The request completed successfully
+        :statuscode 400: A query parameter could not be understood
+        :statuscode 404: A job set with that ID could not be found
+
+        :param job_set_id: The ID of the job set
+        :return: A flask response with the progress of the job set
+        """
+        job_set_uuid = parse_uuid(job_set_id)
+
+        try:
+            job_set = self.job_set_list[job_set_uuid]
+        except KeyError:
+            raise JobSetWithUUIDNotFound(job_set_uuid)
+
+        progress = job_set.jobs.status_counts()
+        page = self.get_page_of_jobs(job_set.jobs)
+
+        links = {
+            'self': url_for(
+                self.__class__.__name__, job_set_id=str(job_set_uuid),
+                _external=True, **self._request.args.to_dict()
+            )
+        }
+        next_page_url = self.next_page_url(
+            page, job_set_id=str(job_set_uuid)
+        )
+        if next_page_url is not None:
+            links['next'] = next_page_url
+
+        response = self.jsonify({
+            'data': JobSetDetailSerializer().dump({
+                'id': job_set.id,
+                'description': job_set.description,
+                'total': sum(progress.values()),
+                'progress': {
+                    status.name: count for status, count in progress.items()
+                },
+                'jobs': page
+            }).data,
+            'links': links
+        })
+        response.status_code = 200
+        return response
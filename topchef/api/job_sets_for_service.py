@@ -0,0 +1,157 @@
+"""
+Maps the ``/services/<service_id>/job_sets`` endpoint
+"""
+from typing import Callable, Optional
+from flask import Response, Request, request, url_for
+from jsonschema import Draft4Validator as JSONSchemaValidator
+from sqlalchemy.orm import Session
+from topchef.api.abstract_endpoints import AbstractEndpointForService
+from topchef.api.abstract_endpoints import AbstractEndpointForServiceMeta
+from topchef.api.job_set_detail import JobSetDetail
+from topchef.config import config
+from topchef.models import Service, ServiceList, JobSetList
+from topchef.models.job_set_list import JobSetList as JobSetListModel
+from topchef.models.errors import DeserializationError
+from topchef.models.validator_cache import VALIDATOR_CACHE
+from topchef.serializers import NewJobSet, BulkItemError
+from topchef.serializers import JobSetDetail as JobSetDetailSerializer
+
+
+class JobSetsForService(AbstractEndpointForService):
+    """
+    Lets clients create a job set, together with all of its jobs, in one
+    request
+    """
+    def __init__(
+            self,
+            session: Session,
+            flask_request: Request=request,
+            service_list: Optional[ServiceList]=None,
+            job_set_list: Optional[JobSetList]=None,
+            validator_factory: Callable[[dict], JSONSchemaValidator]=
+            VALIDATOR_CACHE
+    ) -> None:
+        """
+
+        :param session: The session to use
+        :param flask_request: The request that this endpoint needs to
+            process
+        :param service_list: The services for which job sets can be made
+        :param job_set_list: The list to which new job sets are added
+        :param validator_factory: The callable that provides validators
+            for checking job parameters against the registration schema of
+            the service
+        """
+        super(JobSetsForService, self).__init__(
+            session, flask_request, service_list=service_list
+        )
+        if job_set_list is None:
+            self.job_set_list = JobSetListModel(self.database_session)
+        else:
+            self.job_set_list = job_set_list
+        self._validator_factory = validator_factory
+
+    def post(self, service: Service) -> Response:
+        """
+        Create a job set for the service. Each item in ``jobs`` must satisfy
+        the ``new_job_schema`` of the service's ``jobs`` endpoint. The set is
+        only created if every item is valid. Otherwise, the index and errors
+        of every invalid item are reported under ``errors``. The progress of
+        the set can be followed at the URL in the ``Location`` header.
+
+        .. :quickref: Job Set; Create a job set
+
+        **Example Request**
+
+        .. sourcecode:: http
+
+            POST /services/668ac2ea-063d-4122-ba7a-97a3e8e46a8a/job_sets HTTP/1.1
+            Content-Type: application/json
+
+            {
+                "description": "Rabi sweep",
+                "jobs": [
+                    {"parameters": {"wait_time": 500e-9}},
+                    {"parameters": {"wait_time": 600e-9}}
+                ]
+            }
+
+        **Example Response**
+
+        .. sourcecode:: http
+
+            HTTP/1.1 201 CREATED
+            Content-Type: application/json
+            Location: http://localhost:5000/job_sets/b7fdcb0e-5e1b-4c6a-a5b0-4f0a1b5ac5e2
+
+            {
+                "data": {
+                    "id": "b7fdcb0e-5e1b-4c6a-a5b0-4f0a1b5ac5e2",
+                    "description": "Rabi sweep",
+                    "total": 2
+                },
+                "meta": "new job set ID is b7fdcb0e-5e1b-4c6a-a5b0-4f0a1b5ac5e2"
+            }
+
+        :statuscode 201: The job set and all its jobs were created
+        :statuscode 400: The job set could not be created
+        :statuscode 404: A service with that ID could not be found
+
+        :param service: The service for which the job set is to be made
+        :return: A flask response with the new job set
+        """
+        data, errors = NewJobSet().load(self.request_json)
+        if errors:
+            self.errors.extend(
+                DeserializationError(key, errors[key]) for key in errors.keys()
+            )
+            raise self.Abort()
+
+        if len(data['jobs']) > config.MAXIMUM_JOBS_PER_SUBMISSION:
+            self.errors.append(DeserializationError(
+                'jobs', 'Cannot submit more than %d jobs at once' %
+                        config.MAXIMUM_JOBS_PER_SUBMISSION
+            ))
+            raise self.Abort()
+
+        validator = self._validator_factory(service.job_registration_schema)
+        accepted_items, rejected_items = self.check_new_jobs(
+            data['jobs'], validator
+        )
+
+        if rejected_items:
+            response = self.jsonify({
+                'errors': BulkItemError(many=True).dump(rejected_items).data
+            })
+            response.status_code = 400
+            return response
+
+        job_set = self.job_set_list.new(data['description'])
+        new_job_ids = service.new_jobs(
+            [parameters for _, parameters in accepted_items], job_set
+        )
+
+        serializer = JobSetDetailSerializer(
+            only=('id', 'description', 'total')
+        )
+        response = self.jsonify({
+            'data': serializer.dump({
+                'id': job_set.id,
+                'description': job_set.description,
+                'total': len(new_job_ids)
+            }).data,
+            'meta': 'new job set ID is %s' % job_set.id
+        })
+        response.status_code = 201
+        response.headers['Location'] = url_for(
+            JobSetDetail.__name__, job_set_id=str(job_set.id), _external=True
+        )
+        return response
+
+
+class JobSetsForServiceID(
+    JobSetsForService, metaclass=AbstractEndpointForServiceMeta
+):
+    """
+    Maps service IDs in the URL to services
+    """
@@ -1,17 +1,20 @@
 """
 Maps the ``/services/<service_id>/jobs`` endpoint
 """
-from flask import Response, jsonify, url_for, Request, request
+from flask import Response, url_for, Request, request
 from topchef.api.abstract_endpoints import AbstractEndpointForService
 from topchef.api.abstract_endpoints import AbstractEndpointForServiceMeta
+from topchef.api.abstract_endpoints import MetaSchema
 from topchef.api.job_detail import JobDetailForJobID as JobDetail
+from topchef.config import config
 from topchef.models import Service, ServiceList
 from topchef.models.errors import DeserializationError, ValidationError
-from topchef.serializers import JSONSchema
+from topchef.models.validator_cache import VALIDATOR_CACHE
+from topchef.serializers import JSONSchema, BulkItemSuccess, BulkItemError
+from topchef.serializers import CompiledSerializer
 from topchef.serializers import JobDetail as JobDetailSerializer
 from topchef.serializers.new_job import NewJob as NewJobSerializer
-from jsonschema import Draft4Validator as JSONSchemaValidator
-from typing import Iterable, Optional
+from typing import Callable, Iterable, Optional
 from jsonschema import ValidationError as JSONSchemaError
 from sqlalchemy.orm import Session
 
@@ -29,19 +32,26 @@ class JobsForServiceEndpoint(AbstractEndpointForService):
             session: Session,
             flask_request: Request=request,
             service_list: Optional[ServiceList]=None,
-            validator_factory: Optional[type]=None
+            validator_factory: Optional[Callable]=None
     ):
         super(JobsForServiceEndpoint, self).__init__(
             session, flask_request, service_list=service_list
         )
         if validator_factory is None:
-            self._validator_factory = JSONSchemaValidator
+            self._validator_factory = VALIDATOR_CACHE
         else:
             self._validator_factory = validator_factory
 
     def get(self, service: Service) -> Response:
         """
-        Get the list of jobs available for a service
+        Get the list of jobs available for a service, one page at a time.
+        The jobs are ordered by the date on which they were submitted. The
+        page size is set by the ``limit`` query parameter, and the next page
+        can be retrieved by following the ``next`` link. The ``next`` link
+        is absent on the last page.
+
+        The response is streamed. Jobs are sent as they are read from the
+        database, and the ``links`` object comes after the jobs.
 
         .. :quickref: Service; Get jobs for the service
 
@@ -67,55 +77,12 @@ class JobsForServiceEndpoint(AbstractEndpointForService):
                     }
                 ],
                 "links": {
-                    "self": "http://localhost:5000/services/495d76fd-044c-4f02-8815-5ec6e7634330/jobs"
+                    "self": "http://localhost:5000/services/495d76fd-044c-4f02-8815-5ec6e7634330/jobs?limit=1",
+                    "next": "http://localhost:5000/services/495d76fd-044c-4f02-8815-5ec6e7634330/jobs?limit=1&after=42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7"
                 },
                 "meta": {
                     "data_schema": {
-                        "$schema": "http://json-schema.org/draft-04/schema#",
-                        "description": "The schema for reading data contained in the data key of this response",
-                        "items": {
-                            "$schema": "http://json-schema.org/draft-04/schema#",
-                            "description": "The schema for reading data contained in the data key of this response",
-                            "properties": {
-                                "date_submitted": {
-                                    "format": "date-time",
-                                    "title": "date_submitted",
-                                    "type": "string"
-                                },
-                                "id": {
-                                    "format": "uuid",
-                                    "title": "id",
-                                    "type": "string"
-                                },
-                                "parameters": {
-                                    "title": "parameters",
-                                    "type": "object"
-                                },
-                                "results": {
-                                    "title": "results",
-                                    "type": "object"
-                                },
-                                "status": {
-                                    "enum": [
-                                        "REGISTERED",
-                                        "WORKING",
-                                        "COMPLETED",
-                                        "ERROR"
-                                    ],
-                                    "type": "string"
-                                }
-                            },
-                            "required": [
-                                "id",
-                                "parameters",
-                                "results",
-                                "status"
-                            ],
-                            "title": "Data Schema",
-                            "type": "object"
-                        },
-                        "title": "Data Schema",
-                        "type": "array"
+                        "$ref": "http://localhost:5000/schemas/fe9bc9c460960c3db6ad25d973cc1e0d3c3dade2beccdf0c8b0eff6f065252a2"
                     },
                     "new_job_schema": {
                         "$schema": "http://json-schema.org/draft-04/schema#",
@@ -131,20 +98,49 @@ class JobsForServiceEndpoint(AbstractEndpointForService):
                 }
             }
 
+        :query limit: The maximum number of jobs to return. This defaults to
+            the ``DEFAULT_PAGE_SIZE`` configuration parameter, and is capped
+            by ``MAXIMUM_PAGE_SIZE``
+        :query after: The ID of the last job on the previous page
+        :query fields: A comma-separated list of the job attributes to
+            return, for instance ``id,status``. By default, all attributes
+            are returned. Leaving out ``parameters`` and ``results`` saves
+            the API from loading them from the database
+
         :statuscode 200: The request completed successfully
+        :statuscode 400: A query parameter could not be understood
         :statuscode 404: A service with that ID could not be found
 
         :param service: The service for which jobs are to be retrieved
         :return: A flask response containing the data to display to the user
         """
-        serializer = JobDetailSerializer()
-        response = jsonify({
-            'data': serializer.dump(service.jobs, many=True).data,
+        fields = self.get_requested_fields(
+            JobDetailSerializer().fields.keys()
+        )
+        job_list = service.jobs if fields is None else \
+            service.jobs.only(fields)
+        page = self.get_streamed_page_of_jobs(job_list)
+        self_url = self.self_url(service)
+        service_id = service.id
+
+        serializer = CompiledSerializer.for_schema(
+            JobDetailSerializer, only=fields
+        )
+
+        def links() -> dict:
+            page_links = {'self': self_url}
+            next_page_url = self.next_page_url(page, service_id=service_id)
+            if next_page_url is not None:
+                page_links['next'] = next_page_url
+            return page_links
+
+        response = self.streamed_jsonify({
+            'data': (serializer.dump(job).data for job in page),
             'meta': {
                 'new_job_schema': self._new_job_schema(service),
-                'data_schema': self._data_schema
+                'data_schema': self.schema_reference(self._data_schema)
             },
-            'links': {'self': self.self_url(service)}
+            'links': links
         })
         response.status_code = 200
         return response
@@ -156,6 +152,15 @@ class JobsForServiceEndpoint(AbstractEndpointForService):
         response will also include a ``Location`` header indicating where
         the new job is located.
 
+        If the request body is an array, each item in the array is treated
+        as a separate job, and all the valid jobs are created in one
+        transaction. The response then lists the index and ID of every job
+        that was created under ``data``, and the index and errors of every
+        item that was rejected under ``errors``. The request is successful
+        if at least one job was created. The number of jobs that can be
+        submitted at once is capped by the ``MAXIMUM_JOBS_PER_SUBMISSION``
+        configuration parameter.
+
         .. :quickref: Service; create a new job
 
         **Example Request**
@@ -194,14 +199,60 @@ class JobsForServiceEndpoint(AbstractEndpointForService):
                 "meta": "new job ID is b0b58425-165f-4add-97b0-86da6b38757f"
             }
 
-        :statuscode 201: The job was successfully created
-        :statuscode 400: The job could not be created.
+        **Example Bulk Request**
+
+        .. sourcecode:: http
+
+            POST /services/668ac2ea-063d-4122-ba7a-97a3e8e46a8a/jobs HTTP/1.1
+            Content-Type: application/json
+
+            [
+                {"parameters": {"experiment_type": "RABI"}},
+                {"parameter": {"experiment_type": "RAMSEY"}}
+            ]
+
+        **Example Bulk Response**
+
+        .. sourcecode:: http
+
+            HTTP/1.1 201 CREATED
+            Content-Type: application/json
+
+            {
+                "data": [
+                    {
+                        "index": 0,
+                        "id": "42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7"
+                    }
+                ],
+                "errors": [
+                    {
+                        "index": 1,
+                        "errors": [
+                            {
+                                "detail": "Valdation of key 'parameters' threw error '['Missing data for required field.']'.",
+                                "status_code": 400,
+                                "title": "Deserialization Error From Client Data"
+                            }
+                        ]
+                    }
+                ],
+                "meta": "1 of 2 jobs were created"
+            }
+
+        :statuscode 201: The job was successfully created. For a bulk
+            request, at least one job was created
+        :statuscode 400: The job could not be created. For a bulk request,
+            none of the jobs could be created
         :statuscode 404: A service with the ID could not be found
 
         :param service: The service for which the new job is to be made
         :return: A flask response with the appropriate response as per the
             documentation in this endpoint
         """
+        if isinstance(self.request_json, list):
+            return self._post_many(service, self.request_json)
+
         data, errors = NewJobSerializer().load(self.request_json)
         if errors:
             self.errors.extend(
@@ -219,9 +270,11 @@ class JobsForServiceEndpoint(AbstractEndpointForService):
 
         new_job = service.new_job(data['parameters'])
 
-        job_data_serializer = JobDetailSerializer()
+        job_data_serializer = CompiledSerializer.for_schema(
+            JobDetailSerializer
+        )
 
-        response = jsonify({
+        response = self.jsonify({
             'data': job_data_serializer.dump(new_job).data,
             'meta': 'new job ID is %s' % new_job.id
         })
@@ -231,6 +284,43 @@ class JobsForServiceEndpoint(AbstractEndpointForService):
         )
         return response
 
+    def _post_many(self, service: Service, items: list) -> Response:
+        """
+        Create every job in the request body that is valid. A single
+        validator is built for the service's registration schema, and is
+        reused for every item.
+
+        :param service: The service for which the new jobs are to be made
+        :param items: The items in the request body
+        :return: A flask response reporting the outcome of each item
+        """
+        if len(items) > config.MAXIMUM_JOBS_PER_SUBMISSION:
+            self.errors.append(DeserializationError(
+                'body', 'Cannot submit more than %d jobs at once' %
+                        config.MAXIMUM_JOBS_PER_SUBMISSION
+            ))
+            raise self.Abort()
+
+        validator = self._validator_factory(service.job_registration_schema)
+        accepted_items, rejected_items = self.check_new_jobs(items, validator)
+
+        new_job_ids = service.new_jobs(
+            [parameters for _, parameters in accepted_items]
+        )
+
+        response = self.jsonify({
+            'data': BulkItemSuccess(many=True).dump([
+                {'index': index, 'id': job_id}
+                for (index, _), job_id in zip(accepted_items, new_job_ids)
+            ]).data,
+            'errors': BulkItemError(many=True).dump(rejected_items).data,
+            'meta': '%d of %d jobs were created' % (
+                len(new_job_ids), len(items)
+            )
+        })
+        response.status_code = 201 if new_job_ids else 400
+        return response
+
     @staticmethod
     def _new_job_schema(service: Service) -> dict:
         json_schema = JSONSchema(
@@ -248,8 +338,8 @@ class JobsForServiceEndpoint(AbstractEndpointForService):
         }
         return schema
 
-    @property
-    def _data_schema(self) -> dict:
+    @MetaSchema
+    def _data_schema(cls) -> dict:
         json_schema = JSONSchema(
             title='Data Schema',
             description='The schema for reading data contained in the data '
@@ -2,17 +2,29 @@
 """
 Describes an API endpoint that describes the endpoint for ``/jobs``
 """
-from typing import Optional
+from typing import Callable, Optional, Dict, List, Mapping
+from uuid import UUID
 
 from flask import Request, Response
-from flask import request, jsonify
+from flask import request
+from jsonschema import Draft4Validator as JsonschemaValidator
+from marshmallow import ValidationError as MarshmallowValidationError
 from sqlalchemy.orm import Session
 
 from topchef.api.abstract_endpoints.abstract_endpoint import AbstractEndpoint
+from topchef.api.abstract_endpoints.meta_schema import MetaSchema
+from topchef.config import config
+from topchef.models import Job
 from topchef.models import JobList as JobListInterface
+from topchef.models.errors import DeserializationError, ValidationError
+from topchef.models.errors import JobWithUUIDNotFound, QueryParameterError
 from topchef.models.job_list import JobList as JobListModel
-from topchef.serializers import JSONSchema
+from topchef.models.validator_cache import VALIDATOR_CACHE
+from topchef.serializers import JSONSchema, BulkItemSuccess, BulkItemError
+from topchef.serializers import CompiledSerializer
+from topchef.serializers import BulkJobModification
 from topchef.serializers import JobOverview as JobSerializer
+from topchef.serializers.custom_fields import JobStatusField
 
 __all__ = ["JobsList"]
 
@@ -25,23 +37,43 @@ class JobsList(AbstractEndpoint):
             self,
             session: Session,
             flask_request: Request=request,
-            job_list_model: Optional[JobListInterface]=None
+            job_list_model: Optional[JobListInterface]=None,
+            validator_factory: Callable[[dict], JsonschemaValidator]=
+            VALIDATOR_CACHE
     ) -> None:
         """
 
         :param session: The session to use
         :param flask_request: The Flask request that this endpoint needs to
             process
+        :param job_list_model: The jobs on which this endpoint operates
+        :param validator_factory: The callable that provides validators
+            for checking job results against the result schema of their
+            service. By default, validators are taken from the
+            process-wide validator cache
         """
         super(self.__class__, self).__init__(session, flask_request)
         if job_list_model is None:
             self.job_list = JobListModel(self.database_session)
         else:
             self.job_list = job_list_model
+        self._validator_factory = validator_factory
 
     def get(self) -> Response:
         r"""
-        Get the list of all jobs on the system
+        Get the list of all jobs on the system, one page at a time. The jobs
+        are ordered by the date on which they were submitted. The page size
+        is set by the ``limit`` query parameter, and the next page can be
+        retrieved by following the ``next`` link. The ``next`` link is
+        absent on the last page.
+
+        The jobs can be filtered by status, service, and submission date.
+        The filters are carried over to the ``next`` link. If ``count`` is
+        ``true``, the number of jobs matching the filters is returned in
+        ``meta/total``.
+
+        The response is streamed. Jobs are sent as they are read from the
+        database, and the ``links`` object comes after the jobs.
 
         .. :quickref: Job List; Get all the jobs in the API
 
@@ -61,77 +93,261 @@ class JobsList(AbstractEndpoint):
                     }
                 ],
                 "links": {
-                    "self": "http://127.0.0.1:5000/jobs"
+                    "self": "http://127.0.0.1:5000/jobs?limit=1",
+                    "next": "http://127.0.0.1:5000/jobs?limit=1&after=42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7"
                 },
                 "meta": {
                     "data_schema": {
-                        "$schema": "http://json-schema.org/draft-04/schema#",
-                        "description": "Describes how jobs are presented in the \"data\" endpoint",
-                        "items": {
-                            "$schema": "http://json-schema.org/draft-04/schema#",
-                            "properties": {
-                            "date_submitted": {
-                                "format": "date-time",
-                                "readonly": true,
-                                "title": "date_submitted",
-                                "type": "string"
-                            },
-                            "id": {
-                                "format": "uuid",
-                                "readonly": true,
-                                "title": "id",
-                                "type": "string"
-                            },
-                            "status": {
-                                "enum": [
-                                    "REGISTERED",
-                                    "WORKING",
-                                    "COMPLETED",
-                                    "ERROR"
-                                ],
-                                "type": "string"
-                                }
-                            },
-                            "required": [
-                              "date_submitted",
-                              "id",
-                              "status"
-                            ],
-                            "type": "object"
-                        },
-                        "title": "Job Endpoint Schema",
-                        "type": "array"
+                        "$ref": "http://localhost:5000/schemas/cce1e605e5853187b3c7277d88b8cc4b06faa8e6b82426ed4c88ab26de1da9ad"
                     }
                 }
             }
 
+        :query limit: The maximum number of jobs to return. This defaults to
+            the ``DEFAULT_PAGE_SIZE`` configuration parameter, and is capped
+            by ``MAXIMUM_PAGE_SIZE``
+        :query after: The ID of the last job on the previous page
+        :query status: A comma-separated list of statuses, for instance
+            ``REGISTERED,WORKING``. Only jobs with one of these statuses are
+            returned
+        :query service_id: Only jobs belonging to the service with this ID
+            are returned
+        :query submitted_after: An ISO 8601 date and time. Only jobs
+            submitted after this time are returned
+        :query submitted_before: An ISO 8601 date and time. Only jobs
+            submitted before this time are returned
+        :query count: If ``true``, the number of jobs matching the filters
+            is returned in ``meta/total``. Defaults to ``false``
+
         :statuscode 200: The request completed successfully
+        :statuscode 400: A query parameter could not be understood
 
         :return: The list of all jobs on the system
         """
-        response = jsonify({
-            'data': self._data, 'meta': self._meta, 'links': self.links
+        job_list = self.job_list.filter(
+            statuses=self._requested_statuses,
+            service_id=self.get_uuid_query_parameter('service_id'),
+            submitted_after=self.get_datetime_query_parameter(
+                'submitted_after'
+            ),
+            submitted_before=self.get_datetime_query_parameter(
+                'submitted_before'
+            )
+        )
+        page = self.get_streamed_page_of_jobs(
+            job_list.only(JobSerializer().fields.keys())
+        )
+
+        meta = self._meta
+        if self._request.args.get('count', 'false').lower() == 'true':
+            meta['total'] = len(job_list)
+
+        serializer = CompiledSerializer.for_schema(JobSerializer)
+
+        def links() -> dict:
+            page_links = self.links
+            next_page_url = self.next_page_url(page)
+            if next_page_url is not None:
+                page_links['next'] = next_page_url
+            return page_links
+
+        response = self.streamed_jsonify({
+            'data': (serializer.dump(job).data for job in page),
+            'meta': meta,
+            'links': links
         })
         response.status_code = 200
         return response
 
+    def patch(self) -> Response:
+        """
+        Report the status and results of many jobs at once. The request body
+        must be an array of objects, each holding the ``id`` of the job to
+        change, and optionally a new ``status`` and new ``results`` for it.
+        The results of each job must satisfy the result schema of its
+        service. Every item that is valid is applied in one transaction.
+        The response lists the index and ID of every job that was changed
+        under ``data``, and the index and errors of every item that was
+        rejected under ``errors``. The number of jobs that can be changed at
+        once is capped by the ``MAXIMUM_JOBS_PER_UPDATE`` configuration
+        parameter.
+
+        .. :quickref: Job List; Modify many jobs
+
+        **Example Request**
+
+        .. sourcecode:: http
+
+            PATCH /jobs HTTP/1.1
+            Content-Type: application/json
+
+            [
+                {
+                    "id": "42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7",
+                    "status": "COMPLETED",
+                    "results": {"result_count": 113}
+                },
+                {
+                    "id": "b0b58425-165f-4add-97b0-86da6b38757f",
+                    "status": "COMPLETED"
+                }
+            ]
+
+        **Example Response**
+
+        .. sourcecode:: http
+
+            HTTP/1.1 200 OK
+            Content-Type: application/json
+
+            {
+                "data": [
+                    {
+                        "index": 0,
+                        "id": "42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7"
+                    }
+                ],
+                "errors": [
+                    {
+                        "index": 1,
+                        "errors": [
+                            {
+                                "detail": "A job with id b0b58425-165f-4add-97b0-86da6b38757f was not found",
+                                "status_code": 404,
+                                "title": "Job Not Found"
+                            }
+                        ]
+                    }
+                ],
+                "meta": "1 of 2 jobs were modified"
+            }
+
+        :statuscode 200: At least one of the jobs was modified
+        :statuscode 400: None of the jobs could be modified
+
+        :return: A flask response reporting the outcome of each item
+        """
+        items = self.request_json
+        if not isinstance(items, list):
+            self.errors.append(
+                DeserializationError('body', 'Expected an array of jobs')
+            )
+            raise self.Abort()
+
+        if len(items) > config.MAXIMUM_JOBS_PER_UPDATE:
+            self.errors.append(DeserializationError(
+                'body', 'Cannot modify more than %d jobs at once' %
+                        config.MAXIMUM_JOBS_PER_UPDATE
+            ))
+            raise self.Abort()
+
+        deserializer = BulkJobModification()
+        loaded_items = [deserializer.load(item) for item in items]
+        jobs = self.job_list.jobs_with_ids(
+            data['id'] for data, errors in loaded_items if not errors
+        )
+        validators = {}  # type: Dict[UUID, JsonschemaValidator]
+
+        modified_items = []  # type: List[dict]
+        rejected_items = []  # type: List[dict]
+
+        for index, (data, errors) in enumerate(loaded_items):
+            if errors:
+                item_errors = [
+                    DeserializationError(key, errors[key])
+                    for key in errors.keys()
+                ]
+            else:
+                item_errors = self._modify_job(data, jobs, validators)
+
+            if item_errors:
+                rejected_items.append({'index': index, 'errors': item_errors})
+            else:
+                modified_items.append({'index': index, 'id': data['id']})
+
+        response = self.jsonify({
+            'data': BulkItemSuccess(many=True).dump(modified_items).data,
+            'errors': BulkItemError(many=True).dump(rejected_items).data,
+            'meta': '%d of %d jobs were modified' % (
+                len(modified_items), len(items)
+            )
+        })
+        response.status_code = 200 if modified_items else 400
+        return response
+
+    def _modify_job(
+            self,
+            data: dict,
+            jobs: Mapping[UUID, Job],
+            validators: Dict[UUID, JsonschemaValidator]
+    ) -> list:
+        """
+        Apply one item of a ``PATCH`` request to its job
+
+        :param data: The deserialized item
+        :param jobs: The jobs named in the request, keyed by ID
+        :param validators: Validators that were already fetched during this
+            request, keyed by the ID of the service whose result schema they
+            check. Jobs of the same service share a validator
+        :return: The errors that prevented the job from being modified. If
+            the list is empty, the job was modified
+        """
+        if data['id'] not in jobs:
+            return [JobWithUUIDNotFound(data['id'])]
+
+        job = jobs[data['id']]
+
+        if data.get('results') is not None:
+            if job.service_id not in validators:
+                validators[job.service_id] = self._validator_factory(
+                    job.result_schema
+                )
+            validator = validators[job.service_id]
+            errors = [
+                ValidationError(error)
+                for error in validator.iter_errors(data['results'])
+            ]
+            if errors:
+                return errors
+            job.results = data['results']
+
+        if data.get('status') is not None:
+            job.status = data['status']
+
+        return []
+
     @property
-    def _data(self) -> dict:
+    def _requested_statuses(self) -> Optional[List[Job.JobStatus]]:
         """
 
-        :return: The JSON containing a list of all the jobs on the system
+        :return: The statuses in the ``status`` query parameter, or ``None``
+            if the parameter is not supplied
+        :raises: :exc:`QueryParameterError` if one of the statuses is not a
+            job status
         """
-        serializer = JobSerializer()
-        return serializer.dump(self.job_list, many=True).data
+        raw_value = self._request.args.get('status')
+        if raw_value is None:
+            return None
+
+        status_field = JobStatusField()
+        try:
+            return [
+                status_field.deserialize(status.strip())
+                for status in raw_value.split(',')
+            ]
+        except MarshmallowValidationError:
+            raise QueryParameterError(
+                'status', raw_value, 'a comma-separated list of job statuses'
+            )
 
     @property
     def _meta(self) -> dict:
         return {
-            'data_schema': self._data_schema
+            'data_schema': self.schema_reference(self._data_schema)
         }
 
-    @property
-    def _data_schema(self) -> dict:
+    @MetaSchema
+    def _data_schema(cls) -> dict:
         """
 
         :return: A JSON schema for the data in the ``data`` key of this
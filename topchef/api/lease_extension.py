@@ -0,0 +1,90 @@
+"""
+Maps the ``/jobs/<job_id>/lease`` endpoint
+"""
+from flask import Response, url_for
+from topchef.api.abstract_endpoints import AbstractEndpointForJob
+from topchef.api.abstract_endpoints import parse_uuid
+from topchef.models.errors import JobWithUUIDNotFound
+from topchef.models.errors import LeaseNotHeldError
+from topchef.serializers import JobDetail
+
+
+class LeaseExtension(AbstractEndpointForJob):
+    """
+    Lets workers keep the jobs they are working on. Unlike the other job
+    endpoints, this endpoint does not load the job before working on it, so
+    that a lease can be extended with a single ``UPDATE`` statement.
+    """
+    def post(self, job_id: str) -> Response:
+        """
+        Extend the lease on a ``WORKING`` job, so that the job is not
+        returned to the queue while the worker is still processing it.
+
+        .. :quickref: Job; Extend the lease on a job
+
+        **Example Request**
+
+        .. sourcecode:: http
+
+            POST /jobs/ee2c8b3b-3a51-4c07-8ee0-b7e2f6a2b3e1/lease?lease=60 HTTP/1.1
+            Content-Type: application/json
+
+        **Example Response**
+
+        .. sourcecode:: http
+
+            HTTP/1.1 200 OK
+            Content-Type: application/json
+
+            {
+                "data": {
+                    "id": "ee2c8b3b-3a51-4c07-8ee0-b7e2f6a2b3e1",
+                    "lease_expires": "2017-08-15T18:30:07.902093+00:00"
+                },
+                "links": {
+                    "self": "http://localhost:5000/jobs/ee2c8b3b-3a51-4c07-8ee0-b7e2f6a2b3e1/lease"
+                }
+            }
+
+        :query lease: The number of seconds from now for which the job is to
+            stay leased. Defaults to the ``JOB_LEASE_SECONDS``
+            configuration parameter
+        :query worker: The name of the worker extending the lease. If given,
+            the lease is only extended if it is held by this worker
+        :statuscode 200: The lease was extended
+        :statuscode 400: The ``lease`` parameter is not a positive integer
+        :statuscode 404: A job with that ID could not be found
+        :statuscode 409: The job is not ``WORKING``, or its lease is held by
+            another worker
+
+        :param job_id: The ID of the job whose lease is to be extended
+        :return: A flask response with the new lease expiry
+        """
+        job_uuid = parse_uuid(job_id)
+
+        try:
+            new_lease_expiry = self.job_list.extend_lease(
+                job_uuid,
+                self.requested_lease_duration,
+                self.requested_lease_owner
+            )
+        except KeyError:
+            raise JobWithUUIDNotFound(job_uuid)
+
+        if new_lease_expiry is None:
+            raise LeaseNotHeldError(job_uuid, self.requested_lease_owner)
+
+        serializer = JobDetail(only=('id', 'lease_expires'))
+        response = self.jsonify({
+            'data': serializer.dump(
+                {'id': job_uuid, 'lease_expires': new_lease_expiry}
+            ).data,
+            'links': {
+                'self': url_for(
+                    self.__class__.__name__, job_id=str(job_uuid),
+                    _external=True
+                )
+            }
+        })
+        response.status_code = 200
+        return response
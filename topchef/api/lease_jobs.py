@@ -0,0 +1,147 @@
+"""
+Maps the ``/services/<service_id>/jobs/lease`` endpoint
+"""
+from flask import Response
+from topchef.api.abstract_endpoints import AbstractEndpointForService
+from topchef.api.abstract_endpoints import AbstractEndpointForServiceMeta
+from topchef.api.abstract_endpoints import MetaSchema
+from topchef.config import config
+from topchef.models import Service
+from topchef.serializers import JobDetail, JSONSchema
+
+
+class LeaseJobs(AbstractEndpointForService):
+    """
+    Lets workers claim several jobs for a service in one request
+    """
+    def post(self, service: Service) -> Response:
+        r"""
+        Claim up to ``count`` of the oldest ``REGISTERED`` jobs for the
+        service, and mark them as ``WORKING``. The claim is atomic, so no
+        two workers calling this endpoint at the same time will receive the
+        same job. The number of jobs that can be claimed in one request is
+        capped by the ``MAXIMUM_JOBS_PER_LEASE`` configuration parameter.
+
+        The jobs are leased to the worker for ``lease`` seconds. If the
+        lease on a job is not extended through ``/jobs/<job_id>/lease``
+        before it expires, the job may be returned to the queue.
+
+        .. :quickref: Job; Claim the next few jobs
+
+        **Example Request**
+
+        .. sourcecode:: http
+
+            POST /services/495d76fd-044c-4f02-8815-5ec6e7634330/jobs/lease?count=2 HTTP/1.1
+            Content-Type: application/json
+
+        **Example Response**
+
+        .. sourcecode:: http
+
+            HTTP/1.1 200 OK
+            Content-Type: application/json
+
+            {
+                "data": [
+                    {
+                        "date_submitted": "2017-08-15T18:29:07.902093+00:00",
+                        "id": "42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7",
+                        "parameters": {
+                            "foo": "bar"
+                        },
+                        "lease_expires": "2017-08-15T18:34:07.902093+00:00",
+                        "results": null,
+                        "status": "WORKING"
+                    },
+                    {
+                        "date_submitted": "2017-08-15T18:29:08.102093+00:00",
+                        "id": "a4f1b9c0-4b0c-4a4d-9d4e-5a8c3d6e7f10",
+                        "parameters": {
+                            "foo": "baz"
+                        },
+                        "lease_expires": "2017-08-15T18:34:07.902093+00:00",
+                        "results": null,
+                        "status": "WORKING"
+                    }
+                ],
+                "links": {
+                    "self": "http://localhost:5000/services/495d76fd-044c-4f02-8815-5ec6e7634330/jobs/lease"
+                },
+                "meta": {
+                    "data_schema": {
+                        "$ref": "http://localhost:5000/schemas/ef24ac05e6beb830a592294c57f2d6586e00e1112aa06a3647708c83b0e0ad49"
+                    }
+                }
+            }
+
+        **Example Response With No Job**
+
+        .. sourcecode:: http
+
+            HTTP/1.1 204 NO CONTENT
+
+        :query count: The maximum number of jobs to claim. Defaults to ``1``
+        :query lease: The number of seconds for which the jobs are leased.
+            Defaults to the ``JOB_LEASE_SECONDS`` configuration parameter
+        :query worker: An optional name for the worker claiming the jobs. If
+            given, only a worker with this name may extend the leases
+        :statuscode 200: The jobs were claimed successfully
+        :statuscode 204: The request completed successfully, but there were
+            no jobs to claim
+        :statuscode 400: The ``count`` or ``lease`` parameter is not a
+            positive integer
+        :statuscode 404: A service with that ID could not be found
+
+        :param service: The service for which jobs are to be claimed
+        :return: A flask response with the appropriate data
+        """
+        number_of_jobs = self.get_integer_query_parameter(
+            'count', default=1, minimum=1,
+            maximum=config.MAXIMUM_JOBS_PER_LEASE
+        )
+
+        claimed_jobs = service.jobs.claim_jobs(
+            number_of_jobs,
+            self.requested_lease_duration,
+            self.requested_lease_owner
+        )
+
+        if not claimed_jobs:
+            response = Response()
+            response.status_code = 204
+        else:
+            response = self.jsonify({
+                'data': JobDetail().dump(claimed_jobs, many=True).data,
+                'meta': {
+                    'data_schema': self.schema_reference(self.data_schema)
+                },
+                'links': {'self': self.self_url(service)}
+            })
+            response.status_code = 200
+
+        return response
+
+    @MetaSchema
+    def data_schema(cls) -> dict:
+        """
+
+        :return: The schema for the list of jobs returned by this endpoint
+        """
+        entry_schema = JSONSchema()
+        return {
+            '$schema': entry_schema.schema,
+            'title': 'Job List Schema',
+            'description': 'The schema for the data in the "data" key',
+            'type': 'array',
+            'items': entry_schema.dump(JobDetail())
+        }
+
+
+class LeaseJobsForServiceID(
+    LeaseJobs, metaclass=AbstractEndpointForServiceMeta
+):
+    """
+    Modifies the web methods in order to accept and resolve services for a
+    given service UUID
+    """
@@ -1,15 +1,15 @@
 """
 Maps the ``services/<service_id>/jobs/next`` endpoint
 """
-from datetime import datetime
+from functools import partial
 from .abstract_endpoints import AbstractEndpointForService
 from .abstract_endpoints import AbstractEndpointForServiceMeta
+from .abstract_endpoints import MetaSchema
 from topchef.models import Job, Service
 from typing import Optional
-from flask import Response, jsonify
-from itertools import islice
+from flask import Response
 from topchef.serializers import JobDetail as JobSerializer
-from topchef.serializers import JSONSchema
+from topchef.serializers import JSONSchema, CompiledSerializer
 
 
 class NextJob(AbstractEndpointForService):
@@ -42,102 +42,100 @@ class NextJob(AbstractEndpointForService):
                 },
                 "meta": {
                     "job_schema": {
-                        "$schema": "http://json-schema.org/draft-04/schema#",
-                        "description": "The schema representing the job",
-                        "properties": {
-                            "date_submitted": {
-                                "format": "date-time",
-                                "title": "date_submitted",
-                                "type": "string"
-                            },
-                            "id": {
-                                "format": "uuid",
-                                "title": "id",
-                                "type": "string"
-                            },
-                            "parameters": {
-                                "title": "parameters",
-                                "type": "object"
-                            },
-                            "results": {
-                                "title": "results",
-                                "type": "object"
-                            },
-                            "status": {
-                                "enum": [
-                                    "REGISTERED",
-                                    "WORKING",
-                                    "COMPLETED",
-                                    "ERROR"
-                                ],
-                                "type": "string"
-                            }
-                        },
-                        "required": [
-                            "id",
-                            "parameters",
-                            "results",
-                            "status"
-                        ],
-                        "title": "Job Schema",
-                        "type": "object"
+                        "$ref": "http://localhost:5000/schemas/ba23189e1f47a3bfc3d61f09452f5473b886c6635aaf0c350ec65da7cb0eb222"
                     }
                 }
             }
 
+        :query wait: If there is no job available, the number of seconds for
+            which to hold the request until a job is registered for the
+            service. Defaults to ``0``
         :statuscode 200: The request completed successfully. The next job is
             available in the request body
         :statuscode 204: The request completed successfully, but no next job
             is available
+        :statuscode 400: The ``wait`` parameter is not a non-negative integer
         :statuscode 404: A service with that ID could not be found
 
         :param service: The service for which the next job is to be obtained
         :return: A flask response with the appropriate data
         """
-        try:
-            response = self._get_response_for_job(
-                self._get_next_job(service),
-                service
-            )
-        except StopIteration:
+        next_job = self.wait_for_jobs(
+            service, partial(self._get_next_job, service)
+        )
+
+        if next_job is None:
             response = self._response_for_no_job
+        else:
+            response = self._get_response_for_job(next_job, service)
 
         return response
 
-    @staticmethod
-    def _is_registered(job: Job) -> bool:
-        return job.status is Job.JobStatus.REGISTERED
+    def post(self, service: Service) -> Response:
+        """
+        Claim the next job for the service. The oldest ``REGISTERED`` job
+        for the service is marked as ``WORKING`` and returned in the same
+        request, so that no two workers claiming jobs at the same time can
+        receive the same job. The response body has the same format as
+        the response to a ``GET`` request on this endpoint.
 
-    @staticmethod
-    def _get_next_job(service: Service) -> Optional[Job]:
-        registered_jobs = filter(
-            NextJob._is_registered, service.jobs
-        )
-        return next(
-            iter(
-                islice(
-                    sorted(registered_jobs, key=NextJob._get_date_for_job),
-                    1
-                )
-            )
+        The job is leased to the worker for ``lease`` seconds. If the lease
+        is not extended through ``/jobs/<job_id>/lease`` before it expires,
+        the job may be returned to the queue.
+
+        .. :quickref: Service; claim the next job
+
+        **Example Request**
+
+        .. sourcecode:: http
+
+            POST /services/495d76fd-044c-4f02-8815-5ec6e7634330/jobs/next
+            HTTP/1.1
+            Content-Type: application/json
+
+        :query lease: The number of seconds for which the job is leased.
+            Defaults to the ``JOB_LEASE_SECONDS`` configuration parameter
+        :query worker: An optional name for the worker claiming the job. If
+            given, only a worker with this name may extend the lease
+        :statuscode 200: A job was claimed successfully. The claimed job is
+            available in the request body, with its status set to
+            ``WORKING``
+        :statuscode 204: The request completed successfully, but there
+            were no jobs to claim
+        :statuscode 404: A service with that ID could not be found
+
+        :param service: The service for which the next job is to be claimed
+        :return: A flask response with the appropriate data
+        """
+        claimed_job = service.jobs.claim_next_job(
+            self.requested_lease_duration, self.requested_lease_owner
         )
 
+        if claimed_job is None:
+            response = self._response_for_no_job
+        else:
+            response = self._get_response_for_job(claimed_job, service)
+
+        return response
+
     @staticmethod
-    def _get_date_for_job(job: Job) -> datetime:
-        return job.date_submitted
+    def _get_next_job(service: Service) -> Optional[Job]:
+        """
+
+        :param service: The service for which the next job is to be found
+        :return: The oldest registered job for the service, or ``None`` if
+            there is no such job
+        """
+        return next(iter(service.jobs.queue(1)), None)
 
     def _get_response_for_job(
             self, next_job: Job, service: Service
     ) -> Response:
-        serializer = JobSerializer()
-        schema_serializer = JSONSchema(
-            title="Job Schema",
-            description="The schema representing the job"
-        )
-        response = jsonify({
+        serializer = CompiledSerializer.for_schema(JobSerializer)
+        response = self.jsonify({
             'data': serializer.dump(next_job).data,
             'meta': {
-                'job_schema': schema_serializer.dump(serializer)
+                'job_schema': self.schema_reference(self._job_schema)
             },
             'links': {
                 'self': self.self_url(service)
@@ -146,6 +144,18 @@ class NextJob(AbstractEndpointForService):
         response.status_code = 200
         return response
 
+    @MetaSchema
+    def _job_schema(cls) -> dict:
+        """
+
+        :return: The schema for the job returned by this endpoint
+        """
+        schema_serializer = JSONSchema(
+            title="Job Schema",
+            description="The schema representing the job"
+        )
+        return schema_serializer.dump(JobSerializer())
+
     @property
     def _response_for_no_job(self) -> Response:
         response = Response()
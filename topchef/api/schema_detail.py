@@ -0,0 +1,88 @@
+"""
+Maps the ``/schemas/<schema_fingerprint>`` endpoint
+"""
+from flask import Response, Request, request, jsonify
+from sqlalchemy.orm import Session
+from topchef.api.abstract_endpoints import AbstractEndpoint
+from topchef.api.entity_tags import matching_entity_tag
+from topchef.config import config
+from topchef.models.errors import SchemaNotFound
+from topchef.models.schema_registry import SchemaRegistry, SCHEMA_REGISTRY
+
+
+class SchemaDetail(AbstractEndpoint):
+    """
+    Serves the schemas that responses refer to with ``$ref``
+    """
+    def __init__(
+            self,
+            session: Session,
+            flask_request: Request=request,
+            schema_registry: SchemaRegistry=SCHEMA_REGISTRY
+    ) -> None:
+        """
+
+        :param session: The session to use
+        :param flask_request: The request that this endpoint needs to
+            process
+        :param schema_registry: The registry in which the schemas are
+            published
+        """
+        super(SchemaDetail, self).__init__(session, flask_request)
+        self._schema_registry = schema_registry
+
+    def get(self, schema_fingerprint: str) -> Response:
+        """
+        Get a published schema. The fingerprint in the URL is a hash of the
+        schema, so the schema at a URL never changes. The response may be
+        cached for as long as the client likes, and requests carrying the
+        fingerprint in ``If-None-Match`` are answered with ``304``.
+
+        .. :quickref: Schema; Get a schema referenced by a response
+
+        **Example Response**
+
+        .. sourcecode:: http
+
+            HTTP/1.1 200 OK
+            Content-Type: application/json
+            Cache-Control: public, max-age=31536000, immutable
+            ETag: "ba23189e1f47a3bfc3d61f09452f5473b886c6635aaf0c350ec65da7cb0eb222"
+
+            {
+                "$schema": "http://json-schema.org/draft-04/schema#",
+                "description": "The schema representing the job",
+                "properties": {
+                    "id": {
+                        "title": "id",
+                        "type": "string"
+                    }
+                },
+                "title": "Job Schema",
+                "type": "object"
+            }
+
+        :param schema_fingerprint: The fingerprint of the schema
+        :statuscode 200: The schema was found
+        :statuscode 304: The client already has the schema
+        :statuscode 404: No schema was published with that fingerprint
+        :return: The schema
+        """
+        try:
+            schema = self._schema_registry[schema_fingerprint]
+        except KeyError:
+            raise SchemaNotFound(schema_fingerprint)
+
+        matching_etag = matching_entity_tag(
+            schema_fingerprint, self._request.if_none_match
+        )
+        if matching_etag is not None:
+            response = Response(status=304)
+            response.set_etag(matching_etag)
+        else:
+            response = jsonify(schema)
+            response.status_code = 200
+            response.set_etag(schema_fingerprint)
+        response.headers['Cache-Control'] = \
+            'public, max-age=%d, immutable' % config.SCHEMA_CACHE_SECONDS
+        return response
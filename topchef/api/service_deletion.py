@@ -0,0 +1,70 @@
+"""
+Maps the ``/services/<service_id>/deletion`` endpoint
+"""
+from flask import Response, url_for
+from topchef.api.abstract_endpoints import AbstractEndpointForService
+from topchef.api.abstract_endpoints import parse_uuid
+from topchef.models.errors import ServiceWithUUIDNotFound
+
+
+class ServiceDeletion(AbstractEndpointForService):
+    """
+    Reports the progress of purging a deleted service. Deleted services are
+    hidden from every other endpoint, so this endpoint looks the service up
+    among the deleted services instead of loading it.
+    """
+    def get(self, service_id: str) -> Response:
+        """
+        Return the number of jobs of a deleted service that are still
+        waiting to be removed from the database. Once the service has been
+        purged, it no longer exists, and ``404`` is returned.
+
+        .. :quickref: Service; Follow the purge of a deleted service
+
+        **Example Response**
+
+        .. sourcecode:: http
+
+            HTTP/1.1 200 OK
+            Content-Type: application/json
+
+            {
+                "data": {
+                    "id": "495d76fd-044c-4f02-8815-5ec6e7634330",
+                    "jobs_remaining": 12000
+                },
+                "links": {
+                    "self": "http://localhost:5000/services/495d76fd-044c-4f02-8815-5ec6e7634330/deletion"
+                }
+            }
+
+        :statuscode 200: The service is deleted, and is waiting to be purged
+        :statuscode 404: A deleted service with that ID could not be found.
+            Either the service has been purged, or it was never deleted
+
+        :param service_id: The ID of the deleted service
+        :return: A flask response with the progress of the purge
+        """
+        service_uuid = parse_uuid(service_id)
+
+        try:
+            jobs_remaining = self.service_list.jobs_awaiting_purge(
+                service_uuid
+            )
+        except KeyError:
+            raise ServiceWithUUIDNotFound(service_uuid)
+
+        response = self.jsonify({
+            'data': {
+                'id': str(service_uuid),
+                'jobs_remaining': jobs_remaining
+            },
+            'links': {
+                'self': url_for(
+                    self.__class__.__name__, service_id=str(service_uuid),
+                    _external=True
+                )
+            }
+        })
+        response.status_code = 200
+        return response
@@ -3,13 +3,17 @@ Describes an endpoint where detailed information about the service can be
 obtained
 """
 from datetime import datetime
-from flask import Response, jsonify
+from flask import Response, jsonify, url_for
 from topchef.api.abstract_endpoints import AbstractEndpointForService
 from topchef.api.abstract_endpoints import AbstractEndpointForServiceMeta
+from topchef.api.abstract_endpoints import MetaSchema
+from topchef.api.jobs_for_service import JobsForServiceID as JobsForService
+from topchef.api.service_deletion import ServiceDeletion
 from topchef.models import Service
-from topchef.models.errors import RequestNotJSONError
+from topchef.models.errors import RequestNotJSONError, QueryParameterError
 from topchef.models.errors import DeserializationError
-from topchef.serializers import JSONSchema
+from topchef.serializers import JSONSchema, CompiledSerializer
+from topchef.serializers import JobOverview as JobOverviewSerializer
 from topchef.serializers import ServiceDetail as ServiceSerializer
 from topchef.serializers import ServiceModification as ModifyServiceSerializer
 
@@ -18,6 +22,11 @@ class ServiceDetail(AbstractEndpointForService):
     """
     Describes the endpoint that returns the details for a particular service
     """
+    _SERVICE_FIELDS = tuple(
+        name for name in ServiceSerializer().fields.keys()
+        if name not in ('job_counts', 'jobs')
+    )
+
     def get(self, service: Service) -> Response:
         r"""
         Return details for a given service
@@ -30,6 +39,7 @@ class ServiceDetail(AbstractEndpointForService):
 
             HTTP/1.1 200 OK
             Content-Type: application/json
+            ETag: "6f1d0c2b4e8a9d3c7b5a1e0f2d4c6b8a9e7f5d3c1b0a2e4f6d8c0b9a7e5d3c1f"
 
             {
                 "data": {
@@ -43,98 +53,61 @@ class ServiceDetail(AbstractEndpointForService):
                     "job_result_schema": {
                         "type": "object"
                     },
-                    "jobs": [
-                        {
-                        "date_submitted": "2017-08-15T18:29:07.902093+00:00",
-                        "id": "42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7",
-                        "status": "REGISTERED"
-                        }
-                    ],
+                    "job_counts": {
+                        "REGISTERED": 1,
+                        "WORKING": 0,
+                        "COMPLETED": 0,
+                        "ERROR": 0
+                    },
                     "name": "Testing Service",
-                    "timeout": 30
+                    "timeout": 30,
+                    "job_retention": null
                     },
                     "links": {
                         "self":
-                            "/services/495d76fd-044c-4f02-8815-5ec6e7634330"
+                            "/services/495d76fd-044c-4f02-8815-5ec6e7634330",
+                        "jobs":
+                            "/services/495d76fd-044c-4f02-8815-5ec6e7634330/jobs"
                     },
                     "meta": {
                         "service_schema": {
-                            "$schema":
-                                "http://json-schema.org/draft-04/schema#",
-                            "description":
-                                "A comprehensive schema for services",
-                            "properties": {
-                                "description": {
-                                    "readonly": true,
-                                    "title": "description",
-                                    "type": "string"
-                                },
-                                "has_timed_out": {
-                                    "readonly": true,
-                                    "title": "has_timed_out",
-                                    "type": "boolean"
-                                },
-                                "id": {
-                                    "format": "uuid",
-                                    "readonly": true,
-                                    "title": "id",
-                                    "type": "string"
-                                },
-                                "is_service_available": {
-                                    "readonly": true,
-                                    "title": "is_service_available",
-                                    "type": "boolean"
-                                },
-                                "job_registration_schema": {
-                                    "readonly": true,
-                                    "title": "job_registration_schema",
-                                    "type": "object"
-                                },
-                                "job_result_schema": {
-                                    "readonly": true,
-                                    "title": "job_result_schema",
-                                    "type": "object"
-                                },
-                                "jobs": {
-                                    "items": {
-                                    "type": "object"
-                                    },
-                                    "type": "array"
-                                },
-                                "name": {
-                                    "readonly": true,
-                                    "title": "name",
-                                    "type": "string"
-                                },
-                                "timeout": {
-                                    "readonly": true,
-                                    "title": "timeout",
-                                    "type": "string"
-                                }
-                            },
-                            "required": [
-                                "description",
-                                "has_timed_out",
-                                "id",
-                                "is_service_available",
-                                "job_registration_schema",
-                                "job_result_schema",
-                                "name",
-                                "timeout"
-                            ],
-                            "title": "Detailed Service Schema",
-                            "type": "object"
+                            "$ref": "http://localhost:5000/schemas/4528315481435b1274c2e83fe3bd1b5bf388a7c5d77ab8a129ce7cb55d96d862"
                         }
                     }
                 }
 
+        The jobs of the service are summarized by the number of jobs with
+        each status, which is counted by the database. The jobs themselves
+        can be read a page at a time from the ``jobs`` link. A page of jobs
+        can also be included in ``data/jobs`` with ``?include=jobs``. The
+        page is bounded by the ``limit`` query parameter, in the same way
+        as the jobs list.
+
+        The ``ETag`` of the response changes whenever the service, or any of
+        its jobs, changes. Sending it back in the ``If-None-Match`` header
+        of a later request returns ``304`` if nothing has changed since.
+
+        :query include: ``jobs`` to include a page of the service's jobs in
+            the response
+        :query limit: The maximum number of jobs to include. This defaults
+            to the ``DEFAULT_PAGE_SIZE`` configuration parameter, and is
+            capped by ``MAXIMUM_PAGE_SIZE``
+        :query after: The ID of the job after which the included jobs start
         :statuscode 200: The request completed successfully
+        :statuscode 304: The service has not changed since the client got it
+        :statuscode 400: A query parameter could not be understood
         :statuscode 404: A service with the ID was not found
 
         :param service: The service for which a response is to be retrieved
         :return: A flask response with the appropriate data
         """
-        return self._get_detailed_response_for_service(service)
+        include_jobs = self._jobs_requested
+        return self.conditional_response(
+            self._entity_tag_for_service(service),
+            lambda: self._get_detailed_response_for_service(
+                service, include_jobs
+            )
+        )
 
     def patch(self, service: Service) -> Response:
         """
@@ -153,7 +126,8 @@ class ServiceDetail(AbstractEndpointForService):
                 "is_available": false,
                 "name": "Changed name",
                 "description": "Changed description",
-                "timeout": 20
+                "timeout": 20,
+                "job_retention": 2592000
             }
 
         **Example Response**
@@ -174,27 +148,40 @@ class ServiceDetail(AbstractEndpointForService):
                 "job_result_schema": {
                     "type": "object"
                 },
-                "jobs": [
-                    {
-                        "date_submitted": "2017-08-15T18:29:07.902093+00:00",
-                        "id": "42094fe4-9c71-4d6e-94fd-7ed6e2b46ce7",
-                        "status": "REGISTERED"
-                    }
-                ],
+                "job_counts": {
+                    "REGISTERED": 1,
+                    "WORKING": 0,
+                    "COMPLETED": 0,
+                    "ERROR": 0
+                },
                 "name": "Testing Service",
-                "timeout": 30
+                "timeout": 30,
+                "job_retention": 2592000
             }
 
+        ``job_retention`` is the number of seconds for which the service's
+        finished jobs are kept before the ``archive`` command moves them to
+        the archive, where they can still be read from ``/jobs/<job_id>``.
+        Setting it to ``null`` stops the service's jobs from being archived.
+
+        The response summarizes the jobs of the service in the same way as
+        the response to a ``GET`` request, and accepts the same query
+        parameters.
+
+        The request counts as a heartbeat from the service, which is
+        coalesced in the same way as ``POST /services/<service_id>/heartbeat``.
+        The heartbeat alone does not change the ``version`` of the service.
+
         :statuscode 200: The request completed successfully
         :statuscode 400: If an attempt is made to provide JSON as a request
             body, and the JSON is either syntactically or semantically
-            incorrect.
+            incorrect, or if a query parameter could not be understood.
         :statuscode 404: A service with that ID was not found in the database
 
         :param service: The service to patch
         :return: Reset the service's timeout
         """
-        service.check_in()
+        self.service_list.check_in(service.id)
 
         try:
             request_body = self.request_json
@@ -203,6 +190,58 @@ class ServiceDetail(AbstractEndpointForService):
         else:
             return self._handle_service_modification(request_body, service)
 
+    def delete(self, service: Service) -> Response:
+        """
+        Delete the service. The service disappears from the API at once,
+        along with its jobs, and the jobs are then removed from the database
+        in the background, a chunk at a time, by the ``purge`` command. The
+        progress of the purge can be followed at the ``deletion`` link,
+        which is also returned in the ``Location`` header.
+
+        .. :quickref: Service; Delete the service and its jobs
+
+        **Example Request**
+
+        .. sourcecode:: http
+
+            DELETE /services/495d76fd-044c-4f02-8815-5ec6e7634330 HTTP/1.1
+
+        **Example Response**
+
+        .. sourcecode:: http
+
+            HTTP/1.1 202 ACCEPTED
+            Content-Type: application/json
+            Location: http://localhost:5000/services/495d76fd-044c-4f02-8815-5ec6e7634330/deletion
+
+            {
+                "data": "Service 495d76fd-044c-4f02-8815-5ec6e7634330 deleted",
+                "links": {
+                    "deletion": "http://localhost:5000/services/495d76fd-044c-4f02-8815-5ec6e7634330/deletion"
+                }
+            }
+
+        :statuscode 202: The service was deleted, and its jobs will be
+            purged
+        :statuscode 404: A service with that ID was not found in the database
+
+        :param service: The service to delete
+        :return: A flask response pointing to the progress of the purge
+        """
+        del self.service_list[service.id]
+
+        deletion_url = url_for(
+            ServiceDeletion.__name__, service_id=str(service.id),
+            _external=True
+        )
+        response = self.jsonify({
+            'data': 'Service %s deleted' % service.id,
+            'links': {'deletion': deletion_url}
+        })
+        response.headers['Location'] = deletion_url
+        response.status_code = 202
+        return response
+
     @staticmethod
     def _handle_request_not_json() -> Response:
         response = jsonify({
@@ -215,6 +254,7 @@ class ServiceDetail(AbstractEndpointForService):
     def _handle_service_modification(
             self, request_body: dict, service: Service
     ) -> Response:
+        include_jobs = self._jobs_requested
         serializer = ModifyServiceSerializer()
         deserialized_body, errors = serializer.load(request_body)
 
@@ -224,27 +264,103 @@ class ServiceDetail(AbstractEndpointForService):
 
         self._modify_service(deserialized_body, service)
 
-        return self._get_detailed_response_for_service(service)
+        return self._get_detailed_response_for_service(service, include_jobs)
 
     def _report_deserialization_errors(self, errors: dict):
         self.errors.extend(
             (DeserializationError(key, errors[key]) for key in errors.keys())
         )
 
-    def _get_detailed_response_for_service(self, service: Service) -> Response:
-        serializer = ServiceSerializer()
-        serializer_schema = JSONSchema(
-            title='Detailed Service Schema',
-            description='A comprehensive schema for displaying services'
+    @property
+    def _jobs_requested(self) -> bool:
+        """
+
+        :return: ``True`` if the client asked for a page of the service's
+            jobs through the ``include`` query parameter
+        :raises: :exc:`QueryParameterError` if something other than the
+            jobs is asked for
+        """
+        raw_value = self._request.args.get('include')
+        if raw_value is None:
+            return False
+
+        if raw_value != 'jobs':
+            raise QueryParameterError('include', raw_value, 'jobs')
+
+        return True
+
+    def _get_detailed_response_for_service(
+            self, service: Service, include_jobs: bool
+    ) -> Response:
+        """
+
+        :param service: The service to return
+        :param include_jobs: ``True`` if a page of the service's jobs is to
+            be included in the response
+        :return: The details of the service
+        """
+        serializer = CompiledSerializer.for_schema(
+            ServiceSerializer, only=self._SERVICE_FIELDS
         )
-        response = jsonify({
-            'data': serializer.dump(service, many=False).data,
-            'meta': {'service_schema': serializer_schema.dump(serializer)},
-            'links': {'self': self.self_url(service)}
+        data = serializer.dump(service, many=False).data
+        data['job_counts'] = {
+            status.name: count
+            for status, count in service.jobs.status_counts().items()
+        }
+
+        if include_jobs:
+            job_serializer = CompiledSerializer.for_schema(
+                JobOverviewSerializer
+            )
+            page = self.get_page_of_jobs(
+                service.jobs.only(job_serializer.schema.fields.keys())
+            )
+            data['jobs'] = job_serializer.dump(page, many=True).data
+
+        response = self.jsonify({
+            'data': data,
+            'meta': {
+                'service_schema': self.schema_reference(self._service_schema)
+            },
+            'links': {
+                'self': self.self_url(service),
+                'jobs': url_for(
+                    JobsForService.__name__, service_id=str(service.id),
+                    _external=True
+                )
+            }
         })
         response.status_code = 200
         return response
 
+    def _entity_tag_for_service(self, service: Service) -> str:
+        """
+
+        :param service: The service to be returned
+        :return: The entity tag for the details of the service. The details
+            include a summary of the service's jobs, and whether the service
+            has timed out, which depends on the time rather than on the
+            service's row, so the tag covers these as well. The jobs are
+            covered by the service's ``jobs_version``, so that none of them
+            have to be read
+        """
+        return self.entity_tag(
+            service.id, service.version, service.jobs_version,
+            service.has_timed_out
+        )
+
+    @MetaSchema
+    def _service_schema(cls) -> dict:
+        """
+
+        :return: The schema for the service returned by this endpoint
+        """
+        serializer_schema = JSONSchema(
+            title='Detailed Service Schema',
+            description='A comprehensive schema for displaying services'
+        )
+        return serializer_schema.dump(ServiceSerializer())
+
     @staticmethod
     def _modify_service(request_body: dict, service: Service) -> None:
         request_body_keys = request_body.keys()
@@ -256,6 +372,8 @@ class ServiceDetail(AbstractEndpointForService):
             service.name = request_body['name']
         if 'timeout' in request_body_keys:
             service.timeout = request_body['timeout']
+        if 'job_retention' in request_body_keys:
+            service.job_retention = request_body['job_retention']
 
 
 class ServiceDetailForServiceID(
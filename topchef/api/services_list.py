@@ -1,17 +1,18 @@
 """
 Describes the endpoint for listing services
 """
-from flask import jsonify, Response, request, Request, url_for
+from flask import Response, request, Request, url_for
 from sqlalchemy.orm import Session
 from typing import Optional
 from topchef.api.abstract_endpoints.abstract_endpoint import AbstractEndpoint
+from topchef.api.abstract_endpoints.meta_schema import MetaSchema
 from topchef.api.service_detail import ServiceDetailForServiceID as \
     ServiceDetail
 from topchef.models import ServiceList as ServiceListInterface
 from topchef.models import Service
 from topchef.models.errors import DeserializationError, SerializationError
 from topchef.models.service_list import ServiceList as ServiceListModel
-from topchef.serializers import JSONSchema
+from topchef.serializers import JSONSchema, CompiledSerializer
 from topchef.serializers import NewService as NewServiceSerializer
 from topchef.serializers import ServiceOverview as ServiceOverviewSerializer
 
@@ -51,6 +52,7 @@ class ServicesList(AbstractEndpoint):
 
             HTTP/1.1 200 OK
             Content-Type: application/json
+            ETag: "3b7e9f1a5c2d8e4b6a0f9c3d7e1b5a2f8c4d6e0b9a3f7c1d5e2b8a4f6c0d9e3b"
 
             {
                 "data": [
@@ -65,53 +67,7 @@ class ServicesList(AbstractEndpoint):
                 },
                 "meta": {
                     "new_service_schema": {
-                        "$schema": "http://json-schema.org/draft-04/schema#",
-                        "properties": {
-                            "description": {
-                                "title": "description",
-                                "type": "string"
-                            },
-                            "job_registration_schema": {
-                                "title": "job_registration_schema",
-                                "type": "object"
-                            },
-                            "job_result_schema": {
-                                "title": "job_result_schema",
-                                "type": "object"
-                            },
-                            "name": {
-                                "title": "name",
-                                "type": "string"
-                            }
-                        },
-                        "required": [
-                            "description",
-                            "job_registration_schema",
-                            "job_result_schema",
-                            "name"
-                        ],
-                        "title": "New Service Schema",
-                        "type": "object"
-                       },
-                    "service_schema": {
-                    "$schema": "http://json-schema.org/draft-04/schema#",
-                    "properties": {
-                        "description": {
-                            "readonly": true,
-                            "title": "description",
-                            "type": "string"
-                        },
-                        "id": {
-                            "format": "uuid",
-                            "readonly": true,
-                            "title": "id",
-                            "type": "string"
-                        },
-                        "name": {
-                            "readonly": true,
-                            "title": "name",
-                            "type": "string"
-                        }
+                        "$ref": "http://localhost:5000/schemas/fa94305aa01b04cd983bdabead663593a75c6a2a2b4c3cbaf0b948b861bd58f5"
                     },
                     "required": [
                         "description",
@@ -124,15 +80,34 @@ class ServicesList(AbstractEndpoint):
                 }
             }
 
+        The ``ETag`` of the response changes whenever a service is added,
+        removed, or changed. Sending it back in the ``If-None-Match`` header
+        of a later request returns ``304`` if no service has changed since.
+
+        The ``available`` query parameter lists only the services that jobs
+        can be routed to, or only those that they cannot. A service can
+        take jobs if it is available, and it has checked in within its
+        timeout. This is decided by the database, so that no services have
+        to be loaded to be left out of the list.
+
+        :query available: ``true`` to list only the services that can take
+            jobs, ``false`` to list only those that cannot. By default,
+            every service is listed
         :statuscode 200: The request completed successfully
+        :statuscode 304: No service has changed since the client got the list
+        :statuscode 400: The ``available`` parameter is neither ``true`` nor
+            ``false``
         :return: A Flask response with the appropriate data
         """
-        response = jsonify({
-            'data': self._data, 'meta': self._meta, 'links':
-            self.links
-        })
-        response.status_code = 200
-        return response
+        is_available = self.get_boolean_query_parameter('available')
+        if is_available is not None:
+            self.service_list = self.service_list.filter_by_availability(
+                is_available
+            )
+
+        return self.conditional_response(
+            self._entity_tag, self._get_response
+        )
 
     def post(self) -> Response:
         """
@@ -247,6 +222,28 @@ class ServicesList(AbstractEndpoint):
 
         return response
 
+    @property
+    def _entity_tag(self) -> str:
+        """
+
+        :return: The entity tag for the list of services
+        """
+        return self.entity_tag(
+            self.version_digest(self.service_list.versions())
+        )
+
+    def _get_response(self) -> Response:
+        """
+
+        :return: The full response to a ``GET`` request
+        """
+        response = self.jsonify({
+            'data': self._data, 'meta': self._meta, 'links':
+            self.links
+        })
+        response.status_code = 200
+        return response
+
     @property
     def _data(self) -> dict:
         """
@@ -254,7 +251,7 @@ class ServicesList(AbstractEndpoint):
         :return: The JSON corresponding to all the services loaded onto the
             API
         """
-        serializer = ServiceOverviewSerializer()
+        serializer = CompiledSerializer.for_schema(ServiceOverviewSerializer)
         service_list, errors = serializer.dump(self.service_list, many=True)
 
         if errors:
@@ -269,21 +266,37 @@ class ServicesList(AbstractEndpoint):
 
         :return: The endpoint metadata
         """
+        return {
+            'service_schema': self.schema_reference(self._service_schema),
+            'new_service_schema': self.schema_reference(
+                self._new_service_schema
+            )
+        }
+
+    @MetaSchema
+    def _service_schema(cls) -> dict:
+        """
+
+        :return: The schema for each entry in the services list
+        """
         service_schema = JSONSchema(
             title='Service overview schema',
             description='The schema for each entry in the services list'
         )
+        return service_schema.dump(ServiceOverviewSerializer())
+
+    @MetaSchema
+    def _new_service_schema(cls) -> dict:
+        """
+
+        :return: The schema for the body of a ``POST`` request
+        """
         new_service_schema = JSONSchema(
             title='New Service Schema',
             description='The schema that must be satisfied in order to post '
                         'a new service'
         )
-        return {
-            'service_schema': service_schema.dump(ServiceOverviewSerializer()),
-            'new_service_schema': new_service_schema.dump(
-                NewServiceSerializer()
-            )
-        }
+        return new_service_schema.dump(NewServiceSerializer())
 
     def _report_client_serialization_errors(self, errors: dict) -> None:
         self.errors.extend(
@@ -305,7 +318,7 @@ class ServicesList(AbstractEndpoint):
         return self._make_correct_response(service)
 
     def _make_correct_response(self, service: Service) -> Response:
-        response = jsonify({
+        response = self.jsonify({
             'data': {'message': 'service successfully created'},
             'links': self.links
         })
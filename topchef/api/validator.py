@@ -1,12 +1,14 @@
 """
 Maps the ``/validator`` endpoint
 """
-from .abstract_endpoints import AbstractEndpoint
-from flask import Response, jsonify
+from .abstract_endpoints import AbstractEndpoint, MetaSchema
+from flask import Response, Request, request
+from sqlalchemy.orm import Session
 from topchef.serializers import JSONSchema
 from topchef.serializers import JSONSchemaValidator as ValidatorSerializer
 from topchef.models.errors import DeserializationError
 from topchef.models.errors import ValidationError as ReportableValidationError
+from topchef.models.validator_cache import ValidatorCache, VALIDATOR_CACHE
 from typing import Iterable
 import jsonschema
 
@@ -15,11 +17,31 @@ class JSONSchemaValidator(AbstractEndpoint):
     """
     Maps an endpoint for validating objects against JSON Schemas
     """
+    def __init__(
+            self,
+            session: Session,
+            flask_request: Request=request,
+            validator_cache: ValidatorCache=VALIDATOR_CACHE
+    ) -> None:
+        """
+
+        :param session: The session to use
+        :param flask_request: The request that this endpoint needs to
+            process
+        :param validator_cache: The cache from which validators are taken.
+            By default, this is the cache shared by every endpoint that
+            validates JSON
+        """
+        super(JSONSchemaValidator, self).__init__(session, flask_request)
+        self._validator_cache = validator_cache
+
     def get(self) -> Response:
         """
         Return a schema indicating how the endpoint is to be used. The
         ``validator_schema`` keyword contains a JSON schema that must be
-        satisified in order to ``POST`` requests to the API
+        satisified in order to ``POST`` requests to the API. The
+        ``validator_cache`` keyword reports how often a ready-made validator
+        was found for a schema, across every endpoint that validates JSON
 
         .. :quickref: Validator; Describe how to validate
 
@@ -37,24 +59,13 @@ class JSONSchemaValidator(AbstractEndpoint):
                 },
                 "meta": {
                     "validator_schema": {
-                        "$schema": "http://json-schema.org/draft-04/schema#",
-                        "description": "The POST request schema",
-                        "properties": {
-                            "object": {
-                                "title": "object",
-                                "type": "object"
-                            },
-                            "schema": {
-                                "title": "schema",
-                                "type": "object"
-                            }
-                        },
-                        "required": [
-                            "object",
-                            "schema"
-                        ],
-                        "title": "JSON Schema Validator",
-                        "type": "object"
+                        "$ref": "http://localhost:5000/schemas/f7915887547f6769c97afed14a56084414e0db36f3dbf9c762c46150d9021302"
+                    },
+                    "validator_cache": {
+                        "hits": 1520,
+                        "max_size": 256,
+                        "misses": 12,
+                        "size": 12
                     }
                 }
             }
@@ -62,11 +73,14 @@ class JSONSchemaValidator(AbstractEndpoint):
         :statuscode 200: The request completed successfully
         :return: A flask response indicating how this validator is to be used
         """
-        return jsonify({
+        return self.jsonify({
             'data': {},
             'links': self.links,
             'meta': {
-                'validator_schema': self.validator_schema
+                'validator_schema': self.schema_reference(
+                    self.validator_schema
+                ),
+                'validator_cache': self._validator_cache.statistics
             }
         })
 
@@ -138,7 +152,7 @@ class JSONSchemaValidator(AbstractEndpoint):
             self._report_deserialization_errors(errors)
             raise self.Abort()
 
-        json_schema_validator = jsonschema.Draft4Validator(data['schema'])
+        json_schema_validator = self._validator_cache(data['schema'])
 
         if not json_schema_validator.is_valid(data['object']):
             self._report_validation_errors(
@@ -146,7 +160,7 @@ class JSONSchemaValidator(AbstractEndpoint):
             )
             raise self.Abort()
 
-        response = jsonify({
+        response = self.jsonify({
             'data': {
                 'status': 'Validation was successful'
             },
@@ -155,8 +169,8 @@ class JSONSchemaValidator(AbstractEndpoint):
         response.status_code = 200
         return response
 
-    @property
-    def validator_schema(self) -> dict:
+    @MetaSchema
+    def validator_schema(cls) -> dict:
         """
 
         :return: The validator schema
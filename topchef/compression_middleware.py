@@ -0,0 +1,349 @@
+"""
+Middleware layer that compresses response bodies, and decompresses request
+bodies.
+
+Job parameters and results are verbose JSON documents, which shrink a great
+deal when compressed. Responses larger than
+``config.COMPRESSION_MINIMUM_SIZE`` are compressed with gzip or deflate if
+the client's ``Accept-Encoding`` header allows it. Clients may likewise send
+request bodies compressed with gzip or deflate, as long as they say so in
+the ``Content-Encoding`` header.
+
+Both directions are streamed. Response bodies are compressed chunk by chunk
+as the application produces them, and request bodies are decompressed as
+the application reads them, so neither is held in memory twice. zlib holds
+back its output until it has enough input to compress well, so the
+compressor is flushed after the first chunk of a response, and then after
+every ``config.COMPRESSION_FLUSH_SIZE`` bytes, so that clients of streamed
+responses start receiving the body as soon as it is produced.
+
+Responses that could have been compressed carry ``Vary: Accept-Encoding``
+even when they are sent uncompressed, so that caches do not serve an
+uncompressed body to clients that asked for a compressed one, or the other
+way around.
+
+A compressed body is a different representation from the uncompressed one,
+so it must not share a strong entity tag with it. The strong ``ETag`` of a
+compressed response is suffixed with the name of the encoding, as described
+in :mod:`topchef.api.entity_tags`.
+"""
+import io
+import json
+import zlib
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from typing import Tuple
+from werkzeug.exceptions import BadRequest
+from werkzeug.http import parse_accept_header
+from werkzeug.wrappers import Response
+from werkzeug.wsgi import get_input_stream
+from topchef.api.entity_tags import CONTENT_ENCODINGS, encoded_entity_tag
+from topchef.config import config
+from topchef.models import APIError
+from topchef.models.errors import UnsupportedContentEncodingError
+from topchef.models.errors import RequestBodyTooLargeError
+from topchef.serializers import APIException as ExceptionSerializer
+
+Headers = List[Tuple[str, str]]
+
+
+class CompressionMiddleware(object):
+    """
+    Middleware layer compressing responses and decompressing requests
+    """
+    encodings = CONTENT_ENCODINGS
+
+    window_bits = {
+        'gzip': 16 + zlib.MAX_WBITS,
+        'x-gzip': 16 + zlib.MAX_WBITS,
+        'deflate': zlib.MAX_WBITS
+    }
+
+    uncompressible_status_codes = frozenset([204, 206, 304])
+
+    def __init__(
+            self,
+            app: Callable,
+            minimum_size: int=config.COMPRESSION_MINIMUM_SIZE,
+            compression_level: int=config.COMPRESSION_LEVEL,
+            maximum_request_size: int=
+            config.MAXIMUM_DECOMPRESSED_REQUEST_SIZE,
+            flush_size: int=config.COMPRESSION_FLUSH_SIZE
+    ) -> None:
+        """
+
+        :param app: The WSGI application whose bodies are to be compressed
+        :param minimum_size: The size, in bytes, below which responses are
+            sent uncompressed. Responses whose size is not known in advance
+            are always compressed
+        :param compression_level: The zlib compression level, from ``1``
+            for the fastest compression to ``9`` for the smallest bodies
+        :param maximum_request_size: The largest decompressed request body,
+            in bytes, that the application may read
+        :param flush_size: The number of uncompressed bytes after which the
+            compressed output is flushed to the client
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compression_level = compression_level
+        self.maximum_request_size = maximum_request_size
+        self.flush_size = flush_size
+
+    def __call__(
+            self, environ: Dict[str, Any], start_response: Callable
+    ) -> Iterable[bytes]:
+        """
+
+        :param environ: The request environment
+        :param start_response: The function used to start the response
+        :return: The response body
+        """
+        content_encoding = environ.get('HTTP_CONTENT_ENCODING', '').strip()
+        if content_encoding and content_encoding.lower() != 'identity':
+            if content_encoding.lower() not in self.window_bits:
+                return self._error_response(
+                    UnsupportedContentEncodingError(content_encoding)
+                )(environ, start_response)
+            self._decompress_request(environ, content_encoding.lower())
+
+        encoding = self._accepted_encoding(environ)
+        compressor = []  # type: List[Any]
+        started = []  # type: List[bool]
+
+        def start_compressed_response(
+                status: str, headers: Headers, exc_info: Any=None
+        ) -> Callable:
+            started.append(True)
+            del compressor[:]
+            if self._should_compress(environ, status, headers):
+                if encoding is None:
+                    headers = self._varied_headers(headers)
+                else:
+                    compressor.append(self._compressor(encoding))
+                    headers = self._compressed_headers(headers, encoding)
+            return start_response(status, headers, exc_info)
+
+        app_iter = self.app(environ, start_compressed_response)
+        if started and not compressor:
+            return app_iter
+        return self._compress(app_iter, compressor)
+
+    def _decompress_request(
+            self, environ: Dict[str, Any], content_encoding: str
+    ) -> None:
+        """
+        Replace the request body with a stream that decompresses it as it
+        is read. The length of the decompressed body is not known, so the
+        body is marked as terminated by the end of the stream instead.
+
+        :param environ: The request environment
+        :param content_encoding: The encoding of the request body
+        """
+        environ['wsgi.input'] = io.BufferedReader(DecompressingStream(
+            get_input_stream(environ), self.window_bits[content_encoding],
+            self.maximum_request_size
+        ))
+        environ['wsgi.input_terminated'] = True
+        environ.pop('CONTENT_LENGTH', None)
+        environ.pop('HTTP_CONTENT_ENCODING', None)
+
+    def _accepted_encoding(self, environ: Dict[str, Any]) -> Optional[str]:
+        """
+
+        :param environ: The request environment
+        :return: The compression that the client prefers, or ``None`` if
+            the client does not accept compressed responses
+        """
+        if environ.get('REQUEST_METHOD', '').upper() == 'HEAD':
+            return None
+        accepted = parse_accept_header(environ.get('HTTP_ACCEPT_ENCODING'))
+        return accepted.best_match(self.encodings)
+
+    def _should_compress(
+            self, environ: Dict[str, Any], status: str, headers: Headers
+    ) -> bool:
+        """
+
+        :param environ: The request environment
+        :param status: The status line of the response
+        :param headers: The response headers
+        :return: ``True`` if the response is worth compressing
+        """
+        if int(status.split(None, 1)[0]) in self.uncompressible_status_codes:
+            return False
+
+        header_values = {name.lower(): value for name, value in headers}
+        if 'content-encoding' in header_values:
+            return False
+        if 'no-transform' in header_values.get('cache-control', ''):
+            return False
+
+        content_length = header_values.get('content-length')
+        return content_length is None or \
+            int(content_length) >= self.minimum_size
+
+    def _compressor(self, encoding: str) -> Any:
+        """
+
+        :param encoding: The compression to use
+        :return: A zlib compression object producing that encoding
+        """
+        return zlib.compressobj(
+            self.compression_level, zlib.DEFLATED, self.window_bits[encoding]
+        )
+
+    @staticmethod
+    def _compressed_headers(headers: Headers, encoding: str) -> Headers:
+        """
+
+        :param headers: The headers of the uncompressed response
+        :param encoding: The compression applied to the body
+        :return: The headers of the compressed response. The length of the
+            compressed body is not known until it has been sent, so the
+            ``Content-Length`` header is removed, and a strong ``ETag`` is
+            replaced by the tag of the compressed representation
+        """
+        compressed_headers = [
+            (name, value) for name, value in headers
+            if name.lower() not in ('content-length', 'etag')
+        ]
+        compressed_headers.extend(
+            (name, encoded_entity_tag(value, encoding))
+            for name, value in headers if name.lower() == 'etag'
+        )
+        compressed_headers.append(('Content-Encoding', encoding))
+        return CompressionMiddleware._varied_headers(compressed_headers)
+
+    @staticmethod
+    def _varied_headers(headers: Headers) -> Headers:
+        """
+
+        :param headers: The headers of a response that is compressed for
+            clients that accept it
+        :return: The headers, with ``Accept-Encoding`` added to the
+            ``Vary`` header
+        """
+        vary = [
+            value for name, value in headers if name.lower() == 'vary'
+        ]
+        varied_headers = [
+            (name, value) for name, value in headers if name.lower() != 'vary'
+        ]
+        varied_headers.append(('Vary', ', '.join(vary + ['Accept-Encoding'])))
+        return varied_headers
+
+    def _compress(
+            self, app_iter: Iterable[bytes], compressor: List[Any]
+    ) -> Iterator[bytes]:
+        """
+
+        :param app_iter: The response body produced by the application
+        :param compressor: A list containing the compression object for the
+            response, or an empty list if the response is not compressed.
+            The application may start the response while the body is being
+            produced, so the list is checked for every chunk
+        :return: The response body, compressed if required. The compressed
+            output is flushed after the first chunk, and then whenever
+            ``flush_size`` bytes have been compressed since the last flush
+        """
+        unflushed_size = None  # type: Optional[int]
+        try:
+            for chunk in app_iter:
+                if not compressor:
+                    yield chunk
+                    continue
+                compressed_chunk = compressor[0].compress(chunk)
+                if unflushed_size is None or \
+                        unflushed_size + len(chunk) >= self.flush_size:
+                    compressed_chunk += compressor[0].flush(zlib.Z_SYNC_FLUSH)
+                    unflushed_size = 0
+                else:
+                    unflushed_size += len(chunk)
+                if compressed_chunk:
+                    yield compressed_chunk
+            if compressor:
+                yield compressor[0].flush()
+        finally:
+            if hasattr(app_iter, 'close'):
+                app_iter.close()
+
+    @staticmethod
+    def _error_response(error: APIError) -> Response:
+        """
+
+        :param error: The error that stopped the request from reaching the
+            application
+        :return: A response reporting the error, in the same form as the
+            errors reported by the endpoints
+        """
+        serializer = ExceptionSerializer(many=True)
+        return Response(
+            json.dumps({'errors': serializer.dump([error]).data}),
+            status=error.status_code, mimetype='application/json'
+        )
+
+
+class DecompressingStream(io.RawIOBase):
+    """
+    A read-only stream that decompresses another stream as it is read
+    """
+    chunk_size = 64 * 1024
+
+    def __init__(
+            self, stream: Any, window_bits: int, maximum_size: int
+    ) -> None:
+        """
+
+        :param stream: The compressed stream
+        :param window_bits: The zlib window size, which also selects
+            between the gzip and zlib formats
+        :param maximum_size: The largest number of decompressed bytes that
+            may be read from the stream
+        """
+        super(DecompressingStream, self).__init__()
+        self._stream = stream
+        self._decompressor = zlib.decompressobj(window_bits)
+        self._maximum_size = maximum_size
+        self._size = 0
+        self._buffer = b''
+
+    def readable(self) -> bool:
+        """
+
+        :return: ``True``, since the stream can be read
+        """
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        """
+
+        :param buffer: The buffer into which the decompressed data is
+            written
+        :return: The number of bytes written, which is ``0`` at the end of
+            the compressed data
+        :raises: :exc:`BadRequest` if the compressed data is corrupt or
+            truncated
+        :raises: :exc:`RequestBodyTooLargeError` if the decompressed data is
+            larger than the maximum size
+        """
+        while not self._buffer:
+            if self._decompressor.eof:
+                return 0
+            compressed_data = self._decompressor.unconsumed_tail or \
+                self._stream.read(self.chunk_size)
+            if not compressed_data:
+                raise BadRequest('The compressed request body is truncated')
+            try:
+                self._buffer = self._decompressor.decompress(
+                    compressed_data, self.chunk_size
+                )
+            except zlib.error:
+                raise BadRequest('The compressed request body is corrupt')
+
+            self._size += len(self._buffer)
+            if self._size > self._maximum_size:
+                raise RequestBodyTooLargeError(self._maximum_size)
+
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
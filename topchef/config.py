@@ -35,6 +35,43 @@ class Config(Iterable):
     # DATABASE
     DATABASE_URI = 'sqlite:///%s/db.sqlite3' % BASE_DIRECTORY
 
+    # PAGINATION
+    DEFAULT_PAGE_SIZE = 100
+    MAXIMUM_PAGE_SIZE = 1000
+
+    # JOB QUEUE
+    MAXIMUM_JOBS_PER_SUBMISSION = 50000
+    MAXIMUM_JOBS_PER_UPDATE = 10000
+    MAXIMUM_JOBS_PER_LEASE = 100
+    DEFAULT_QUEUE_DEPTH = 10
+    MAXIMUM_QUEUE_DEPTH = 100
+    MAXIMUM_LONG_POLL_SECONDS = 30
+    LONG_POLL_RECHECK_SECONDS = 5
+    JOB_LEASE_SECONDS = 300
+    MAXIMUM_JOB_LEASE_SECONDS = 3600
+    ARCHIVE_CHUNK_SIZE = 1000
+
+    # RESULT STORAGE
+    RESULT_BLOB_THRESHOLD_BYTES = 64 * 1024
+    RESULT_BLOB_DIRECTORY = os.path.join(BASE_DIRECTORY, 'blobs')
+    RESULT_BLOB_CHUNK_SIZE = 64 * 1024
+    RESULT_BLOB_MINIMUM_AGE_SECONDS = 3600
+
+    # SERVICES
+    HEARTBEAT_COALESCING_SECONDS = 1
+    PURGE_CHUNK_SIZE = 1000
+
+    # VALIDATION
+    VALIDATOR_CACHE_SIZE = 256
+    SCHEMA_CACHE_SECONDS = 31536000
+
+    # COMPRESSION
+    COMPRESSION_ENABLED = True
+    COMPRESSION_MINIMUM_SIZE = 1024
+    COMPRESSION_LEVEL = 6
+    COMPRESSION_FLUSH_SIZE = 16 * 1024
+    MAXIMUM_DECOMPRESSED_REQUEST_SIZE = 256 * 1024 * 1024
+
     def __init__(self, environment=os.environ):
 
         Parameter = namedtuple('Parameter', ['key', 'from_env', 'from_file'])
@@ -23,4 +23,5 @@ for more details about object-relational mapping.
 """
 from .service import Service
 from .job import Job, JobStatus
+from .archived_job import ArchivedJob
 from .job_set import JobSet
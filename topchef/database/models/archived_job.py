@@ -0,0 +1,33 @@
+"""
+Contains a model for a job that has been moved to the archive. Archived jobs
+are only ever read. They are written by copying rows out of the jobs table
+in bulk, so this model has no constructor of its own
+"""
+from datetime import datetime
+from typing import Optional
+from .declarative_base import BASE
+from ..schemas import database, JobStatus
+from ...json_type import JSON_TYPE as JSON
+
+
+class ArchivedJob(BASE):
+    """
+    The database model for an archived job. It has the same attributes as
+    a job that is not leased, so that it can be wrapped by the same model
+    class
+    """
+    __table__ = database.archived_jobs
+
+    id = __table__.c.job_id
+
+    status = __table__.c.status  # type: JobStatus
+    results = __table__.c.results  # type: JSON
+    parameters = __table__.c.parameters  # type: JSON
+    results_blob = __table__.c.results_blob  # type: Optional[str]
+    date_submitted = __table__.c.date_submitted  # type: datetime
+    service_id = __table__.c.service_id
+    version = __table__.c.version  # type: int
+    date_archived = __table__.c.date_archived  # type: datetime
+
+    lease_expires = None  # type: Optional[datetime]
+    lease_owner = None  # type: Optional[str]
@@ -22,20 +22,25 @@ class Job(BASE):
     status = __table__.c.status  # type: JobStatus
     results = __table__.c.results  # type: JSON
     parameters = __table__.c.parameters  # type: JSON
+    results_blob = __table__.c.results_blob  # type: Optional[str]
     date_submitted = __table__.c.date_submitted  # type: datetime
     service_id = __table__.c.service_id
+    lease_expires = __table__.c.lease_expires  # type: Optional[datetime]
+    lease_owner = __table__.c.lease_owner  # type: Optional[str]
+    version = __table__.c.version  # type: int
 
     def __init__(
             self, job_id: UUID, status: JobStatus, parameters: JSON,
             service: 'Service', results: Optional[JSON],
-            date_submitted=datetime.utcnow()
+            date_submitted: Optional[datetime]=None
     ) -> None:
         self.id = job_id
         self.status = status
         self.parameters = parameters
         self.results = results
         self.service = service
-        self.date_submitted = date_submitted
+        self.date_submitted = date_submitted if date_submitted is not None \
+            else datetime.utcnow()
 
     @classmethod
     def new(cls, service: 'Service', parameters: JSON) -> 'Job':
@@ -9,8 +9,12 @@ from .declarative_base import BASE
 from uuid import UUID, uuid4
 from ...json_type import JSON_TYPE as JSON
 from .job import Job
+from .archived_job import ArchivedJob
+from ..seconds_after import SecondsAfter
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql.elements import ColumnElement
 from datetime import datetime
+from typing import Optional
 
 
 class Service(BASE):
@@ -29,11 +33,18 @@ class Service(BASE):
     is_service_available = __table__.c.is_service_available
     last_checked_in = __table__.c.last_checked_in
     timeout = __table__.c.heartbeat_timeout_seconds
+    version = __table__.c.version  # type: int
+    jobs_version = __table__.c.jobs_version  # type: int
+    is_deleted = __table__.c.is_deleted  # type: bool
+    job_retention = __table__.c.job_retention_seconds  # type: Optional[int]
 
     jobs = relationship(
         Job, backref='service', cascade='all, delete-orphan',
         lazy='dynamic'
     )
+    archived_jobs = relationship(
+        ArchivedJob, backref='service', lazy='dynamic'
+    )
 
     def __init__(
             self, service_id: UUID, name: str, description: str,
@@ -46,6 +57,7 @@ class Service(BASE):
         self.job_registration_schema = registration_schema
         self.job_result_schema = result_schema
         self.is_service_available = False
+        self.is_deleted = False
         self.last_checked_in = datetime.utcnow()
         self.timeout = 30
 
@@ -62,3 +74,24 @@ class Service(BASE):
         return cls(
             service_id, name, description, registration_schema, result_schema
         )
+
+    @classmethod
+    def has_timed_out_at(cls, time: datetime) -> ColumnElement:
+        """
+
+        :param time: The time at which the services are checked
+        :return: A SQL expression that is true for services that had not
+            checked in within their timeout at that time
+        """
+        return SecondsAfter(cls.last_checked_in, cls.timeout) < time
+
+    @classmethod
+    def is_live_at(cls, time: datetime) -> ColumnElement:
+        """
+
+        :param time: The time at which the services are checked
+        :return: A SQL expression that is true for services that are
+            available, and that had checked in within their timeout at that
+            time
+        """
+        return cls.is_service_available & ~cls.has_timed_out_at(time)
@@ -17,5 +17,6 @@ database.
 from .abstract_database_schema import AbstractDatabaseSchema
 from .database_schema import DatabaseSchema
 from .job_status import JobStatus
+from .schema_upgrader import SchemaUpgrader
 
 database = DatabaseSchema()
@@ -41,6 +41,15 @@ class AbstractDatabaseSchema(object, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError()
 
+    @property
+    @abc.abstractmethod
+    def archived_jobs(self) -> Table:
+        """
+
+        :return: The table to which old finished jobs are moved
+        """
+        raise NotImplementedError()
+
     @property
     @abc.abstractmethod
     def metadata(self) -> MetaData:
@@ -2,14 +2,37 @@ from .abstract_database_schema import AbstractDatabaseSchema
 from .job_status import JobStatus
 from datetime import datetime
 from sqlalchemy import Table, Column, MetaData, String, Boolean, Integer
-from sqlalchemy import DateTime, ForeignKey, Enum
+from sqlalchemy import DateTime, ForeignKey, Enum, Index, literal_column
+from sqlalchemy import false
 from ..uuid_database_type import UUID
 from ..json_type import JSON
 
 
 class DatabaseSchema(AbstractDatabaseSchema):
     """
-    Describes the schema for the database
+    Describes the schema for the database.
+
+    Services and jobs carry a ``version`` column, which starts at 1 and is
+    incremented by every ``UPDATE`` of the row, whether it is issued by the
+    ORM or by a bulk update. Endpoints use it to tell clients whether a
+    resource has changed since they last read it. Services also carry a
+    ``jobs_version`` column, which
+    :mod:`topchef.models.job_change_tracker` increments whenever jobs of
+    the service are registered, deleted, or change status.
+
+    Deleting a service only sets its ``is_deleted`` flag, which hides it
+    from the API. Its jobs, and then the service itself, are removed later
+    by the purger, in small batches.
+
+    Services may set a ``job_retention_seconds``. Finished jobs older than
+    that are moved, in small batches, from ``jobs`` into ``archived_jobs``,
+    which keeps everything needed to read a finished job, but none of the
+    indexes needed to queue and lease jobs. A service without a retention
+    keeps its jobs in ``jobs`` forever.
+
+    Results that are too large to keep in the row are kept in the blob store
+    of :mod:`topchef.models.blob_store`. The row then has no ``results``,
+    and ``results_blob`` holds the digest of the blob instead.
     """
     _GENERAL_JSON_SCHEMA = {'type': 'object'}
 
@@ -36,7 +59,20 @@ class DatabaseSchema(AbstractDatabaseSchema):
             JSON,
             nullable=False,
             default=_GENERAL_JSON_SCHEMA
-        )
+        ),
+        Column(
+            'version', Integer, nullable=False, default=1, server_default='1',
+            onupdate=literal_column('version') + 1
+        ),
+        Column(
+            'jobs_version', Integer, nullable=False, default=1,
+            server_default='1'
+        ),
+        Column(
+            'is_deleted', Boolean, nullable=False, default=False,
+            server_default=false()
+        ),
+        Column('job_retention_seconds', Integer, nullable=True)
     )
 
     _jobs = Table(
@@ -50,7 +86,47 @@ class DatabaseSchema(AbstractDatabaseSchema):
         Column('status', Enum(JobStatus), default=JobStatus.REGISTERED),
         Column('parameters', JSON, nullable=False),
         Column('results', JSON, nullable=True),
-        Column('job_set_id', ForeignKey('job_sets.job_set_id'), nullable=True)
+        Column('results_blob', String(64), nullable=True),
+        Column('job_set_id', ForeignKey('job_sets.job_set_id'), nullable=True),
+        Column('lease_expires', DateTime, nullable=True),
+        Column('lease_owner', String(100), nullable=True),
+        Column(
+            'version', Integer, nullable=False, default=1, server_default='1',
+            onupdate=literal_column('version') + 1
+        ),
+        Index(
+            'ix_jobs_service_id_status_date_submitted',
+            'service_id', 'status', 'date_submitted'
+        ),
+        Index(
+            'ix_jobs_service_id_date_submitted_job_id',
+            'service_id', 'date_submitted', 'job_id'
+        ),
+        Index('ix_jobs_status_date_submitted', 'status', 'date_submitted'),
+        Index('ix_jobs_status_lease_expires', 'status', 'lease_expires'),
+        Index(
+            'ix_jobs_job_set_id_date_submitted_job_id',
+            'job_set_id', 'date_submitted', 'job_id'
+        ),
+        Index('ix_jobs_job_set_id_status', 'job_set_id', 'status')
+    )
+
+    _archived_jobs = Table(
+        'archived_jobs', _metadata,
+        Column('job_id', UUID, primary_key=True, nullable=False),
+        Column('service_id', UUID, ForeignKey('services.service_id'),
+               nullable=False
+               ),
+        Column('date_submitted', DateTime, nullable=False),
+        Column('status', Enum(JobStatus), nullable=False),
+        Column('parameters', JSON, nullable=False),
+        Column('results', JSON, nullable=True),
+        Column('results_blob', String(64), nullable=True),
+        Column('job_set_id', ForeignKey('job_sets.job_set_id'), nullable=True),
+        Column('version', Integer, nullable=False),
+        Column('date_archived', DateTime, nullable=False),
+        Index('ix_archived_jobs_service_id', 'service_id'),
+        Index('ix_archived_jobs_job_set_id_status', 'job_set_id', 'status')
     )
 
     _job_sets = Table(
@@ -83,6 +159,15 @@ class DatabaseSchema(AbstractDatabaseSchema):
         """
         return self._jobs
 
+    @property
+    def archived_jobs(self) -> Table:
+        """
+
+        :return: The table of finished jobs that have been moved out of the
+            jobs table
+        """
+        return self._archived_jobs
+
     @property
     def metadata(self) -> MetaData:
         """
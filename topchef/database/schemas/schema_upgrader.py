@@ -0,0 +1,109 @@
+"""
+Brings an existing database up to date with the schema declared in
+:mod:`.database_schema`. ``create_all`` only creates tables that do not
+exist yet, so databases that were created by an older version of the API
+miss any columns and indexes that were declared since. The upgrader adds
+them in place, without touching any of the data already in the database.
+
+Only additive changes are supported. A column can only be added if it is
+nullable or has a server-side default, since the rows that are already in
+the table need a value for it.
+"""
+import logging
+from sqlalchemy import Table, Column, inspect
+from sqlalchemy.engine import Engine, Connection
+from sqlalchemy.engine.reflection import Inspector
+from sqlalchemy.schema import CreateColumn
+from .abstract_database_schema import AbstractDatabaseSchema
+
+LOG = logging.getLogger(__name__)
+
+
+class SchemaUpgrader(object):
+    """
+    Adds missing tables, columns, and indexes to a database
+    """
+    def __init__(self, database_schema: AbstractDatabaseSchema) -> None:
+        """
+
+        :param database_schema: The schema to which the database is to be
+            upgraded
+        """
+        self.schema = database_schema
+
+    def upgrade(self, engine: Engine) -> None:
+        """
+        Upgrade the database. Running the upgrade on a database that is
+        already up to date does nothing.
+
+        :param engine: The engine connected to the database to upgrade
+        """
+        self.schema.metadata.create_all(bind=engine)
+
+        with engine.begin() as connection:
+            inspector = inspect(connection)
+            for table in self.schema.metadata.sorted_tables:
+                self._add_missing_columns(connection, inspector, table)
+                self._add_missing_indexes(connection, inspector, table)
+
+    def _add_missing_columns(
+            self, connection: Connection, inspector: Inspector, table: Table
+    ) -> None:
+        """
+
+        :param connection: The connection to the database
+        :param inspector: An inspector that can read the database's schema
+        :param table: The table to which columns are to be added
+        """
+        existing_columns = {
+            column['name'] for column in inspector.get_columns(table.name)
+        }
+        for column in table.columns:
+            if column.name not in existing_columns:
+                self._add_column(connection, table, column)
+
+    @staticmethod
+    def _add_column(
+            connection: Connection, table: Table, column: Column
+    ) -> None:
+        """
+
+        :param connection: The connection to the database
+        :param table: The table to which the column is to be added
+        :param column: The column to add
+        :raises: :exc:`ValueError` if the column cannot be filled in for the
+            rows already in the table
+        """
+        if not column.nullable and column.server_default is None:
+            raise ValueError(
+                'Unable to add column %s to table %s. The column must be '
+                'nullable, or have a server default' % (
+                    column.name, table.name
+                )
+            )
+
+        LOG.info('Adding column %s to table %s', column.name, table.name)
+        connection.execute('ALTER TABLE %s ADD COLUMN %s' % (
+            connection.dialect.identifier_preparer.format_table(table),
+            CreateColumn(column).compile(dialect=connection.dialect)
+        ))
+
+    @staticmethod
+    def _add_missing_indexes(
+            connection: Connection, inspector: Inspector, table: Table
+    ) -> None:
+        """
+
+        :param connection: The connection to the database
+        :param inspector: An inspector that can read the database's schema
+        :param table: The table to which indexes are to be added
+        """
+        existing_indexes = {
+            index['name'] for index in inspector.get_indexes(table.name)
+        }
+        for index in table.indexes:
+            if index.name not in existing_indexes:
+                LOG.info(
+                    'Creating index %s on table %s', index.name, table.name
+                )
+                index.create(bind=connection)
@@ -0,0 +1,57 @@
+"""
+Describes a SQL expression for the date and time that comes a number of
+seconds after another date and time. Every database spells date arithmetic
+differently, so the expression is compiled separately for each of the
+databases supported by the API. This lets queries compare times that depend
+on the columns of a row, like the time at which a service times out, without
+loading the row into Python.
+
+On SQLite, where dates and times are stored as text, the result is text in
+the same format as the stored times, truncated to the millisecond, so that
+it can be compared to them.
+"""
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+
+
+class SecondsAfter(FunctionElement):
+    """
+    The time that comes a number of seconds after a time. This takes two
+    arguments. The first is the time, and the second is the number of
+    seconds
+    """
+    type = DateTime()
+    name = 'seconds_after'
+
+
+@compiles(SecondsAfter)
+def _compile_seconds_after(element: SecondsAfter, compiler, **kwargs) -> str:
+    """
+    Compile the expression using SQL standard interval arithmetic, which is
+    understood by PostgreSQL
+    """
+    time, seconds = element.clauses.clauses
+    return "(%s + %s * INTERVAL '1 second')" % (
+        compiler.process(time, **kwargs), compiler.process(seconds, **kwargs)
+    )
+
+
+@compiles(SecondsAfter, 'sqlite')
+def _compile_seconds_after_for_sqlite(
+        element: SecondsAfter, compiler, **kwargs
+) -> str:
+    time, seconds = element.clauses.clauses
+    return "strftime('%Y-%m-%d %H:%M:%f', {}, '+' || {} || ' seconds')".format(
+        compiler.process(time, **kwargs), compiler.process(seconds, **kwargs)
+    )
+
+
+@compiles(SecondsAfter, 'mysql')
+def _compile_seconds_after_for_mysql(
+        element: SecondsAfter, compiler, **kwargs
+) -> str:
+    time, seconds = element.clauses.clauses
+    return 'DATE_ADD(%s, INTERVAL %s SECOND)' % (
+        compiler.process(time, **kwargs), compiler.process(seconds, **kwargs)
+    )
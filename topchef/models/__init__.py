@@ -31,7 +31,10 @@ interfaces.
 """
 from .interfaces import Job
 from .interfaces import JobList
+from .interfaces import JobArchive
 from .interfaces import Service
 from .interfaces import ServiceList
+from .interfaces import JobSet
+from .interfaces import JobSetList
 from .interfaces import APIMetadata
 from .interfaces import APIError
@@ -35,16 +35,20 @@ Therefore, everything before
 """
 import abc
 from ..interfaces.job_list import JobList
-from sqlalchemy.orm import Query, Session
+from sqlalchemy import and_, or_, func
+from sqlalchemy.orm import Query, Session, joinedload, defer
 from topchef.database.models import Job as DatabaseJob
 from topchef.database.models.job import JobStatus as DatabaseJobStatus
-from typing import Iterator, Sequence
+from typing import Iterator, Sequence, Tuple
 from collections.abc import AsyncIterator
 from topchef.models.interfaces.job import Job
 from topchef.models.job import Job as JobModel
+from topchef.models.job_change_tracker import JOB_CHANGE_TRACKER
 from copy import deepcopy
 from uuid import UUID
-from typing import Union
+from typing import Union, Optional, Dict, Any, Iterable, List, Callable
+from datetime import datetime, timedelta
+from sqlalchemy.orm.attributes import InstrumentedAttribute
 
 
 class JobListFromQuery(JobList, metaclass=abc.ABCMeta):
@@ -55,6 +59,21 @@ class JobListFromQuery(JobList, metaclass=abc.ABCMeta):
         Job.JobStatus.ERROR: DatabaseJobStatus.ERROR
     }
 
+    _DIALECTS_SUPPORTING_SKIP_LOCKED = frozenset(['postgresql'])
+
+    _MAXIMUM_CLAIM_ATTEMPTS = 10
+
+    _MAXIMUM_IDS_PER_QUERY = 500
+
+    _VERSIONS_PER_BATCH = 1000
+
+    _JOBS_PER_STREAMED_BATCH = 100
+
+    _DEFERRABLE_COLUMNS = {
+        'parameters': ('parameters',),
+        'results': ('results', 'results_blob')
+    }
+
     @property
     @abc.abstractmethod
     def root_job_query(self) -> Query:
@@ -79,6 +98,87 @@ class JobListFromQuery(JobList, metaclass=abc.ABCMeta):
         """
         return JobModel(self._safely_get_database_job(job_id))
 
+    def only(self, attributes: Iterable[str]) -> JobList:
+        """
+        Defer loading the large JSON columns that are not needed. If a
+        deferred attribute is read anyway, SQLAlchemy loads it with a
+        separate query
+
+        :param attributes: The names of the job attributes to load
+        :return: A job list that only loads those attributes
+        """
+        requested_attributes = frozenset(attributes)
+        deferred_columns = [
+            column
+            for attribute, columns in self._DEFERRABLE_COLUMNS.items()
+            if attribute not in requested_attributes
+            for column in columns
+        ]
+        return _JobListView(self, lambda query: query.options(
+            *(defer(column) for column in deferred_columns)
+        ))
+
+    def filter(
+            self,
+            statuses: Optional[Iterable[Job.JobStatus]]=None,
+            service_id: Optional[UUID]=None,
+            submitted_after: Optional[datetime]=None,
+            submitted_before: Optional[datetime]=None
+    ) -> JobList:
+        """
+        Add the criteria to the ``WHERE`` clause of the query for this
+        list, so that the database can use its indexes on ``status``,
+        ``service_id`` and ``date_submitted`` to find the matching jobs
+
+        :param statuses: The statuses that the jobs may have
+        :param service_id: The ID of the service that the jobs belong to
+        :param submitted_after: The time after which the jobs were submitted
+        :param submitted_before: The time before which the jobs were
+            submitted
+        :return: The jobs in this list that match every given criterion
+        """
+        criteria = []
+
+        if statuses is not None:
+            criteria.append(DatabaseJob.status.in_(
+                [self._MODEL_TO_DB_JOB_STATUS[status] for status in statuses]
+            ))
+        if service_id is not None:
+            criteria.append(DatabaseJob.service_id == service_id)
+        if submitted_after is not None:
+            criteria.append(DatabaseJob.date_submitted > submitted_after)
+        if submitted_before is not None:
+            criteria.append(DatabaseJob.date_submitted < submitted_before)
+
+        return _JobListView(self, lambda query: query.filter(*criteria))
+
+    def jobs_with_ids(self, job_ids: Iterable[UUID]) -> Dict[UUID, Job]:
+        """
+        Load the jobs with ``IN`` queries, along with their services, so
+        that no further queries are needed to read the result schemas. The
+        IDs are sent in chunks, in order to stay below the limit that some
+        databases place on the number of parameters in a query.
+
+        :param job_ids: The IDs of the jobs to retrieve
+        :return: The jobs that were found, keyed by ID
+        """
+        unique_job_ids = list(set(job_ids))  # type: List[UUID]
+        jobs = {}  # type: Dict[UUID, Job]
+
+        for start in range(
+                0, len(unique_job_ids), self._MAXIMUM_IDS_PER_QUERY
+        ):
+            chunk = unique_job_ids[start:start + self._MAXIMUM_IDS_PER_QUERY]
+            query = self.root_job_query.filter(
+                DatabaseJob.id.in_(chunk)
+            ).options(joinedload('service'))
+            jobs.update(
+                (database_job.id, JobModel(database_job))
+                for database_job in query
+            )
+
+        return jobs
+
     def __setitem__(self, job_id: UUID, job: Job) -> None:
         """
 
@@ -87,7 +187,7 @@ class JobListFromQuery(JobList, metaclass=abc.ABCMeta):
         """
         database_job = self._safely_get_database_job(job_id)
         database_job.status = self._MODEL_TO_DB_JOB_STATUS[job.status]
-        database_job.results = job.results
+        JobModel(database_job).results = job.results
 
         self.session.add(database_job)
 
@@ -135,6 +235,357 @@ class JobListFromQuery(JobList, metaclass=abc.ABCMeta):
     def __len__(self) -> int:
         return self.root_job_query.count()
 
+    def page(
+            self, limit: int, after: Optional[UUID]=None
+    ) -> Sequence[Job]:
+        """
+        Seek past the previous page using the index on
+        ``(date_submitted, job_id)``, so that the cost of fetching a page
+        does not depend on how deep into the list the page is
+
+        :param limit: The maximum number of jobs on the page
+        :param after: The ID of the last job on the previous page
+        :return: The jobs on the page
+        """
+        return [
+            JobModel(database_job)
+            for database_job in self._page_query(limit, after)
+        ]
+
+    def stream_page(
+            self, limit: int, after: Optional[UUID]=None
+    ) -> Iterator[Job]:
+        """
+        Read the page in batches of ``_JOBS_PER_STREAMED_BATCH`` jobs. On
+        databases that support it, the rows are fetched through a
+        server-side cursor. The query is only run once the iterator is
+        first advanced, so the jobs are read in the transaction that is
+        current at that time.
+
+        :param limit: The maximum number of jobs on the page
+        :param after: The ID of the last job on the previous page
+        :return: An iterator over the jobs on the page
+        """
+        query = self._page_query(limit, after).execution_options(
+            stream_results=True
+        ).yield_per(self._JOBS_PER_STREAMED_BATCH)
+
+        def jobs() -> Iterator[Job]:
+            for database_job in query:
+                yield JobModel(database_job)
+        return jobs()
+
+    def _page_query(self, limit: int, after: Optional[UUID]) -> Query:
+        """
+
+        :param limit: The maximum number of jobs on the page
+        :param after: The ID of the last job on the previous page
+        :return: The query for the jobs on the page
+        :raises: :exc:`KeyError` if there is no job with the ID ``after``
+        """
+        query = self.root_job_query
+
+        if after is not None:
+            previous_job = self._safely_get_database_job(after)
+            query = query.filter(or_(
+                DatabaseJob.date_submitted > previous_job.date_submitted,
+                and_(
+                    DatabaseJob.date_submitted == previous_job.date_submitted,
+                    DatabaseJob.id > previous_job.id
+                )
+            ))
+
+        return query.order_by(
+            DatabaseJob.date_submitted, DatabaseJob.id
+        ).limit(limit)
+
+    def status_counts(self) -> Dict[Job.JobStatus, int]:
+        """
+        Count the jobs with a single ``GROUP BY status`` query
+
+        :return: The number of jobs with each status
+        """
+        counts = dict(
+            self.root_job_query.with_entities(
+                DatabaseJob.status, func.count(DatabaseJob.id)
+            ).group_by(DatabaseJob.status)
+        )
+        return {
+            status: counts.get(self._MODEL_TO_DB_JOB_STATUS[status], 0)
+            for status in Job.JobStatus
+        }
+
+    def versions(self) -> Iterator[Tuple[UUID, int]]:
+        """
+        Read the IDs and versions of the jobs in batches, so that none of
+        the other columns are loaded
+
+        :return: The ``(job_id, version)`` pairs of the jobs in this list
+        """
+        query = self.root_job_query.with_entities(
+            DatabaseJob.id, DatabaseJob.version
+        ).order_by(DatabaseJob.id)
+        return (
+            (job_id, version)
+            for job_id, version in query.yield_per(self._VERSIONS_PER_BATCH)
+        )
+
+    def queue(self, depth: int) -> Sequence[Job]:
+        """
+        Get the head of the queue with a single
+        ``ORDER BY date_submitted LIMIT depth`` query, which is served from
+        the index on the status and submission date of the jobs.
+
+        :param depth: The maximum number of jobs to return
+        :return: Up to ``depth`` of the oldest ``REGISTERED`` jobs
+        """
+        if depth < 1:
+            return []
+
+        return [
+            JobModel(database_job) for database_job in
+            self._registered_job_query.limit(depth)
+        ]
+
+    def claim_next_job(
+            self, lease_duration: timedelta, lease_owner: Optional[str]=None
+    ) -> Optional[Job]:
+        """
+
+        :param lease_duration: The amount of time for which the job is
+            leased
+        :param lease_owner: An optional name for the worker claiming the job
+        :return: The oldest ``REGISTERED`` job in the list, which has now
+            been marked as ``WORKING``, or ``None`` if no job could be claimed
+        """
+        return next(
+            iter(self.claim_jobs(1, lease_duration, lease_owner)), None
+        )
+
+    def claim_jobs(
+            self,
+            number_of_jobs: int,
+            lease_duration: timedelta,
+            lease_owner: Optional[str]=None
+    ) -> Sequence[Job]:
+        """
+        Claim up to ``number_of_jobs`` of the oldest ``REGISTERED`` jobs in
+        the list by flipping their status to ``WORKING``, and setting the
+        expiry of their lease. The claim is made in the session's current
+        transaction, so it becomes visible to other clients once the
+        session is committed.
+
+        On PostgreSQL, the jobs are locked with
+        ``SELECT ... FOR UPDATE SKIP LOCKED``, so that concurrent claimants
+        skip over rows that are already being claimed instead of waiting on
+        them. On other databases, each job is claimed with a conditional
+        ``UPDATE`` that only succeeds if the job is still ``REGISTERED``.
+        If another client wins the race for a job, the next oldest jobs are
+        tried instead.
+
+        :param number_of_jobs: The maximum number of jobs to claim
+        :param lease_duration: The amount of time for which the jobs are
+            leased
+        :param lease_owner: An optional name for the worker claiming the
+            jobs
+        :return: The claimed jobs, in the order in which they were submitted
+        """
+        if number_of_jobs < 1:
+            return []
+
+        lease = {
+            DatabaseJob.status: DatabaseJobStatus.WORKING,
+            DatabaseJob.lease_expires: datetime.utcnow() + lease_duration,
+            DatabaseJob.lease_owner: lease_owner
+        }
+
+        if self._database_supports_skip_locked:
+            database_jobs = self._claim_with_skip_locked(
+                number_of_jobs, lease
+            )
+        else:
+            database_jobs = self._claim_with_conditional_update(
+                number_of_jobs, lease
+            )
+
+        JOB_CHANGE_TRACKER.jobs_changed(
+            self.session,
+            {database_job.service_id for database_job in database_jobs}
+        )
+        return [JobModel(database_job) for database_job in database_jobs]
+
+    def extend_lease(
+            self,
+            job_id: UUID,
+            lease_duration: timedelta,
+            lease_owner: Optional[str]=None
+    ) -> Optional[datetime]:
+        """
+        Extend the lease on a job with a single ``UPDATE`` statement. The
+        job is only looked up if the lease could not be extended, in order
+        to tell a missing job apart from a job that is not leased. Jobs
+        already loaded into the session are synchronized by fetching the
+        matching rows, since the root query of a list may restrict it with
+        subqueries that cannot be evaluated in Python.
+
+        :param job_id: The ID of the job whose lease is to be extended
+        :param lease_duration: The amount of time from now for which the job
+            is to stay leased
+        :param lease_owner: The worker extending the lease
+        :return: The new lease expiry, or ``None`` if the lease could not be
+            extended
+        :raises: :exc:`KeyError` if a job with that ID does not exist
+        """
+        new_lease_expiry = datetime.utcnow() + lease_duration
+
+        leased_job_query = self.root_job_query.filter(
+            DatabaseJob.id == job_id,
+            DatabaseJob.status == DatabaseJobStatus.WORKING
+        )
+        if lease_owner is not None:
+            leased_job_query = leased_job_query.filter(
+                DatabaseJob.lease_owner == lease_owner
+            )
+
+        number_of_updated_rows = leased_job_query.update(
+            {DatabaseJob.lease_expires: new_lease_expiry},
+            synchronize_session='fetch'
+        )
+
+        if number_of_updated_rows:
+            return new_lease_expiry
+        elif job_id not in self:
+            raise KeyError('A job with id %s does not exist' % job_id)
+        else:
+            return None
+
+    def requeue_expired_jobs(self) -> int:
+        """
+        Return all ``WORKING`` jobs whose leases have expired to the queue
+        in a single ``UPDATE`` statement. Jobs that were claimed before
+        leases were introduced have no lease expiry, and are left alone.
+        The services of the expired jobs are looked up beforehand, so that
+        their ``jobs_version`` can be incremented.
+
+        :return: The number of jobs that were returned to the queue
+        """
+        expired_job_query = self.root_job_query.filter(
+            DatabaseJob.status == DatabaseJobStatus.WORKING,
+            DatabaseJob.lease_expires < datetime.utcnow()
+        )
+        JOB_CHANGE_TRACKER.jobs_changed(self.session, (
+            row.service_id for row in expired_job_query.with_entities(
+                DatabaseJob.service_id
+            ).distinct()
+        ))
+        return expired_job_query.update(
+            {
+                DatabaseJob.status: DatabaseJobStatus.REGISTERED,
+                DatabaseJob.lease_expires: None,
+                DatabaseJob.lease_owner: None
+            },
+            synchronize_session=False
+        )
+
+    @property
+    def _registered_job_query(self) -> Query:
+        """
+
+        :return: A query for all the ``REGISTERED`` jobs in this list, in the
+            order in which they were submitted
+        """
+        return self.root_job_query.filter(
+            DatabaseJob.status == DatabaseJobStatus.REGISTERED
+        ).order_by(
+            DatabaseJob.date_submitted, DatabaseJob.id
+        )
+
+    @property
+    def _database_supports_skip_locked(self) -> bool:
+        """
+
+        :return: ``True`` if the database to which the session is bound
+            understands ``FOR UPDATE SKIP LOCKED``
+        """
+        dialect_name = self.session.get_bind().dialect.name
+        return dialect_name in self._DIALECTS_SUPPORTING_SKIP_LOCKED
+
+    def _claim_with_skip_locked(
+            self, number_of_jobs: int, lease: Dict[InstrumentedAttribute, Any]
+    ) -> Sequence[DatabaseJob]:
+        """
+
+        :param number_of_jobs: The maximum number of jobs to claim
+        :param lease: The values to set on each claimed job
+        :return: The claimed jobs
+        """
+        database_jobs = self._registered_job_query.with_for_update(
+            skip_locked=True
+        ).limit(number_of_jobs).all()
+
+        for database_job in database_jobs:
+            for column, value in lease.items():
+                setattr(database_job, column.key, value)
+
+        return database_jobs
+
+    def _claim_with_conditional_update(
+            self, number_of_jobs: int, lease: Dict[InstrumentedAttribute, Any]
+    ) -> Sequence[DatabaseJob]:
+        """
+
+        :param number_of_jobs: The maximum number of jobs to claim
+        :param lease: The values to set on each claimed job
+        :return: The claimed jobs. Fewer than ``number_of_jobs`` jobs are
+            returned if there are not enough registered jobs, or if every
+            attempt to claim the remaining jobs lost its race to another
+            client
+        """
+        claimed_job_ids = []
+
+        for _ in range(self._MAXIMUM_CLAIM_ATTEMPTS):
+            number_of_jobs_left = number_of_jobs - len(claimed_job_ids)
+            if not number_of_jobs_left:
+                break
+
+            candidate_ids = [
+                row.id for row in self._registered_job_query.with_entities(
+                    DatabaseJob.id
+                ).limit(number_of_jobs_left)
+            ]
+            if not candidate_ids:
+                break
+
+            claimed_job_ids.extend(
+                job_id for job_id in candidate_ids
+                if self._conditionally_claim(job_id, lease)
+            )
+
+        if not claimed_job_ids:
+            return []
+
+        return self.root_job_query.filter(
+            DatabaseJob.id.in_(claimed_job_ids)
+        ).order_by(
+            DatabaseJob.date_submitted, DatabaseJob.id
+        ).populate_existing().all()
+
+    def _conditionally_claim(
+            self, job_id: UUID, lease: Dict[InstrumentedAttribute, Any]
+    ) -> bool:
+        """
+
+        :param job_id: The ID of the job to claim
+        :param lease: The values to set on the job if it is claimed
+        :return: ``True`` if the job was still ``REGISTERED``, and has now
+            been claimed. ``False`` if another client got to the job first
+        """
+        number_of_updated_rows = self.session.query(DatabaseJob).filter(
+            DatabaseJob.id == job_id,
+            DatabaseJob.status == DatabaseJobStatus.REGISTERED
+        ).update(lease, synchronize_session=False)
+        return number_of_updated_rows == 1
+
     def _safely_get_database_job(self, job_id: UUID) -> DatabaseJob:
         job = self.root_job_query.filter_by(id=job_id).first()
 
@@ -198,3 +649,28 @@ class JobListFromQuery(JobList, metaclass=abc.ABCMeta):
 
             def __await__(self) -> Job:
                 return self.job
+
+
+class _JobListView(JobListFromQuery):
+    """
+    A job list whose query is derived from the query of another job list,
+    for instance to filter the jobs or to leave out some of their columns
+    """
+    def __init__(
+            self,
+            job_list: JobListFromQuery,
+            refine_query: Callable[[Query], Query]
+    ) -> None:
+        """
+
+        :param job_list: The job list to view
+        :param refine_query: A function that takes the query of the viewed
+            job list, and returns the query for this view
+        """
+        super(_JobListView, self).__init__(job_list.session)
+        self._job_list = job_list
+        self._refine_query = refine_query
+
+    @property
+    def root_job_query(self) -> Query:
+        return self._refine_query(self._job_list.root_job_query)
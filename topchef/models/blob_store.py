@@ -0,0 +1,247 @@
+"""
+Keeps large job results out of the database, in a directory of files named
+after the SHA-256 digest of their contents.
+
+On databases other than PostgreSQL, results are stored as text in a column
+of limited length, and every row that is loaded carries the whole document
+with it. Results whose JSON encoding is longer than
+``config.RESULT_BLOB_THRESHOLD_BYTES`` are instead written to the blob store,
+and the row only keeps the digest of the file. Since the files are named
+after their contents, identical results are only stored once, and a file is
+never changed after it has been written. Files are written under a temporary
+name, and then renamed, so that a reader never sees a partially-written
+file.
+
+Blobs are read through a read-only memory map, so that a large result can
+be sent to a client a chunk at a time, without being copied into memory or
+parsed first.
+
+Blobs are not removed when the jobs that refer to them are changed or
+deleted, since other jobs may have the same results. A blob is also written
+before the transaction that refers to it commits, and is left behind if
+that transaction is rolled back. The ``purge`` and ``archive`` commands
+therefore remove the blobs that no job or archived job refers to, once they
+are older than ``config.RESULT_BLOB_MINIMUM_AGE_SECONDS``. Younger blobs may
+belong to a transaction that has not committed yet. Storing a blob that is
+already stored makes it young again.
+"""
+import hashlib
+import mmap
+import os
+import re
+import tempfile
+import time
+from typing import Container, Iterator, Set
+from sqlalchemy.orm import Session
+from topchef.config import config
+from topchef.database.models import ArchivedJob as DatabaseArchivedJob
+from topchef.database.models import Job as DatabaseJob
+
+
+class BlobReader(object):
+    """
+    An iterable over the contents of a blob, in chunks. The blob stays
+    mapped into memory until the reader is closed, which WSGI servers do
+    once the response has been sent
+    """
+    def __init__(self, path: str, chunk_size: int) -> None:
+        """
+
+        :param path: The path to the blob
+        :param chunk_size: The number of bytes in each chunk
+        :raises: :exc:`KeyError` if the blob does not exist
+        """
+        try:
+            self._file = open(path, 'rb')
+        except FileNotFoundError:
+            raise KeyError('A blob at %s does not exist' % path)
+
+        try:
+            if os.fstat(self._file.fileno()).st_size == 0:
+                self._map = b''  # An empty file cannot be mapped
+            else:
+                self._map = mmap.mmap(
+                    self._file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+        except BaseException:
+            self._file.close()
+            raise
+        self._chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[bytes]:
+        for offset in range(0, len(self._map), self._chunk_size):
+            yield self._map[offset:offset + self._chunk_size]
+
+    def __len__(self) -> int:
+        """
+
+        :return: The size of the blob, in bytes
+        """
+        return len(self._map)
+
+    def read(self) -> bytes:
+        """
+
+        :return: The whole blob
+        """
+        return self._map[:]
+
+    def close(self) -> None:
+        """
+        Unmap the blob, and close its file
+        """
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+
+class BlobStore(object):
+    """
+    A content-addressed store of immutable blobs in a local directory. Blobs
+    are spread over subdirectories named after the first two characters of
+    their digest, so that no directory grows too large
+    """
+    _DIGEST_PATTERN = re.compile('^[0-9a-f]{64}$')
+
+    def __init__(
+            self,
+            directory: str=config.RESULT_BLOB_DIRECTORY,
+            chunk_size: int=config.RESULT_BLOB_CHUNK_SIZE
+    ) -> None:
+        """
+
+        :param directory: The directory in which blobs are kept. It is
+            created when the first blob is written
+        :param chunk_size: The number of bytes in each chunk returned by
+            the readers of this store
+        """
+        self._directory = directory
+        self._chunk_size = chunk_size
+
+    def put(self, contents: bytes) -> str:
+        """
+        Store a blob. If an identical blob is already stored, nothing is
+        written
+
+        :param contents: The blob to store
+        :return: The digest by which the blob can be read
+        """
+        digest = hashlib.sha256(contents).hexdigest()
+        path = self._path(digest)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        else:
+            return digest
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(file_descriptor, 'wb') as blob_file:
+                blob_file.write(contents)
+                blob_file.flush()
+                os.fsync(blob_file.fileno())
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+        return digest
+
+    def open(self, digest: str) -> BlobReader:
+        """
+
+        :param digest: The digest of the blob
+        :return: A reader for the blob, which must be closed once it is no
+            longer needed
+        :raises: :exc:`KeyError` if a blob with that digest does not exist
+        """
+        return BlobReader(self._path(digest), self._chunk_size)
+
+    def read(self, digest: str) -> bytes:
+        """
+
+        :param digest: The digest of the blob
+        :return: The contents of the blob
+        :raises: :exc:`KeyError` if a blob with that digest does not exist
+        """
+        reader = self.open(digest)
+        try:
+            return reader.read()
+        finally:
+            reader.close()
+
+    def remove_unreferenced(
+            self,
+            referenced_digests: Container[str],
+            minimum_age: float=config.RESULT_BLOB_MINIMUM_AGE_SECONDS
+    ) -> int:
+        """
+        Remove the blobs that nothing refers to, along with any temporary
+        files left behind by writes that did not finish
+
+        :param referenced_digests: The digests of the blobs to keep
+        :param minimum_age: The number of seconds for which a blob is kept
+            after it was last stored, whether or not it is referenced
+        :return: The number of files that were removed
+        """
+        if not os.path.isdir(self._directory):
+            return 0
+
+        oldest_kept_time = time.time() - minimum_age
+        number_of_files = 0
+        for prefix in os.listdir(self._directory):
+            subdirectory = os.path.join(self._directory, prefix)
+            if not os.path.isdir(subdirectory):
+                continue
+            for name in os.listdir(subdirectory):
+                if prefix + name in referenced_digests:
+                    continue
+                path = os.path.join(subdirectory, name)
+                try:
+                    if os.stat(path).st_mtime > oldest_kept_time:
+                        continue
+                    os.unlink(path)
+                except FileNotFoundError:
+                    continue
+                number_of_files += 1
+
+        return number_of_files
+
+    def __contains__(self, digest: str) -> bool:
+        return self._DIGEST_PATTERN.match(digest) is not None and \
+            os.path.exists(self._path(digest))
+
+    def _path(self, digest: str) -> str:
+        """
+
+        :param digest: The digest of a blob
+        :return: The path to the blob
+        :raises: :exc:`KeyError` if the digest is not a SHA-256 digest, so
+            that a digest read from the database can never point outside
+            the store
+        """
+        if self._DIGEST_PATTERN.match(digest) is None:
+            raise KeyError('%s is not the digest of a blob' % digest)
+        return os.path.join(self._directory, digest[:2], digest[2:])
+
+
+def referenced_result_blobs(session: Session) -> Set[str]:
+    """
+
+    :param session: The session with which the jobs are read
+    :return: The digests of the results of every job, including the jobs
+        in the archive
+    """
+    jobs = session.query(DatabaseJob.results_blob).filter(
+        DatabaseJob.results_blob.isnot(None)
+    )
+    archived_jobs = session.query(DatabaseArchivedJob.results_blob).filter(
+        DatabaseArchivedJob.results_blob.isnot(None)
+    )
+    return {digest for digest, in jobs.union(archived_jobs)}
+
+
+RESULT_BLOB_STORE = BlobStore()
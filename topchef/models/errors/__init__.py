@@ -15,3 +15,9 @@ from .serialization_error import SerializationError
 from .request_not_json_error import RequestNotJSONError
 from .job_with_uuid_not_found_error import JobWithUUIDNotFound
 from .jsonschema_validation_error import ValidationError
+from .query_parameter_error import QueryParameterError
+from .lease_not_held_error import LeaseNotHeldError
+from .job_set_not_found_error import JobSetWithUUIDNotFound
+from .schema_not_found_error import SchemaNotFound
+from .unsupported_content_encoding_error import UnsupportedContentEncodingError
+from .request_body_too_large_error import RequestBodyTooLargeError
@@ -0,0 +1,54 @@
+"""
+Contains an exception thrown if a worker tries to extend the lease on a job
+that it no longer holds
+"""
+from uuid import UUID
+from typing import Optional
+from topchef.models.interfaces import APIError
+
+
+class LeaseNotHeldError(APIError):
+    """
+    Thrown if the lease on a job cannot be extended, because the job is not
+    ``WORKING``, or because the lease belongs to another worker
+    """
+    def __init__(self, job_id: UUID, lease_owner: Optional[str]) -> None:
+        """
+
+        :param job_id: The ID of the job whose lease could not be extended
+        :param lease_owner: The worker that attempted to extend the lease
+        """
+        self.job_id = job_id
+        self.lease_owner = lease_owner
+
+    @property
+    def status_code(self) -> int:
+        """
+
+        :return: The ``409 CONFLICT`` status code, indicating that the
+            request conflicts with the current state of the job
+        """
+        return 409
+
+    @property
+    def title(self) -> str:
+        """
+
+        :return: The title of the error
+        """
+        return 'Lease Not Held'
+
+    @property
+    def detail(self) -> str:
+        """
+
+        :return: A detailed message explaining what went wrong
+        """
+        if self.lease_owner is None:
+            return 'The job with id %s is not leased to any worker' % (
+                self.job_id
+            )
+        else:
+            return 'The job with id %s is not leased to worker %s' % (
+                self.job_id, self.lease_owner
+            )
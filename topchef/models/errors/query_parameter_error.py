@@ -0,0 +1,55 @@
+"""
+Describes a reportable exception that is thrown if a query parameter in the
+URL of a request cannot be understood by the API. This is a client-side
+error.
+"""
+from topchef.models.interfaces import APIError
+
+
+class QueryParameterError(APIError):
+    """
+    Describes the exception
+    """
+    def __init__(
+            self, parameter_name: str, offending_value: str, expected: str
+    ) -> None:
+        """
+
+        :param parameter_name: The name of the query parameter that could
+            not be understood
+        :param offending_value: The value supplied for the parameter
+        :param expected: A description of the values that the parameter
+            accepts
+        """
+        self.parameter_name = parameter_name
+        self.offending_value = offending_value
+        self.expected = expected
+
+    @property
+    def status_code(self) -> int:
+        """
+
+        :return: Since this error is thrown when the user supplies an
+            invalid query parameter, the status code for this error is
+            ``400 BAD REQUEST``
+        """
+        return 400
+
+    @property
+    def title(self) -> str:
+        """
+
+        :return: The title of the error
+        """
+        return 'Invalid Query Parameter'
+
+    @property
+    def detail(self) -> str:
+        """
+
+        :return: A detailed message explaining what went wrong
+        """
+        return "The value '%s' of query parameter '%s' is invalid. " \
+               "Expected %s" % (
+                   self.offending_value, self.parameter_name, self.expected
+               )
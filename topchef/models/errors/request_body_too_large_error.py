@@ -0,0 +1,44 @@
+"""
+Contains an exception thrown if a compressed request body expands to more
+data than the API is willing to read
+"""
+from ..interfaces import APIError
+
+
+class RequestBodyTooLargeError(APIError):
+    """
+    Thrown if a decompressed request body is larger than the maximum size
+    """
+    def __init__(self, maximum_size: int) -> None:
+        """
+
+        :param maximum_size: The largest decompressed body, in bytes, that
+            the API will read
+        """
+        self._maximum_size = maximum_size
+
+    @property
+    def status_code(self) -> int:
+        """
+
+        :return: The 413 status code indicating that the request body is
+            too large
+        """
+        return 413
+
+    @property
+    def title(self) -> str:
+        """
+
+        :return: The title of the error
+        """
+        return 'Request Body Too Large'
+
+    @property
+    def detail(self) -> str:
+        """
+
+        :return: A detailed message explaining what went wrong
+        """
+        return 'The decompressed request body is larger than the maximum ' \
+               'of %d bytes' % self._maximum_size
@@ -0,0 +1,39 @@
+"""
+Contains an exception thrown if a published schema with a particular
+fingerprint is not found
+"""
+from ..interfaces import APIError
+
+
+class SchemaNotFound(APIError):
+    """
+    Thrown if no schema was published under a given fingerprint
+    """
+    def __init__(self, fingerprint: str):
+        self._fingerprint = fingerprint
+
+    @property
+    def status_code(self) -> int:
+        """
+
+        :return: The 404 status code indicating that a resource was not found
+        """
+        return 404
+
+    @property
+    def title(self) -> str:
+        """
+
+        :return: The title of the error
+        """
+        return 'Schema Not Found'
+
+    @property
+    def detail(self) -> str:
+        """
+
+        :return: A detailed message explaining what went wrong
+        """
+        return 'A schema with fingerprint %s was not found' % (
+            self._fingerprint
+        )
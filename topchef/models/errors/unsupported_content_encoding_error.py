@@ -0,0 +1,46 @@
+"""
+Contains an exception thrown if a request body is compressed in a way that
+the API cannot decompress
+"""
+from ..interfaces import APIError
+
+
+class UnsupportedContentEncodingError(APIError):
+    """
+    Thrown if the ``Content-Encoding`` of a request is not one that the API
+    understands
+    """
+    def __init__(self, content_encoding: str) -> None:
+        """
+
+        :param content_encoding: The encoding that the client used
+        """
+        self._content_encoding = content_encoding
+
+    @property
+    def status_code(self) -> int:
+        """
+
+        :return: The 415 status code indicating that the request body is in
+            a format that the API does not accept
+        """
+        return 415
+
+    @property
+    def title(self) -> str:
+        """
+
+        :return: The title of the error
+        """
+        return 'Unsupported Content Encoding'
+
+    @property
+    def detail(self) -> str:
+        """
+
+        :return: A detailed message explaining what went wrong
+        """
+        return 'The content encoding %s is not supported. Request bodies ' \
+               'may be compressed with gzip or deflate' % (
+                   self._content_encoding
+               )
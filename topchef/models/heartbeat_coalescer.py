@@ -0,0 +1,277 @@
+"""
+Collects the heartbeats that services send to the API, and writes them to
+the database in batches.
+
+Workers check in every few seconds, so writing every heartbeat as it arrives
+would make the heartbeats the busiest writers to the services table. Instead,
+the time of the latest heartbeat from each service is kept in memory. Once
+the coalescing window has passed since the last write, the next heartbeat
+writes every heartbeat collected in the meantime in a single batched
+``UPDATE`` statement, which is committed with the transaction of the request
+that carried it. If a session factory has been given to the coalescer, a
+timer also writes the buffered heartbeats once the window has passed, so
+that a heartbeat reaches the database at most one window late even if no
+other heartbeat arrives.
+
+The coalescer remembers which services exist, so that buffering a heartbeat
+does not need a statement of its own. The first heartbeat of a service that
+is not known yet is written at once with a single-row ``UPDATE``, whose row
+count tells whether the service exists. The services in each batch are
+checked again when the batch is written, so that a service deleted by
+another process is forgotten within one window.
+
+Heartbeats only change the time at which a service last checked in. They do
+not change the ``version`` of the service, since the time itself is not part
+of any representation of the service.
+"""
+import logging
+import threading
+from datetime import datetime
+from time import monotonic
+from typing import Callable, Dict, Iterable, Optional, Set
+from uuid import UUID
+from sqlalchemy import and_, bindparam, not_, select
+from sqlalchemy.orm import Session
+from topchef.config import config
+from topchef.database.schemas import database
+
+LOG = logging.getLogger(__name__)
+
+
+class HeartbeatCoalescer(object):
+    """
+    Buffers heartbeats in memory, and writes them to the database at most
+    once per coalescing window
+    """
+    def __init__(
+            self,
+            window_seconds: float=config.HEARTBEAT_COALESCING_SECONDS,
+            clock: Callable[[], float]=monotonic,
+            session_factory: Optional[Callable[[], Session]]=None
+    ) -> None:
+        """
+
+        :param window_seconds: The minimum number of seconds between two
+            writes of the buffered heartbeats. If this is ``0``, every
+            heartbeat is written as soon as it arrives
+        :param clock: The clock used to measure the window
+        :param session_factory: A function returning a new session, in
+            which the timer writes the heartbeats that are still buffered
+            once the window has passed. If this is ``None``, buffered
+            heartbeats are only written by later heartbeats and by
+            :meth:`HeartbeatCoalescer.flush`
+        """
+        self._window_seconds = window_seconds
+        self._clock = clock
+        self.session_factory = session_factory
+        self._lock = threading.Lock()
+        self._pending = {}  # type: Dict[UUID, datetime]
+        self._known_service_ids = set()  # type: Set[UUID]
+        self._last_write = None  # type: Optional[float]
+        self._timer = None  # type: Optional[threading.Timer]
+
+    @property
+    def number_of_pending_heartbeats(self) -> int:
+        """
+
+        :return: The number of services whose latest heartbeat has not
+            been written to the database yet
+        """
+        with self._lock:
+            return len(self._pending)
+
+    def check_in(self, session: Session, service_id: UUID) -> None:
+        """
+        Record a heartbeat from a service. If the service is not known to
+        exist, the heartbeat is written at once. Otherwise, it is buffered,
+        and every buffered heartbeat is written in this session if the
+        coalescing window has passed
+
+        :param session: The session of the request carrying the heartbeat
+        :param service_id: The ID of the service that checked in
+        :raises: :exc:`KeyError` if a service with that ID does not exist,
+            or has been deleted
+        """
+        now = datetime.utcnow()
+        with self._lock:
+            is_known = service_id in self._known_service_ids
+            if is_known:
+                self._pending[service_id] = now
+                if self._is_in_window(self._clock()):
+                    self._schedule_timer()
+                    return
+                heartbeats = self._take_pending_heartbeats(self._clock())
+
+        if is_known:
+            self._write(session, heartbeats)
+        elif self._write_heartbeat(session, service_id, now):
+            with self._lock:
+                self._known_service_ids.add(service_id)
+                if self._last_write is None:
+                    self._last_write = self._clock()
+        else:
+            raise KeyError('A service with id %s does not exist' % service_id)
+
+    def flush(self, session: Session) -> None:
+        """
+        Write every buffered heartbeat in this session, regardless of the
+        coalescing window. This should be called before reading the times
+        at which services last checked in
+
+        :param session: The session in which the heartbeats are written
+        """
+        with self._lock:
+            heartbeats = self._take_pending_heartbeats(self._clock())
+
+        self._write(session, heartbeats)
+
+    def forget(self, service_id: UUID) -> None:
+        """
+        Drop the buffered heartbeat of a service that has been deleted, so
+        that its next heartbeat is refused
+
+        :param service_id: The ID of the deleted service
+        """
+        with self._lock:
+            self._known_service_ids.discard(service_id)
+            self._pending.pop(service_id, None)
+
+    def _is_in_window(self, now: float) -> bool:
+        """
+        Must be called with the lock held
+
+        :param now: The current time on the clock
+        :return: ``True`` if the window that started with the last write
+            has not passed yet
+        """
+        return self._last_write is not None and \
+            now - self._last_write < self._window_seconds
+
+    def _schedule_timer(self) -> None:
+        """
+        Start a timer that writes the buffered heartbeats once the window
+        has passed, unless one is already running. Must be called with the
+        lock held
+        """
+        if self.session_factory is None or self._timer is not None:
+            return
+
+        delay = max(
+            0.0, self._last_write + self._window_seconds - self._clock()
+        )
+        self._timer = threading.Timer(delay, self._flush_on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _flush_on_timer(self) -> None:
+        """
+        Write the buffered heartbeats in a session of their own. Errors are
+        logged, since there is no request to report them to
+        """
+        with self._lock:
+            self._timer = None
+
+        session = self.session_factory()
+        try:
+            self.flush(session)
+            session.commit()
+        except Exception:
+            session.rollback()
+            LOG.exception('Unable to write the buffered heartbeats')
+        finally:
+            session.close()
+
+    def _take_pending_heartbeats(self, now: float) -> Dict[UUID, datetime]:
+        """
+        Must be called with the lock held
+
+        :param now: The time on the clock at which the heartbeats are taken
+        :return: The buffered heartbeats. The buffer is emptied
+        """
+        heartbeats = self._pending
+        self._pending = {}
+        self._last_write = now
+        return heartbeats
+
+    @staticmethod
+    def _write_heartbeat(
+            session: Session, service_id: UUID, time: datetime
+    ) -> bool:
+        """
+
+        :param session: The session in which the heartbeat is written
+        :param service_id: The ID of the service that checked in
+        :param time: The time of the heartbeat
+        :return: ``True`` if the service exists, and its heartbeat was
+            written
+        """
+        services = database.services
+        result = session.execute(
+            services.update().where(and_(
+                services.c.service_id == service_id,
+                not_(services.c.is_deleted)
+            )).values(last_checked_in=time, version=services.c.version)
+        )
+        return result.rowcount == 1
+
+    def _write(
+            self, session: Session, heartbeats: Dict[UUID, datetime]
+    ) -> None:
+        """
+        Check which of the services still exist, forget the others, and
+        write the heartbeats of the rest
+
+        :param session: The session in which the heartbeats are written
+        :param heartbeats: The time of the latest heartbeat from each
+            service
+        """
+        if not heartbeats:
+            return
+
+        existing_service_ids = self._existing_service_ids(
+            session, heartbeats.keys()
+        )
+        with self._lock:
+            self._known_service_ids.difference_update(
+                heartbeats.keys() - existing_service_ids
+            )
+        if not existing_service_ids:
+            return
+
+        services = database.services
+        session.execute(
+            services.update().where(
+                services.c.service_id == bindparam('heartbeat_service_id')
+            ).values(
+                last_checked_in=bindparam('heartbeat_time'),
+                version=services.c.version
+            ),
+            [
+                {'heartbeat_service_id': service_id, 'heartbeat_time': time}
+                for service_id, time in heartbeats.items()
+                if service_id in existing_service_ids
+            ]
+        )
+
+    @staticmethod
+    def _existing_service_ids(
+            session: Session, service_ids: Iterable[UUID]
+    ) -> Set[UUID]:
+        """
+
+        :param session: The session in which the services are looked up
+        :param service_ids: The IDs of the services to look up
+        :return: The IDs of those services that have not been deleted
+        """
+        services = database.services
+        return {
+            service_id for (service_id,) in session.execute(
+                select([services.c.service_id]).where(and_(
+                    services.c.service_id.in_(list(service_ids)),
+                    not_(services.c.is_deleted)
+                ))
+            )
+        }
+
+
+HEARTBEAT_COALESCER = HeartbeatCoalescer()
@@ -5,5 +5,8 @@ from .api_metadata import APIMetadata
 from .service_list import ServiceList
 from .job import Job
 from .job_list import JobList
+from .job_archive import JobArchive
 from .service import Service
 from .api_error import APIError
+from .job_set import JobSet
+from .job_set_list import JobSetList
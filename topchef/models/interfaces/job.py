@@ -6,6 +6,7 @@ from enum import Enum
 from uuid import UUID
 from topchef.database.models import JobStatus
 from datetime import datetime
+from typing import Iterable, Optional
 
 
 class Job(object, metaclass=abc.ABCMeta):
@@ -54,11 +55,53 @@ class Job(object, metaclass=abc.ABCMeta):
     def results(self, new_results):
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def encoded_results(self) -> Iterable[bytes]:
+        """
+        Read the results without parsing them. If the returned iterable has
+        a ``close`` method, it must be called once the results have been
+        read
+
+        :return: The results, encoded as a JSON document, in chunks
+        """
+        raise NotImplementedError()
+
     @property
     @abc.abstractmethod
     def date_submitted(self) -> datetime:
         raise NotImplementedError()
 
+    @property
+    @abc.abstractmethod
+    def lease_expires(self) -> Optional[datetime]:
+        """
+
+        :return: The time after which the job is returned to the queue if
+            the worker processing it has not reported back, or ``None`` if
+            nobody holds a lease on the job
+        """
+        raise NotImplementedError()
+
+    @property
+    @abc.abstractmethod
+    def version(self) -> int:
+        """
+
+        :return: A number that changes whenever the job is modified. Two
+            reads of the job that return the same version return the same
+            job
+        """
+        raise NotImplementedError()
+
+    @property
+    @abc.abstractmethod
+    def service_id(self) -> UUID:
+        """
+
+        :return: The ID of the service to which the job belongs
+        """
+        raise NotImplementedError()
+
     @property
     @abc.abstractmethod
     def parameter_schema(self) -> dict:
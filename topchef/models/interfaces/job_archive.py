@@ -0,0 +1,55 @@
+"""
+Contains an interface for the archive of finished jobs
+"""
+import abc
+from uuid import UUID
+from collections.abc import Mapping
+from typing import Iterator
+from topchef.models.interfaces.job import Job
+
+
+class JobArchive(Mapping, metaclass=abc.ABCMeta):
+    """
+    Describes an interface for moving old finished jobs out of the way of
+    the job queues, and for reading them afterwards. Archived jobs can no
+    longer be modified
+    """
+    @abc.abstractmethod
+    def __getitem__(self, job_id: UUID) -> Job:
+        """
+
+        :param job_id: The ID of the archived job to retrieve
+        :return: The job
+        :raises: :exc:`KeyError` if an archived job with this ID does not
+            exist
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def __iter__(self) -> Iterator[Job]:
+        """
+
+        :return: An iterator over all the archived jobs
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        """
+
+        :return: The number of archived jobs
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def archive_expired_jobs(self, max_jobs: int) -> int:
+        """
+        Move a bounded number of jobs into the archive. A job is moved if it
+        is ``COMPLETED`` or ``ERROR``, and was submitted longer ago than the
+        job retention of its service
+
+        :param max_jobs: The maximum number of jobs to move
+        :return: The number of jobs that were moved. If this is less than
+            ``max_jobs``, every expired job has been archived
+        """
+        raise NotImplementedError()
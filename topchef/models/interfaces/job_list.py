@@ -1,8 +1,10 @@
 import abc
 from collections.abc import MutableMapping, AsyncIterable
 from uuid import UUID
+from datetime import datetime, timedelta
 from topchef.models.interfaces.job import Job
-from typing import Iterator, AsyncIterator, Union
+from typing import Iterator, AsyncIterator, Union, Optional, Sequence
+from typing import Iterable, Mapping, Dict, Tuple
 
 
 class JobList(MutableMapping, AsyncIterable, metaclass=abc.ABCMeta):
@@ -10,6 +12,200 @@ class JobList(MutableMapping, AsyncIterable, metaclass=abc.ABCMeta):
     Describes an interface for manipulating a set of jobs posted to the API.
     The Job list should be iterating over all the jobs in the list.
     """
+    @abc.abstractmethod
+    def queue(self, depth: int) -> Sequence[Job]:
+        """
+
+        :param depth: The maximum number of jobs to return
+        :return: Up to ``depth`` of the oldest ``REGISTERED`` jobs in this
+            list, in the order in which they were submitted. These are the
+            jobs that will be claimed next
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def claim_next_job(
+            self, lease_duration: timedelta, lease_owner: Optional[str]=None
+    ) -> Optional[Job]:
+        """
+        Take the oldest ``REGISTERED`` job in this list, mark it as
+        ``WORKING``, and lease it to the caller. This operation MUST be
+        atomic, such that two clients claiming jobs from the same list at
+        the same time never receive the same job.
+
+        :param lease_duration: The amount of time for which the job is
+            leased. If the lease is not extended before it expires, the job
+            may be returned to the queue by
+            :meth:`JobList.requeue_expired_jobs`
+        :param lease_owner: An optional name for the worker claiming the
+            job. If this is provided, only this worker may extend the lease
+        :return: The claimed job, or ``None`` if there are no registered jobs
+            in the list
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def claim_jobs(
+            self,
+            number_of_jobs: int,
+            lease_duration: timedelta,
+            lease_owner: Optional[str]=None
+    ) -> Sequence[Job]:
+        """
+        Take up to ``number_of_jobs`` of the oldest ``REGISTERED`` jobs in
+        this list, mark them as ``WORKING``, and lease them to the caller.
+        The same atomicity guarantee as for :meth:`JobList.claim_next_job`
+        applies to each of the claimed jobs.
+
+        :param number_of_jobs: The maximum number of jobs to claim
+        :param lease_duration: The amount of time for which the jobs are
+            leased
+        :param lease_owner: An optional name for the worker claiming the
+            jobs
+        :return: The claimed jobs, in the order in which they were submitted
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def extend_lease(
+            self,
+            job_id: UUID,
+            lease_duration: timedelta,
+            lease_owner: Optional[str]=None
+    ) -> Optional[datetime]:
+        """
+        Push back the expiry of the lease on a ``WORKING`` job
+
+        :param job_id: The ID of the job whose lease is to be extended
+        :param lease_duration: The amount of time from now for which the job
+            is to stay leased
+        :param lease_owner: The worker extending the lease. If this is
+            provided, the lease is only extended if it is held by this worker
+        :return: The new lease expiry, or ``None`` if the job is not
+            ``WORKING``, or if its lease is held by another worker
+        :raises: :exc:`KeyError` if a job with that ID does not exist
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def requeue_expired_jobs(self) -> int:
+        """
+        Return every ``WORKING`` job whose lease has expired to the
+        ``REGISTERED`` state, so that it can be claimed again
+
+        :return: The number of jobs that were returned to the queue
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def page(
+            self, limit: int, after: Optional[UUID]=None
+    ) -> Sequence[Job]:
+        """
+        Get one page of jobs, ordered by the date on which they were
+        submitted, with the job ID breaking ties. Pages are addressed by
+        the last job on the previous page rather than by an offset, so that
+        jobs registered while the client is paging do not shift the pages.
+
+        :param limit: The maximum number of jobs on the page
+        :param after: The ID of the last job on the previous page. If this
+            is ``None``, the first page is returned
+        :return: The jobs on the page
+        :raises: :exc:`KeyError` if ``after`` is not the ID of a job in this
+            list
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def stream_page(
+            self, limit: int, after: Optional[UUID]=None
+    ) -> Iterator[Job]:
+        """
+        Get the same jobs as :meth:`JobList.page`, reading them as the
+        iterator is consumed rather than all at once, so that a large page
+        never has to be held in memory. The last job of the previous page
+        MUST be looked up before this method returns, so that an invalid
+        ``after`` is reported straight away.
+
+        :param limit: The maximum number of jobs on the page
+        :param after: The ID of the last job on the previous page. If this
+            is ``None``, the first page is returned
+        :return: An iterator over the jobs on the page
+        :raises: :exc:`KeyError` if ``after`` is not the ID of a job in this
+            list
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def status_counts(self) -> Dict[Job.JobStatus, int]:
+        """
+
+        :return: The number of jobs in this list with each status. Every
+            status is present in the mapping, even if no job has it
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def only(self, attributes: Iterable[str]) -> 'JobList':
+        """
+        Get a view of this list for callers that only need some attributes
+        of each job, so that the remaining attributes do not have to be
+        loaded. Reading one of the remaining attributes from a job in the
+        view MUST still work, though it may be slower.
+
+        :param attributes: The names of the job attributes that the caller
+            will read
+        :return: A job list with the same jobs as this list
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def filter(
+            self,
+            statuses: Optional[Iterable[Job.JobStatus]]=None,
+            service_id: Optional[UUID]=None,
+            submitted_after: Optional[datetime]=None,
+            submitted_before: Optional[datetime]=None
+    ) -> 'JobList':
+        """
+        Get the jobs in this list that match some criteria. Criteria that
+        are ``None`` are ignored. The returned list supports every
+        operation of a job list, so it can be paged through, or counted
+        with :func:`len`.
+
+        :param statuses: The statuses that the jobs may have
+        :param service_id: The ID of the service that the jobs belong to
+        :param submitted_after: Only jobs submitted after this time match
+        :param submitted_before: Only jobs submitted before this time match
+        :return: The jobs that match every given criterion
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def versions(self) -> Iterator[Tuple[UUID, int]]:
+        """
+        Read the version of every job in this list, without loading the
+        jobs. This lets callers check whether any job in the list has
+        changed, or whether jobs were added or removed, cheaply.
+
+        :return: An iterator of ``(job_id, version)`` pairs, ordered by job
+            ID
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def jobs_with_ids(self, job_ids: Iterable[UUID]) -> Mapping[UUID, Job]:
+        """
+        Retrieve many jobs at once. This is meant for endpoints that act on
+        a batch of jobs, and SHOULD be cheaper than looking up each job on
+        its own.
+
+        :param job_ids: The IDs of the jobs to retrieve
+        :return: A mapping from job ID to job. IDs of jobs that are not in
+            this list are left out of the mapping
+        """
+        raise NotImplementedError()
+
     @abc.abstractmethod
     def __getitem__(self, job_id: UUID) -> Job:
         """
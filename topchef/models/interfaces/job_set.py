@@ -0,0 +1,51 @@
+"""
+Describes the interface for job sets. A job set groups jobs that were
+submitted together, for instance the points of a parameter sweep, so that
+their progress can be tracked as a whole.
+"""
+import abc
+from uuid import UUID
+from topchef.models.interfaces.job_list import JobList
+
+
+class JobSet(object, metaclass=abc.ABCMeta):
+    """
+    The interface for a job set
+    """
+    @property
+    @abc.abstractmethod
+    def id(self) -> UUID:
+        """
+
+        :return: The ID of the job set
+        """
+        raise NotImplementedError()
+
+    @property
+    @abc.abstractmethod
+    def description(self) -> str:
+        """
+
+        :return: A description of the job set
+        """
+        raise NotImplementedError()
+
+    @property
+    @abc.abstractmethod
+    def jobs(self) -> JobList:
+        """
+
+        :return: The jobs that belong to this set
+        """
+        raise NotImplementedError()
+
+    def __eq__(self, other: 'JobSet') -> bool:
+        """
+
+        :param other: The job set against which equality is to be checked
+        :return: ``True`` if the two job sets have the same ID
+        """
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash((self.__class__.__name__, self.id))
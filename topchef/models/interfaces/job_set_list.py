@@ -0,0 +1,51 @@
+"""
+Contains an interface for getting job sets
+"""
+import abc
+from uuid import UUID
+from collections.abc import Mapping
+from typing import Iterator
+from topchef.models.interfaces.job_set import JobSet
+
+
+class JobSetList(Mapping, metaclass=abc.ABCMeta):
+    """
+    Describes an interface for reading and creating the job sets that have
+    been posted to the API
+    """
+    @abc.abstractmethod
+    def __getitem__(self, job_set_id: UUID) -> JobSet:
+        """
+
+        :param job_set_id: The ID of the job set to retrieve
+        :return: The job set
+        :raises: :exc:`KeyError` if a job set with this ID does not exist
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def __iter__(self) -> Iterator[JobSet]:
+        """
+
+        :return: An iterator over all the job sets
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        """
+
+        :return: The number of job sets
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def new(self, description: str) -> JobSet:
+        """
+        Create an empty job set. Jobs are added to the set when they are
+        created, by passing the set to :meth:`Service.new_jobs`
+
+        :param description: A description of the new job set
+        :return: The new job set
+        """
+        raise NotImplementedError()
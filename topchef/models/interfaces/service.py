@@ -5,7 +5,7 @@ services and experiment setups.
 """
 import abc
 from collections.abc import Iterable, AsyncIterable
-from typing import Callable, AsyncIterator
+from typing import Callable, AsyncIterator, Sequence, Optional
 from typing import Iterator as IteratorType
 from uuid import UUID
 from sqlalchemy.orm import Session
@@ -14,6 +14,7 @@ from topchef.database.models import Job as DatabaseJob
 from topchef.database.models import Service as DatabaseService
 from topchef.json_type import JSON_TYPE as JSON
 from topchef.models.interfaces.job import Job
+from topchef.models.interfaces.job_set import JobSet
 from datetime import timedelta
 
 
@@ -151,6 +152,48 @@ class Service(Iterable, AsyncIterable, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError()
 
+    @property
+    @abc.abstractmethod
+    def job_retention(self) -> Optional[timedelta]:
+        """
+
+        :return: How long finished jobs of the service are kept among the
+            jobs that can be queued, before they are moved to the archive.
+            If this is ``None``, finished jobs are never archived
+        """
+        raise NotImplementedError()
+
+    @job_retention.setter
+    @abc.abstractmethod
+    def job_retention(self, new_retention: Optional[timedelta]) -> None:
+        """
+
+        :param new_retention: The desired retention, or ``None`` to stop
+            archiving the service's jobs
+        """
+        raise NotImplementedError()
+
+    @property
+    @abc.abstractmethod
+    def version(self) -> int:
+        """
+
+        :return: A number that changes whenever the service is modified.
+            This does not cover the jobs of the service, nor
+            :attr:`Service.has_timed_out`, which changes with time
+        """
+        raise NotImplementedError()
+
+    @property
+    @abc.abstractmethod
+    def jobs_version(self) -> int:
+        """
+
+        :return: A number that changes whenever jobs are registered for the
+            service, deleted, or change status
+        """
+        raise NotImplementedError()
+
     @abc.abstractmethod
     def check_in(self) -> None:
         """
@@ -201,6 +244,26 @@ class Service(Iterable, AsyncIterable, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def new_jobs(
+            self,
+            parameter_sets: Sequence[JSON],
+            job_set: Optional[JobSet]=None
+    ) -> Sequence[UUID]:
+        """
+        Register many jobs at once. The jobs are written in a single
+        multi-row insert, and are queued in the order in which their
+        parameters were given. The parameters are not validated against the
+        job registration schema, so the caller must do this beforehand.
+
+        :param parameter_sets: The parameters of each job to create
+        :param job_set: The job set to which the new jobs are to belong.
+            By default, the jobs do not belong to a set
+        :return: The IDs of the new jobs, in the same order as the
+            parameters
+        """
+        raise NotImplementedError()
+
     @property
     @abc.abstractmethod
     def jobs(self) -> JobList:
@@ -4,7 +4,7 @@ Contains an interface for getting services
 import abc
 from uuid import UUID
 from collections.abc import AsyncIterable, MutableMapping
-from typing import Union, AsyncIterator, Iterator
+from typing import Union, AsyncIterator, Iterator, Tuple
 from topchef.json_type import JSON_TYPE as JSON
 from topchef.models.interfaces.service import Service
 
@@ -36,6 +36,14 @@ class ServiceList(MutableMapping, AsyncIterable, metaclass=abc.ABCMeta):
 
     @abc.abstractmethod
     def __delitem__(self, service_id: UUID) -> None:
+        """
+        Delete a service. The service disappears from the list immediately,
+        but its jobs may be removed from storage later, by
+        :meth:`ServiceList.purge_deleted_services`
+
+        :param service_id: The ID of the service to delete
+        :raises: :exc:`KeyError` if a service with this ID does not exist
+        """
         raise NotImplementedError()
 
     @abc.abstractmethod
@@ -56,6 +64,83 @@ class ServiceList(MutableMapping, AsyncIterable, metaclass=abc.ABCMeta):
     def __len__(self) -> int:
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def versions(self) -> Iterator[Tuple[UUID, int]]:
+        """
+        Read the version of every service, without loading the services.
+        This lets callers check whether any service in the list has changed
+        cheaply.
+
+        :return: An iterator of ``(service_id, version)`` pairs, ordered by
+            service ID
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def filter_by_availability(self, is_available: bool) -> 'ServiceList':
+        """
+        Restrict the list to the services that are live, or to the services
+        that are not. A service is live if it is available, and has checked
+        in within its timeout. The restriction applies to iterating over the
+        list, to its length, and to its versions
+
+        :param is_available: ``True`` to keep only the live services,
+            ``False`` to keep only the others
+        :return: The restricted list
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def mark_timed_out_services_unavailable(self) -> int:
+        """
+        Mark every available service that has not checked in within its
+        timeout as unavailable, without loading the services. A service
+        that was marked unavailable must be made available again by its
+        owner, like a newly-registered service
+
+        :return: The number of services that were marked unavailable
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def jobs_awaiting_purge(self, service_id: UUID) -> int:
+        """
+        Report the progress of purging a deleted service
+
+        :param service_id: The ID of a deleted service
+        :return: The number of jobs of the service that have not been
+            removed from storage yet
+        :raises: :exc:`KeyError` if no deleted service with that ID is
+            waiting to be purged. This is the case once the service has
+            been purged
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def purge_deleted_services(self, max_jobs: int) -> int:
+        """
+        Remove a bounded number of jobs of deleted services from storage.
+        Deleted services that have no jobs left are removed as well
+
+        :param max_jobs: The maximum number of jobs to remove
+        :return: The number of jobs that were removed. If this is less than
+            ``max_jobs``, every deleted service has been purged
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def check_in(self, service_id: UUID) -> None:
+        """
+        Record a heartbeat from a service, without loading the service.
+        Heartbeats may be written to storage some time after they are
+        recorded, so that heartbeats arriving close together are written
+        together
+
+        :param service_id: The ID of the service that checked in
+        :raises: :exc:`KeyError` if a service with that ID does not exist
+        """
+        raise NotImplementedError()
+
     @abc.abstractmethod
     def new(
             self, name: str, description: str, registration_schema: JSON,
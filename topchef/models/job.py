@@ -3,8 +3,10 @@ Implements a job that maps to the
 """
 import json
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 from uuid import UUID
+from topchef.config import config
+from topchef.models.blob_store import BlobStore, RESULT_BLOB_STORE
 from topchef.models.interfaces.job import Job as JobInterface
 from ..database.models import Job as DatabaseJob
 from ..database.models import JobStatus as DatabaseJobStatus
@@ -13,7 +15,9 @@ from ..json_type import JSON_TYPE as JSON
 
 class Job(JobInterface):
     """
-    Contains an implementation of the job interface
+    Contains an implementation of the job interface. Results whose JSON
+    encoding is longer than the blob threshold are written to the blob
+    store, and only their digest is kept in the database model
     """
     _DATABASE_JOB_STATUS_LOOKUP = {
         DatabaseJobStatus.REGISTERED: JobInterface.JobStatus.REGISTERED,
@@ -29,12 +33,22 @@ class Job(JobInterface):
         JobInterface.JobStatus.ERROR: DatabaseJobStatus.ERROR
     }
 
-    def __init__(self, database_job: DatabaseJob):
+    def __init__(
+            self,
+            database_job: DatabaseJob,
+            blob_store: BlobStore=RESULT_BLOB_STORE,
+            blob_threshold: int=config.RESULT_BLOB_THRESHOLD_BYTES
+    ):
         """
 
         :param database_job: The database model for the job
+        :param blob_store: The store in which large results are kept
+        :param blob_threshold: The length, in bytes, of the longest JSON
+            encoding of the results that is kept in the database model
         """
         self.db_model = database_job
+        self._blob_store = blob_store
+        self._blob_threshold = blob_threshold
 
     @property
     def id(self) -> UUID:
@@ -52,13 +66,21 @@ class Job(JobInterface):
     def status(self, new_status: JobInterface.JobStatus) -> None:
         self.db_model.status = self._MODEL_JOB_STATUS_LOOKUP[new_status]
 
+        if new_status is not JobInterface.JobStatus.WORKING:
+            self.db_model.lease_expires = None
+            self.db_model.lease_owner = None
+
     @property
     def parameters(self) -> JSON:
         return self.db_model.parameters
 
     @property
     def results(self) -> Optional[JSON]:
-        return self.db_model.results
+        if self.db_model.results_blob is None:
+            return self.db_model.results
+        return json.loads(
+            self._blob_store.read(self.db_model.results_blob).decode('utf-8')
+        )
 
     @property
     def date_submitted(self) -> datetime:
@@ -66,8 +88,36 @@ class Job(JobInterface):
 
     @results.setter
     def results(self, new_results: JSON) -> None:
-        self._assert_json(new_results)
-        self.db_model.results = new_results
+        encoded_results = self._encode_json(new_results)
+        if len(encoded_results) > self._blob_threshold:
+            self.db_model.results_blob = self._blob_store.put(encoded_results)
+            self.db_model.results = None
+        else:
+            self.db_model.results_blob = None
+            self.db_model.results = new_results
+
+    def encoded_results(self) -> Iterable[bytes]:
+        """
+        Results kept in the blob store are read straight from it, without
+        being parsed
+
+        :return: The results, encoded as a JSON document, in chunks
+        """
+        if self.db_model.results_blob is None:
+            return [json.dumps(self.db_model.results).encode('utf-8')]
+        return self._blob_store.open(self.db_model.results_blob)
+
+    @property
+    def lease_expires(self) -> Optional[datetime]:
+        return self.db_model.lease_expires
+
+    @property
+    def version(self) -> int:
+        return self.db_model.version
+
+    @property
+    def service_id(self) -> UUID:
+        return self.db_model.service_id
 
     @property
     def parameter_schema(self) -> dict:
@@ -81,10 +131,16 @@ class Job(JobInterface):
         return hash((self.__class__.__name__, self.id))
 
     @staticmethod
-    def _assert_json(json_to_set):
+    def _encode_json(json_to_set) -> bytes:
+        """
+
+        :param json_to_set: The document to encode
+        :return: The document, encoded as JSON
+        :raises: :exc:`ValueError` if the document cannot be encoded as JSON
+        """
         try:
-            json.loads(json.dumps(json_to_set))
-        except json.JSONDecodeError as error:
+            return json.dumps(json_to_set).encode('utf-8')
+        except (TypeError, ValueError) as error:
             raise ValueError(
                 'The input is not JSON', error
             )
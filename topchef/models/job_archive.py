@@ -0,0 +1,158 @@
+"""
+Contains an implementation of the ``JobArchive`` interface backed by the
+``archived_jobs`` table.
+
+Jobs are archived in bulk, without loading them. The IDs of a batch of
+expired jobs are selected first, and their rows are locked until the
+transaction commits. The rows are then copied into the archive with an
+``INSERT ... SELECT`` statement, and deleted from the jobs table. Keeping
+each batch small keeps the locks on the jobs table short.
+"""
+from datetime import datetime, timedelta
+from typing import Iterator, List
+from uuid import UUID
+from sqlalchemy import DateTime, literal, select
+from sqlalchemy.orm import Query, Session
+from topchef.database.models import ArchivedJob as DatabaseArchivedJob
+from topchef.database.models import Job as DatabaseJob
+from topchef.database.models import JobStatus as DatabaseJobStatus
+from topchef.database.models import Service as DatabaseService
+from topchef.database.schemas import database
+from topchef.models.interfaces.job_archive import JobArchive as IJobArchive
+from topchef.models.job import Job
+from topchef.models.job_change_tracker import JOB_CHANGE_TRACKER
+
+
+class JobArchive(IJobArchive):
+    """
+    Moves jobs to the archive table, and reads them from it. Jobs of deleted
+    services are left out, in the same way as they are left out of the job
+    list
+    """
+    _FINISHED_STATUSES = (
+        DatabaseJobStatus.COMPLETED, DatabaseJobStatus.ERROR
+    )
+
+    def __init__(self, session: Session) -> None:
+        """
+
+        :param session: The database session to use for archiving jobs
+        """
+        self.session = session
+
+    def __getitem__(self, job_id: UUID) -> Job:
+        db_model = self._query.filter(
+            DatabaseArchivedJob.id == job_id
+        ).first()
+
+        if db_model is None:
+            raise KeyError('An archived job with id %s does not exist' % (
+                job_id
+            ))
+
+        return Job(db_model)
+
+    def __iter__(self) -> Iterator[Job]:
+        return (Job(db_model) for db_model in self._query)
+
+    def __len__(self) -> int:
+        return self._query.count()
+
+    def archive_expired_jobs(self, max_jobs: int) -> int:
+        """
+        Services with a job retention are archived one at a time, so that
+        the expired jobs of each service are found through the index on the
+        service, status, and submission date of the jobs
+
+        :param max_jobs: The maximum number of jobs to move
+        :return: The number of jobs that were moved
+        """
+        now = datetime.utcnow()
+        services_with_retention = self.session.query(
+            DatabaseService.id, DatabaseService.job_retention
+        ).filter(
+            DatabaseService.job_retention.isnot(None),
+            ~DatabaseService.is_deleted
+        ).order_by(DatabaseService.id).all()
+
+        number_of_jobs = 0
+        for service_id, retention_seconds in services_with_retention:
+            if number_of_jobs >= max_jobs:
+                break
+
+            job_ids = self._expired_job_ids(
+                service_id, now - timedelta(seconds=retention_seconds),
+                max_jobs - number_of_jobs
+            )
+            if job_ids:
+                self._move_to_archive(job_ids, now)
+                JOB_CHANGE_TRACKER.jobs_changed(self.session, [service_id])
+            number_of_jobs += len(job_ids)
+
+        return number_of_jobs
+
+    @property
+    def _query(self) -> Query:
+        """
+
+        :return: A query for the archived jobs of services that have not
+            been deleted
+        """
+        deleted_service_ids = self.session.query(DatabaseService.id).filter(
+            DatabaseService.is_deleted
+        )
+        return self.session.query(DatabaseArchivedJob).filter(
+            DatabaseArchivedJob.service_id.notin_(
+                deleted_service_ids.subquery()
+            )
+        )
+
+    def _expired_job_ids(
+            self, service_id: UUID, cutoff: datetime, max_jobs: int
+    ) -> List[UUID]:
+        """
+
+        :param service_id: The ID of the service whose jobs are to be
+            archived
+        :param cutoff: Finished jobs submitted before this time are expired
+        :param max_jobs: The maximum number of IDs to return
+        :return: The IDs of the expired jobs. The rows of the jobs stay
+            locked until the transaction ends
+        """
+        return [
+            job_id for (job_id,) in self.session.query(DatabaseJob.id).filter(
+                DatabaseJob.service_id == service_id,
+                DatabaseJob.status.in_(self._FINISHED_STATUSES),
+                DatabaseJob.date_submitted < cutoff
+            ).limit(max_jobs).with_for_update()
+        ]
+
+    def _move_to_archive(
+            self, job_ids: List[UUID], date_archived: datetime
+    ) -> None:
+        """
+
+        :param job_ids: The IDs of the jobs to move
+        :param date_archived: The time to record as the time at which the
+            jobs were archived
+        """
+        jobs = database.jobs
+        archived_jobs = database.archived_jobs
+
+        self.session.execute(archived_jobs.insert().from_select(
+            [
+                archived_jobs.c.job_id, archived_jobs.c.service_id,
+                archived_jobs.c.date_submitted, archived_jobs.c.status,
+                archived_jobs.c.parameters, archived_jobs.c.results,
+                archived_jobs.c.results_blob,
+                archived_jobs.c.job_set_id, archived_jobs.c.version,
+                archived_jobs.c.date_archived
+            ],
+            select([
+                jobs.c.job_id, jobs.c.service_id, jobs.c.date_submitted,
+                jobs.c.status, jobs.c.parameters, jobs.c.results,
+                jobs.c.results_blob, jobs.c.job_set_id, jobs.c.version,
+                literal(date_archived, type_=DateTime)
+            ]).where(jobs.c.job_id.in_(job_ids))
+        ))
+        self.session.execute(jobs.delete().where(jobs.c.job_id.in_(job_ids)))
@@ -0,0 +1,115 @@
+"""
+Keeps a version number on every service that changes whenever the jobs
+listed for the service change, so that the service's details can be
+revalidated without reading any of its jobs.
+
+A service's ``jobs_version`` is incremented once for every committed
+transaction that registered, deleted, or changed the status of one of the
+service's jobs. Changes made through the ORM are picked up from the
+session's flushes. Changes made with bulk statements, which the ORM does not
+see, must be reported with :meth:`JobChangeTracker.jobs_changed`.
+
+The counters are incremented just before the transaction commits, in a
+single ``UPDATE`` statement. The rows of the services are therefore only
+locked for the time that it takes to commit, and workers claiming jobs of
+the same service do not queue up behind each other for the rest of their
+transaction.
+"""
+from typing import Iterable, Set
+from uuid import UUID
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from topchef.database.models import Job as DatabaseJob
+from topchef.database.schemas import database
+
+
+class JobChangeTracker(object):
+    """
+    Increments the ``jobs_version`` of the services whose jobs were changed
+    in a transaction
+    """
+    _SESSION_INFO_KEY = 'topchef_services_with_changed_jobs'
+
+    def jobs_changed(
+            self, session: Session, service_ids: Iterable[UUID]
+    ) -> None:
+        """
+        Remember that jobs of some services were changed in this session.
+        The services' versions are incremented when the session commits.
+
+        :param session: The session in which the jobs were changed
+        :param service_ids: The IDs of the services whose jobs were changed
+        """
+        session.info.setdefault(self._SESSION_INFO_KEY, set()).update(
+            service_ids
+        )
+
+    def listen(self, session_class: type=Session) -> None:
+        """
+        Attach the tracker to the flush and transaction events of a session
+        class
+
+        :param session_class: The session class for which events are to be
+            watched. By default, this is every SQLAlchemy session
+        """
+        event.listen(session_class, 'after_flush', self._after_flush)
+        event.listen(session_class, 'before_commit', self._before_commit)
+        event.listen(
+            session_class, 'after_soft_rollback', self._after_soft_rollback
+        )
+
+    def _after_flush(self, session: Session, _) -> None:
+        """
+
+        :param session: The session that was flushed. Its lists of new,
+            changed, and deleted objects still describe the flush
+        """
+        service_ids = {
+            job.service_id for job in session.new
+            if isinstance(job, DatabaseJob)
+        }  # type: Set[UUID]
+        service_ids.update(
+            job.service_id for job in session.deleted
+            if isinstance(job, DatabaseJob)
+        )
+        service_ids.update(
+            job.service_id for job in session.dirty
+            if isinstance(job, DatabaseJob) and
+            inspect(job).attrs.status.history.has_changes()
+        )
+        if service_ids:
+            self.jobs_changed(session, service_ids)
+
+    def _before_commit(self, session: Session) -> None:
+        """
+        Flush any pending changes, so that every change to the jobs is
+        known, and then increment the versions of the services
+
+        :param session: The session that is about to commit
+        """
+        session.flush()
+        service_ids = session.info.pop(self._SESSION_INFO_KEY, None)
+        if not service_ids:
+            return
+
+        services = database.services
+        session.execute(
+            services.update().where(
+                services.c.service_id.in_(service_ids)
+            ).values(
+                jobs_version=services.c.jobs_version + 1,
+                version=services.c.version
+            )
+        )
+
+    def _after_soft_rollback(self, session: Session, _) -> None:
+        """
+
+        :param session: The session that was rolled back. The changes made
+            in this session no longer exist
+        """
+        session.info.pop(self._SESSION_INFO_KEY, None)
+
+
+JOB_CHANGE_TRACKER = JobChangeTracker()
+JOB_CHANGE_TRACKER.listen()
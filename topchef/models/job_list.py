@@ -1,11 +1,19 @@
 from topchef.models.abstract_classes import JobListFromQuery
 from topchef.database.models import Job as DatabaseJob
+from topchef.database.models import Service as DatabaseService
 
 
 class JobList(JobListFromQuery):
     """
-    Implements the interface to get all the jobs in the job list
+    Implements the interface to get all the jobs in the job list. Jobs
+    belonging to services that have been deleted are left out, even while
+    they are waiting to be purged
     """
     @property
     def root_job_query(self):
-        return self.session.query(DatabaseJob)
+        deleted_service_ids = self.session.query(DatabaseService.id).filter(
+            DatabaseService.is_deleted
+        )
+        return self.session.query(DatabaseJob).filter(
+            DatabaseJob.service_id.notin_(deleted_service_ids.subquery())
+        )
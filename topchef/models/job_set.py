@@ -0,0 +1,114 @@
+"""
+Contains an implementation of the ``JobSet`` interface that pulls all the
+required data from a SQLAlchemy model class
+"""
+from typing import Dict
+from uuid import UUID
+from sqlalchemy import func
+from sqlalchemy.orm import Query, Session
+from .interfaces import Job
+from .interfaces import JobSet as JobSetInterface
+from .interfaces import JobList as JobListInterface
+from .abstract_classes import JobListFromQuery
+from ..database.models import ArchivedJob as DatabaseArchivedJob
+from ..database.models import Job as DatabaseJob
+from ..database.models import JobSet as DatabaseJobSet
+from ..database.models import Service as DatabaseService
+
+
+class JobSet(JobSetInterface):
+    """
+    Provides a model class that gets all its data from a job set in the API
+    database
+    """
+    def __init__(
+            self, database_job_set: DatabaseJobSet, session: Session
+    ) -> None:
+        """
+
+        :param database_job_set: The database model for the job set
+        :param session: The session from which the jobs in the set are to
+            be retrieved
+        """
+        self.db_model = database_job_set
+        self._session = session
+
+    @property
+    def id(self) -> UUID:
+        """
+
+        :return: The job set ID
+        """
+        return self.db_model.id
+
+    @property
+    def description(self) -> str:
+        """
+
+        :return: The job set description
+        """
+        return self.db_model.description
+
+    @property
+    def jobs(self) -> JobListInterface:
+        """
+
+        :return: The jobs in this set
+        """
+        return self._ListOfJobsInJobSet(self.id, self._session)
+
+    def __repr__(self) -> str:
+        return '%s(database_job_set=%s, session=%s)' % (
+            self.__class__.__name__, self.db_model, self._session
+        )
+
+    class _ListOfJobsInJobSet(JobListFromQuery):
+        def __init__(self, job_set_id: UUID, db_session: Session):
+            super(self.__class__, self).__init__(db_session)
+            self.job_set_id = job_set_id
+
+        @property
+        def root_job_query(self) -> Query:
+            return self._query_for(DatabaseJob)
+
+        def status_counts(self) -> Dict[Job.JobStatus, int]:
+            """
+            Count the jobs in the set, including the jobs that have been
+            moved to the archive, so that the size of the set does not
+            shrink when its finished jobs are archived. The statuses of
+            both tables are combined with ``UNION ALL``, and counted with
+            a single ``GROUP BY status`` query
+
+            :return: The number of jobs with each status
+            """
+            statuses = self._query_for(DatabaseJob).with_entities(
+                DatabaseJob.status
+            ).union_all(
+                self._query_for(DatabaseArchivedJob).with_entities(
+                    DatabaseArchivedJob.status
+                )
+            ).subquery()
+            status = list(statuses.columns)[0]
+            counts = dict(
+                self.session.query(status, func.count()).group_by(status)
+            )
+            return {
+                status: counts.get(self._MODEL_TO_DB_JOB_STATUS[status], 0)
+                for status in Job.JobStatus
+            }
+
+        def _query_for(self, job_model: type) -> Query:
+            """
+
+            :param job_model: The model of the table from which jobs are
+                read, which is either the jobs table or the archive
+            :return: A query for the jobs of this set in the table, leaving
+                out the jobs of deleted services
+            """
+            deleted_service_ids = self.session.query(
+                DatabaseService.id
+            ).filter(DatabaseService.is_deleted)
+            return self.session.query(job_model).filter(
+                job_model.job_set_id == self.job_set_id,
+                job_model.service_id.notin_(deleted_service_ids.subquery())
+            )
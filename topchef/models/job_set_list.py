@@ -0,0 +1,66 @@
+"""
+Contains an implementation of the ``JobSetList`` interface backed by the
+API database
+"""
+from typing import Iterator
+from uuid import UUID
+from sqlalchemy.orm import Query, Session
+from topchef.database.models import ArchivedJob as DatabaseArchivedJob
+from topchef.database.models import Job as DatabaseJob
+from topchef.database.models import JobSet as DatabaseJobSet
+from topchef.database.models import Service as DatabaseService
+from topchef.models.interfaces.job_set_list import JobSetList as IJobSetList
+from topchef.models.job_set import JobSet
+
+
+class JobSetList(IJobSetList):
+    """
+    Gets job sets from a relational DB back end. Job sets whose jobs belong
+    to a deleted service are left out, in the same way as the jobs
+    themselves
+    """
+    def __init__(self, session: Session) -> None:
+        """
+
+        :param session: The database session to use for getting job sets
+        """
+        self.session = session
+
+    def __getitem__(self, job_set_id: UUID) -> JobSet:
+        db_model = self._query.filter(DatabaseJobSet.id == job_set_id).first()
+
+        if db_model is None:
+            raise KeyError('A job set with id %s does not exist' % job_set_id)
+
+        return JobSet(db_model, self.session)
+
+    def __iter__(self) -> Iterator[JobSet]:
+        return (
+            JobSet(db_model, self.session)
+            for db_model in self._query
+        )
+
+    def __len__(self) -> int:
+        return self._query.count()
+
+    def new(self, description: str) -> JobSet:
+        db_model = DatabaseJobSet.new(description, [])
+        self.session.add(db_model)
+        return JobSet(db_model, self.session)
+
+    @property
+    def _query(self) -> Query:
+        """
+
+        :return: A query for the job sets that do not have any jobs, current
+            or archived, belonging to a deleted service
+        """
+        return self.session.query(DatabaseJobSet).filter(*(
+            ~self.session.query(job_model.id).join(
+                DatabaseService, job_model.service_id == DatabaseService.id
+            ).filter(
+                job_model.job_set_id == DatabaseJobSet.id,
+                DatabaseService.is_deleted
+            ).exists()
+            for job_model in (DatabaseJob, DatabaseArchivedJob)
+        ))
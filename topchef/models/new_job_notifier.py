@@ -0,0 +1,153 @@
+"""
+Lets HTTP requests wait for new jobs to be registered for a service,
+without having to poll the database.
+
+Every service has a generation counter, which is incremented whenever a
+transaction that registered a job for the service is committed. A request
+that wants to wait for new jobs reads the generation, checks the database
+for jobs, and if there are none, blocks until the generation changes. Since
+the generation is read before the database is checked, jobs that are
+committed between the check and the wait are never missed.
+
+The notifier only knows about jobs committed in the current process. If the
+API runs in several processes, waiters should wake up once in a while to
+check the database, in order to pick up jobs that were committed elsewhere.
+"""
+import threading
+from typing import Dict, Iterable
+from uuid import UUID
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class NewJobNotifier(object):
+    """
+    Wakes up waiting requests when jobs are committed for a service
+    """
+    _SESSION_INFO_KEY = 'topchef_services_with_new_jobs'
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._generations = {}  # type: Dict[UUID, int]
+        self._conditions = {}  # type: Dict[UUID, threading.Condition]
+        self._number_of_waiters = {}  # type: Dict[UUID, int]
+
+    def generation(self, service_id: UUID) -> int:
+        """
+
+        :param service_id: The ID of the service for which the generation
+            is to be retrieved
+        :return: A number that changes every time that jobs are committed
+            for the service
+        """
+        with self._lock:
+            return self._generations.get(service_id, 0)
+
+    def wait(self, service_id: UUID, generation: int, timeout: float) -> bool:
+        """
+        Block until jobs are committed for the service, or until the timeout
+        expires
+
+        :param service_id: The ID of the service for which jobs are awaited
+        :param generation: The generation of the service at the time that
+            the caller last checked for jobs
+        :param timeout: The maximum number of seconds to wait
+        :return: ``True`` if jobs were committed for the service since
+            ``generation`` was read, otherwise ``False``
+        """
+        with self._lock:
+            condition = self._get_condition(service_id)
+            try:
+                return condition.wait_for(
+                    lambda: self._generations.get(service_id, 0) != generation,
+                    timeout
+                )
+            finally:
+                self._release_condition(service_id)
+
+    def notify(self, service_ids: Iterable[UUID]) -> None:
+        """
+        Increment the generation of each service, and wake up any requests
+        waiting on those services
+
+        :param service_ids: The IDs of the services for which jobs were
+            committed
+        """
+        with self._lock:
+            for service_id in service_ids:
+                self._generations[service_id] = \
+                    self._generations.get(service_id, 0) + 1
+                if service_id in self._conditions:
+                    self._conditions[service_id].notify_all()
+
+    def job_registered(self, session: Session, service_id: UUID) -> None:
+        """
+        Remember that a job was registered for a service in this session.
+        The waiting requests are woken up once the session commits.
+
+        :param session: The session in which the job was registered
+        :param service_id: The ID of the service for which the job was
+            registered
+        """
+        session.info.setdefault(self._SESSION_INFO_KEY, set()).add(service_id)
+
+    def listen(self, session_class: type=Session) -> None:
+        """
+        Attach the notifier to the transaction events of a session class
+
+        :param session_class: The session class for which transaction
+            events are to be watched. By default, this is every SQLAlchemy
+            session
+        """
+        event.listen(session_class, 'after_commit', self._after_commit)
+        event.listen(
+            session_class, 'after_soft_rollback', self._after_soft_rollback
+        )
+
+    def _after_commit(self, session: Session) -> None:
+        """
+
+        :param session: The session that was committed
+        """
+        service_ids = session.info.pop(self._SESSION_INFO_KEY, None)
+        if service_ids:
+            self.notify(service_ids)
+
+    def _after_soft_rollback(self, session: Session, _) -> None:
+        """
+
+        :param session: The session that was rolled back. Jobs registered in
+            this session no longer exist, so nobody is woken up for them
+        """
+        session.info.pop(self._SESSION_INFO_KEY, None)
+
+    def _get_condition(self, service_id: UUID) -> threading.Condition:
+        """
+        Must be called with the lock held
+
+        :param service_id: The service for which a condition is required
+        :return: The condition on which requests waiting for the service
+            block
+        """
+        if service_id not in self._conditions:
+            self._conditions[service_id] = threading.Condition(self._lock)
+            self._number_of_waiters[service_id] = 0
+
+        self._number_of_waiters[service_id] += 1
+        return self._conditions[service_id]
+
+    def _release_condition(self, service_id: UUID) -> None:
+        """
+        Must be called with the lock held. Forget about the condition for a
+        service once nobody is waiting on it
+
+        :param service_id: The service for which a waiter has stopped waiting
+        """
+        self._number_of_waiters[service_id] -= 1
+        if not self._number_of_waiters[service_id]:
+            del self._number_of_waiters[service_id]
+            del self._conditions[service_id]
+
+
+NEW_JOB_NOTIFIER = NewJobNotifier()
+NEW_JOB_NOTIFIER.listen()
@@ -0,0 +1,117 @@
+"""
+Publishes JSON schemas under names derived from their content, so that
+responses can refer to a schema with a ``$ref`` instead of carrying the
+whole schema. Since the name of a schema changes whenever the schema
+changes, clients and proxies can cache a published schema forever.
+
+The registry only holds the schemas that the API generates for its own
+documents. These are the same in every process running the same version of
+the API, so a schema referenced by a response from one process can be
+fetched from any other.
+"""
+import hashlib
+import json
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator
+from werkzeug.datastructures import ImmutableDict, ImmutableList
+
+__all__ = ["fingerprint", "PublishedSchema", "SchemaRegistry"]
+
+
+def fingerprint(schema: dict) -> str:
+    """
+
+    :param schema: The schema to fingerprint
+    :return: A hash of the schema document. Schemas that are equal as JSON
+        documents have the same fingerprint, regardless of the order of their
+        keys
+    """
+    document = json.dumps(schema, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(document.encode('utf-8')).hexdigest()
+
+
+class PublishedSchema(ImmutableDict):
+    """
+    A read-only schema that knows the name under which it was published
+    """
+    def __init__(self, schema: dict, schema_fingerprint: str) -> None:
+        """
+
+        :param schema: The schema
+        :param schema_fingerprint: The fingerprint of the schema
+        """
+        super(PublishedSchema, self).__init__(schema)
+        self.fingerprint = schema_fingerprint
+
+
+class SchemaRegistry(Mapping):
+    """
+    Maps the fingerprint of each published schema to the schema
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._schemas = {}  # type: Dict[str, PublishedSchema]
+
+    def register(self, schema: dict) -> PublishedSchema:
+        """
+
+        :param schema: The schema to publish
+        :return: A read-only copy of the schema, carrying its fingerprint.
+            If an equal schema was already published, that schema is
+            returned
+        """
+        schema_fingerprint = fingerprint(schema)
+        with self._lock:
+            if schema_fingerprint not in self._schemas:
+                self._schemas[schema_fingerprint] = PublishedSchema(
+                    self._freeze(schema), schema_fingerprint
+                )
+            return self._schemas[schema_fingerprint]
+
+    def __getitem__(self, schema_fingerprint: str) -> PublishedSchema:
+        """
+
+        :param schema_fingerprint: The fingerprint of the schema
+        :return: The schema
+        :raises: :exc:`KeyError` if no schema with that fingerprint was
+            published
+        """
+        with self._lock:
+            return self._schemas[schema_fingerprint]
+
+    def __iter__(self) -> Iterator[str]:
+        """
+
+        :return: An iterator over the fingerprints of the published schemas
+        """
+        with self._lock:
+            return iter(list(self._schemas.keys()))
+
+    def __len__(self) -> int:
+        """
+
+        :return: The number of published schemas
+        """
+        with self._lock:
+            return len(self._schemas)
+
+    @classmethod
+    def _freeze(cls, document: Any) -> Any:
+        """
+
+        :param document: A JSON document
+        :return: A copy of the document in which every object and array is
+            read-only
+        """
+        if isinstance(document, dict):
+            return ImmutableDict(
+                (key, cls._freeze(value)) for key, value in document.items()
+            )
+        elif isinstance(document, (list, tuple)):
+            return ImmutableList(cls._freeze(value) for value in document)
+        else:
+            return document
+
+
+SCHEMA_REGISTRY = SchemaRegistry()
@@ -3,17 +3,21 @@ Contains an implementation of the ``Service`` interface that pulls all the
 required data from a SQLAlchemy model class.
 """
 import json
-from typing import Type, Callable
-from uuid import UUID
+from typing import Type, Callable, Sequence, Optional
+from uuid import UUID, uuid4
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.declarative import declarative_base
 from .interfaces import Service as ServiceInterface
 from .interfaces import JobList as JobListInterface
+from .interfaces import JobSet as JobSetInterface
 from .abstract_classes import JobListFromQuery
 from .job import Job
+from .new_job_notifier import NEW_JOB_NOTIFIER
+from .job_change_tracker import JOB_CHANGE_TRACKER
 from ..database.models import Job as DatabaseJob
 from ..database.models import Service as DatabaseService
+from ..database.schemas import JobStatus
 from ..json_type import JSON_TYPE as JSON
 
 
@@ -128,6 +132,40 @@ class Service(ServiceInterface):
             )
         self.db_model.timeout = new_timeout.total_seconds()
 
+    @property
+    def job_retention(self) -> Optional[timedelta]:
+        if self.db_model.job_retention is None:
+            return None
+        return timedelta(seconds=self.db_model.job_retention)
+
+    @job_retention.setter
+    def job_retention(self, new_retention: Optional[timedelta]) -> None:
+        if new_retention is None:
+            self.db_model.job_retention = None
+            return
+        if not new_retention.total_seconds() > 0:
+            raise ValueError(
+                'The job retention must be a time longer than 0 seconds'
+            )
+        self.db_model.job_retention = new_retention.total_seconds()
+
+    @property
+    def version(self) -> int:
+        """
+
+        :return: The version of the service's row in the database
+        """
+        return self.db_model.version
+
+    @property
+    def jobs_version(self) -> int:
+        """
+
+        :return: The number of committed transactions that changed the
+            jobs of this service, plus one
+        """
+        return self.db_model.jobs_version
+
     def check_in(self) -> None:
         self.db_model.last_checked_in = datetime.utcnow()
 
@@ -148,9 +186,52 @@ class Service(ServiceInterface):
         db_job = database_job_constructor(self.db_model, parameters)
         session = self._session_getter_for_model(self.db_model)
         session.add(db_job)
+        NEW_JOB_NOTIFIER.job_registered(session, self.id)
 
         return Job(db_job)
 
+    def new_jobs(
+            self,
+            parameter_sets: Sequence[JSON],
+            job_set: Optional[JobSetInterface]=None
+    ) -> Sequence[UUID]:
+        """
+        Jobs in the same batch share the date on which they were submitted.
+        Jobs with the same submission date are claimed in the order of
+        their IDs, so the batch is given IDs in ascending order, and the
+        jobs are claimed in the order in which they were given. Pending
+        changes are flushed before the insert, so that the rows never
+        reference a service or job set that is not yet in the database.
+
+        :param parameter_sets: The parameters of each job to create
+        :param job_set: The job set to which the new jobs belong
+        :return: The IDs of the new jobs
+        """
+        if not parameter_sets:
+            return []
+
+        date_submitted = datetime.utcnow()
+        job_ids = sorted(uuid4() for _ in parameter_sets)
+        rows = [
+            {
+                'job_id': job_id,
+                'service_id': self.id,
+                'status': JobStatus.REGISTERED,
+                'parameters': parameters,
+                'results': None,
+                'job_set_id': job_set.id if job_set is not None else None,
+                'date_submitted': date_submitted
+            } for job_id, parameters in zip(job_ids, parameter_sets)
+        ]
+
+        session = self._session_getter_for_model(self.db_model)
+        session.flush()
+        session.execute(DatabaseJob.__table__.insert(), rows)
+        NEW_JOB_NOTIFIER.job_registered(session, self.id)
+        JOB_CHANGE_TRACKER.jobs_changed(session, [self.id])
+
+        return [row['job_id'] for row in rows]
+
     @property
     def jobs(self) -> JobListInterface:
         return self._ListOfJobsForService(
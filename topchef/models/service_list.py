@@ -1,26 +1,46 @@
 from collections.abc import AsyncIterator as CollectionsAsyncIterator
 from collections.abc import Awaitable
-from typing import Union, Iterator, Sequence, AsyncIterator
+from datetime import datetime
+from typing import Union, Iterator, Sequence, AsyncIterator, Tuple, Optional
+from typing import Type
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, Query
 
 from topchef.database.models import Service as DatabaseService
+from topchef.database.models import Job as DatabaseJob
+from topchef.database.models import ArchivedJob as DatabaseArchivedJob
+from topchef.database.models import JobSet as DatabaseJobSet
 from topchef.json_type import JSON_TYPE as JSON
 from topchef.models.interfaces.service_list import ServiceList as IServiceList
 from topchef.models.service import Service
+from topchef.models.heartbeat_coalescer import HEARTBEAT_COALESCER
+from topchef.models.heartbeat_coalescer import HeartbeatCoalescer
 
 
 class ServiceList(IServiceList):
     """
-    Implements a means of getting services from a relational DB back end
+    Implements a means of getting services from a relational DB back end.
+    Services that have been deleted are left out of every lookup, even
+    while their jobs are still being purged
     """
-    def __init__(self, session: Session) -> None:
+    def __init__(
+            self, session: Session,
+            heartbeat_coalescer: HeartbeatCoalescer=HEARTBEAT_COALESCER,
+            is_available: Optional[bool]=None
+    ) -> None:
         """
 
         :param session: The database session to use for getting services
+        :param heartbeat_coalescer: The buffer in which heartbeats from the
+            services are collected before they are written
+        :param is_available: If this is ``True``, only the live services
+            are listed. If this is ``False``, only the services that are not
+            live are listed. By default, every service is listed
         """
         self.session = session
+        self._heartbeat_coalescer = heartbeat_coalescer
+        self._is_available = is_available
 
     def __getitem__(self, service_id: UUID) -> Service:
         db_model = self._get_db_model_by_id(self.session, service_id)
@@ -36,11 +56,20 @@ class ServiceList(IServiceList):
         self.session.add(db_model)
 
     def __delitem__(self, service_id: UUID) -> None:
+        """
+        Mark the service as deleted. Its jobs are left for
+        :meth:`ServiceList.purge_deleted_services` to remove, so that this
+        takes the same time no matter how many jobs the service has
+
+        :param service_id: The ID of the service to delete
+        :raises: :exc:`KeyError` if a service with that ID does not exist
+        """
         db_model = self._get_db_model_by_id(self.session, service_id)
 
-        for job in db_model.jobs:
-            self.session.delete(job)
-        self.session.delete(db_model)
+        db_model.is_deleted = True
+        db_model.is_service_available = False
+        self.session.add(db_model)
+        self._heartbeat_coalescer.forget(service_id)
 
     def __contains__(
             self, service_or_service_id: Union[UUID, Service]
@@ -56,18 +85,127 @@ class ServiceList(IServiceList):
         return is_in_collection
 
     def __len__(self) -> int:
-        return self.session.query(DatabaseService).count()
+        return self._query.count()
 
     def __iter__(self) -> Iterator[Service]:
         return (
             Service(db_service)
-            for db_service in self.session.query(DatabaseService).all()
+            for db_service in self._query.all()
         )
 
     def __aiter__(self) -> AsyncIterator[Service]:
-        services = self.session.query(DatabaseService).all()  # type: list
+        services = self._query.all()  # type: list
         return self._AsynchronousServicesIterator(services)
 
+    def versions(self) -> Iterator[Tuple[UUID, int]]:
+        """
+
+        :return: The ``(service_id, version)`` pairs of every service, read
+            without loading the services' schemas
+        """
+        return iter(
+            self._filter(self.session.query(
+                DatabaseService.id, DatabaseService.version
+            ).filter_by(is_deleted=False)).order_by(DatabaseService.id).all()
+        )
+
+    def filter_by_availability(self, is_available: bool) -> 'ServiceList':
+        """
+        Liveness is decided by the database, when the list is read
+
+        :param is_available: ``True`` to keep only the live services,
+            ``False`` to keep only the others
+        :return: The restricted list
+        """
+        return self.__class__(
+            self.session, self._heartbeat_coalescer, is_available
+        )
+
+    def mark_timed_out_services_unavailable(self) -> int:
+        """
+        Write any heartbeats buffered in this process, so that services
+        that have checked in are not swept, and then mark the services with
+        a single ``UPDATE`` statement
+
+        :return: The number of services that were marked unavailable
+        """
+        self._heartbeat_coalescer.flush(self.session)
+        return self.session.query(DatabaseService).filter(
+            DatabaseService.is_service_available,
+            ~DatabaseService.is_deleted,
+            DatabaseService.has_timed_out_at(datetime.utcnow())
+        ).update(
+            {DatabaseService.is_service_available: False},
+            synchronize_session=False
+        )
+
+    def jobs_awaiting_purge(self, service_id: UUID) -> int:
+        """
+
+        :param service_id: The ID of a deleted service
+        :return: The number of jobs of the service that have not been
+            purged yet
+        :raises: :exc:`KeyError` if no deleted service with that ID is
+            waiting to be purged
+        """
+        deleted_service = self.session.query(DatabaseService.id).filter_by(
+            id=service_id, is_deleted=True
+        ).first()
+        if deleted_service is None:
+            raise KeyError('A deleted service with that ID does not exist')
+
+        return sum(
+            self.session.query(job_model).filter_by(
+                service_id=service_id
+            ).count()
+            for job_model in (DatabaseJob, DatabaseArchivedJob)
+        )
+
+    def purge_deleted_services(self, max_jobs: int) -> int:
+        """
+        Delete up to ``max_jobs`` jobs of deleted services, first from the
+        jobs table and then from the archive, with one ``DELETE`` statement
+        per table. Once a deleted service has no jobs left in either table,
+        the service is deleted as well, along with the job sets that no
+        longer have any jobs. Since every job set is created with at least
+        one job, only the job sets of purged services are left empty
+
+        :param max_jobs: The maximum number of jobs to delete
+        :return: The number of jobs that were deleted. If this is less than
+            ``max_jobs``, every deleted service has been purged
+        """
+        number_of_jobs = 0
+        for job_model in (DatabaseJob, DatabaseArchivedJob):
+            number_of_jobs += self._purge_jobs_of_deleted_services(
+                job_model, max_jobs - number_of_jobs
+            )
+
+        if number_of_jobs < max_jobs:
+            self.session.query(DatabaseService).filter(
+                DatabaseService.is_deleted,
+                ~DatabaseService.jobs.any(),
+                ~DatabaseService.archived_jobs.any()
+            ).delete(synchronize_session=False)
+            self.session.query(DatabaseJobSet).filter(
+                ~DatabaseJobSet.jobs.any(),
+                ~self.session.query(DatabaseArchivedJob.id).filter(
+                    DatabaseArchivedJob.job_set_id == DatabaseJobSet.id
+                ).exists()
+            ).delete(synchronize_session=False)
+
+        return number_of_jobs
+
+    def check_in(self, service_id: UUID) -> None:
+        """
+        Hand the heartbeat to the coalescer, which only looks the service
+        up if it has not seen the service before, or when it writes its
+        batch of heartbeats
+
+        :param service_id: The ID of the service that checked in
+        :raises: :exc:`KeyError` if a service with that ID does not exist
+        """
+        self._heartbeat_coalescer.check_in(self.session, service_id)
+
     def new(
             self, name: str, description: str, registration_schema: JSON,
             result_schema: JSON) -> Service:
@@ -77,6 +215,62 @@ class ServiceList(IServiceList):
         self.session.add(service)
         return Service(service)
 
+    @property
+    def _query(self) -> Query:
+        """
+
+        :return: A query for the services in this list
+        """
+        return self._filter(
+            self.session.query(DatabaseService).filter_by(is_deleted=False)
+        )
+
+    def _filter(self, query: Query) -> Query:
+        """
+
+        :param query: A query over the services table that leaves out
+            deleted services
+        :return: The query, restricted to the services in this list
+        """
+        if self._is_available is None:
+            return query
+
+        is_live = DatabaseService.is_live_at(datetime.utcnow())
+        return query.filter(is_live if self._is_available else ~is_live)
+
+    def _purge_jobs_of_deleted_services(
+            self,
+            job_model: Union[Type[DatabaseJob], Type[DatabaseArchivedJob]],
+            max_jobs: int
+    ) -> int:
+        """
+        The IDs of the jobs are selected before they are deleted, since
+        MySQL does not allow ``LIMIT`` in the subquery of a ``DELETE``
+
+        :param job_model: The model of the table from which jobs are to be
+            deleted
+        :param max_jobs: The maximum number of jobs to delete
+        :return: The number of jobs that were deleted
+        """
+        if max_jobs <= 0:
+            return 0
+
+        deleted_service_ids = self.session.query(DatabaseService.id).filter(
+            DatabaseService.is_deleted
+        ).subquery()
+        job_ids = [
+            job_id for (job_id,) in self.session.query(job_model.id).filter(
+                job_model.service_id.in_(deleted_service_ids)
+            ).limit(max_jobs)
+        ]
+
+        if job_ids:
+            self.session.query(job_model).filter(
+                job_model.id.in_(job_ids)
+            ).delete(synchronize_session=False)
+
+        return len(job_ids)
+
     @staticmethod
     def _get_db_model_by_id(
             session: Session, service_id: UUID
@@ -85,7 +279,7 @@ class ServiceList(IServiceList):
         db_model = session.query(
             DatabaseService
         ).filter_by(
-            id=service_id
+            id=service_id, is_deleted=False
         ).first()
 
         if db_model is None:
@@ -95,12 +289,12 @@ class ServiceList(IServiceList):
 
     def _check_service_membership(self, service: Service):
         number_of_matches = self.session.query(DatabaseService).filter_by(
-            id=service.id).count()
+            id=service.id, is_deleted=False).count()
         return bool(number_of_matches)
 
     def _check_id_membership(self, service_id: UUID) -> bool:
         number_of_matches = self.session.query(DatabaseService).filter_by(
-            id=service_id
+            id=service_id, is_deleted=False
         ).count()
         return bool(number_of_matches)
 
@@ -0,0 +1,164 @@
+"""
+Keeps ready-made JSON schema validators around between requests, so that
+endpoints that check many instances against the same service schema do not
+have to build a new validator for every request.
+
+Validators are keyed by a fingerprint of the schema document, rather than by
+the service that owns the schema. Services with identical schemas therefore
+share a validator, and a schema that changes gets a new fingerprint, so a
+stale validator is never handed out. The validators for a schema are also
+evicted as soon as a service's schema is replaced, so that the cache does not
+fill up with validators that nobody will ask for again.
+
+Cached validators are shared between threads. ``jsonschema`` validators keep
+no state between calls, apart from the resolution scope of their ref
+resolver. For schemas whose ``$ref`` keywords point into the schema itself,
+this scope does not depend on the order in which threads resolve
+references.
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Any
+from jsonschema import Draft4Validator
+from sqlalchemy import event
+from topchef.config import config
+from topchef.database.models import Service as DatabaseService
+from topchef.models.schema_registry import fingerprint
+
+
+class ValidatorCache(object):
+    """
+    A size-bounded cache of JSON schema validators, that evicts the least
+    recently used validator when it is full. Calling the cache with a schema
+    returns a validator for that schema, so the cache can be used wherever a
+    validator class is expected
+    """
+    def __init__(
+            self,
+            max_size: int=config.VALIDATOR_CACHE_SIZE,
+            validator_factory: Callable[[dict], Any]=Draft4Validator
+    ) -> None:
+        """
+
+        :param max_size: The maximum number of validators to keep
+        :param validator_factory: The callable used to build a validator
+            from a schema when the cache does not have one yet
+        """
+        self._max_size = max_size
+        self._validator_factory = validator_factory
+        self._lock = threading.Lock()
+        self._validators = OrderedDict()  # type: OrderedDict
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def fingerprint(schema: dict) -> str:
+        """
+
+        :param schema: The schema to fingerprint
+        :return: A hash of the schema document. Schemas that are equal as
+            JSON documents have the same fingerprint, regardless of the order
+            of their keys
+        """
+        return fingerprint(schema)
+
+    def __call__(self, schema: dict) -> Any:
+        """
+
+        :param schema: The schema for which a validator is required
+        :return: A validator for the schema
+        """
+        key = self.fingerprint(schema)
+
+        with self._lock:
+            if key in self._validators:
+                self._hits += 1
+                self._validators.move_to_end(key)
+                return self._validators[key]
+            self._misses += 1
+
+        validator = self._validator_factory(schema)
+
+        with self._lock:
+            self._validators[key] = validator
+            self._validators.move_to_end(key)
+            while len(self._validators) > self._max_size:
+                self._validators.popitem(last=False)
+
+        return validator
+
+    def invalidate(self, schema: dict) -> None:
+        """
+        Forget the validator for a schema, if there is one
+
+        :param schema: The schema whose validator is to be removed
+        """
+        key = self.fingerprint(schema)
+        with self._lock:
+            self._validators.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Forget every validator, and reset the hit and miss counters
+        """
+        with self._lock:
+            self._validators.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        """
+
+        :return: The number of validators in the cache
+        """
+        with self._lock:
+            return len(self._validators)
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        """
+
+        :return: The number of times that a validator was found in the
+            cache, the number of times one had to be built, the number of
+            validators in the cache, and the maximum number of validators
+            that the cache will hold
+        """
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'size': len(self._validators),
+                'max_size': self._max_size
+            }
+
+    def listen(self, service_class: type=DatabaseService) -> None:
+        """
+        Evict the validators for a service's old schemas whenever one of
+        the service's schemas is replaced
+
+        :param service_class: The mapped class whose schema attributes are
+            to be watched
+        """
+        for attribute in (
+                service_class.job_registration_schema,
+                service_class.job_result_schema
+        ):
+            event.listen(
+                attribute, 'set', self._schema_replaced, active_history=True
+            )
+
+    def _schema_replaced(self, _, new_schema: Any, old_schema: Any, __) -> Any:
+        """
+
+        :param new_schema: The schema that the service now has
+        :param old_schema: The schema that the service had before. This is
+            a SQLAlchemy marker object if the service had no schema yet
+        :return: The new schema, unchanged
+        """
+        if isinstance(old_schema, dict) and old_schema != new_schema:
+            self.invalidate(old_schema)
+        return new_schema
+
+
+VALIDATOR_CACHE = ValidatorCache()
+VALIDATOR_CACHE.listen()
@@ -12,7 +12,10 @@ from .api_exception import APIException
 from .service_detail import ServiceDetail
 from .job_overview import JobOverview
 from .job_detail import JobDetail
-from .job_modification import JobModification
+from .job_modification import JobModification, BulkJobModification
 from .json_schema_validator import JSONSchemaValidator
 from .service_modifier import ServiceModification
 from .new_job import NewJob
+from .bulk_item import BulkItemSuccess, BulkItemError
+from .job_set import NewJobSet, JobSetDetail
+from .compiled_serializer import CompiledSerializer
@@ -0,0 +1,26 @@
+"""
+Contains serializers for reporting the outcome of each item in a request
+that acts on many items at once
+"""
+from marshmallow import Schema, fields
+from topchef.serializers.api_exception import APIException
+
+
+class BulkItemSuccess(Schema):
+    """
+    Describes an item that was processed successfully. The index is the
+    position of the item in the request body
+    """
+    index = fields.Int(dump_only=True, required=True)
+    id = fields.UUID(dump_only=True, required=True)
+
+
+class BulkItemError(Schema):
+    """
+    Describes an item that could not be processed, along with the errors
+    that were encountered while processing it
+    """
+    index = fields.Int(dump_only=True, required=True)
+    errors = fields.Nested(
+        APIException, many=True, dump_only=True, required=True
+    )
@@ -0,0 +1,283 @@
+"""
+:mod:`marshmallow` serializes an object by walking through every field of
+the schema, and asking each field to look up, check, and format its value.
+This is flexible, but most of the work is repeated for every object, which
+makes the listing endpoints spend most of their time in the serializer.
+
+A :class:`CompiledSerializer` inspects a schema once, and builds a
+specialized function for each field, that does only the work needed for
+the kind of field it is. The output is the same as the output of the
+schema's ``dump`` method. Fields that the compiler does not know about are
+formatted by the field itself, and any object that the compiled functions
+cannot serialize cleanly, such as one with an invalid value, is handed to
+the schema, so that errors are reported exactly as before.
+"""
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+from marshmallow import Schema, fields, MarshalResult, ValidationError
+from marshmallow.marshalling import missing
+from marshmallow import utils
+from topchef.serializers.custom_fields import JobStatusField
+from topchef.models import Job
+
+__all__ = ["CompiledSerializer"]
+
+FieldFunction = Callable[[Any], Any]
+
+
+class CompiledSerializer(object):
+    """
+    Serializes objects in the same way as a :mod:`marshmallow` schema, using
+    functions built once for the schema
+
+    .. sourcecode:: python
+
+        serializer = CompiledSerializer.for_schema(JobOverview)
+        data, errors = serializer.dump(jobs, many=True)
+    """
+    _compiled = {}  # type: Dict[Tuple[type, Optional[Tuple[str, ...]]], Any]
+    _compiled_lock = threading.RLock()
+
+    def __init__(
+            self,
+            schema_class: type,
+            only: Optional[Iterable[str]]=None
+    ) -> None:
+        """
+
+        :param schema_class: The :class:`marshmallow.Schema` to compile
+        :param only: The names of the fields to serialize. If this is
+            ``None``, every field is serialized
+        """
+        self._schema = schema_class(only=tuple(only) if only else None)
+        self._fields = self._compile_fields(self._schema)
+
+    @classmethod
+    def for_schema(
+            cls, schema_class: type, only: Optional[Iterable[str]]=None
+    ) -> 'CompiledSerializer':
+        """
+
+        :param schema_class: The schema to compile
+        :param only: The names of the fields to serialize
+        :return: A serializer for the schema, which is only compiled the
+            first time that it is asked for. The order of the fields, and
+            any repeated fields, make no difference to the output, so they
+            make no difference to which serializer is returned either
+        """
+        only = tuple(sorted(set(only))) if only else None
+        key = (schema_class, only)
+        try:
+            return cls._compiled[key]
+        except KeyError:
+            pass
+
+        with cls._compiled_lock:
+            if key not in cls._compiled:
+                cls._compiled[key] = cls(schema_class, only)
+            return cls._compiled[key]
+
+    @property
+    def schema(self) -> Schema:
+        """
+
+        :return: The schema that this serializer was compiled from
+        """
+        return self._schema
+
+    def dump(self, obj: Any, many: bool=False) -> MarshalResult:
+        """
+
+        :param obj: The object, or the iterable of objects, to serialize
+        :param many: ``True`` if ``obj`` is an iterable of objects
+        :return: The serialized data, and any errors found while
+            serializing it, in the form returned by
+            :meth:`marshmallow.Schema.dump`
+        """
+        if self._fields is None:
+            return self._schema.dump(obj, many=many)
+
+        try:
+            if many:
+                data = [self._dump_one(item) for item in obj]
+            else:
+                data = self._dump_one(obj)
+        except (ValidationError, _NotCompilable):
+            return self._schema.dump(obj, many=many)
+
+        return MarshalResult(data, {})
+
+    def _dump_one(self, obj: Any) -> dict:
+        """
+
+        :param obj: The object to serialize
+        :return: The serialized object
+        :raises: :exc:`ValidationError` if a value could not be formatted
+        """
+        if hasattr(type(obj), '__getitem__'):
+            raise _NotCompilable()
+
+        data = {}
+        for key, serialize_field in self._fields:
+            value = serialize_field(obj)
+            if value is not missing:
+                data[key] = value
+        return data
+
+    @classmethod
+    def _compile_fields(
+            cls, schema: Schema
+    ) -> Optional[List[Tuple[str, FieldFunction]]]:
+        """
+
+        :param schema: The schema to compile
+        :return: The key of each field to serialize, along with a function
+            that takes an object and returns the serialized value of the
+            field, or ``missing`` if the field is to be left out. If the
+            schema uses features that the compiled functions do not
+            support, such as processors or a key prefix, ``None`` is
+            returned
+        """
+        if schema.__processors__ or schema.prefix or \
+                schema.opts.fields or schema.opts.additional or \
+                schema.exclude:
+            return None
+
+        compiled_fields = []
+        for name, field in schema.fields.items():
+            if field.load_only:
+                continue
+            compiled_fields.append(
+                (field.dump_to or name, cls._compile_field(name, field))
+            )
+        return compiled_fields
+
+    @classmethod
+    def _compile_field(
+            cls, name: str, field: fields.Field
+    ) -> FieldFunction:
+        """
+
+        :param name: The name of the field in the schema
+        :param field: The field to compile
+        :return: A function that takes an object, and returns the
+            serialized value of the field
+        """
+        attribute = field.attribute or name
+        format_value = cls._compile_formatter(name, field)
+
+        if format_value is None or '.' in attribute or \
+                field.default is not missing:
+            return lambda obj: field.serialize(name, obj)
+
+        def serialize_field(obj: Any) -> Any:
+            value = getattr(obj, attribute, missing)
+            if value is missing:
+                return missing
+            if callable(value):
+                value = value()
+            return format_value(value)
+        return serialize_field
+
+    @staticmethod
+    def _compile_formatter(
+            name: str, field: fields.Field
+    ) -> Optional[FieldFunction]:
+        """
+
+        :param name: The name of the field in the schema
+        :param field: The field to compile
+        :return: A function that formats a value of the field, or ``None``
+            if the field must format its values itself
+        """
+        field_type = type(field)
+
+        if field_type is fields.UUID:
+            return _format_uuid(name, field)
+        elif field_type is fields.String:
+            return _format_string
+        elif field_type is fields.Dict:
+            return _identity
+        elif field_type is fields.DateTime and field.dateformat is None \
+                and not field.localtime:
+            return _format_datetime(name, field)
+        elif field_type is fields.Boolean:
+            return _format_boolean(name, field)
+        elif field_type is JobStatusField:
+            return _format_job_status
+        elif field_type is fields.Nested and field.only is None and \
+                not field.exclude:
+            return _format_nested(field)
+        else:
+            return None
+
+
+class _NotCompilable(Exception):
+    """
+    Thrown if an object cannot be serialized by the compiled functions, and
+    must be given to the schema instead
+    """
+    pass
+
+
+_JOB_STATUSES = {status: status.name for status in Job.JobStatus}
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _format_string(value: Any) -> Optional[str]:
+    if value is None or type(value) is str:
+        return value
+    return utils.ensure_text_type(value)
+
+
+def _format_job_status(value: Job.JobStatus) -> str:
+    try:
+        return _JOB_STATUSES[value]
+    except (KeyError, TypeError):
+        raise _NotCompilable()
+
+
+def _format_uuid(name: str, field: fields.UUID) -> FieldFunction:
+    def format_uuid(value: Any) -> Optional[str]:
+        if value is None:
+            return None
+        if type(value) is UUID:
+            return str(value)
+        return field._serialize(value, name, None)
+    return format_uuid
+
+
+def _format_datetime(name: str, field: fields.DateTime) -> FieldFunction:
+    def format_datetime(value: Any) -> Optional[str]:
+        if value is None:
+            return None
+        if type(value) is datetime and value.tzinfo is None:
+            return value.isoformat() + '+00:00'
+        return field._serialize(value, name, None)
+    return format_datetime
+
+
+def _format_boolean(name: str, field: fields.Boolean) -> FieldFunction:
+    def format_boolean(value: Any) -> Optional[bool]:
+        if value is None or type(value) is bool:
+            return value
+        return field._serialize(value, name, None)
+    return format_boolean
+
+
+def _format_nested(field: fields.Nested) -> FieldFunction:
+    nested_serializer = CompiledSerializer.for_schema(type(field.schema))
+
+    def format_nested(value: Any) -> Any:
+        if value is None:
+            return None
+        data, errors = nested_serializer.dump(value, many=field.many)
+        if errors:
+            raise ValidationError(errors, data=data)
+        return data
+    return format_nested
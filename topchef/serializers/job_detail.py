@@ -11,3 +11,4 @@ class JobDetail(Schema):
     parameters = fields.Dict(required=True)
     results = fields.Dict(required=True)
     date_submitted = fields.DateTime()
+    lease_expires = fields.DateTime(allow_none=True)
@@ -12,3 +12,11 @@ class JobModification(Schema):
     """
     status = JobStatusField(required=False, allow_none=True)
     results = fields.Dict(required=False, allow_none=True)
+
+
+class BulkJobModification(JobModification):
+    """
+    The schema that must be satisfied by each item of a request that
+    changes many jobs at once. Each item names the job that it changes
+    """
+    id = fields.UUID(required=True)
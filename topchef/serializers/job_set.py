@@ -0,0 +1,30 @@
+"""
+Contains serializers for creating and reporting job sets
+"""
+from marshmallow import Schema, fields, validate
+from topchef.serializers.job_overview import JobOverview
+
+
+class NewJobSet(Schema):
+    """
+    The schema that must be satisfied in order to create a job set. Each
+    item in ``jobs`` must satisfy the new job schema of the service, and
+    there must be at least one item, so that the job set belongs to the
+    service through its jobs
+    """
+    description = fields.Str(required=True, validate=validate.Length(max=140))
+    jobs = fields.List(
+        fields.Raw(), required=True, validate=validate.Length(min=1)
+    )
+
+
+class JobSetDetail(Schema):
+    """
+    Describes a job set, along with the number of its jobs with each status,
+    and one page of its jobs
+    """
+    id = fields.UUID(dump_only=True, required=True)
+    description = fields.Str(dump_only=True, required=True)
+    total = fields.Int(dump_only=True)
+    progress = fields.Dict(dump_only=True)
+    jobs = fields.Nested(JobOverview, many=True, dump_only=True)
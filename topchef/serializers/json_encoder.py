@@ -0,0 +1,161 @@
+"""
+Encodes the documents returned by the API as JSON.
+
+:func:`dumps` is :func:`json.dumps`, with values of other types handed to
+the ``default`` function, or rejected with :exc:`TypeError` if there is no
+such function. Documents that contain themselves are rejected with
+:exc:`ValueError`, as the standard library checks for circular references.
+The encoding of the jobs themselves is sped up by
+:mod:`topchef.serializers.compiled_serializer`, which builds the documents
+that are encoded here.
+
+:func:`iterdumps` produces the same text in chunks, so that a response can
+be sent while the items of a long array are still being read from the
+database.
+"""
+import json
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+__all__ = ["dumps", "iterdumps"]
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def dumps(
+        document: Any,
+        indent: Optional[int]=None,
+        separators: Optional[Tuple[str, str]]=None,
+        sort_keys: bool=False,
+        ensure_ascii: bool=True,
+        default: Optional[Callable[[Any], Any]]=None
+) -> str:
+    """
+
+    :param document: The document to encode
+    :param indent: The number of spaces by which each level of the
+        document is indented, or ``None`` for output on a single line
+    :param separators: The separator placed between items, and the
+        separator placed between keys and values
+    :param sort_keys: If ``True``, the keys of each object are sorted
+    :param ensure_ascii: If ``True``, characters outside of ASCII are
+        escaped
+    :param default: A function that returns a JSON-serializable version of
+        a value that is not a JSON type, or raises :exc:`TypeError` if the
+        value cannot be serialized
+    :return: The document, encoded as JSON
+    :raises: :exc:`TypeError` if the document contains a value that is not
+        a JSON type, and that ``default`` cannot convert
+    :raises: :exc:`ValueError` if the document contains a circular
+        reference
+    """
+    return json.dumps(
+        document, indent=indent, separators=separators, sort_keys=sort_keys,
+        ensure_ascii=ensure_ascii, default=default or _reject,
+        check_circular=True
+    )
+
+
+def iterdumps(
+        document: dict,
+        indent: Optional[int]=None,
+        separators: Optional[Tuple[str, str]]=None,
+        sort_keys: bool=False,
+        ensure_ascii: bool=True,
+        default: Optional[Callable[[Any], Any]]=None,
+        chunk_size: int=_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Encode an object piece by piece. The values of the object may be
+    iterators, which are encoded as arrays one item at a time, or functions
+    that take no arguments, which are only called once the values before
+    them have been encoded. A value can therefore depend on the items of an
+    iterator that comes before it. Joining the chunks gives the same text as
+    :func:`dumps` gives for the object with every iterator turned into a
+    list, and every function replaced by what it returns.
+
+    :param document: The object to encode. Its keys must be strings
+    :param indent: The number of spaces by which each level of the
+        document is indented, or ``None`` for output on a single line
+    :param separators: The separator placed between items, and the
+        separator placed between keys and values
+    :param sort_keys: If ``True``, the keys of each object are sorted
+    :param ensure_ascii: If ``True``, characters outside of ASCII are
+        escaped
+    :param default: A function that returns a JSON-serializable version of
+        a value that is not a JSON type
+    :param chunk_size: The number of characters that are collected before
+        a chunk is produced. Chunks may be longer, if a single item of an
+        array is longer than this
+    :return: The encoded object, in chunks
+    :raises: :exc:`ValueError` if a value of the object contains a circular
+        reference
+    """
+    if separators is None:
+        separators = (', ', ': ') if indent is None else (',', ': ')
+    item_separator, key_separator = separators
+    encoder = json.JSONEncoder(
+        indent=indent, separators=separators, sort_keys=sort_keys,
+        ensure_ascii=ensure_ascii, default=default or _reject,
+        check_circular=True
+    )
+
+    def newline(level: int) -> str:
+        if indent is None:
+            return ''
+        return '\n' + ' ' * indent * level
+
+    def encode_value(value: Any, level: int) -> str:
+        # JSON strings cannot hold line breaks, so every line break in the
+        # encoded value starts a line that is indented one level deeper
+        return encoder.encode(value).replace('\n', newline(level))
+
+    if not document:
+        yield '{}'
+        return
+
+    keys = sorted(document) if sort_keys else list(document)
+    buffer = ['{']
+    buffered_size = 1
+
+    for key_index, key in enumerate(keys):
+        if key_index:
+            buffer.append(item_separator)
+        buffer.append(newline(1) + encoder.encode(key) + key_separator)
+
+        value = document[key]
+        if callable(value):
+            value = value()
+
+        if not isinstance(value, Iterator):
+            buffer.append(encode_value(value, 1))
+            continue
+
+        item_prefix = '[' + newline(2)
+        for item in value:
+            chunk = item_prefix + encode_value(item, 2)
+            item_prefix = item_separator + newline(2)
+            buffer.append(chunk)
+            buffered_size += len(chunk)
+            if buffered_size >= chunk_size:
+                yield ''.join(buffer)
+                buffer = []
+                buffered_size = 0
+
+        if item_prefix[0] == '[':
+            buffer.append('[]')
+        else:
+            buffer.append(newline(1) + ']')
+
+    buffer.append(newline(0) + '}')
+    yield ''.join(buffer)
+
+
+def _reject(value: Any) -> None:
+    """
+    Refuse to encode values that are not JSON types
+
+    :param value: The value that could not be encoded
+    """
+    raise TypeError('Object of type %s is not JSON serializable' % (
+        value.__class__.__name__
+    ))
@@ -7,7 +7,10 @@ from topchef.serializers.job_overview import JobOverview
 
 class ServiceDetail(Schema):
     """
-    A detailed serializer for services
+    A detailed serializer for services. ``job_counts`` holds the number of
+    the service's jobs with each status. ``jobs`` is only filled in with a
+    page of the service's jobs when the page is asked for. ``job_retention``
+    is ``None`` if the service's finished jobs are never archived
     """
     id = fields.UUID(required=True, dump_only=True)
     name = fields.Str(required=True, dump_only=True)
@@ -15,6 +18,10 @@ class ServiceDetail(Schema):
     job_registration_schema = fields.Dict(required=True, dump_only=True)
     job_result_schema = fields.Dict(required=True, dump_only=True)
     is_service_available = fields.Boolean(required=True, dump_only=True)
+    job_counts = fields.Dict(required=True, dump_only=True)
     jobs = fields.Nested(JobOverview, many=True, dump_only=True)
     has_timed_out = fields.Boolean(required=True, dump_only=True)
     timeout = fields.TimeDelta(required=True, dump_only=True)
+    job_retention = fields.TimeDelta(
+        required=True, allow_none=True, dump_only=True
+    )
@@ -2,6 +2,7 @@
 Contains a serializer for modifying the service
 """
 from datetime import timedelta
+from typing import Optional
 from marshmallow import Schema, fields, validates, ValidationError
 
 
@@ -10,6 +11,7 @@ class ServiceModification(Schema):
     description = fields.Str(required=False)
     name = fields.Str(required=False)
     timeout = fields.TimeDelta(required=False)
+    job_retention = fields.TimeDelta(required=False, allow_none=True)
 
     @validates('timeout')
     def validate_timeout(self, timeout: timedelta):
@@ -19,3 +21,12 @@ class ServiceModification(Schema):
             )
         else:
             return True
+
+    @validates('job_retention')
+    def validate_job_retention(self, job_retention: Optional[timedelta]):
+        if job_retention is not None and job_retention.total_seconds() <= 0:
+            raise ValidationError(
+                'Attempted to set a job retention that is not positive'
+            )
+        else:
+            return True
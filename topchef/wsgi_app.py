@@ -17,8 +17,14 @@ from flask import Flask
 from .api import APIMetadata, ServicesList, ServiceDetail
 from .api import JobsList, JobsForService, JobQueueForService
 from .api import NextJob as NextJobEndpoint, JobDetail
+from .api import LeaseJobs, LeaseExtension, Heartbeat, ServiceDeletion
+from .api import JobResults
+from .api import JobSetsForService, JobSetDetail
 from .api import JSONSchemaValidator
+from .api import SchemaDetail
 from .method_override_middleware import HTTPMethodOverrideMiddleware
+from .compression_middleware import CompressionMiddleware
+from .models.heartbeat_coalescer import HEARTBEAT_COALESCER
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
@@ -56,8 +62,11 @@ class ProductionWSGIAppFactory(
     def __init__(self):
         self._app = Flask(__name__)
         self._app.wsgi_app = HTTPMethodOverrideMiddleware(self._app.wsgi_app)
+        if config.COMPRESSION_ENABLED:
+            self._app.wsgi_app = CompressionMiddleware(self._app.wsgi_app)
 
         self._engine = create_engine(config.DATABASE_URI)
+        HEARTBEAT_COALESCER.session_factory = sessionmaker(bind=self._engine)
 
         self._app.add_url_rule(
             '/', view_func=APIMetadata.as_view(
@@ -76,6 +85,18 @@ class ProductionWSGIAppFactory(
                 ServiceDetail.__name__, self._session_factory()
             )
         )
+        self._app.add_url_rule(
+            '/services/<service_id>/heartbeat',
+            view_func=Heartbeat.as_view(
+                Heartbeat.__name__, self._session_factory()
+            )
+        )
+        self._app.add_url_rule(
+            '/services/<service_id>/deletion',
+            view_func=ServiceDeletion.as_view(
+                ServiceDeletion.__name__, self._session_factory()
+            )
+        )
         self._app.add_url_rule(
             '/services/<service_id>/queue',
             view_func=JobQueueForService.as_view(
@@ -94,6 +115,18 @@ class ProductionWSGIAppFactory(
                 JobDetail.__name__, self._session_factory()
             )
         )
+        self._app.add_url_rule(
+            '/jobs/<job_id>/lease',
+            view_func=LeaseExtension.as_view(
+                LeaseExtension.__name__, self._session_factory()
+            )
+        )
+        self._app.add_url_rule(
+            '/jobs/<job_id>/results',
+            view_func=JobResults.as_view(
+                JobResults.__name__, self._session_factory()
+            )
+        )
         self._app.add_url_rule(
             '/services/<service_id>/jobs',
             view_func=JobsForService.as_view(
@@ -106,6 +139,24 @@ class ProductionWSGIAppFactory(
                 NextJobEndpoint.__name__, self._session_factory()
             )
         )
+        self._app.add_url_rule(
+            '/services/<service_id>/jobs/lease',
+            view_func=LeaseJobs.as_view(
+                LeaseJobs.__name__, self._session_factory()
+            )
+        )
+        self._app.add_url_rule(
+            '/services/<service_id>/job_sets',
+            view_func=JobSetsForService.as_view(
+                JobSetsForService.__name__, self._session_factory()
+            )
+        )
+        self._app.add_url_rule(
+            '/job_sets/<job_set_id>',
+            view_func=JobSetDetail.as_view(
+                JobSetDetail.__name__, self._session_factory()
+            )
+        )
         self._app.add_url_rule(
             '/validator',
             view_func=JSONSchemaValidator.as_view(
@@ -113,6 +164,15 @@ class ProductionWSGIAppFactory(
             )
         )
 
+        self._app.add_url_rule(
+            '/schemas/<schema_fingerprint>',
+            view_func=SchemaDetail.as_view(
+                SchemaDetail.__name__, self._session_factory()
+            )
+        )
+
+        self._precompute_meta_schemas()
+
     @property
     def app(self) -> Flask:
         return self._app
@@ -121,6 +181,19 @@ class ProductionWSGIAppFactory(
     def engine(self) -> Engine:
         return self._engine
 
+    def _precompute_meta_schemas(self) -> None:
+        """
+        Build the schemas that every endpoint places in the ``meta`` object
+        of its responses, so that the first requests do not have to wait
+        for them
+        """
+        for view_function in self._app.view_functions.values():
+            view_class = getattr(view_function, 'view_class', None)
+            if view_class is not None and hasattr(
+                    view_class, 'precompute_meta_schemas'
+            ):
+                view_class.precompute_meta_schemas()
+
     @property
     def _session_factory(self) -> sessionmaker:
         return scoped_session(sessionmaker(bind=self._engine))